@@ -1,3 +1,29 @@
-from cognite.client._cognite_client import CogniteClient
+import importlib
+import sys
 
 __version__ = "1.8.0"
+
+# Modules are imported when the name is first accessed (PEP 562), so that importing the package stays cheap
+_LAZY_ATTRIBUTES = {
+    "CogniteClient": "cognite.client._cognite_client",
+    "AsyncCogniteClient": "cognite.client._async_cognite_client",
+}
+
+__all__ = ["CogniteClient", "AsyncCogniteClient"]
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+    value = globals()[name] = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ is only supported from Python 3.7, so earlier versions import everything up front
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
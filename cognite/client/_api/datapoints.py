@@ -1,4 +1,3 @@
-import copy
 import math
 import re as regexp
 import threading
@@ -9,7 +8,7 @@ from typing import *
 import cognite.client.utils._time
 from cognite.client import utils
 from cognite.client._api.synthetic_time_series import SyntheticDatapointsAPI
-from cognite.client._api_client import APIClient
+from cognite.client._api_client import APIClient, LazyAPI
 from cognite.client.data_classes import Datapoints, DatapointsList, DatapointsQuery
 from cognite.client.exceptions import CogniteAPIError
 
@@ -17,15 +16,19 @@ from cognite.client.exceptions import CogniteAPIError
 class DatapointsAPI(APIClient):
     _RESOURCE_PATH = "/timeseries/data"
 
+    synthetic = LazyAPI(
+        "synthetic",
+        lambda api: SyntheticDatapointsAPI(
+            api._config, api_version=api._api_version, cognite_client=api._cognite_client
+        ),
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._DPS_LIMIT_AGG = 10000
         self._DPS_LIMIT = 100000
         self._POST_DPS_OBJECTS_LIMIT = 10000
         self._RETRIEVE_LATEST_LIMIT = 100
-        self.synthetic = SyntheticDatapointsAPI(
-            self._config, api_version=self._api_version, cognite_client=self._cognite_client
-        )
 
     def retrieve(
         self,
@@ -169,7 +172,7 @@ class DatapointsAPI(APIClient):
             for chunk in utils._auxiliary.split_into_chunks(all_ids, self._RETRIEVE_LATEST_LIMIT)
         ]
         tasks_summary = utils._concurrency.execute_tasks_concurrently(
-            self._post, tasks, max_workers=self._config.max_workers
+            self._post, tasks, max_workers=self._config.max_workers, executor=self._config.executor, fail_fast=True
         )
         if tasks_summary.exceptions:
             raise tasks_summary.exceptions[0]
@@ -748,7 +751,10 @@ class DatapointsPoster:
         for dps_object_list in dps_object_lists:
             tasks.append((dps_object_list,))
         summary = utils._concurrency.execute_tasks_concurrently(
-            self._insert_datapoints, tasks, max_workers=self.client._config.max_workers
+            self._insert_datapoints,
+            tasks,
+            max_workers=self.client._config.max_workers,
+            executor=self.client._config.executor,
         )
         summary.raise_compound_exception_if_failed_tasks(
             task_unwrap_fn=lambda x: x[0],
@@ -760,6 +766,9 @@ class DatapointsPoster:
         for it in post_dps_objects:
             it["datapoints"] = [{"timestamp": t, "value": v} for t, v in it["datapoints"]]
         self.client._post(url_path=self.client._RESOURCE_PATH, json={"items": post_dps_objects})
+        metrics = self.client._config.metrics
+        if metrics is not None:
+            metrics.count_datapoints(inserted=sum(len(it["datapoints"]) for it in post_dps_objects))
         for it in post_dps_objects:
             del it["datapoints"]
 
@@ -797,30 +806,35 @@ class _DPTask:
     def next_start_offset(self):
         return cognite.client.utils._time.granularity_to_ms(self.granularity) if self.granularity else 1
 
+    @property
+    def expected_fields(self):
+        return self.aggregates or ["value"]
+
+    @utils._profiling.profiled_stage("_load")
     def store_partial_result(self, raw_data, start, end):
-        expected_fields = self.aggregates or ["value"]
+        expected_fields = self.expected_fields + ["timestamp"]
+        columns = {key: [dp[key] if key in dp else None for dp in raw_data["datapoints"]] for key in expected_fields}
+        return self.store_partial_columns(raw_data, columns, start, end)
+
+    @utils._profiling.profiled_stage("_load")
+    def store_partial_columns(self, raw_data, columns, start, end):
+        def load(columns):
+            return Datapoints._load_columns(raw_data, columns, cognite_client=self.client._cognite_client)
 
-        if self.include_outside_points and raw_data["datapoints"]:
+        if self.include_outside_points and columns["timestamp"]:
             # assumes first query has full start/end range
-            copy_data = copy.copy(raw_data)  # shallow copy
-            if raw_data["datapoints"][0]["timestamp"] < start:
+            if columns["timestamp"][0] < start:
                 if not self.point_before:
-                    copy_data["datapoints"] = raw_data["datapoints"][:1]
-                    self.point_before = Datapoints._load(
-                        copy_data, expected_fields, cognite_client=self.client._cognite_client
-                    )
-                raw_data["datapoints"] = raw_data["datapoints"][1:]
-            if raw_data["datapoints"] and raw_data["datapoints"][-1]["timestamp"] >= end:
+                    self.point_before = load({key: values[:1] for key, values in columns.items()})
+                columns = {key: values[1:] for key, values in columns.items()}
+            if columns["timestamp"] and columns["timestamp"][-1] >= end:
                 if not self.point_after:
-                    copy_data["datapoints"] = raw_data["datapoints"][-1:]
-                    self.point_after = Datapoints._load(
-                        copy_data, expected_fields, cognite_client=self.client._cognite_client
-                    )
-                raw_data["datapoints"] = raw_data["datapoints"][:-1]
+                    self.point_after = load({key: values[-1:] for key, values in columns.items()})
+                columns = {key: values[:-1] for key, values in columns.items()}
 
-        self.results.append(Datapoints._load(raw_data, expected_fields, cognite_client=self.client._cognite_client))
-        last_timestamp = raw_data["datapoints"] and raw_data["datapoints"][-1]["timestamp"]
-        return len(raw_data["datapoints"]), last_timestamp
+        self.results.append(load(columns))
+        last_timestamp = columns["timestamp"] and columns["timestamp"][-1]
+        return len(columns["timestamp"]), last_timestamp
 
     def mark_missing(self):  # for ignore unknown ids
         self.missing = True
@@ -917,6 +931,8 @@ class DatapointsFetcher:
             self._fetch_dps_initial_and_return_remaining_tasks,
             [(t,) for t in tasks],
             max_workers=self.client._config.max_workers,
+            executor=self.client._config.executor,
+            fail_fast=True,
         )
         if tasks_summary.exceptions:
             raise tasks_summary.exceptions[0]
@@ -926,7 +942,10 @@ class DatapointsFetcher:
             self._fetch_datapoints_for_remaining_queries(remaining_tasks_with_windows)
 
     def _fetch_dps_initial_and_return_remaining_tasks(self, task: _DPTask) -> List[Tuple[_DPTask, _DPWindow]]:
-        ndp_in_first_task, last_timestamp = self._get_datapoints(task, None, True)
+        attributes = {"cognite.timeseries": str(utils._auxiliary.unwrap_identifer(task.ts_item))}
+        with utils._tracing.span(self.client._config.tracer, "datapoints.first_page", attributes) as span:
+            ndp_in_first_task, last_timestamp = self._get_datapoints(task, None, True)
+            span.set_attribute("cognite.items", ndp_in_first_task)
         if ndp_in_first_task < task.request_limit:
             return []
         remaining_user_limit = task.limit - ndp_in_first_task
@@ -936,7 +955,11 @@ class DatapointsFetcher:
 
     def _fetch_datapoints_for_remaining_queries(self, tasks_with_windows: List[Tuple[_DPTask, _DPWindow]]):
         tasks_summary = utils._concurrency.execute_tasks_concurrently(
-            self._get_datapoints_with_paging, tasks_with_windows, max_workers=self.client._config.max_workers
+            self._get_datapoints_with_paging,
+            tasks_with_windows,
+            max_workers=self.client._config.max_workers,
+            executor=self.client._config.executor,
+            fail_fast=True,
         )
         if tasks_summary.exceptions:
             raise tasks_summary.exceptions[0]
@@ -964,7 +987,8 @@ class DatapointsFetcher:
             count_task = _DPTask(
                 self.client, task.start, task.end, {"id": id}, ["count"], count_granularity, False, None, False
             )
-            self._get_datapoints_with_paging(count_task, _DPWindow(task.start, task.end))
+            with utils._tracing.span(self.client._config.tracer, "datapoints.count", {"cognite.timeseries": str(id)}):
+                self._get_datapoints_with_paging(count_task, _DPWindow(task.start, task.end))
             res = count_task.result()
         except CogniteAPIError:
             res = []
@@ -1013,12 +1037,23 @@ class DatapointsFetcher:
 
     def _get_datapoints_with_paging(self, task, window):
         ndp_retrieved_total = 0
-        while window.end > window.start and ndp_retrieved_total < window.limit:
-            ndp_retrieved, last_time = self._get_datapoints(task, window)
-            if ndp_retrieved < min(window.limit, task.request_limit):
-                break
-            window.limit -= ndp_retrieved
-            window.start = last_time + task.next_start_offset()
+        attributes = {
+            "cognite.timeseries": str(utils._auxiliary.unwrap_identifer(task.ts_item)),
+            "cognite.window_start": window.start,
+            "cognite.window_end": window.end,
+        }
+        with utils._tracing.span(self.client._config.tracer, "datapoints.window", attributes) as span:
+            pages = items = 0
+            while window.end > window.start and ndp_retrieved_total < window.limit:
+                ndp_retrieved, last_time = self._get_datapoints(task, window)
+                pages += 1
+                items += ndp_retrieved
+                if ndp_retrieved < min(window.limit, task.request_limit):
+                    break
+                window.limit -= ndp_retrieved
+                window.start = last_time + task.next_start_offset()
+            span.set_attribute("cognite.items", items)
+            span.set_attribute("cognite.pages", pages)
 
     def _get_datapoints(
         self, task: _DPTask, window: _DPWindow = None, first_page: bool = False
@@ -1034,11 +1069,24 @@ class DatapointsFetcher:
             "ignoreUnknownIds": task.ignore_unknown_ids,
             "limit": min(window.limit, task.request_limit),
         }
+        if self.client._config.streaming_json_decode:
+            res = self.client._post(self.client._RESOURCE_PATH + "/list", json=payload, stream=True)
+            items = utils._streaming.load_datapoints_columns(res, task.expected_fields)
+            if not items and task.ignore_unknown_ids:
+                return task.mark_missing()
+            return self._count_retrieved(task.store_partial_columns(items[0][0], items[0][1], window.start, window.end))
+
         res = self.client._post(self.client._RESOURCE_PATH + "/list", json=payload).json()["items"]
         if not res and task.ignore_unknown_ids:
             return task.mark_missing()
         else:
-            return task.store_partial_result(res[0], window.start, window.end)
+            return self._count_retrieved(task.store_partial_result(res[0], window.start, window.end))
+
+    def _count_retrieved(self, stored: Tuple[int, Union[None, int]]) -> Tuple[int, Union[None, int]]:
+        metrics = self.client._config.metrics
+        if metrics is not None:
+            metrics.count_datapoints(retrieved=stored[0])
+        return stored
 
     @staticmethod
     def _process_ts_identifiers(ids, external_ids) -> Tuple[List[Dict], bool]:
@@ -141,6 +141,8 @@ class FilesAPI(APIClient):
         )
         returned_file_metadata = res.json()
         upload_url = returned_file_metadata.pop("uploadUrl")
+        if overwrite:
+            self._invalidate_cached_file(returned_file_metadata)
         file_metadata = FileMetadata._load(returned_file_metadata)
 
         return (file_metadata, upload_url)
@@ -494,7 +496,7 @@ class FilesAPI(APIClient):
                         file_metadata.name = file_name
                         tasks.append((file_metadata, file_path, overwrite))
             tasks_summary = utils._concurrency.execute_tasks_concurrently(
-                self._upload_file_from_path, tasks, self._config.max_workers
+                self._upload_file_from_path, tasks, self._config.max_workers, executor=self._config.executor
             )
             tasks_summary.raise_compound_exception_if_failed_tasks(task_unwrap_fn=lambda x: x[0].name)
             return FileMetadataList(tasks_summary.results)
@@ -572,8 +574,14 @@ class FilesAPI(APIClient):
         upload_url = returned_file_metadata.pop("uploadUrl")
         headers = {"X-Upload-Content-Type": file_metadata.mime_type}
         self._request_session.put(upload_url, data=content, headers=headers)
+        # An overwritten file, or the uploaded status of a new one, may have been cached meanwhile
+        self._invalidate_cached_file(returned_file_metadata)
         return FileMetadata._load(returned_file_metadata)
 
+    def _invalidate_cached_file(self, file_metadata: Dict):
+        identifiers = [{"id": file_metadata.get("id")}, {"externalId": file_metadata.get("externalId")}]
+        self._invalidate_cached_resources(self._RESOURCE_PATH, identifiers)
+
     def download(
         self, directory: str, id: Union[int, List[int]] = None, external_id: Union[str, List[str]] = None
     ) -> None:
@@ -619,7 +627,7 @@ class FilesAPI(APIClient):
     def _download_files_to_directory(self, directory, all_ids, id_to_metadata):
         tasks = [(directory, id, id_to_metadata) for id in all_ids]
         tasks_summary = utils._concurrency.execute_tasks_concurrently(
-            self._process_file_download, tasks, max_workers=self._config.max_workers
+            self._process_file_download, tasks, max_workers=self._config.max_workers, executor=self._config.executor
         )
         tasks_summary.raise_compound_exception_if_failed_tasks(
             task_unwrap_fn=lambda task: id_to_metadata[utils._auxiliary.unwrap_identifer(task[1])],
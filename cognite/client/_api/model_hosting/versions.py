@@ -1,7 +1,7 @@
 import os
-from concurrent.futures.thread import ThreadPoolExecutor
 from typing import Any, Dict, List
 
+from cognite.client import utils
 from cognite.client._api_client import APIClient
 from cognite.client.data_classes.model_hosting.versions import (
     ModelArtifactList,
@@ -247,13 +247,10 @@ class ModelVersionsAPI(APIClient):
 
         if len(upload_tasks) == 0:
             raise EmptyArtifactsDirectory("Artifacts directory is empty.")
-        self._execute_tasks_concurrently(self.upload_artifact_from_file, upload_tasks)
-
-    @staticmethod
-    def _execute_tasks_concurrently(func, tasks):
-        with ThreadPoolExecutor(16) as p:
-            futures = [p.submit(func, *task) for task in tasks]
-            return [future.result() for future in futures]
+        tasks_summary = utils._concurrency.execute_tasks_concurrently(
+            self.upload_artifact_from_file, upload_tasks, self._config.max_workers, executor=self._config.executor
+        )
+        tasks_summary.raise_compound_exception_if_failed_tasks(task_unwrap_fn=lambda task: task[2])
 
     def _upload_file(self, upload_url, file_path):
         with open(file_path, "rb") as fh:
@@ -468,7 +468,7 @@ class SequencesDataAPI(APIClient):
         ]
         tasks = [({**base_obj, **rows},) for rows in row_objs]
         summary = utils._concurrency.execute_tasks_concurrently(
-            self._insert_data, tasks, max_workers=self._config.max_workers
+            self._insert_data, tasks, max_workers=self._config.max_workers, executor=self._config.executor
         )
         summary.raise_compound_exception_if_failed_tasks()
 
@@ -603,7 +603,11 @@ class SequencesDataAPI(APIClient):
             )
 
         tasks_summary = utils._concurrency.execute_tasks_concurrently(
-            _fetch_sequence, [(x,) for x in post_objs], max_workers=self._config.max_workers
+            _fetch_sequence,
+            [(x,) for x in post_objs],
+            max_workers=self._config.max_workers,
+            executor=self._config.executor,
+            fail_fast=True,
         )
         if tasks_summary.exceptions:
             raise tasks_summary.exceptions[0]
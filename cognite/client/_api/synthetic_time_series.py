@@ -85,7 +85,11 @@ class SyntheticDatapointsAPI(APIClient):
             tasks.append((query, query_datapoints, limit))
 
         datapoints_summary = utils._concurrency.execute_tasks_concurrently(
-            self._fetch_datapoints, tasks, max_workers=self._config.max_workers
+            self._fetch_datapoints,
+            tasks,
+            max_workers=self._config.max_workers,
+            executor=self._config.executor,
+            fail_fast=True,
         )
 
         if datapoints_summary.exceptions:
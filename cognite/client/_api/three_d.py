@@ -552,7 +552,9 @@ class ThreeDAssetMappingAPI(APIClient):
             [a.dump(camel_case=True) for a in asset_mapping], self._DELETE_LIMIT
         )
         tasks = [{"url_path": path + "/delete", "json": {"items": chunk}} for chunk in chunks]
-        summary = utils._concurrency.execute_tasks_concurrently(self._post, tasks, self._config.max_workers)
+        summary = utils._concurrency.execute_tasks_concurrently(
+            self._post, tasks, self._config.max_workers, executor=self._config.executor
+        )
         summary.raise_compound_exception_if_failed_tasks(
             task_unwrap_fn=lambda task: task["json"]["items"],
             task_list_element_unwrap_fn=lambda el: ThreeDAssetMapping._load(el),
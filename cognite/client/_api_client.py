@@ -1,18 +1,17 @@
-import gzip
-import json as _json
+import json
 import logging
 import numbers
 import os
 import re
+import threading
+import time
 from collections import UserList
-from http import cookiejar
-from typing import Any, Callable, Dict, List, Optional, Union
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin
 
 import requests.utils
 from requests import Response, Session
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3 import Retry
 from requests.structures import CaseInsensitiveDict
 
 from cognite.client import utils
@@ -21,64 +20,50 @@ from cognite.client.exceptions import CogniteAPIError, CogniteNotFoundError
 
 log = logging.getLogger("cognite-sdk")
 
+_blocked_requests = threading.local()
 
-class BlockAll(cookiejar.CookiePolicy):
-    return_ok = set_ok = domain_return_ok = path_return_ok = lambda self, *args, **kwargs: False
-    netscape = True
-    rfc2965 = hide_cookie2 = False
 
+class RequestBlockedError(Exception):
+    """Raised when an API client is about to send a request from a thread where requests are blocked."""
 
-class RetryWithMaxBackoff(Retry):
-    def get_backoff_time(self):
-        return min(utils._client_config._DefaultConfig().max_retry_backoff, super().get_backoff_time())
 
+@contextmanager
+def block_requests():
+    """Makes every API client raise RequestBlockedError instead of sending requests from this thread, until the context
+    exits."""
+    previous = getattr(_blocked_requests, "active", False)
+    _blocked_requests.active = True
+    try:
+        yield
+    finally:
+        _blocked_requests.active = previous
 
-def _init_requests_session():
-    session = Session()
-    session_with_retry = Session()
 
-    cookies_policy = BlockAll()
-    session.cookies.set_policy(cookies_policy)
-    session_with_retry.cookies.set_policy(cookies_policy)
+class LazyAPI:
+    """Creates an API the first time it is accessed on an instance of the class it is declared on.
 
-    config = utils._client_config._DefaultConfig()
-    adapter = HTTPAdapter(
-        max_retries=RetryWithMaxBackoff(
-            total=config.max_retries,
-            read=0,
-            backoff_factor=0.5,
-            status_forcelist=[429],
-            method_whitelist=False,
-            raise_on_status=False,
-        ),
-        pool_maxsize=config.max_connection_pool_size,
-    )
-    adapter_with_retry = HTTPAdapter(
-        max_retries=RetryWithMaxBackoff(
-            total=config.max_retries,
-            backoff_factor=0.5,
-            status_forcelist=config.status_forcelist,
-            method_whitelist=False,
-            raise_on_status=False,
-        ),
-        pool_maxsize=config.max_connection_pool_size,
-    )
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    session_with_retry.mount("http://", adapter_with_retry)
-    session_with_retry.mount("https://", adapter_with_retry)
+    The API is stored in the instance __dict__ under the same name, so later accesses are plain attribute lookups which
+    never reach this descriptor.
 
-    if config.disable_ssl:
-        import urllib3
+    Args:
+        name (str): The attribute name the descriptor is assigned to. It is passed explicitly, as __set_name__ is only
+            called from Python 3.6.
+        factory (Callable[[Any], APIClient]): Creates the API, given the instance it is accessed on.
+    """
 
-        urllib3.disable_warnings()
-        session.verify = False
-        session_with_retry.verify = False
+    def __init__(self, name: str, factory: Callable[[Any], "APIClient"]):
+        self._name = name
+        self._factory = factory
+        self._lock = threading.Lock()
 
-    return session, session_with_retry
-
-
-_REQUESTS_SESSION, _REQUESTS_SESSION_WITH_RETRY = _init_requests_session()
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with self._lock:
+            api = instance.__dict__.get(self._name)
+            if api is None:
+                api = instance.__dict__[self._name] = self._factory(instance)
+        return api
 
 
 class APIClient:
@@ -114,14 +99,25 @@ class APIClient:
         "/relationships/list",
         "/relationships/byids",
     }
+    # Retryable POST endpoints which only read, so that identical concurrent requests to them can share a response
+    COALESCABLE_POST_ENDPOINTS = RETRYABLE_POST_ENDPOINTS - {
+        "/timeseries/data",
+        "/timeseries/data/delete",
+        "/sequences/data",
+        "/sequences/data/delete",
+    }
 
-    def __init__(self, config: utils._client_config.ClientConfig, api_version: str = None, cognite_client=None):
-        self._request_session = _REQUESTS_SESSION
-        self._request_session_with_retry = _REQUESTS_SESSION_WITH_RETRY
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        utils._profiling.profile_api_methods(cls)
+        utils._tracing.trace_api_methods(cls)
 
+    def __init__(self, config: utils._client_config.ClientConfig, api_version: str = None, cognite_client=None):
         self._config = config
         self._api_version = api_version
         self._cognite_client = cognite_client
+        self._static_headers = None
+        self._static_headers_key = None
 
         self._CREATE_LIMIT = 1000
         self._LIST_LIMIT = 1000
@@ -129,58 +125,255 @@ class APIClient:
         self._DELETE_LIMIT = 1000
         self._UPDATE_LIMIT = 1000
 
+    @property
+    def _request_session(self) -> Session:
+        # Used for URLs outside the API, like file upload and download links
+        return self._config.sessions.get("external")
+
+    @property
+    def _api_session(self) -> Session:
+        return self._config.sessions.get("api")
+
     def _delete(self, url_path: str, params: Dict[str, Any] = None, headers: Dict[str, Any] = None):
         return self._do_request("DELETE", url_path, params=params, headers=headers, timeout=self._config.timeout)
 
-    def _get(self, url_path: str, params: Dict[str, Any] = None, headers: Dict[str, Any] = None):
-        return self._do_request("GET", url_path, params=params, headers=headers, timeout=self._config.timeout)
+    def _get(self, url_path: str, params: Dict[str, Any] = None, headers: Dict[str, Any] = None, stream: bool = False):
+        return self._do_request(
+            "GET", url_path, params=params, headers=headers, timeout=self._config.timeout, stream=stream
+        )
 
     def _post(
-        self, url_path: str, json: Dict[str, Any] = None, params: Dict[str, Any] = None, headers: Dict[str, Any] = None
+        self,
+        url_path: str,
+        json: Dict[str, Any] = None,
+        params: Dict[str, Any] = None,
+        headers: Dict[str, Any] = None,
+        stream: bool = False,
     ):
         return self._do_request(
-            "POST", url_path, json=json, headers=headers, params=params, timeout=self._config.timeout
+            "POST", url_path, json=json, headers=headers, params=params, timeout=self._config.timeout, stream=stream
         )
 
     def _put(self, url_path: str, json: Dict[str, Any] = None, headers: Dict[str, Any] = None):
         return self._do_request("PUT", url_path, json=json, headers=headers, timeout=self._config.timeout)
 
     def _do_request(self, method: str, url_path: str, **kwargs):
+        if getattr(_blocked_requests, "active", False):
+            raise RequestBlockedError("{} {}".format(method, url_path))
         is_retryable, full_url = self._resolve_url(method, url_path)
+        json_payload = kwargs.get("json")
 
+        coalescer = self._config.coalescer
+        if coalescer is not None and self._is_coalescable(method, url_path, is_retryable, kwargs):
+            res, request_info = self._send_coalesced_request(coalescer, method, url_path, full_url, **kwargs)
+        else:
+            res, request_info = self._send_request(method, url_path, full_url, is_retryable, **kwargs)
+
+        if not self._status_is_valid(res.status_code):
+            if res.status_code == 401 and self._config.token_cache is not None:
+                self._config.token_cache.invalidate()
+            try:
+                self._raise_API_error(res, payload=json_payload)
+            except CogniteAPIError as e:
+                if request_info is not None:
+                    self._config.hooks.on_error(request_info, e)
+                raise
+        self._log_request(res, payload=json_payload)
+        return res
+
+    def _is_coalescable(self, method: str, url_path: str, is_retryable: bool, kwargs: Dict) -> bool:
+        if kwargs.get("stream") or not is_retryable:
+            return False
+        return method == "GET" or (method == "POST" and url_path in self.COALESCABLE_POST_ENDPOINTS)
+
+    def _send_coalesced_request(
+        self, coalescer: "utils._coalescing.RequestCoalescer", method: str, url_path: str, full_url: str, **kwargs
+    ) -> Tuple[Response, Optional["utils._hooks.RequestInfo"]]:
+        codec = self._config.codec
         json_payload = kwargs.get("json")
-        headers = self._configure_headers(self._config.headers.copy())
+        headers = self._configure_headers(self._config.headers)
         headers.update(kwargs.get("headers") or {})
+        params_and_headers = (
+            codec.dumps(kwargs.get("params")),
+            tuple(sorted((k, str(v)) for k, v in (kwargs.get("headers") or {}).items())),
+            utils._coalescing.get_credentials_key(headers),
+        )
 
+        identifiers = utils._coalescing.get_byids_identifiers(url_path, json_payload)
+        if identifiers is not None:
+
+            def send_merged(merged_identifiers):
+                merged_kwargs = dict(kwargs, json=dict(json_payload, items=merged_identifiers))
+                return self._send_request(method, url_path, full_url, True, **merged_kwargs)
+
+            def split(res, own_identifiers):
+                if not self._status_is_valid(res.status_code):
+                    return None
+                res = utils._coalescing.select_items(res, own_identifiers, codec.dumps)
+                self._parse_json_with_codec(res, codec)
+                return res
+
+            other_fields = {k: v for k, v in json_payload.items() if k != "items"}
+            key = (full_url, codec.dumps(other_fields)) + params_and_headers
+            result = coalescer.do_batched(key, identifiers, send_merged, split)
+            if result is not None:
+                return result
+            return self._send_request(method, url_path, full_url, True, **kwargs)
+
+        key = (method, full_url, codec.dumps(json_payload)) + params_and_headers
+        (res, request_info), leader = coalescer.do(
+            key, lambda: self._send_request(method, url_path, full_url, True, **kwargs)
+        )
+        if leader:
+            return res, request_info
+        # res.json() returns a new object on every call, so callers can not see each other's changes to the body
+        return utils._coalescing.copy_response(res), None
+
+    def _send_request(
+        self, method: str, url_path: str, full_url: str, is_retryable: bool, **kwargs
+    ) -> Tuple[Response, Optional["utils._hooks.RequestInfo"]]:
+        json_payload = kwargs.get("json")
+        headers = self._configure_headers(self._config.headers)
+        headers.update(kwargs.get("headers") or {})
+        original_kwargs = dict(kwargs)
+
+        codec = self._config.codec
+        content_encoding = None
         if json_payload:
-            data = _json.dumps(json_payload, default=utils._auxiliary.json_dump_default)
-            kwargs["data"] = data
             if method in ["PUT", "POST"] and not os.getenv("COGNITE_DISABLE_GZIP", False):
-                kwargs["data"] = gzip.compress(data.encode())
-                headers["Content-Encoding"] = "gzip"
+                kwargs["data"], content_encoding = self._config.compression.compress(codec.iterdumps(json_payload))
+                if content_encoding is not None:
+                    headers["Content-Encoding"] = content_encoding
+            else:
+                kwargs["data"] = codec.dumps(json_payload)
 
         kwargs["headers"] = headers
 
-        if is_retryable:
-            res = self._request_session_with_retry.request(method=method, url=full_url, **kwargs)
-        else:
-            res = self._request_session.request(method=method, url=full_url, **kwargs)
+        hooks = self._config.hooks
+        request_info = None
+        if hooks:
+            request_info = utils._hooks.RequestInfo(method, url_path, full_url, headers, kwargs.get("data"))
+            hooks.before_request(request_info)
 
-        if not self._status_is_valid(res.status_code):
-            self._raise_API_error(res, payload=json_payload)
-        self._log_request(res, payload=json_payload)
-        return res
+        try:
+            with utils._profiling.stage("http") as stage:
+                res = self._send_with_retries(method, url_path, full_url, is_retryable, request_info, **kwargs)
+                if not kwargs.get("stream"):
+                    stage.add_bytes(len(res.content))
+        except Exception as e:
+            if request_info is not None:
+                hooks.on_error(request_info, e)
+            raise
+        self._parse_json_with_codec(res, codec)
+        if request_info is not None:
+            hooks.after_response(request_info, res)
+        if res.status_code == 415 and content_encoding is not None:
+            if self._config.compression.negotiate(content_encoding, res.headers.get("Accept-Encoding")):
+                return self._send_request(method, url_path, full_url, is_retryable, **original_kwargs)
+        return res, request_info
+
+    def _send_with_retries(
+        self,
+        method: str,
+        url_path: str,
+        url: str,
+        is_retryable: bool,
+        request_info: Optional["utils._hooks.RequestInfo"],
+        **kwargs
+    ) -> Response:
+        retry_policy = self._config.retry_policy
+        circuit_breaker = self._config.circuit_breaker
+        retry_policy.on_request()
+        retries, backoff = 0, 0.0
+        while True:
+            if circuit_breaker is not None:
+                circuit_breaker.before_attempt(url_path)
+            res, error = None, None
+            try:
+                res = self._send_attempt(method, url_path, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = e
+            except Exception:
+                if circuit_breaker is not None:
+                    circuit_breaker.record(url_path, failed=True)
+                raise
+            status = res.status_code if res is not None else None
+            if circuit_breaker is not None:
+                circuit_breaker.record(url_path, failed=error is not None or status >= 500)
+            # Requests to an endpoint family which keeps failing are not retried while its circuit is open
+            circuit_open = circuit_breaker is not None and circuit_breaker.is_open(url_path)
+            if circuit_open or not retry_policy.should_retry(retries, is_retryable, status, error):
+                if error is not None:
+                    raise error
+                return res
+            backoff = retry_policy.get_backoff(backoff, res)
+            if request_info is not None:
+                request_info.retries += 1
+                request_info.backoff_time += backoff
+                self._config.hooks.on_retry(request_info, status, error)
+            if circuit_breaker is None:
+                time.sleep(backoff)
+            elif circuit_breaker.wait(url_path, backoff):
+                if error is not None:
+                    raise error
+                return res
+            if res is not None:
+                res.close()
+            retries += 1
+
+    def _send_attempt(self, method: str, url_path: str, url: str, **kwargs) -> Response:
+        # Every attempt takes a token, as retries are requests to the API too
+        rate_limiter = self._config.rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.acquire(url_path)
+        session = self._config.sessions.get("http2") if self._config.http2 else self._api_session
+        limiter = self._config.concurrency_limiter
+        if limiter is None:
+            return session.request(method=method, url=url, **kwargs)
+        limiter.acquire()
+        latency, throttled = None, False
+        try:
+            start = time.monotonic()
+            res = session.request(method=method, url=url, **kwargs)
+            latency = time.monotonic() - start
+            throttled = res.status_code in utils._rate_limiting.THROTTLING_STATUS_CODES
+            return res
+        finally:
+            limiter.release(latency=latency, throttled=throttled)
+
+    @staticmethod
+    def _parse_json_with_codec(res: Response, codec: "utils._codec.JsonCodec"):
+        # Replaces res.json with a method parsing the body with the configured codec. Every call returns a new object,
+        # so callers can change it freely. Call it once per response and keep the result.
+        def json(**kwargs):
+            with utils._profiling.stage("decode"):
+                return codec.loads(res.content)
+
+        res.json = json
 
     def _configure_headers(self, additional_headers):
+        headers = CaseInsensitiveDict(self._get_static_headers())
+        if isinstance(self._config.token, Callable):
+            headers["Authorization"] = "Bearer {}".format(self._config.token_cache.get())
+        headers.update(additional_headers)
+        return headers
+
+    def _get_static_headers(self):
+        # The headers only depend on these config values, so they are built once and rebuilt if any of them change
+        key = (self._config.api_key, self._config.token, self._config.client_name)
+        if self._static_headers is None or key != self._static_headers_key:
+            self._static_headers = self._build_static_headers()
+            self._static_headers_key = key
+        return self._static_headers
+
+    def _build_static_headers(self):
         headers = CaseInsensitiveDict()
         headers.update(requests.utils.default_headers())
         if self._config.token is None:
             headers["api-key"] = self._config.api_key
         elif isinstance(self._config.token, str):
             headers["Authorization"] = "Bearer {}".format(self._config.token)
-        elif isinstance(self._config.token, Callable):
-            headers["Authorization"] = "Bearer {}".format(self._config.token())
-        else:
+        elif not isinstance(self._config.token, Callable):
             raise TypeError("'token' must be str, Callable, or None.")
         headers["content-type"] = "application/json"
         headers["accept"] = "application/json"
@@ -190,7 +383,6 @@ class APIClient:
             headers["User-Agent"] += " " + utils._auxiliary.get_user_agent()
         else:
             headers["User-Agent"] = utils._auxiliary.get_user_agent()
-        headers.update(additional_headers)
         return headers
 
     def _resolve_url(self, method: str, url_path: str):
@@ -226,13 +418,21 @@ class APIClient:
     ):
         cls = cls or self._LIST_CLASS._RESOURCE
         resource_path = resource_path or self._RESOURCE_PATH
+        cache = self._get_resource_cache(resource_path, [{"id": id}], params, headers)
+        if cache is not None:
+            cached = cache.get(resource_path, [{"id": id}])
+            if cached:
+                return cls._load(cached[0], cognite_client=self._cognite_client)
         try:
             res = self._get(
                 url_path=utils._auxiliary.interpolate_and_url_encode(resource_path + "/{}", str(id)),
                 params=params,
                 headers=headers,
             )
-            return cls._load(res.json(), cognite_client=self._cognite_client)
+            item = res.json()
+            if cache is not None:
+                cache.put(resource_path, [item])
+            return cls._load(item, cognite_client=self._cognite_client)
         except CogniteAPIError as e:
             if e.code != 404:
                 raise
@@ -250,7 +450,10 @@ class APIClient:
         cls = cls or self._LIST_CLASS
         resource_path = resource_path or self._RESOURCE_PATH
         all_ids = self._process_ids(ids, external_ids, wrap_ids=wrap_ids)
-        id_chunks = utils._auxiliary.split_into_chunks(all_ids, self._RETRIEVE_LIMIT)
+        cache = self._get_resource_cache(resource_path, all_ids, None, headers)
+        cached_items = cache.get(resource_path, all_ids) if cache is not None else {}
+        missing_ids = [identifier for i, identifier in enumerate(all_ids) if i not in cached_items]
+        id_chunks = utils._auxiliary.split_into_chunks(missing_ids, self._RETRIEVE_LIMIT)
 
         ignore_unknown = {} if ignore_unknown_ids is None else {"ignoreUnknownIds": ignore_unknown_ids}
         tasks = [
@@ -258,7 +461,12 @@ class APIClient:
             for id_chunk in id_chunks
         ]
         tasks_summary = utils._concurrency.execute_tasks_concurrently(
-            self._post, tasks, max_workers=self._config.max_workers
+            self._post,
+            tasks,
+            max_workers=self._config.max_workers,
+            executor=self._config.executor,
+            max_in_flight=self._config.max_workers,
+            fail_fast=True,
         )
 
         if tasks_summary.exceptions:
@@ -270,11 +478,41 @@ class APIClient:
                 raise
 
         retrieved_items = tasks_summary.joined_results(lambda res: res.json()["items"])
+        if cache is not None:
+            cache.put(resource_path, retrieved_items)
+            retrieved_items = self._merge_cached_items(all_ids, cached_items, retrieved_items)
 
         if self._is_single_identifier(ids, external_ids):
             return cls._RESOURCE._load(retrieved_items[0], cognite_client=self._cognite_client)
         return cls._load(retrieved_items, cognite_client=self._cognite_client)
 
+    def _get_resource_cache(
+        self, resource_path: str, identifiers: List, params: Optional[Dict], headers: Optional[Dict]
+    ) -> Optional["utils._cache.ResourceCache"]:
+        cache = self._config.resource_cache
+        if cache is None or resource_path not in cache.resource_paths or params or headers:
+            return None
+        keys = [utils._cache.get_identifier_key(i) if isinstance(i, dict) else None for i in identifiers]
+        # Requests with duplicate or unwrapped identifiers are left to the API to reject
+        if None in keys or len(set(keys)) != len(keys):
+            return None
+        return cache
+
+    @staticmethod
+    def _merge_cached_items(identifiers: List[Dict], cached_items: Dict[int, Dict], retrieved_items: List[Dict]):
+        retrieved = {}
+        for item in retrieved_items:
+            for field in utils._cache.IDENTIFIER_FIELDS:
+                if item.get(field) is not None:
+                    retrieved[(field, item[field])] = item
+        items = []
+        for i, identifier in enumerate(identifiers):
+            item = cached_items.get(i) or retrieved.get(utils._cache.get_identifier_key(identifier))
+            # Unknown identifiers are skipped when retrieving with ignore_unknown_ids
+            if item is not None:
+                items.append(item)
+        return items
+
     def _list_generator(
         self,
         method: str,
@@ -298,6 +536,7 @@ class APIClient:
         next_cursor = None
         filter = filter or {}
         current_items = []
+        stream = self._config.streaming_json_decode
         while True:
             if limit:
                 num_of_remaining_items = limit - total_items_retrieved
@@ -310,28 +549,33 @@ class APIClient:
                 params["cursor"] = next_cursor
                 if sort is not None:
                     params["sort"] = sort
-                res = self._get(url_path=resource_path, params=params, headers=headers)
+                res = self._get(url_path=resource_path, params=params, headers=headers, stream=stream)
             elif method == "POST":
                 body = {"filter": filter, "limit": current_limit, "cursor": next_cursor, **(other_params or {})}
                 if sort is not None:
                     body["sort"] = sort
-                res = self._post(url_path=resource_path + "/list", json=body, headers=headers)
+                res = self._post(url_path=resource_path + "/list", json=body, headers=headers, stream=stream)
             else:
                 raise ValueError("_list_generator parameter `method` must be GET or POST, not {}".format(method))
-            last_received_items = res.json()["items"]
-            total_items_retrieved += len(last_received_items)
+            if stream:
+                # Items are decoded and yielded as the page is downloaded
+                page = utils._streaming.ListResponseReader(res)
+                received_items = page
+            else:
+                page = res.json()
+                received_items = page["items"]
 
-            if not chunk_size:
-                for item in last_received_items:
+            for item in received_items:
+                total_items_retrieved += 1
+                if not chunk_size:
                     yield cls._RESOURCE._load(item, cognite_client=self._cognite_client)
-            else:
-                current_items.extend(last_received_items)
-                if len(current_items) >= chunk_size:
-                    items_to_yield = current_items[:chunk_size]
-                    current_items = current_items[chunk_size:]
-                    yield cls._load(items_to_yield, cognite_client=self._cognite_client)
+                else:
+                    current_items.append(item)
+                    if len(current_items) >= chunk_size:
+                        yield cls._load(current_items, cognite_client=self._cognite_client)
+                        current_items = []
 
-            next_cursor = res.json().get("nextCursor")
+            next_cursor = page.next_cursor if stream else page.get("nextCursor")
             if total_items_retrieved == limit or next_cursor is None:
                 if chunk_size and current_items:
                     yield cls._load(current_items, cognite_client=self._cognite_client)
@@ -348,7 +592,21 @@ class APIClient:
         partitions=None,
         sort=None,
         headers: Dict = None,
+        use_disk_cache: bool = True,
     ):
+        disk_cache = self._config.disk_cache
+        if (
+            use_disk_cache
+            and disk_cache is not None
+            and method == "POST"
+            and limit in [None, -1, float("inf")]
+            and (resource_path or self._RESOURCE_PATH) in disk_cache.resource_paths
+            and not other_params
+            and sort is None
+            and headers is None
+            and "lastUpdatedTime" not in (filter or {})
+        ):
+            return self._list_with_disk_cache(disk_cache, cls, resource_path, filter, partitions)
         if partitions:
             if limit not in [None, -1, float("inf")]:
                 raise ValueError("When using partitions, limit should be `None`, `-1` or `inf`.")
@@ -380,6 +638,55 @@ class APIClient:
             items.extend(resource_list.data)
         return cls(items, cognite_client=self._cognite_client)
 
+    def _list_with_disk_cache(
+        self, disk_cache: "utils._disk_cache.DiskCache", cls, resource_path: str, filter: Dict, partitions
+    ):
+        cls = cls or self._LIST_CLASS
+        resource_path = resource_path or self._RESOURCE_PATH
+        scope = self._get_disk_cache_scope()
+        query = json.dumps(filter or {}, sort_keys=True)
+        started_at = time.time()
+        previous = disk_cache.get_list_query(scope, resource_path, query)
+
+        def list_resources(filter):
+            resources = self._list(
+                method="POST",
+                cls=cls,
+                resource_path=resource_path,
+                filter=filter,
+                partitions=partitions,
+                use_disk_cache=False,
+            )
+            return [resource.dump(camel_case=True) for resource in resources]
+
+        def is_cacheable(items):
+            return all(item.get("id") is not None and item.get("lastUpdatedTime") is not None for item in items)
+
+        if previous is not None:
+            # Resources updated since the last listing may have started or stopped matching the filter. Finding those
+            # which stopped matching takes listing every updated resource, not only the matching ones.
+            updated_filter = {"lastUpdatedTime": {"min": previous.synced_at}}
+            updated = list_resources(updated_filter)
+            matching = list_resources({**filter, **updated_filter}) if filter else updated
+            if is_cacheable(updated) and is_cacheable(matching):
+                updated_ids = {item["id"] for item in updated}
+                matching_ids = [item["id"] for item in matching]
+                # Resources keep the position they were first listed in, and new ones are added at the end
+                still_matching = set(matching_ids)
+                ids = [item_id for item_id in previous.ids if item_id not in updated_ids or item_id in still_matching]
+                listed = set(ids)
+                ids.extend(item_id for item_id in matching_ids if item_id not in listed)
+                disk_cache.store(scope, resource_path, query, started_at, matching, ids, full=False)
+                return cls._load(disk_cache.load(scope, resource_path, ids), cognite_client=self._cognite_client)
+
+        items = list_resources(filter)
+        if is_cacheable(items):
+            disk_cache.store(scope, resource_path, query, started_at, items, [item["id"] for item in items], full=True)
+        return cls._load(items, cognite_client=self._cognite_client)
+
+    def _get_disk_cache_scope(self) -> str:
+        return "{}/{}".format(self._config.base_url, self._config.project)
+
     def _list_partitioned(
         self,
         partitions,
@@ -395,23 +702,28 @@ class APIClient:
         def get_partition(partition):
             next_cursor = None
             retrieved_items = []
-            while True:
-                body = {
-                    "filter": filter or {},
-                    "limit": self._LIST_LIMIT,
-                    "cursor": next_cursor,
-                    "partition": partition,
-                    **(other_params or {}),
-                }
-                res = self._post(url_path=resource_path + "/list", json=body, headers=headers)
-                retrieved_items.extend(res.json()["items"])
-                next_cursor = res.json().get("nextCursor")
-                if next_cursor is None:
-                    break
+            with utils._tracing.span(self._config.tracer, "list.partition", {"cognite.partition": partition}) as span:
+                while True:
+                    body = {
+                        "filter": filter or {},
+                        "limit": self._LIST_LIMIT,
+                        "cursor": next_cursor,
+                        "partition": partition,
+                        **(other_params or {}),
+                    }
+                    res = self._post(url_path=resource_path + "/list", json=body, headers=headers)
+                    res_json = res.json()
+                    retrieved_items.extend(res_json["items"])
+                    next_cursor = res_json.get("nextCursor")
+                    if next_cursor is None:
+                        break
+                span.set_attribute("cognite.items", len(retrieved_items))
             return retrieved_items
 
         tasks = [("{}/{}".format(i + 1, partitions),) for i in range(partitions)]
-        tasks_summary = utils._concurrency.execute_tasks_concurrently(get_partition, tasks, max_workers=partitions)
+        tasks_summary = utils._concurrency.execute_tasks_concurrently(
+            get_partition, tasks, max_workers=partitions, executor=self._config.executor, fail_fast=True
+        )
         if tasks_summary.exceptions:
             raise tasks_summary.exceptions[0]
         return cls._load(tasks_summary.joined_results(), cognite_client=self._cognite_client)
@@ -465,7 +777,9 @@ class APIClient:
             items_split.append({"items": items_chunk})
 
         tasks = [(resource_path, task_items, params, headers) for task_items in items_split]
-        summary = utils._concurrency.execute_tasks_concurrently(self._post, tasks, max_workers=self._config.max_workers)
+        summary = utils._concurrency.execute_tasks_concurrently(
+            self._post, tasks, max_workers=self._config.max_workers, executor=self._config.executor
+        )
 
         def unwrap_element(el):
             if isinstance(el, dict):
@@ -504,6 +818,8 @@ class APIClient:
     ):
         resource_path = resource_path or self._RESOURCE_PATH
         all_ids = self._process_ids(ids, external_ids, wrap_ids)
+        identifiers = [i if isinstance(i, dict) else {"id": i} for i in all_ids]
+        self._invalidate_cached_resources(resource_path, identifiers, extra_body_fields)
         id_chunks = utils._auxiliary.split_into_chunks(all_ids, self._DELETE_LIMIT)
         tasks = [
             {
@@ -514,11 +830,19 @@ class APIClient:
             }
             for chunk in id_chunks
         ]
-        summary = utils._concurrency.execute_tasks_concurrently(self._post, tasks, max_workers=self._config.max_workers)
+        summary = utils._concurrency.execute_tasks_concurrently(
+            self._post, tasks, max_workers=self._config.max_workers, executor=self._config.executor
+        )
+        # Again once the requests are done, in case they were retrieved and cached while being deleted
+        self._invalidate_cached_resources(resource_path, identifiers, extra_body_fields)
         summary.raise_compound_exception_if_failed_tasks(
             task_unwrap_fn=lambda task: task["json"]["items"],
             task_list_element_unwrap_fn=utils._auxiliary.unwrap_identifer,
         )
+        disk_cache = self._config.disk_cache
+        if disk_cache is not None and resource_path in disk_cache.resource_paths:
+            # Descendants deleted with recursive are not known, and are only removed by the next full listing
+            disk_cache.delete(self._get_disk_cache_scope(), resource_path, identifiers)
 
     def _update_multiple(
         self,
@@ -542,6 +866,7 @@ class APIClient:
                 patch_objects.append(item.dump())
             else:
                 raise ValueError("update item must be of type CogniteResource or CogniteUpdate")
+        self._invalidate_cached_resources(resource_path, patch_objects)
         patch_object_chunks = utils._auxiliary.split_into_chunks(patch_objects, self._UPDATE_LIMIT)
 
         tasks = [
@@ -550,8 +875,10 @@ class APIClient:
         ]
 
         tasks_summary = utils._concurrency.execute_tasks_concurrently(
-            self._post, tasks, max_workers=self._config.max_workers
+            self._post, tasks, max_workers=self._config.max_workers, executor=self._config.executor
         )
+        # Again once the requests are done, in case they were retrieved and cached while being updated
+        self._invalidate_cached_resources(resource_path, patch_objects)
         tasks_summary.raise_compound_exception_if_failed_tasks(
             task_unwrap_fn=lambda task: task["json"]["items"],
             task_list_element_unwrap_fn=lambda el: utils._auxiliary.unwrap_identifer(el),
@@ -562,6 +889,16 @@ class APIClient:
             return cls._RESOURCE._load(updated_items[0], cognite_client=self._cognite_client)
         return cls._load(updated_items, cognite_client=self._cognite_client)
 
+    def _invalidate_cached_resources(self, resource_path: str, identifiers: List[Dict], extra_body_fields: Dict = None):
+        cache = self._config.resource_cache
+        if cache is None or resource_path not in cache.resource_paths:
+            return
+        if extra_body_fields and extra_body_fields.get("recursive"):
+            # Descendants of the deleted resources are deleted too, and it is not known which they are
+            cache.clear(resource_path)
+        else:
+            cache.invalidate(resource_path, identifiers)
+
     def _search(
         self,
         search: Dict,
@@ -689,6 +1026,8 @@ class APIClient:
 
     @staticmethod
     def _log_request(res: Response, **kwargs):
+        if not log.isEnabledFor(logging.DEBUG):
+            return
         method = res.request.method
         url = res.request.url
         status_code = res.status_code
@@ -0,0 +1,537 @@
+import asyncio
+import os
+from collections import UserList
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import requests
+from requests import Response
+
+from cognite.client import utils
+from cognite.client._api_client import APIClient
+from cognite.client.data_classes._base import CogniteFilter, CogniteResource, CogniteUpdate
+from cognite.client.exceptions import CogniteAPIError, CogniteNotFoundError
+
+
+class AsyncAPIClient:
+    """Sends the requests of an API with async I/O.
+
+    Has a coroutine counterpart of each request method of APIClient in REQUEST_METHODS, taking the same arguments and
+    returning the same data classes. Requests are built, retried and checked for errors with the helpers of the
+    APIClient, but they are sent with an AsyncHTTPClient, and wait for responses, retries and rate limits on the event
+    loop instead of in a thread.
+
+    The resource cache, disk cache, request coalescing, circuit breaker, adaptive concurrency, tracing and profiling
+    are only implemented by the APIClient.
+
+    Args:
+        api (APIClient): The API to send requests for.
+        http_client (AsyncHTTPClient): Sends the requests.
+    """
+
+    REQUEST_METHODS = (
+        "_delete",
+        "_get",
+        "_post",
+        "_put",
+        "_retrieve",
+        "_retrieve_multiple",
+        "_list",
+        "_aggregate",
+        "_create_multiple",
+        "_delete_multiple",
+        "_update_multiple",
+        "_search",
+    )
+
+    def __init__(self, api: APIClient, http_client: "utils._async_http.AsyncHTTPClient"):
+        self._api = api
+        self._config = api._config
+        self._http_client = http_client
+
+    async def _delete(self, url_path: str, params: Dict[str, Any] = None, headers: Dict[str, Any] = None):
+        return await self._do_request("DELETE", url_path, params=params, headers=headers, timeout=self._config.timeout)
+
+    async def _get(
+        self, url_path: str, params: Dict[str, Any] = None, headers: Dict[str, Any] = None, stream: bool = False
+    ):
+        # The body is read before the response is returned, also when it is streamed
+        return await self._do_request("GET", url_path, params=params, headers=headers, timeout=self._config.timeout)
+
+    async def _post(
+        self,
+        url_path: str,
+        json: Dict[str, Any] = None,
+        params: Dict[str, Any] = None,
+        headers: Dict[str, Any] = None,
+        stream: bool = False,
+    ):
+        return await self._do_request(
+            "POST", url_path, json=json, headers=headers, params=params, timeout=self._config.timeout
+        )
+
+    async def _put(self, url_path: str, json: Dict[str, Any] = None, headers: Dict[str, Any] = None):
+        return await self._do_request("PUT", url_path, json=json, headers=headers, timeout=self._config.timeout)
+
+    async def _do_request(self, method: str, url_path: str, **kwargs) -> Response:
+        is_retryable, full_url = self._api._resolve_url(method, url_path)
+        json_payload = kwargs.get("json")
+        res, request_info = await self._send_request(method, url_path, full_url, is_retryable, **kwargs)
+
+        if not self._api._status_is_valid(res.status_code):
+            if res.status_code == 401 and self._config.token_cache is not None:
+                self._config.token_cache.invalidate()
+            try:
+                self._api._raise_API_error(res, payload=json_payload)
+            except CogniteAPIError as e:
+                if request_info is not None:
+                    self._config.hooks.on_error(request_info, e)
+                raise
+        self._api._log_request(res, payload=json_payload)
+        return res
+
+    async def _send_request(
+        self, method: str, url_path: str, full_url: str, is_retryable: bool, **kwargs
+    ) -> Tuple[Response, Optional["utils._hooks.RequestInfo"]]:
+        json_payload = kwargs.get("json")
+        if callable(self._config.token):
+            # The token factory is called from a thread, as fetching a new token blocks
+            loop = asyncio.get_event_loop()
+            headers = await loop.run_in_executor(None, self._api._configure_headers, self._config.headers)
+        else:
+            headers = self._api._configure_headers(self._config.headers)
+        headers.update(kwargs.get("headers") or {})
+
+        codec = self._config.codec
+        data, content_encoding = None, None
+        if json_payload:
+            if method in ["PUT", "POST"] and not os.getenv("COGNITE_DISABLE_GZIP", False):
+                data, content_encoding = self._config.compression.compress(codec.iterdumps(json_payload))
+                if content_encoding is not None:
+                    headers["Content-Encoding"] = content_encoding
+            else:
+                data = codec.dumps(json_payload)
+
+        hooks = self._config.hooks
+        request_info = None
+        if hooks:
+            request_info = utils._hooks.RequestInfo(method, url_path, full_url, headers, data)
+            hooks.before_request(request_info)
+
+        try:
+            res = await self._send_with_retries(
+                method,
+                url_path,
+                full_url,
+                is_retryable,
+                request_info,
+                headers=headers,
+                data=data,
+                params=kwargs.get("params"),
+                timeout=kwargs.get("timeout"),
+            )
+        except Exception as e:
+            if request_info is not None:
+                hooks.on_error(request_info, e)
+            raise
+        self._api._parse_json_with_codec(res, codec)
+        if request_info is not None:
+            hooks.after_response(request_info, res)
+        if res.status_code == 415 and content_encoding is not None:
+            if self._config.compression.negotiate(content_encoding, res.headers.get("Accept-Encoding")):
+                return await self._send_request(method, url_path, full_url, is_retryable, **kwargs)
+        return res, request_info
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        url_path: str,
+        url: str,
+        is_retryable: bool,
+        request_info: Optional["utils._hooks.RequestInfo"],
+        **kwargs
+    ) -> Response:
+        retry_policy = self._config.retry_policy
+        retry_policy.on_request()
+        retries, backoff = 0, 0.0
+        while True:
+            res, error = None, None
+            try:
+                res = await self._send_attempt(method, url_path, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = e
+            status = res.status_code if res is not None else None
+            if not retry_policy.should_retry(retries, is_retryable, status, error):
+                if error is not None:
+                    raise error
+                return res
+            backoff = retry_policy.get_backoff(backoff, res)
+            if request_info is not None:
+                request_info.retries += 1
+                request_info.backoff_time += backoff
+                self._config.hooks.on_retry(request_info, status, error)
+            await asyncio.sleep(backoff)
+            retries += 1
+
+    async def _send_attempt(self, method: str, url_path: str, url: str, **kwargs) -> Response:
+        rate_limiter = self._config.rate_limiter
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async(url_path)
+        return await self._http_client.request(method, url, **kwargs)
+
+    async def _retrieve(
+        self, id: Union[int, str], cls=None, resource_path: str = None, params: Dict = None, headers: Dict = None
+    ):
+        cls = cls or self._api._LIST_CLASS._RESOURCE
+        resource_path = resource_path or self._api._RESOURCE_PATH
+        try:
+            res = await self._get(
+                url_path=utils._auxiliary.interpolate_and_url_encode(resource_path + "/{}", str(id)),
+                params=params,
+                headers=headers,
+            )
+            return cls._load(res.json(), cognite_client=self._api._cognite_client)
+        except CogniteAPIError as e:
+            if e.code != 404:
+                raise
+
+    async def _retrieve_multiple(
+        self,
+        wrap_ids: bool,
+        cls=None,
+        resource_path: str = None,
+        ids: Union[List[int], int] = None,
+        external_ids: Union[List[str], str] = None,
+        ignore_unknown_ids=None,
+        headers: Dict = None,
+    ):
+        cls = cls or self._api._LIST_CLASS
+        resource_path = resource_path or self._api._RESOURCE_PATH
+        all_ids = self._api._process_ids(ids, external_ids, wrap_ids=wrap_ids)
+        id_chunks = utils._auxiliary.split_into_chunks(all_ids, self._api._RETRIEVE_LIMIT)
+
+        ignore_unknown = {} if ignore_unknown_ids is None else {"ignoreUnknownIds": ignore_unknown_ids}
+        tasks = [
+            {"url_path": resource_path + "/byids", "json": {"items": id_chunk, **ignore_unknown}, "headers": headers}
+            for id_chunk in id_chunks
+        ]
+        tasks_summary = await execute_tasks_concurrently(self._post, tasks, fail_fast=True)
+
+        if tasks_summary.exceptions:
+            try:
+                utils._concurrency.collect_exc_info_and_raise(tasks_summary.exceptions)
+            except CogniteNotFoundError:
+                if self._api._is_single_identifier(ids, external_ids):
+                    return None
+                raise
+
+        retrieved_items = tasks_summary.joined_results(lambda res: res.json()["items"])
+        if self._api._is_single_identifier(ids, external_ids):
+            return cls._RESOURCE._load(retrieved_items[0], cognite_client=self._api._cognite_client)
+        return cls._load(retrieved_items, cognite_client=self._api._cognite_client)
+
+    async def _list(
+        self,
+        method: str,
+        cls=None,
+        resource_path: str = None,
+        limit: int = None,
+        filter: Dict = None,
+        other_params=None,
+        partitions=None,
+        sort=None,
+        headers: Dict = None,
+        use_disk_cache: bool = True,
+    ):
+        cls = cls or self._api._LIST_CLASS
+        resource_path = resource_path or self._api._RESOURCE_PATH
+        if partitions:
+            if limit not in [None, -1, float("inf")]:
+                raise ValueError("When using partitions, limit should be `None`, `-1` or `inf`.")
+            if sort is not None:
+                raise ValueError("When using sort, partitions is not supported.")
+            return await self._list_partitioned(
+                partitions=partitions,
+                cls=cls,
+                resource_path=resource_path,
+                filter=filter,
+                other_params=other_params,
+                headers=headers,
+            )
+        if method not in ["GET", "POST"]:
+            raise ValueError("_list_generator parameter `method` must be GET or POST, not {}".format(method))
+
+        if limit == -1 or limit == float("inf"):
+            limit = None
+        filter = filter or {}
+        items = []
+        next_cursor = None
+        while True:
+            current_limit = self._api._LIST_LIMIT
+            if limit:
+                current_limit = min(current_limit, limit - len(items))
+            if method == "GET":
+                params = filter.copy()
+                params["limit"] = current_limit
+                params["cursor"] = next_cursor
+                if sort is not None:
+                    params["sort"] = sort
+                res = await self._get(url_path=resource_path, params=params, headers=headers)
+            else:
+                body = {"filter": filter, "limit": current_limit, "cursor": next_cursor, **(other_params or {})}
+                if sort is not None:
+                    body["sort"] = sort
+                res = await self._post(url_path=resource_path + "/list", json=body, headers=headers)
+            page = res.json()
+            items.extend(page["items"])
+            next_cursor = page.get("nextCursor")
+            if len(items) == limit or next_cursor is None:
+                return cls._load(items, cognite_client=self._api._cognite_client)
+
+    async def _list_partitioned(
+        self,
+        partitions,
+        cls=None,
+        resource_path: str = None,
+        filter: Dict = None,
+        other_params=None,
+        headers: Dict = None,
+    ):
+        async def get_partition(partition):
+            next_cursor = None
+            retrieved_items = []
+            while True:
+                body = {
+                    "filter": filter or {},
+                    "limit": self._api._LIST_LIMIT,
+                    "cursor": next_cursor,
+                    "partition": partition,
+                    **(other_params or {}),
+                }
+                res = await self._post(url_path=resource_path + "/list", json=body, headers=headers)
+                res_json = res.json()
+                retrieved_items.extend(res_json["items"])
+                next_cursor = res_json.get("nextCursor")
+                if next_cursor is None:
+                    return retrieved_items
+
+        tasks = [("{}/{}".format(i + 1, partitions),) for i in range(partitions)]
+        tasks_summary = await execute_tasks_concurrently(get_partition, tasks, fail_fast=True)
+        if tasks_summary.exceptions:
+            raise tasks_summary.exceptions[0]
+        return cls._load(tasks_summary.joined_results(), cognite_client=self._api._cognite_client)
+
+    async def _aggregate(
+        self,
+        resource_path: str = None,
+        filter: Union[CogniteFilter, Dict] = None,
+        aggregate: str = None,
+        fields: List[str] = None,
+        headers: Dict = None,
+        cls=None,
+    ):
+        utils._auxiliary.assert_type(filter, "filter", [dict, CogniteFilter], allow_none=True)
+        utils._auxiliary.assert_type(fields, "fields", [list], allow_none=True)
+        if isinstance(filter, CogniteFilter):
+            filter = filter.dump(camel_case=True)
+        elif isinstance(filter, Dict):
+            filter = utils._auxiliary.convert_all_keys_to_camel_case(filter)
+        resource_path = resource_path or self._api._RESOURCE_PATH
+        body = {"filter": filter or {}}
+        if aggregate is not None:
+            body["aggregate"] = aggregate
+        if fields is not None:
+            body["fields"] = fields
+        res = await self._post(url_path=resource_path + "/aggregate", json=body, headers=headers)
+        return [cls(**agg) for agg in res.json()["items"]]
+
+    async def _create_multiple(
+        self,
+        items: Union[List[Any], Any],
+        cls: Any = None,
+        resource_path: str = None,
+        params: Dict = None,
+        headers: Dict = None,
+        limit=None,
+    ):
+        cls = cls or self._api._LIST_CLASS
+        resource_path = resource_path or self._api._RESOURCE_PATH
+        limit = limit or self._api._CREATE_LIMIT
+        single_item = not isinstance(items, list)
+        if single_item:
+            items = [items]
+
+        items_split = []
+        for i in range(0, len(items), limit):
+            if isinstance(items[i], CogniteResource):
+                items_chunk = [item.dump(camel_case=True) for item in items[i : i + limit]]
+            else:
+                items_chunk = [item for item in items[i : i + limit]]
+            items_split.append({"items": items_chunk})
+
+        tasks = [(resource_path, task_items, params, headers) for task_items in items_split]
+        summary = await execute_tasks_concurrently(self._post, tasks)
+
+        def unwrap_element(el):
+            if isinstance(el, dict):
+                return cls._RESOURCE._load(el)
+            else:
+                return el
+
+        def str_format_element(el):
+            if isinstance(el, CogniteResource):
+                dumped = el.dump()
+                if "external_id" in dumped:
+                    return dumped["external_id"]
+                return dumped
+            return el
+
+        summary.raise_compound_exception_if_failed_tasks(
+            task_unwrap_fn=lambda task: task[1]["items"],
+            task_list_element_unwrap_fn=unwrap_element,
+            str_format_element_fn=str_format_element,
+        )
+        created_resources = summary.joined_results(lambda res: res.json()["items"])
+
+        if single_item:
+            return cls._RESOURCE._load(created_resources[0], cognite_client=self._api._cognite_client)
+        return cls._load(created_resources, cognite_client=self._api._cognite_client)
+
+    async def _delete_multiple(
+        self,
+        wrap_ids: bool,
+        resource_path: str = None,
+        ids: Union[List[int], int] = None,
+        external_ids: Union[List[str], str] = None,
+        params: Dict = None,
+        headers: Dict = None,
+        extra_body_fields: Dict = None,
+    ):
+        resource_path = resource_path or self._api._RESOURCE_PATH
+        all_ids = self._api._process_ids(ids, external_ids, wrap_ids)
+        id_chunks = utils._auxiliary.split_into_chunks(all_ids, self._api._DELETE_LIMIT)
+        tasks = [
+            {
+                "url_path": resource_path + "/delete",
+                "json": {"items": chunk, **(extra_body_fields or {})},
+                "params": params,
+                "headers": headers,
+            }
+            for chunk in id_chunks
+        ]
+        summary = await execute_tasks_concurrently(self._post, tasks)
+        summary.raise_compound_exception_if_failed_tasks(
+            task_unwrap_fn=lambda task: task["json"]["items"],
+            task_list_element_unwrap_fn=utils._auxiliary.unwrap_identifer,
+        )
+
+    async def _update_multiple(
+        self,
+        items: Union[List[Any], Any],
+        cls: Any = None,
+        resource_path: str = None,
+        params: Dict = None,
+        headers: Dict = None,
+    ):
+        cls = cls or self._api._LIST_CLASS
+        resource_path = resource_path or self._api._RESOURCE_PATH
+        patch_objects = []
+        single_item = not isinstance(items, (list, UserList))
+        if single_item:
+            items = [items]
+
+        for item in items:
+            if isinstance(item, CogniteResource):
+                patch_objects.append(
+                    self._api._convert_resource_to_patch_object(item, cls._UPDATE._get_update_properties())
+                )
+            elif isinstance(item, CogniteUpdate):
+                patch_objects.append(item.dump())
+            else:
+                raise ValueError("update item must be of type CogniteResource or CogniteUpdate")
+        patch_object_chunks = utils._auxiliary.split_into_chunks(patch_objects, self._api._UPDATE_LIMIT)
+
+        tasks = [
+            {"url_path": resource_path + "/update", "json": {"items": chunk}, "params": params, "headers": headers}
+            for chunk in patch_object_chunks
+        ]
+
+        tasks_summary = await execute_tasks_concurrently(self._post, tasks)
+        tasks_summary.raise_compound_exception_if_failed_tasks(
+            task_unwrap_fn=lambda task: task["json"]["items"],
+            task_list_element_unwrap_fn=lambda el: utils._auxiliary.unwrap_identifer(el),
+        )
+        updated_items = tasks_summary.joined_results(lambda res: res.json()["items"])
+
+        if single_item:
+            return cls._RESOURCE._load(updated_items[0], cognite_client=self._api._cognite_client)
+        return cls._load(updated_items, cognite_client=self._api._cognite_client)
+
+    async def _search(
+        self,
+        search: Dict,
+        filter: Union[Dict, CogniteFilter],
+        limit: int,
+        cls: Any = None,
+        resource_path: str = None,
+        params: Dict = None,
+        headers: Dict = None,
+    ):
+        utils._auxiliary.assert_type(filter, "filter", [dict, CogniteFilter], allow_none=True)
+        if isinstance(filter, CogniteFilter):
+            filter = filter.dump(camel_case=True)
+        elif isinstance(filter, dict):
+            filter = utils._auxiliary.convert_all_keys_to_camel_case(filter)
+        cls = cls or self._api._LIST_CLASS
+        resource_path = resource_path or self._api._RESOURCE_PATH
+        res = await self._post(
+            url_path=resource_path + "/search",
+            json={"search": search, "filter": filter, "limit": limit},
+            params=params,
+            headers=headers,
+        )
+        return cls._load(res.json()["items"], cognite_client=self._api._cognite_client)
+
+
+async def execute_tasks_concurrently(
+    func: Callable, tasks: Union[List[Tuple], List[Dict]], fail_fast: bool = False
+) -> "utils._concurrency.TasksSummary":
+    """Awaits the coroutine function once per task, all at the same time, like
+    utils._concurrency.execute_tasks_concurrently does on a thread pool.
+
+    With fail_fast, the remaining tasks are cancelled once a task fails. As they may have sent their request already,
+    they are reported as tasks with an unknown result.
+    """
+    futures = [asyncio.ensure_future(func(**task) if isinstance(task, dict) else func(*task)) for task in tasks]
+    try:
+        if futures:
+            _, pending = await asyncio.wait(
+                futures, return_when=asyncio.FIRST_EXCEPTION if fail_fast else asyncio.ALL_COMPLETED
+            )
+            for future in pending:
+                future.cancel()
+            if pending:
+                await asyncio.wait(pending)
+    finally:
+        for future in futures:
+            future.cancel()
+
+    successful_tasks = []
+    failed_tasks = []
+    unknown_result_tasks = []
+    results = []
+    exceptions = []
+    for task, future in zip(tasks, futures):
+        if future.cancelled():
+            unknown_result_tasks.append(task)
+            continue
+        e = future.exception()
+        if e is None:
+            successful_tasks.append(task)
+            results.append(future.result())
+            continue
+        exceptions.append(e)
+        if isinstance(e, CogniteAPIError) and e.code >= 500:
+            unknown_result_tasks.append(task)
+        else:
+            failed_tasks.append(task)
+    return utils._concurrency.TasksSummary(successful_tasks, unknown_result_tasks, failed_tasks, results, exceptions)
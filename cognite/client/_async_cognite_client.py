@@ -0,0 +1,249 @@
+import asyncio
+import copy
+import functools
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from cognite.client import utils
+from cognite.client._api_client import APIClient, LazyAPI, RequestBlockedError, block_requests
+from cognite.client._async_api_client import AsyncAPIClient
+from cognite.client._cognite_client import CogniteClient
+from cognite.client.utils._client_config import ClientConfig
+
+
+class _CapturedResult:
+    # Stands in for the result of a request method while finding the request an API method sends. Any use of it means
+    # the API method does more than return the result, so it raises.
+    def _raise(self, *args, **kwargs):
+        raise RequestBlockedError("The result of the request is used")
+
+    __getattr__ = __iter__ = __len__ = __getitem__ = __contains__ = __bool__ = __call__ = _raise
+
+
+class AsyncAPI:
+    """Awaitable view of an API class.
+
+    Every public method of the wrapped API is exposed as a coroutine function with the same signature, and nested APIs
+    (e.g. :code:`raw.rows` or :code:`three_d.models`) are wrapped the same way. Methods which return the result of one
+    request method of the API, like retrieve, list, create, update, delete and search, send their requests with async
+    I/O. Any other method runs on the executor of the client configuration instead. Both return the same data classes
+    as the blocking client.
+    """
+
+    def __init__(self, api: APIClient, async_client: "AsyncCogniteClient"):
+        self._api = api
+        self._async_client = async_client
+        self._async_api = AsyncAPIClient(api, async_client._http_client)
+
+    def __getattr__(self, item):
+        if item.startswith("_"):
+            raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, item))
+        attr = getattr(self._api, item)
+        if isinstance(attr, APIClient):
+            wrapped = AsyncAPI(attr, self._async_client)
+        elif callable(attr):
+            wrapped = self._make_awaitable(item, attr)
+        else:
+            return attr
+        self.__dict__[item] = wrapped
+        return wrapped
+
+    def __dir__(self):
+        return sorted(set(dir(self.__class__)) | {a for a in dir(self._api) if not a.startswith("_")})
+
+    def __repr__(self):
+        return "<{} wrapping {}>".format(self.__class__.__name__, self._api.__class__.__name__)
+
+    def _make_awaitable(self, name: str, fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def awaitable(*args, **kwargs):
+            if await self._async_client._sends_natively():
+                request = self._find_request(name, args, kwargs)
+                if request is not None:
+                    method, request_args, request_kwargs, returns_result = request
+                    result = await getattr(self._async_api, method)(*request_args, **request_kwargs)
+                    return result if returns_result else None
+            return await self._async_client._run(fn, *args, **kwargs)
+
+        return awaitable
+
+    def _find_request(self, name: str, args: Tuple, kwargs: Dict) -> Optional[Tuple[str, Tuple, Dict, bool]]:
+        # Runs the API method on a copy of the API with its request methods replaced, and with requests blocked, to
+        # find the request method it calls and the arguments it calls it with. Returns None unless it calls exactly one
+        # and returns its result or nothing.
+        api = copy.copy(self._api)
+        calls = []
+        result = _CapturedResult()
+
+        def capture(method):
+            def captured(*request_args, **request_kwargs):
+                calls.append((method, request_args, request_kwargs))
+                return result
+
+            return captured
+
+        for method in AsyncAPIClient.REQUEST_METHODS:
+            api.__dict__[method] = capture(method)
+        try:
+            with block_requests():
+                returned = getattr(api, name)(*args, **kwargs)
+        except RequestBlockedError:
+            return None
+        except Exception:
+            if calls:
+                return None
+            # Raised before any request, e.g. for invalid arguments, so the blocking client would raise it too
+            raise
+        if len(calls) != 1 or (returned is not result and returned is not None):
+            return None
+        method, request_args, request_kwargs = calls[0]
+        return method, request_args, request_kwargs, returned is result
+
+
+class AsyncCogniteClient:
+    """Asyncio entrypoint into Cognite Python SDK.
+
+    Mirrors the :code:`CogniteClient`: every API exposed on the blocking client is available here with the same
+    methods, but each method is a coroutine function. Data classes returned are the same as for the blocking client.
+
+    Requests are sent with async I/O, using an httpx client owned by this client, so any number of calls can be in
+    flight on one event loop without a thread each. Requests are built, retried and checked for errors the same way as
+    by the blocking client. API methods which do more than send a request and return its result, e.g. file uploads and
+    datapoints retrieval, run the blocking client on the pool of :code:`max_workers` threads of the client
+    configuration (see :code:`ClientConfig.executor`) instead. So do all methods when the client is configured with a
+    resource cache, disk cache, request coalescing, circuit breaker, adaptive concurrency or tracing, or when its calls
+    are profiled. Requires httpx, which the async extra installs (pip install cognite-sdk[async]).
+
+    Args:
+        *args: Positional arguments passed on to :code:`CogniteClient`.
+        **kwargs: Keyword arguments passed on to :code:`CogniteClient`.
+
+    Examples:
+
+        Retrieve assets and raw rows concurrently::
+
+            >>> import asyncio
+            >>> from cognite.client import AsyncCogniteClient
+            >>> async def main():
+            ...     async with AsyncCogniteClient() as c:
+            ...         assets, rows = await asyncio.gather(
+            ...             c.assets.list(limit=5), c.raw.rows.list("db1", "table1", limit=5)
+            ...         )
+            >>> asyncio.get_event_loop().run_until_complete(main())
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._client = CogniteClient(*args, **kwargs)
+        self._http_client = utils._async_http.AsyncHTTPClient(self._client.config)
+        self._api_client = AsyncAPIClient(self._client._api_client, self._http_client)
+        self._project_resolved = False
+
+    def __getattr__(self, item):
+        # APIs of the blocking client are created on first access, and so are the awaitable views of them
+        if not item.startswith("_") and isinstance(getattr(CogniteClient, item, None), LazyAPI):
+            wrapped = self.__dict__[item] = AsyncAPI(getattr(self._client, item), self)
+            return wrapped
+        raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, item))
+
+    def __dir__(self):
+        return sorted(
+            set(super().__dir__()) | {k for k, v in vars(CogniteClient).items() if isinstance(v, LazyAPI)}
+        )
+
+    @property
+    def config(self) -> ClientConfig:
+        """Returns a config object containing the configuration for the current client.
+
+        Returns:
+            ClientConfig: The configuration object.
+        """
+        return self._client.config
+
+    @property
+    def hooks(self) -> "utils._hooks.RequestHooks":
+        """Returns the hooks called during the lifecycle of every request sent by this client.
+
+        Returns:
+            RequestHooks: The request hooks.
+        """
+        return self._client.hooks
+
+    @property
+    def metrics(self) -> Optional["utils._metrics.MetricsCollector"]:
+        """Returns the request metrics collected per endpoint, if the client was created with collect_metrics=True.
+
+        Returns:
+            Optional[MetricsCollector]: The metrics collector, or None if metrics are not collected.
+        """
+        return self._client.metrics
+
+    @property
+    def version(self) -> str:
+        """Returns the current SDK version.
+
+        Returns:
+            str: The current SDK version
+        """
+        return self._client.version
+
+    @property
+    def sync_client(self) -> CogniteClient:
+        """Returns the blocking client this client dispatches calls to.
+
+        Returns:
+            CogniteClient: The blocking client.
+        """
+        return self._client
+
+    async def get(self, url: str, params: Dict[str, Any] = None, headers: Dict[str, Any] = None):
+        """Perform a GET request to an arbitrary path in the API."""
+        if await self._sends_natively():
+            return await self._api_client._get(url, params=params, headers=headers)
+        return await self._run(self._client.get, url, params=params, headers=headers)
+
+    async def post(self, url: str, json: Dict[str, Any], params: Dict[str, Any] = None, headers: Dict[str, Any] = None):
+        """Perform a POST request to an arbitrary path in the API."""
+        if await self._sends_natively():
+            return await self._api_client._post(url, json=json, params=params, headers=headers)
+        return await self._run(self._client.post, url, json=json, params=params, headers=headers)
+
+    async def put(self, url: str, json: Dict[str, Any] = None, headers: Dict[str, Any] = None):
+        """Perform a PUT request to an arbitrary path in the API."""
+        if await self._sends_natively():
+            return await self._api_client._put(url, json=json, headers=headers)
+        return await self._run(self._client.put, url, json=json, headers=headers)
+
+    async def delete(self, url: str, params: Dict[str, Any] = None, headers: Dict[str, Any] = None):
+        """Perform a DELETE request to an arbitrary path in the API."""
+        if await self._sends_natively():
+            return await self._api_client._delete(url, params=params, headers=headers)
+        return await self._run(self._client.delete, url, params=params, headers=headers)
+
+    async def warm_up(self, connections: int = None) -> int:
+        """Open connections to the API in advance for the blocking client. See :code:`CogniteClient.warm_up`."""
+        return await self._run(self._client.warm_up, connections)
+
+    async def close(self):
+        """Close the connections of this client. The blocking client it wraps, and its worker threads, are left open
+        for other users of it."""
+        await self._http_client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _sends_natively(self) -> bool:
+        config = self._client.config
+        features = [config.resource_cache, config.disk_cache, config.coalescer, config.circuit_breaker, config.tracer]
+        if any(f is not None for f in features) or config.adaptive_concurrency or utils._profiling.is_profiling():
+            return False
+        if not self._project_resolved:
+            # The project may be inferred from the credentials, which blocks while the first request is sent
+            await self._run(getattr, config, "project")
+            self._project_resolved = True
+        return True
+
+    async def _run(self, fn: Callable, *args, **kwargs):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._client.config.executor, functools.partial(fn, *args, **kwargs))
@@ -1,32 +1,42 @@
+import importlib
+import threading
 import warnings
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, ContextManager, Dict, Optional, Union
 
 from cognite.client import utils
-from cognite.client._api.assets import AssetsAPI
-from cognite.client._api.data_sets import DataSetsAPI
-from cognite.client._api.datapoints import DatapointsAPI
-from cognite.client._api.events import EventsAPI
-from cognite.client._api.files import FilesAPI
-from cognite.client._api.iam import IAMAPI
-from cognite.client._api.login import LoginAPI
-from cognite.client._api.raw import RawAPI
-from cognite.client._api.sequences import SequencesAPI
-from cognite.client._api.three_d import ThreeDAPI
-from cognite.client._api.time_series import TimeSeriesAPI
-from cognite.client._api.labels import LabelsAPI
-from cognite.client._api_client import APIClient
+from cognite.client._api_client import APIClient, LazyAPI
 from cognite.client.exceptions import CogniteAPIKeyError
 from cognite.client.utils._client_config import ClientConfig
 
+# Projects inferred from an API key or token, per base url, so that clients created with the same credentials only ask
+# the API once per process
+_INFERRED_PROJECTS = {}
+_INFERRED_PROJECTS_LOCK = threading.Lock()
+
+
+def _api(name: str, api_class: str, module: str = None, versioned: bool = True) -> LazyAPI:
+    # The module of an API is only imported when the API is first accessed
+    def create(client):
+        cls = getattr(importlib.import_module("cognite.client._api." + (module or name)), api_class)
+        if not versioned:
+            return cls(client._config, cognite_client=client)
+        return cls(client._config, api_version=client._API_VERSION, cognite_client=client)
+
+    return LazyAPI(name, create)
+
 
 class CogniteClient:
     """Main entrypoint into Cognite Python SDK.
 
     All services are made available through this object. See examples below.
 
+    APIs are created the first time they are accessed, and creating a client sends no requests: the project, if not
+    given, is inferred from the credentials when the first request needs it, and the check for newer versions of the
+    SDK runs in a background thread.
+
     Args:
         api_key (str): API key
-        project (str): Project. Defaults to project of given API key.
+        project (str): Project. Defaults to project of given API key, inferred on first use.
         client_name (str): A user-defined name for the client. Used to identify number of unique applications/scripts
             running on top of CDF.
         base_url (str): Base url to send requests to. Defaults to "https://api.cognitedata.com"
@@ -35,12 +45,69 @@ class CogniteClient:
         timeout (int): Timeout on requests sent to the api. Defaults to 30 seconds.
         token (Union[str, Callable[[], str]]): A jwt or method which takes no arguments and returns a jwt to use for authentication.
             This will override any api-key set.
-        disable_pypi_version_check (bool): Don't check for newer versions of the SDK on client creation
+        disable_pypi_version_check (bool): Don't check for newer versions of the SDK on client creation. The check runs
+            in the background at most once per process, and its result is reused by all processes for a day.
         debug (bool): Configures logger to log extra request details to stderr.
+        adaptive_concurrency (bool): Adapt the number of requests in flight to the project to 429/503 responses and
+            latency. The limit is shared by all clients in this process using the same project.
+        rate_limits (Dict[str, float]): Maximum number of requests per second this client sends, per endpoint family,
+            e.g. {"/timeseries/data": 50, "/raw": 20, "*": 100}. "*" applies to requests matching no other family. The
+            limits are shared by all clients in this process using the same project and rate limits.
+        token_background_refresh (bool): When token is a method, refresh the token in a background thread shortly
+            before it expires instead of blocking a request while the method is called.
+        json_codec (Union[str, JsonCodec]): JSON library used for request and response bodies. One of "json" (default),
+            "orjson", "ujson", "auto" to use orjson if it is installed, or a JsonCodec, e.g. to reject NaN.
+        compression (Union[str, CompressionPolicy]): How to compress request bodies. Either "gzip" (default), "deflate",
+            "zstd", or a CompressionPolicy setting the algorithm, level and minimum body size to compress.
+        streaming_json_decode (bool): Decode list and datapoints responses while they are downloaded, instead of
+            loading each page into memory before decoding it. Requires ijson.
+        http2 (bool): Send requests over HTTP/2, multiplexing concurrent requests over a few connections. Requires
+            httpx with the http2 extra. Defaults to False.
+        collect_metrics (bool): Collect latency, size, retry and throttling metrics per endpoint, available as
+            :code:`metrics`. Defaults to False.
+        tracing (bool): Trace calls, HTTP requests and the chunks and windows of concurrent operations with
+            OpenTelemetry spans. Requires opentelemetry-api. Defaults to False.
+        tracer_provider (TracerProvider): OpenTelemetry tracer provider to create spans with, instead of the global one.
+            Enables tracing.
+        retry_budget (Union[bool, RetryBudget]): Limit retries to a fraction of the requests sent, so that retries do
+            not multiply the load on an overloaded API. True uses a RetryBudget with default settings. Defaults to False.
+        circuit_breaker (Union[bool, CircuitBreaker]): Stop sending requests to an endpoint family for a while when its
+            requests keep failing, raising CogniteCircuitOpenError instead. True uses a CircuitBreaker with default
+            settings. Defaults to False.
+        coalesce_requests (Union[bool, RequestCoalescer]): Send identical concurrent reads once, sharing the response,
+            and merge concurrent requests retrieving resources by id into one request. True uses a RequestCoalescer
+            with default settings. Defaults to False.
+        resource_cache (Union[bool, ResourceCache]): Cache assets, time series, sequences and files retrieved by id or
+            external id, and retrieve only those not cached. True caches up to 10000 resources for 5 minutes. Defaults
+            to False.
+        disk_cache (Union[str, DiskCache]): Store listed assets and time series in an SQLite database, which can be
+            shared by processes, and only list those updated since the last time the same resources were listed. A
+            directory to store the database in uses a DiskCache with default settings. Defaults to the environment
+            variable 'COGNITE_DISK_CACHE_DIR', or no caching.
+        max_connection_pool_size (int): Maximum number of connections to keep open to each host. Every client has
+            its own connection pools. Defaults to the environment variable 'COGNITE_MAX_CONNECTION_POOL_SIZE', or the
+            larger of max_workers and 50.
+        max_retries (int): Maximum number of retries of a request. Defaults to the environment variable
+            'COGNITE_MAX_RETRIES', or 10.
+        disable_ssl (bool): Don't verify the SSL certificates of the API and of file upload and download links.
+            Defaults to the environment variable 'COGNITE_DISABLE_SSL'.
     """
 
     _API_VERSION = "v1"
 
+    login = _api("login", "LoginAPI", versioned=False)
+    assets = _api("assets", "AssetsAPI")
+    datapoints = _api("datapoints", "DatapointsAPI")
+    events = _api("events", "EventsAPI")
+    files = _api("files", "FilesAPI")
+    iam = _api("iam", "IAMAPI")
+    data_sets = _api("data_sets", "DataSetsAPI")
+    sequences = _api("sequences", "SequencesAPI")
+    time_series = _api("time_series", "TimeSeriesAPI")
+    raw = _api("raw", "RawAPI")
+    three_d = _api("three_d", "ThreeDAPI")
+    labels = _api("labels", "LabelsAPI")
+
     def __init__(
         self,
         api_key: str = None,
@@ -53,6 +120,24 @@ class CogniteClient:
         token: Union[str, Callable[[], str], None] = None,
         disable_pypi_version_check: Optional[bool] = None,
         debug: bool = False,
+        adaptive_concurrency: Optional[bool] = None,
+        rate_limits: Dict[str, float] = None,
+        token_background_refresh: bool = False,
+        json_codec: str = None,
+        compression: Union[str, "utils._compression.CompressionPolicy"] = None,
+        streaming_json_decode: bool = False,
+        http2: Optional[bool] = None,
+        collect_metrics: bool = False,
+        tracing: bool = False,
+        tracer_provider: Any = None,
+        retry_budget: Union[bool, "utils._retry.RetryBudget"] = False,
+        circuit_breaker: Union[bool, "utils._circuit_breaker.CircuitBreaker"] = False,
+        coalesce_requests: Union[bool, "utils._coalescing.RequestCoalescer"] = False,
+        resource_cache: Union[bool, "utils._cache.ResourceCache"] = False,
+        disk_cache: Union[str, "utils._disk_cache.DiskCache"] = None,
+        max_connection_pool_size: int = None,
+        max_retries: int = None,
+        disable_ssl: Optional[bool] = None,
     ):
         self._config = ClientConfig(
             api_key=api_key,
@@ -65,21 +150,27 @@ class CogniteClient:
             token=token,
             disable_pypi_version_check=disable_pypi_version_check,
             debug=debug,
+            adaptive_concurrency=adaptive_concurrency,
+            rate_limits=rate_limits,
+            token_background_refresh=token_background_refresh,
+            json_codec=json_codec,
+            compression=compression,
+            streaming_json_decode=streaming_json_decode,
+            http2=http2,
+            collect_metrics=collect_metrics,
+            tracing=tracing,
+            tracer_provider=tracer_provider,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+            coalesce_requests=coalesce_requests,
+            resource_cache=resource_cache,
+            disk_cache=disk_cache,
+            max_connection_pool_size=max_connection_pool_size,
+            max_retries=max_retries,
+            disable_ssl=disable_ssl,
         )
-        self.login = LoginAPI(self._config, cognite_client=self)
         if self._config.project is None:
-            self._config.project = self._infer_project()
-        self.assets = AssetsAPI(self._config, api_version=self._API_VERSION, cognite_client=self)
-        self.datapoints = DatapointsAPI(self._config, api_version=self._API_VERSION, cognite_client=self)
-        self.events = EventsAPI(self._config, api_version=self._API_VERSION, cognite_client=self)
-        self.files = FilesAPI(self._config, api_version=self._API_VERSION, cognite_client=self)
-        self.iam = IAMAPI(self._config, api_version=self._API_VERSION, cognite_client=self)
-        self.data_sets = DataSetsAPI(self._config, api_version=self._API_VERSION, cognite_client=self)
-        self.sequences = SequencesAPI(self._config, api_version=self._API_VERSION, cognite_client=self)
-        self.time_series = TimeSeriesAPI(self._config, api_version=self._API_VERSION, cognite_client=self)
-        self.raw = RawAPI(self._config, api_version=self._API_VERSION, cognite_client=self)
-        self.three_d = ThreeDAPI(self._config, api_version=self._API_VERSION, cognite_client=self)
-        self.labels = LabelsAPI(self._config, api_version=self._API_VERSION, cognite_client=self)
+            self._config._project_resolver = self._infer_project
         self._api_client = APIClient(self._config, cognite_client=self)
 
     def get(self, url: str, params: Dict[str, Any] = None, headers: Dict[str, Any] = None):
@@ -98,6 +189,59 @@ class CogniteClient:
         """Perform a DELETE request to an arbitrary path in the API."""
         return self._api_client._delete(url, params=params, headers=headers)
 
+    def warm_up(self, connections: int = None) -> int:
+        """Open connections to the API in advance, before latency-sensitive work starts.
+
+        Resolves the host of the API and completes TCP and TLS handshakes for the given number of keep-alive
+        connections, which later requests then reuse. Connections over HTTP/2 are not opened in advance.
+
+        Args:
+            connections (int): Number of connections to open. Defaults to max_workers.
+
+        Returns:
+            int: The number of connections opened.
+
+        Examples:
+
+            Open a connection for every worker thread before fetching datapoints::
+
+                >>> from cognite.client import CogniteClient
+                >>> c = CogniteClient()
+                >>> c.warm_up()
+        """
+        return self._config.sessions.warm_up(connections)
+
+    def profile(self, snapshots: bool = False) -> ContextManager["utils._profiling.MemoryProfile"]:
+        """Measure the time and memory spent in the calls made to this client, per call and per stage of each call.
+
+        Every call to a public method of an API made within the context, in the same thread, is profiled. The memory
+        allocated from its start to its peak and retained when it returns is measured with tracemalloc, as well as for
+        each of its stages: sending requests and receiving responses, decoding them, loading data class objects,
+        extending datapoints and converting to pandas. Work done on the worker threads of the client is attributed to
+        the call which started it.
+
+        Tracing allocations makes Python code several times slower, so profiling is meant for finding out where the
+        memory goes, not for production use.
+
+        Args:
+            snapshots (bool): Take a tracemalloc snapshot when every call returns, available as the snapshot of its
+                profile. Defaults to False.
+
+        Returns:
+            A context manager returning the MemoryProfile, which is filled in as calls return.
+
+        Examples:
+
+            Find out where the memory of a large datapoints retrieval goes::
+
+                >>> from cognite.client import CogniteClient
+                >>> c = CogniteClient()
+                >>> with c.profile() as p:
+                ...     df = c.datapoints.retrieve_dataframe(id=[1, 2, 3], start=0, end="now", aggregates=["average"], granularity="1m")
+                >>> print(p)
+        """
+        return utils._profiling.profile(self._config, snapshots)
+
     @property
     def version(self) -> str:
         """Returns the current SDK version.
@@ -107,6 +251,24 @@ class CogniteClient:
         """
         return utils._auxiliary.get_current_sdk_version()
 
+    @property
+    def hooks(self) -> "utils._hooks.RequestHooks":
+        """Returns the hooks called during the lifecycle of every request sent by this client.
+
+        Returns:
+            RequestHooks: The request hooks.
+        """
+        return self._config.hooks
+
+    @property
+    def metrics(self) -> Optional["utils._metrics.MetricsCollector"]:
+        """Returns the request metrics collected per endpoint, if the client was created with collect_metrics=True.
+
+        Returns:
+            Optional[MetricsCollector]: The metrics collector, or None if metrics are not collected.
+        """
+        return self._config.metrics
+
     @property
     def config(self) -> ClientConfig:
         """Returns a config object containing the configuration for the current client.
@@ -117,13 +279,23 @@ class CogniteClient:
         return self._config
 
     def _infer_project(self):
+        credentials = self._config.api_key if self._config.api_key is not None else self._config.token
+        # Token factories may return a different token on every call, so projects inferred through them are not shared
+        key = None if callable(credentials) else (self._config.base_url, credentials)
+        with _INFERRED_PROJECTS_LOCK:
+            project = _INFERRED_PROJECTS.get(key)
+        if project is not None:
+            return project
+
         login_status = self.login.status()
-        if login_status.logged_in:
-            warnings.warn(
-                "Authenticated towards inferred project '{}'. Pass project to the CogniteClient constructor or set"
-                " the environment variable 'COGNITE_PROJECT' to suppress this warning.".format(login_status.project),
-                stacklevel=3,
-            )
-            return login_status.project
-        else:
+        if not login_status.logged_in:
             raise CogniteAPIKeyError("Invalid API key")
+        warnings.warn(
+            "Authenticated towards inferred project '{}'. Pass project to the CogniteClient constructor or set"
+            " the environment variable 'COGNITE_PROJECT' to suppress this warning.".format(login_status.project),
+            stacklevel=3,
+        )
+        if key is not None:
+            with _INFERRED_PROJECTS_LOCK:
+                _INFERRED_PROJECTS[key] = login_status.project
+        return login_status.project
@@ -1,66 +1,99 @@
-from typing import *
+import importlib
+import sys
 
-from cognite.client.data_classes.assets import (
-    AggregateResultItem,
-    Asset,
-    AssetAggregate,
-    AssetFilter,
-    AssetList,
-    AssetUpdate,
-    AssetLabelFilter,
-)
-from cognite.client.data_classes.data_sets import DataSet, DataSetAggregate, DataSetFilter, DataSetList, DataSetUpdate
-from cognite.client.data_classes.datapoints import Datapoint, Datapoints, DatapointsList, DatapointsQuery
-from cognite.client.data_classes.events import EndTimeFilter, Event, EventFilter, EventList, EventUpdate
-from cognite.client.data_classes.files import (
-    FileAggregate,
-    FileMetadata,
-    FileMetadataFilter,
-    FileMetadataList,
-    FileMetadataUpdate,
-)
-from cognite.client.data_classes.iam import (
-    APIKey,
-    APIKeyList,
-    Group,
-    GroupList,
-    SecurityCategory,
-    SecurityCategoryList,
-    ServiceAccount,
-    ServiceAccountList,
-)
-from cognite.client.data_classes.login import LoginStatus
-from cognite.client.data_classes.raw import Database, DatabaseList, Row, RowList, Table, TableList
-from cognite.client.data_classes.relationships import Relationship, RelationshipFilter, RelationshipList
-from cognite.client.data_classes.sequences import (
-    Sequence,
-    SequenceAggregate,
-    SequenceData,
-    SequenceDataList,
-    SequenceFilter,
-    SequenceList,
-    SequenceUpdate,
-)
-from cognite.client.data_classes.shared import TimestampRange, AggregateResult, AggregateUniqueValuesResult
-from cognite.client.data_classes.three_d import (
-    BoundingBox3D,
-    RevisionCameraProperties,
-    ThreeDAssetMapping,
-    ThreeDAssetMappingList,
-    ThreeDModel,
-    ThreeDModelList,
-    ThreeDModelRevision,
-    ThreeDModelRevisionList,
-    ThreeDModelRevisionUpdate,
-    ThreeDModelUpdate,
-    ThreeDNode,
-    ThreeDNodeList,
-)
-from cognite.client.data_classes.time_series import (
-    TimeSeries,
-    TimeSeriesAggregate,
-    TimeSeriesFilter,
-    TimeSeriesList,
-    TimeSeriesUpdate,
-)
-from cognite.client.data_classes.labels import Label, LabelFilter, LabelList
+# Data classes are imported when first accessed (PEP 562), so that only the modules of the resources used are loaded
+_LAZY_ATTRIBUTES = {
+    "AggregateResultItem": "assets",
+    "Asset": "assets",
+    "AssetAggregate": "assets",
+    "AssetFilter": "assets",
+    "AssetList": "assets",
+    "AssetUpdate": "assets",
+    "AssetLabelFilter": "assets",
+    "DataSet": "data_sets",
+    "DataSetAggregate": "data_sets",
+    "DataSetFilter": "data_sets",
+    "DataSetList": "data_sets",
+    "DataSetUpdate": "data_sets",
+    "Datapoint": "datapoints",
+    "Datapoints": "datapoints",
+    "DatapointsList": "datapoints",
+    "DatapointsQuery": "datapoints",
+    "EndTimeFilter": "events",
+    "Event": "events",
+    "EventFilter": "events",
+    "EventList": "events",
+    "EventUpdate": "events",
+    "FileAggregate": "files",
+    "FileMetadata": "files",
+    "FileMetadataFilter": "files",
+    "FileMetadataList": "files",
+    "FileMetadataUpdate": "files",
+    "APIKey": "iam",
+    "APIKeyList": "iam",
+    "Group": "iam",
+    "GroupList": "iam",
+    "SecurityCategory": "iam",
+    "SecurityCategoryList": "iam",
+    "ServiceAccount": "iam",
+    "ServiceAccountList": "iam",
+    "LoginStatus": "login",
+    "Database": "raw",
+    "DatabaseList": "raw",
+    "Row": "raw",
+    "RowList": "raw",
+    "Table": "raw",
+    "TableList": "raw",
+    "Relationship": "relationships",
+    "RelationshipFilter": "relationships",
+    "RelationshipList": "relationships",
+    "Sequence": "sequences",
+    "SequenceAggregate": "sequences",
+    "SequenceData": "sequences",
+    "SequenceDataList": "sequences",
+    "SequenceFilter": "sequences",
+    "SequenceList": "sequences",
+    "SequenceUpdate": "sequences",
+    "TimestampRange": "shared",
+    "AggregateResult": "shared",
+    "AggregateUniqueValuesResult": "shared",
+    "BoundingBox3D": "three_d",
+    "RevisionCameraProperties": "three_d",
+    "ThreeDAssetMapping": "three_d",
+    "ThreeDAssetMappingList": "three_d",
+    "ThreeDModel": "three_d",
+    "ThreeDModelList": "three_d",
+    "ThreeDModelRevision": "three_d",
+    "ThreeDModelRevisionList": "three_d",
+    "ThreeDModelRevisionUpdate": "three_d",
+    "ThreeDModelUpdate": "three_d",
+    "ThreeDNode": "three_d",
+    "ThreeDNodeList": "three_d",
+    "TimeSeries": "time_series",
+    "TimeSeriesAggregate": "time_series",
+    "TimeSeriesFilter": "time_series",
+    "TimeSeriesList": "time_series",
+    "TimeSeriesUpdate": "time_series",
+    "Label": "labels",
+    "LabelFilter": "labels",
+    "LabelList": "labels",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+    value = globals()[name] = getattr(importlib.import_module("." + _LAZY_ATTRIBUTES[name], __name__), name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ is only supported from Python 3.7, so earlier versions import every data class up front
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
@@ -1,5 +1,6 @@
 import json
-from collections import UserList
+from collections import UserList, namedtuple
+from itertools import chain, repeat
 from typing import *
 
 from cognite.client import utils
@@ -8,7 +9,60 @@ from cognite.client.exceptions import CogniteMissingClientError
 EXCLUDE_VALUE = [None]
 
 
+class _CogniteClientAttribute:
+    """The ``_cognite_client`` attribute of resources, raising CogniteMissingClientError if no client is set.
+
+    The client is stored in ``_cognite_client_or_none``. Checking it in a descriptor rather than in
+    ``__getattribute__`` means every other attribute lookup on a resource costs the same as on a plain object.
+    """
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        client = instance._cognite_client_or_none
+        if client is None:
+            raise CogniteMissingClientError
+        return client
+
+    def __set__(self, instance, value):
+        instance._cognite_client_or_none = value
+
+
+_Layout = namedtuple("_Layout", ["fields", "field_set", "has_dict"])
+_LAYOUTS = {}
+
+
+def _layout(cls) -> _Layout:
+    # The public slots of a class in definition order, and whether its instances also have a __dict__
+    layout = _LAYOUTS.get(cls)
+    if layout is None:
+        fields = []
+        has_dict = False
+        for klass in reversed(cls.__mro__[:-1]):
+            slots = klass.__dict__.get("__slots__")
+            if slots is None:
+                has_dict = True
+                continue
+            fields.extend(name for name in ((slots,) if isinstance(slots, str) else slots) if not name.startswith("_"))
+        layout = _LAYOUTS[cls] = _Layout(tuple(fields), frozenset(fields), has_dict)
+    return layout
+
+
+def _public_attributes(obj) -> Iterable[Tuple[str, Any]]:
+    layout = _layout(type(obj))
+    if not layout.fields:
+        return obj.__dict__.items() if layout.has_dict else ()
+    attributes = zip(layout.fields, map(getattr, repeat(obj), layout.fields, repeat(None)))
+    if layout.has_dict:
+        return chain(attributes, obj.__dict__.items())
+    return attributes
+
+
 class CogniteResponse:
+    __slots__ = ("_cognite_client_or_none", "__weakref__")
+
+    _cognite_client = _CogniteClientAttribute()
+
     def __str__(self):
         item = utils._time.convert_time_attributes_to_datetime(self.dump())
         return json.dumps(item, default=utils._auxiliary.json_dump_default, indent=4)
@@ -19,13 +73,6 @@ class CogniteResponse:
     def __eq__(self, other):
         return type(other) == type(self) and other.dump() == self.dump()
 
-    def __getattribute__(self, item):
-        attr = super().__getattribute__(item)
-        if item == "_cognite_client":
-            if attr is None:
-                raise CogniteMissingClientError
-        return attr
-
     def dump(self, camel_case: bool = False) -> Dict[str, Any]:
         """Dump the instance into a json serializable python data type.
 
@@ -36,7 +83,9 @@ class CogniteResponse:
             Dict[str, Any]: A dictionary representation of the instance.
         """
         dumped = {
-            key: value for key, value in self.__dict__.items() if value not in EXCLUDE_VALUE and not key.startswith("_")
+            key: value
+            for key, value in _public_attributes(self)
+            if value not in EXCLUDE_VALUE and not key.startswith("_")
         }
         if camel_case:
             dumped = {utils._auxiliary.to_camel_case(key): value for key, value in dumped.items()}
@@ -51,6 +100,10 @@ class CogniteResponse:
 
 
 class CogniteResource:
+    __slots__ = ("_cognite_client_or_none", "__weakref__")
+
+    _cognite_client = _CogniteClientAttribute()
+
     def __new__(cls, *args, **kwargs):
         obj = super().__new__(cls)
         obj._cognite_client = None
@@ -65,13 +118,6 @@ class CogniteResource:
         item = utils._time.convert_time_attributes_to_datetime(self.dump())
         return json.dumps(item, default=utils._auxiliary.json_dump_default, indent=4)
 
-    def __getattribute__(self, item):
-        attr = super().__getattribute__(item)
-        if item == "_cognite_client":
-            if attr is None:
-                raise CogniteMissingClientError
-        return attr
-
     def dump(self, camel_case: bool = False) -> Dict[str, Any]:
         """Dump the instance into a json serializable Python data type.
 
@@ -84,11 +130,13 @@ class CogniteResource:
         if camel_case:
             return {
                 utils._auxiliary.to_camel_case(key): value
-                for key, value in self.__dict__.items()
+                for key, value in _public_attributes(self)
                 if value not in EXCLUDE_VALUE and not key.startswith("_")
             }
         return {
-            key: value for key, value in self.__dict__.items() if value not in EXCLUDE_VALUE and not key.startswith("_")
+            key: value
+            for key, value in _public_attributes(self)
+            if value not in EXCLUDE_VALUE and not key.startswith("_")
         }
 
     @classmethod
@@ -97,13 +145,15 @@ class CogniteResource:
             return cls._load(json.loads(resource), cognite_client=cognite_client)
         elif isinstance(resource, Dict):
             instance = cls(cognite_client=cognite_client)
+            layout = _layout(cls)
             for key, value in resource.items():
                 snake_case_key = utils._auxiliary.to_snake_case(key)
-                if hasattr(instance, snake_case_key):
+                if snake_case_key in layout.field_set or (layout.has_dict and hasattr(instance, snake_case_key)):
                     setattr(instance, snake_case_key, value)
             return instance
         raise TypeError("Resource must be json str or Dict, not {}".format(type(resource)))
 
+    @utils._profiling.profiled_stage("to_pandas")
     def to_pandas(self, expand: List[str] = ("metadata",), ignore: List[str] = None, camel_case: bool = True):
         """Convert the instance into a pandas DataFrame.
 
@@ -160,6 +210,8 @@ class CogniteResourceList(UserList):
     _UPDATE = None
     _ASSERT_CLASSES = True
 
+    _cognite_client = _CogniteClientAttribute()
+
     def __init__(self, resources: List[Any], cognite_client=None):
         if self._ASSERT_CLASSES:
             assert self._RESOURCE is not None, "{} does not have _RESOURCE set".format(self.__class__.__name__)
@@ -181,19 +233,10 @@ class CogniteResourceList(UserList):
             if hasattr(self.data[0], "id"):
                 self._id_to_item = {item.id: item for item in self.data if item.id is not None}
 
-    def __getattribute__(self, item):
-        attr = super().__getattribute__(item)
-        if item == "_cognite_client" and attr is None:
-            raise CogniteMissingClientError
-        return attr
-
     def __getitem__(self, item):
         value = super().__getitem__(item)
         if isinstance(item, slice):
-            c = None
-            if super().__getattribute__("_cognite_client") is not None:
-                c = self._cognite_client
-            return self.__class__(value, cognite_client=c)
+            return self.__class__(value, cognite_client=self._cognite_client_or_none)
         return value
 
     def __str__(self):
@@ -226,6 +269,7 @@ class CogniteResourceList(UserList):
             return self._id_to_item.get(id)
         return self._external_id_to_item.get(external_id)
 
+    @utils._profiling.profiled_stage("to_pandas")
     def to_pandas(self, camel_case=True) -> "pandas.DataFrame":
         """Convert the instance into a pandas DataFrame.
 
@@ -249,6 +293,7 @@ class CogniteResourceList(UserList):
         return self.to_pandas(camel_case=False)._repr_html_()
 
     @classmethod
+    @utils._profiling.profiled_stage("_load")
     def _load(cls, resource_list: Union[List, str], cognite_client=None):
         if isinstance(resource_list, str):
             return cls._load(json.loads(resource_list), cognite_client=cognite_client)
@@ -368,6 +413,10 @@ class CogniteListUpdate:
 
 
 class CogniteFilter:
+    __slots__ = ("_cognite_client_or_none", "__weakref__")
+
+    _cognite_client = _CogniteClientAttribute()
+
     def __eq__(self, other):
         return type(self) == type(other) and self.dump() == other.dump()
 
@@ -378,13 +427,6 @@ class CogniteFilter:
     def __repr__(self):
         return self.__str__()
 
-    def __getattribute__(self, item):
-        attr = super().__getattribute__(item)
-        if item == "_cognite_client":
-            if attr is None:
-                raise CogniteMissingClientError
-        return attr
-
     def dump(self, camel_case: bool = False):
         """Dump the instance into a json serializable Python data type.
 
@@ -394,9 +436,11 @@ class CogniteFilter:
         if camel_case:
             return {
                 utils._auxiliary.to_camel_case(key): value
-                for key, value in self.__dict__.items()
+                for key, value in _public_attributes(self)
                 if value not in EXCLUDE_VALUE and not key.startswith("_")
             }
         return {
-            key: value for key, value in self.__dict__.items() if value not in EXCLUDE_VALUE and not key.startswith("_")
+            key: value
+            for key, value in _public_attributes(self)
+            if value not in EXCLUDE_VALUE and not key.startswith("_")
         }
@@ -67,6 +67,23 @@ class Asset(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "external_id",
+        "name",
+        "parent_id",
+        "parent_external_id",
+        "description",
+        "data_set_id",
+        "metadata",
+        "source",
+        "labels",
+        "id",
+        "created_time",
+        "last_updated_time",
+        "root_id",
+        "aggregates",
+    )
+
     def __init__(
         self,
         external_id: str = None,
@@ -176,6 +193,7 @@ class Asset(CogniteResource):
         """
         return self._cognite_client.files.list(asset_ids=[self.id], **kwargs)
 
+    @utils._profiling.profiled_stage("to_pandas")
     def to_pandas(
         self, expand: List[str] = ("metadata", "aggregates"), ignore: List[str] = None, camel_case: bool = True
     ):
@@ -349,7 +367,7 @@ class AssetList(CogniteResourceList):
         for i in range(0, len(ids), self._retrieve_chunk_size):
             tasks.append({"asset_ids": ids[i : i + self._retrieve_chunk_size]})
         res_list = utils._concurrency.execute_tasks_concurrently(
-            retrieve_and_deduplicate, tasks, resource_api._config.max_workers
+            retrieve_and_deduplicate, tasks, resource_api._config.max_workers, executor=resource_api._config.executor
         ).results
         resources = resource_list_class([])
         for res in res_list:
@@ -367,6 +385,8 @@ class AssetLabelFilter(CogniteFilter):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = ("contains_any", "contains_all")
+
     def __init__(
         self, contains_any: List[Dict[str, Any]] = None, contains_all: List[Dict[str, Any]] = None, cognite_client=None
     ):
@@ -399,6 +419,22 @@ class AssetFilter(CogniteFilter):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "name",
+        "parent_ids",
+        "parent_external_ids",
+        "root_ids",
+        "asset_subtree_ids",
+        "data_set_ids",
+        "metadata",
+        "source",
+        "created_time",
+        "last_updated_time",
+        "root",
+        "external_id_prefix",
+        "labels",
+    )
+
     def __init__(
         self,
         name: str = None,
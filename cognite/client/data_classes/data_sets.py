@@ -20,6 +20,10 @@ class DataSet(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "external_id", "name", "description", "metadata", "write_protected", "id", "created_time", "last_updated_time"
+    )
+
     def __init__(
         self,
         external_id: str = None,
@@ -58,6 +62,8 @@ class DataSetFilter(CogniteFilter):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = ("metadata", "created_time", "last_updated_time", "external_id_prefix", "write_protected")
+
     def __init__(
         self,
         metadata: Dict[str, str] = None,
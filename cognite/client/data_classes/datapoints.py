@@ -26,6 +26,21 @@ class Datapoint(CogniteResource):
         total_variation (float): The total variation of the interpolated underlying function.
     """
 
+    __slots__ = (
+        "timestamp",
+        "value",
+        "average",
+        "max",
+        "min",
+        "count",
+        "sum",
+        "interpolation",
+        "step_interpolation",
+        "continuous_variance",
+        "discrete_variance",
+        "total_variation",
+    )
+
     def __init__(
         self,
         timestamp: Union[int, float] = None,
@@ -186,6 +201,7 @@ class Datapoints:
             dumped = {utils._auxiliary.to_camel_case(key): value for key, value in dumped.items()}
         return {key: value for key, value in dumped.items() if value is not None}
 
+    @utils._profiling.profiled_stage("to_pandas")
     def to_pandas(
         self, column_names: str = "externalId", include_aggregate_name: bool = True, include_errors: bool = False
     ) -> "pandas.DataFrame":
@@ -237,25 +253,25 @@ class Datapoints:
         return df
 
     @classmethod
+    @utils._profiling.profiled_stage("_load")
     def _load(cls, dps_object, expected_fields: List[str] = None, cognite_client=None):
+        expected_fields = (expected_fields or ["value"]) + ["timestamp"]
+        columns = {key: [dp[key] if key in dp else None for dp in dps_object["datapoints"]] for key in expected_fields}
+        return cls._load_columns(dps_object, columns, cognite_client=cognite_client)
+
+    @classmethod
+    def _load_columns(cls, dps_object, columns: Dict[str, List], cognite_client=None):
         instance = cls()
         instance.id = dps_object.get("id")
         instance.external_id = dps_object.get("externalId")
         instance.is_string = dps_object["isString"]  # should never be missing
         instance.is_step = dps_object.get("isStep")  # NB can be null if isString is true
         instance.unit = dps_object.get("unit")
-        expected_fields = (expected_fields or ["value"]) + ["timestamp"]
-        if len(dps_object["datapoints"]) == 0:
-            for key in expected_fields:
-                snake_key = utils._auxiliary.to_snake_case(key)
-                setattr(instance, snake_key, [])
-        else:
-            for key in expected_fields:
-                data = [dp[key] if key in dp else None for dp in dps_object["datapoints"]]
-                snake_key = utils._auxiliary.to_snake_case(key)
-                setattr(instance, snake_key, data)
+        for key, data in columns.items():
+            setattr(instance, utils._auxiliary.to_snake_case(key), data)
         return instance
 
+    @utils._profiling.profiled_stage("_extend")
     def _extend(self, other_dps):
         if self.id is None and self.external_id is None:
             self.id = other_dps.id
@@ -315,6 +331,7 @@ class DatapointsList(CogniteResourceList):
             i["datapoints"] = utils._time.convert_time_attributes_to_datetime(i["datapoints"])
         return json.dumps(item, default=lambda x: x.__dict__, indent=4)
 
+    @utils._profiling.profiled_stage("to_pandas")
     def to_pandas(self, column_names: str = "externalId", include_aggregate_name: bool = True) -> "pandas.DataFrame":
         """Convert the datapoints list into a pandas DataFrame.
 
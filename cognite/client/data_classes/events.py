@@ -48,6 +48,22 @@ class Event(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "external_id",
+        "data_set_id",
+        "start_time",
+        "end_time",
+        "type",
+        "subtype",
+        "description",
+        "metadata",
+        "asset_ids",
+        "source",
+        "id",
+        "last_updated_time",
+        "created_time",
+    )
+
     def __init__(
         self,
         external_id: str = None,
@@ -106,6 +122,24 @@ class EventFilter(CogniteFilter):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "start_time",
+        "end_time",
+        "active_at_time",
+        "metadata",
+        "asset_ids",
+        "asset_external_ids",
+        "root_asset_ids",
+        "asset_subtree_ids",
+        "data_set_ids",
+        "source",
+        "type",
+        "subtype",
+        "created_time",
+        "last_updated_time",
+        "external_id_prefix",
+    )
+
     def __init__(
         self,
         start_time: Union[Dict[str, Any], TimestampRange] = None,
@@ -28,6 +28,24 @@ class FileMetadata(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "external_id",
+        "name",
+        "source",
+        "mime_type",
+        "metadata",
+        "asset_ids",
+        "data_set_id",
+        "source_created_time",
+        "source_modified_time",
+        "security_categories",
+        "id",
+        "uploaded",
+        "uploaded_time",
+        "created_time",
+        "last_updated_time",
+    )
+
     def __init__(
         self,
         external_id: str = None,
@@ -91,6 +109,25 @@ class FileMetadataFilter(CogniteFilter):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "name",
+        "mime_type",
+        "metadata",
+        "asset_ids",
+        "asset_external_ids",
+        "root_asset_ids",
+        "data_set_ids",
+        "asset_subtree_ids",
+        "source",
+        "created_time",
+        "last_updated_time",
+        "uploaded_time",
+        "source_created_time",
+        "source_modified_time",
+        "external_id_prefix",
+        "uploaded",
+    )
+
     def __init__(
         self,
         name: str = None,
@@ -16,6 +16,8 @@ class ServiceAccount(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = ("name", "groups", "id", "is_deleted", "deleted_time")
+
     def __init__(
         self,
         name: str = None,
@@ -53,6 +55,8 @@ class APIKey(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = ("id", "service_account_id", "created_time", "status", "value")
+
     def __init__(
         self,
         id: int = None,
@@ -91,6 +95,8 @@ class Group(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = ("name", "source_id", "capabilities", "id", "is_deleted", "deleted_time")
+
     def __init__(
         self,
         name: str = None,
@@ -127,6 +133,8 @@ class SecurityCategory(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = ("name", "id")
+
     def __init__(self, name: str = None, id: int = None, cognite_client=None):
         self.name = name
         self.id = id
@@ -18,6 +18,8 @@ class Label(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = ("external_id", "name", "description", "created_time")
+
     def __init__(
         self,
         external_id: str = None,
@@ -45,6 +47,8 @@ class LabelFilter(CogniteFilter):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = ("name", "external_id_prefix")
+
     def __init__(self, name: str = None, external_id_prefix: str = None, cognite_client=None):
         self.name = name
         self.external_id_prefix = external_id_prefix
@@ -15,6 +15,8 @@ class Row(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = ("key", "columns", "last_updated_time")
+
     def __init__(
         self, key: str = None, columns: Dict[str, Any] = None, last_updated_time: int = None, cognite_client=None
     ):
@@ -24,6 +26,7 @@ class Row(CogniteResource):
         self._cognite_client = cognite_client
 
     # GenStop
+    @utils._profiling.profiled_stage("to_pandas")
     def to_pandas(self):
         """Convert the instance into a pandas DataFrame.
 
@@ -41,6 +44,7 @@ class RowList(CogniteResourceList):
     _RESOURCE = Row
     _ASSERT_CLASSES = False
 
+    @utils._profiling.profiled_stage("to_pandas")
     def to_pandas(self):
         """Convert the instance into a pandas DataFrame.
 
@@ -63,6 +67,8 @@ class Table(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = ("name", "_db_name")
+
     def __init__(self, name: str = None, cognite_client=None):
         self.name = name
         self._cognite_client = cognite_client
@@ -99,6 +105,8 @@ class Database(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str = None, cognite_client=None):
         self.name = name
         self._cognite_client = cognite_client
@@ -22,6 +22,19 @@ class Relationship(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "source",
+        "target",
+        "start_time",
+        "end_time",
+        "confidence",
+        "data_set",
+        "external_id",
+        "relationship_type",
+        "created_time",
+        "last_updated_time",
+    )
+
     def __init__(
         self,
         source: Dict[str, Any] = None,
@@ -100,6 +113,25 @@ class RelationshipFilter(CogniteFilter):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "sources",
+        "targets",
+        "relationship_types",
+        "data_sets",
+        "start_time",
+        "end_time",
+        "confidence",
+        "last_updated_time",
+        "created_time",
+        "active_at_time",
+        "source_resource",
+        "source_resource_id",
+        "target_resource",
+        "target_resource_id",
+        "data_set",
+        "relationship_type",
+    )
+
     def __init__(
         self,
         sources: List[Dict[str, Any]] = None,
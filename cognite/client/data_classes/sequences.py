@@ -24,6 +24,19 @@ class Sequence(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "asset_id",
+        "external_id",
+        "metadata",
+        "columns",
+        "created_time",
+        "last_updated_time",
+        "data_set_id",
+    )
+
     def __init__(
         self,
         id: int = None,
@@ -97,6 +110,18 @@ class SequenceFilter(CogniteFilter):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "name",
+        "external_id_prefix",
+        "metadata",
+        "asset_ids",
+        "root_asset_ids",
+        "asset_subtree_ids",
+        "created_time",
+        "last_updated_time",
+        "data_set_ids",
+    )
+
     def __init__(
         self,
         name: str = None,
@@ -311,6 +336,7 @@ class SequenceData:
             dumped = {utils._auxiliary.to_camel_case(key): value for key, value in dumped.items()}
         return {key: value for key, value in dumped.items() if value is not None}
 
+    @utils._profiling.profiled_stage("to_pandas")
     def to_pandas(self, column_names: str = "columnExternalId") -> "pandas.DataFrame":
         """Convert the sequence data into a pandas DataFrame.
 
@@ -368,6 +394,7 @@ class SequenceDataList(CogniteResourceList):
     def __str__(self):
         return json.dumps(self.dump(), indent=4)
 
+    @utils._profiling.profiled_stage("to_pandas")
     def to_pandas(self, column_names: str = "externalId|columnExternalId") -> "pandas.DataFrame":
         """Convert the sequence data list into a pandas DataFrame. Each column will be a sequence.
 
@@ -55,6 +55,8 @@ class ThreeDModel(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = ("name", "id", "created_time", "metadata")
+
     def __init__(
         self,
         name: str = None,
@@ -139,6 +141,20 @@ class ThreeDModelRevision(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "id",
+        "file_id",
+        "published",
+        "rotation",
+        "camera",
+        "status",
+        "metadata",
+        "thumbnail_threed_file_id",
+        "thumbnail_url",
+        "asset_mapping_count",
+        "created_time",
+    )
+
     def __init__(
         self,
         id: int = None,
@@ -250,6 +266,8 @@ class ThreeDNode(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = ("id", "tree_index", "parent_id", "depth", "name", "subtree_size", "properties", "bounding_box")
+
     def __init__(
         self,
         id: int = None,
@@ -300,6 +318,8 @@ class ThreeDAssetMapping(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = ("node_id", "asset_id", "tree_index", "subtree_size")
+
     def __init__(
         self,
         node_id: int = None,
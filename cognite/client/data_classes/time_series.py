@@ -27,6 +27,23 @@ class TimeSeries(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "id",
+        "external_id",
+        "name",
+        "is_string",
+        "metadata",
+        "unit",
+        "asset_id",
+        "is_step",
+        "description",
+        "security_categories",
+        "data_set_id",
+        "created_time",
+        "last_updated_time",
+        "legacy_name",
+    )
+
     def __init__(
         self,
         id: int = None,
@@ -151,6 +168,22 @@ class TimeSeriesFilter(CogniteFilter):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "name",
+        "unit",
+        "is_string",
+        "is_step",
+        "metadata",
+        "asset_ids",
+        "asset_external_ids",
+        "root_asset_ids",
+        "asset_subtree_ids",
+        "data_set_ids",
+        "external_id_prefix",
+        "created_time",
+        "last_updated_time",
+    )
+
     def __init__(
         self,
         name: str = None,
@@ -147,6 +147,31 @@ class CogniteDuplicatedError(CogniteMultiException):
         return msg
 
 
+class CogniteCircuitOpenError(Exception):
+    """Cognite Circuit Open Error
+
+    Raised instead of sending a request when the circuit breaker of the client has stopped requests to a failing
+    endpoint family. The request was not sent, so nothing was processed.
+
+    Args:
+        endpoint (str): The endpoint family, e.g. /timeseries/data.
+        retry_after (float): Seconds until a request to the endpoint family is sent again to probe whether it has
+            recovered.
+    """
+
+    def __init__(self, endpoint: str, retry_after: float):
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        self.message = "Requests to {} are failing, not sending more for {:.1f} seconds".format(endpoint, retry_after)
+        super().__init__(self.message)
+
+    def __reduce__(self):
+        return type(self), (self.endpoint, self.retry_after)
+
+    def __str__(self):
+        return self.message
+
+
 class CogniteImportError(Exception):
     """Cognite Import Error
 
@@ -19,6 +19,7 @@ from cognite.client._api.three_d import (
     ThreeDRevisionsAPI,
 )
 from cognite.client._api.time_series import TimeSeriesAPI
+from cognite.client.utils._fake_server import FakeCogniteServer
 
 
 class CogniteClientMock(MagicMock):
@@ -1,2 +1,52 @@
-from cognite.client.utils import _auxiliary, _client_config, _concurrency, _logging, _time, _version_checker
-from cognite.client.utils._time import ms_to_datetime, timestamp_to_ms
+import importlib
+import sys
+
+# Submodules are imported when first accessed as attributes (PEP 562), e.g. utils._time.timestamp_to_ms
+_SUBMODULES = {
+    "_async_http",
+    "_auth",
+    "_auxiliary",
+    "_cache",
+    "_circuit_breaker",
+    "_client_config",
+    "_coalescing",
+    "_codec",
+    "_compression",
+    "_concurrency",
+    "_disk_cache",
+    "_experimental_warning",
+    "_fake_server",
+    "_hooks",
+    "_http2",
+    "_logging",
+    "_metrics",
+    "_profiling",
+    "_prometheus",
+    "_rate_limiting",
+    "_retry",
+    "_sessions",
+    "_streaming",
+    "_time",
+    "_tracing",
+    "_version_checker",
+}
+_LAZY_ATTRIBUTES = {"ms_to_datetime": "_time", "timestamp_to_ms": "_time"}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    if name in _LAZY_ATTRIBUTES:
+        value = globals()[name] = getattr(importlib.import_module("." + _LAZY_ATTRIBUTES[name], __name__), name)
+        return value
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | set(_LAZY_ATTRIBUTES))
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ is only supported from Python 3.7, so earlier versions import every submodule up front
+    for _name in sorted(_SUBMODULES) + sorted(_LAZY_ATTRIBUTES):
+        __getattr__(_name)
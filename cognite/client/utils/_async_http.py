@@ -0,0 +1,120 @@
+"""Asyncio transport of the AsyncCogniteClient.
+
+Requests are sent with an httpx AsyncClient on the event loop of the caller, so any number of requests can be in flight
+without a thread per request. Requires httpx, which the async extra installs (pip install cognite-sdk[async]).
+
+Responses are returned as requests responses with the body already read, so that the response and error handling of
+the blocking client is shared by both clients. Connection errors and timeouts are raised as the requests exceptions
+the blocking client would raise for them.
+"""
+import asyncio
+import io
+from typing import Any, Dict
+
+import requests
+from requests import Response
+from requests.packages.urllib3 import HTTPResponse
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from cognite.client import utils
+
+_HTTP_VERSIONS = {"HTTP/1.0": 10, "HTTP/1.1": 11, "HTTP/2": 20}
+
+
+class AsyncHTTPClient:
+    """Sends requests with an httpx AsyncClient, configured like the sessions of the blocking client.
+
+    An httpx client can only be used on the event loop it was first used on, so a new one is created when the client is
+    used from another event loop.
+
+    Args:
+        config (ClientConfig): The configuration of the client, giving the connection pool size, whether to use HTTP/2
+            and whether to verify certificates.
+        transport (httpx.AsyncBaseTransport): The transport to send requests with. Defaults to the httpx transport.
+    """
+
+    def __init__(self, config: "utils._client_config.ClientConfig", transport: Any = None):
+        self._httpx = utils._auxiliary.local_import("httpx")
+        if config.http2 and transport is None:
+            utils._auxiliary.local_import("h2")
+        self._config = config
+        self._transport = transport
+        self._client = None
+        self._loop = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: bytes = None,
+        params: Dict[str, Any] = None,
+        timeout: float = None,
+    ) -> Response:
+        """Send a request and read the body of the response.
+
+        Returns:
+            Response: The response, with the request it answers as sent.
+        """
+        # The URL and headers are prepared by requests, so that query parameters are encoded as by the blocking client
+        request = requests.Request(method, url, headers=headers, data=data, params=params).prepare()
+        client = self._get_client()
+        try:
+            res = await client.request(
+                request.method,
+                request.url,
+                headers=list(request.headers.items()),
+                content=request.body,
+                timeout=self._httpx.Timeout(timeout),
+            )
+        except self._httpx.TransportError as e:
+            raise utils._http2.to_requests_error(e, request) from e
+        return self._build_response(request, res)
+
+    async def aclose(self):
+        """Close the connections of the client. A new client is created if requests are sent again."""
+        client, self._client, self._loop = self._client, None, None
+        if client is not None:
+            await client.aclose()
+
+    def _get_client(self):
+        loop = asyncio.get_event_loop()
+        if self._client is None or self._loop is not loop:
+            # A client created on another event loop is not closed, as its connections belong to that loop
+            self._client = self._create_client()
+            self._loop = loop
+        return self._client
+
+    def _create_client(self):
+        pool_size = self._config.max_connection_pool_size
+        return self._httpx.AsyncClient(
+            http2=bool(self._config.http2),
+            verify=not self._config.disable_ssl,
+            limits=self._httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            follow_redirects=True,
+            transport=self._transport,
+        )
+
+    @staticmethod
+    def _build_response(request: requests.PreparedRequest, res: Any) -> Response:
+        # httpx has already decoded the content, so the raw response is given no headers
+        raw = HTTPResponse(
+            body=io.BytesIO(res.content),
+            status=res.status_code,
+            reason=res.reason_phrase,
+            version=_HTTP_VERSIONS.get(res.http_version, 11),
+            preload_content=False,
+            decode_content=False,
+        )
+        response = Response()
+        response.status_code = res.status_code
+        response.headers = CaseInsensitiveDict(res.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = raw
+        response.reason = res.reason_phrase
+        response.url = str(res.url)
+        response.request = request
+        response._content = res.content
+        response._content_consumed = True
+        return response
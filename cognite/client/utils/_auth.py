@@ -0,0 +1,95 @@
+import base64
+import json
+import logging
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+log = logging.getLogger("cognite-sdk")
+
+
+def get_jwt_expiry(token: str) -> Optional[float]:
+    """Returns the expiry time of a JWT in seconds since epoch, or None if the token has no readable 'exp' claim.
+
+    The signature is not verified.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload.encode()).decode())["exp"])
+    except (IndexError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+class TokenCache:
+    """Caches the token returned by a token factory until shortly before it expires.
+
+    Tokens are cached only if they are JWTs with an 'exp' claim; for any other token the factory is called every time.
+
+    Args:
+        token_factory (Callable[[], str]): Method which takes no arguments and returns a token.
+        refresh_margin (float): Number of seconds before expiry at which the token is refreshed.
+        background_refresh (bool): Refresh the token in a background thread when it is about to expire, while
+            still handing out the current one, instead of blocking the request until the factory returns.
+    """
+
+    def __init__(self, token_factory: Callable[[], str], refresh_margin: float = 30, background_refresh: bool = False):
+        self.token_factory = token_factory
+        self.refresh_margin = refresh_margin
+        self.background_refresh = background_refresh
+        # The token and its expiry as one tuple, which get reads without the lock. Swapping the tuple is atomic, so a
+        # reader never pairs a token with the expiry of another one.
+        self._cached = None  # type: Optional[Tuple[str, float]]
+        self._cacheable = True
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    def get(self) -> str:
+        """Returns a token which is valid for at least refresh_margin more seconds, if possible."""
+        if not self._cacheable:
+            return self.token_factory()
+        cached = self._cached
+        if cached is not None:
+            token, expires_at = cached
+            now = time.time()
+            if now < expires_at - self.refresh_margin:
+                return token
+            if self.background_refresh and now < expires_at:
+                self._refresh_in_background()
+                return token
+        with self._lock:
+            cached = self._cached
+            if cached is not None and time.time() < cached[1] - self.refresh_margin:
+                return cached[0]
+            return self._refresh()
+
+    def invalidate(self):
+        """Discard the cached token, e.g. after the API has rejected it."""
+        with self._lock:
+            self._cached = None
+
+    def _refresh(self) -> str:
+        token = self.token_factory()
+        expires_at = get_jwt_expiry(token)
+        if expires_at is None:
+            self._cacheable = False
+            self._cached = None
+        else:
+            self._cached = (token, expires_at)
+        return token
+
+    def _refresh_in_background(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, daemon=True).start()
+
+    def _background_refresh(self):
+        try:
+            with self._lock:
+                self._refresh()
+        except Exception as e:
+            log.warning("Failed to refresh token in background: {}".format(e))
+        finally:
+            self._refreshing = False
@@ -12,11 +12,14 @@ import platform
 import random
 import re
 import string
+import threading
 import warnings
 from decimal import Decimal
 from typing import Any, Dict, List, Union
 from urllib.parse import quote
 
+import requests
+
 import cognite.client
 from cognite.client import utils
 from cognite.client.exceptions import CogniteImportError
@@ -48,6 +51,8 @@ def json_dump_default(x):
         return float(x)
     if hasattr(x, "__dict__"):
         return x.__dict__
+    if hasattr(x, "__slots__") and hasattr(x, "dump"):
+        return x.dump()
     raise TypeError("Object {} of type {} can't be serialized by the JSON encoder".format(x, x.__class__))
 
 
@@ -139,9 +144,29 @@ def get_user_agent():
     return "{} {} {}".format(sdk_version, python_version, operating_system)
 
 
+_VERSION_CHECK_STARTED = False
+_VERSION_CHECK_LOCK = threading.Lock()
+
+
+def _check_client_has_newest_major_version_in_background():
+    # PyPI is asked at most once per process, in a daemon thread, so creating a client never waits for it
+    global _VERSION_CHECK_STARTED
+    with _VERSION_CHECK_LOCK:
+        if _VERSION_CHECK_STARTED:
+            return
+        _VERSION_CHECK_STARTED = True
+    threading.Thread(
+        target=_check_client_has_newest_major_version, name="cognite-sdk-version-check", daemon=True
+    ).start()
+
+
 def _check_client_has_newest_major_version():
     this_version = utils._auxiliary.get_current_sdk_version()
-    newest_version = utils._version_checker.get_newest_version_in_major_release("cognite-sdk", this_version)
+    try:
+        newest_version = utils._version_checker.get_cached_newest_version_in_major_release("cognite-sdk", this_version)
+    except (requests.exceptions.RequestException, ValueError):
+        # PyPI is for some reason not reachable or its response could not be parsed, skip version check
+        return
     if newest_version != this_version:
         warnings.warn(
             "You are using version {} of the SDK, however version {} is available. "
@@ -0,0 +1,144 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+IDENTIFIER_FIELDS = ("id", "externalId")
+
+
+def get_identifier_key(identifier: Dict) -> Optional[Tuple[str, Hashable]]:
+    """Returns the field and value of an identifier like {"id": 1} or {"externalId": "a"}, or None if it has neither."""
+    for field in IDENTIFIER_FIELDS:
+        if identifier.get(field) is not None:
+            return field, identifier[field]
+    return None
+
+
+class _Entry:
+    __slots__ = ("item", "keys", "expires")
+
+    def __init__(self, item: Dict, keys: List[Tuple], expires: float):
+        self.item = item
+        self.keys = keys
+        self.expires = expires
+
+
+class ResourceCache:
+    """Caches resources retrieved by id or external id in memory, to avoid retrieving metadata which rarely changes.
+
+    Resources are cached per resource type, e.g. /timeseries, under both their id and external id, for ttl seconds.
+    When more than max_size resources are cached, the least recently used ones are evicted. Updating or deleting
+    resources through the client evicts them, but changes made by other clients are only seen once cached resources
+    expire.
+
+    Args:
+        ttl (float): Seconds a resource is cached.
+        max_size (int): Maximum number of resources cached.
+        resource_paths (Sequence[str]): Resource types to cache.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        max_size: int = 10000,
+        resource_paths: Sequence[str] = ("/assets", "/timeseries", "/sequences", "/files"),
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.resource_paths = frozenset(resource_paths)
+        self._entries = OrderedDict()  # type: OrderedDict[Tuple, _Entry]
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, resource_path: str, identifiers: List[Dict]) -> Dict[int, Dict]:
+        """Returns copies of the cached resources with the given identifiers, by their index in identifiers.
+
+        Args:
+            resource_path (str): The resource type, e.g. /timeseries.
+            identifiers (List[Dict]): Identifiers like {"id": 1} or {"externalId": "a"}.
+
+        Returns:
+            Dict[int, Dict]: The cached resources, as returned by the API.
+        """
+        found = {}
+        now = time.monotonic()
+        with self._lock:
+            for i, identifier in enumerate(identifiers):
+                entry = self._entries.get((resource_path,) + (get_identifier_key(identifier) or ()))
+                if entry is not None and entry.expires <= now:
+                    self._remove(entry)
+                    entry = None
+                if entry is None:
+                    self._misses += 1
+                    continue
+                self._hits += 1
+                for entry_key in entry.keys:
+                    self._entries.move_to_end(entry_key)
+                found[i] = entry.item
+        # Resources are copied so that changes to the returned objects do not change the cache
+        return {i: copy.deepcopy(item) for i, item in found.items()}
+
+    def put(self, resource_path: str, items: Iterable[Dict]):
+        """Caches resources retrieved from the API."""
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            for item in items:
+                keys = [
+                    (resource_path, field, item[field]) for field in IDENTIFIER_FIELDS if item.get(field) is not None
+                ]
+                if not keys:
+                    continue
+                self._invalidate(keys)
+                entry = _Entry(copy.deepcopy(item), keys, expires)
+                for key in keys:
+                    self._entries[key] = entry
+                self._size += 1
+            while self._size > self.max_size:
+                self._remove(next(iter(self._entries.values())))
+                self._evictions += 1
+
+    def invalidate(self, resource_path: str, identifiers: Iterable[Dict]):
+        """Evicts the resources with the given identifiers, e.g. because they were updated or deleted."""
+        keys = []
+        for identifier in identifiers:
+            key = get_identifier_key(identifier) if isinstance(identifier, dict) else None
+            if key is not None:
+                keys.append((resource_path,) + key)
+        with self._lock:
+            self._invalidate(keys)
+
+    def clear(self, resource_path: str = None):
+        """Evicts all resources, or all resources of one type."""
+        with self._lock:
+            if resource_path is None:
+                self._entries.clear()
+                self._size = 0
+                return
+            entries = {id(e): e for key, e in self._entries.items() if key[0] == resource_path}
+            for entry in entries.values():
+                self._remove(entry)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the number of cached resources, and the hits, misses and evictions of the least recently used
+        resources so far."""
+        with self._lock:
+            return {"size": self._size, "hits": self._hits, "misses": self._misses, "evictions": self._evictions}
+
+    def _invalidate(self, keys: Iterable[Tuple]):
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._remove(entry)
+
+    def _remove(self, entry: _Entry):
+        for key in entry.keys:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+        self._size -= 1
+
+    def __repr__(self):
+        return "<{} {}>".format(self.__class__.__name__, self.stats())
@@ -0,0 +1,127 @@
+import re
+import threading
+import time
+from typing import Dict
+
+from cognite.client.exceptions import CogniteCircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_FAMILY = re.compile(r"^/(?:timeseries/(?:data|synthetic)|[^/]+)")
+
+
+def get_endpoint_family(url_path: str) -> str:
+    """Returns the endpoint family a request path belongs to, e.g. /assets for /assets/byids and /timeseries/data for
+    /timeseries/data/list."""
+    match = _FAMILY.match(url_path)
+    return match.group(0) if match else url_path
+
+
+class _Circuit:
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        # Set while the circuit is open, to wake up requests waiting to retry
+        self.opened = threading.Event()
+
+
+class CircuitBreaker:
+    """Fails requests fast while an endpoint family keeps failing, instead of retrying every request.
+
+    Every endpoint family, e.g. /assets, /raw or /timeseries/data, has a circuit. After failure_threshold consecutive
+    attempts failing with a 5xx status code, a connection error or a timeout, the circuit opens: requests to the family
+    raise CogniteCircuitOpenError without being sent, and requests waiting to retry stop retrying. After
+    recovery_timeout seconds, the circuit is half-open, and a single request is sent to probe whether the family has
+    recovered. If it succeeds the circuit closes, otherwise it opens again for another recovery_timeout seconds.
+
+    Args:
+        failure_threshold (int): Consecutive failed attempts which open a circuit.
+        recovery_timeout (float): Seconds a circuit stays open before a probe request is sent.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30):
+        assert failure_threshold >= 1, "failure_threshold must be at least 1, was {}".format(failure_threshold)
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._circuits = {}  # type: Dict[str, _Circuit]
+        self._lock = threading.Lock()
+
+    def get_state(self, url_path: str) -> str:
+        """Returns the state of the circuit of a request path: "closed", "open" or "half_open"."""
+        with self._lock:
+            return self._get_circuit(url_path).state
+
+    def before_attempt(self, url_path: str):
+        """Called before every attempt of a request.
+
+        Raises:
+            CogniteCircuitOpenError: If the circuit is open, or half-open with a probe request in flight.
+        """
+        family = get_endpoint_family(url_path)
+        with self._lock:
+            circuit = self._get_circuit(family)
+            if circuit.state == CLOSED:
+                return
+            retry_after = circuit.opened_at + self.recovery_timeout - time.monotonic()
+            if circuit.state == OPEN and retry_after <= 0:
+                circuit.state = HALF_OPEN
+            if circuit.state == HALF_OPEN and not circuit.probing:
+                circuit.probing = True
+                return
+        raise CogniteCircuitOpenError(family, max(retry_after, 0.0))
+
+    def record(self, url_path: str, failed: bool):
+        """Records the outcome of an attempt of a request, opening or closing its circuit.
+
+        Args:
+            url_path (str): Path of the request relative to the project.
+            failed (bool): Whether the attempt failed with a 5xx status code, a connection error or a timeout.
+        """
+        with self._lock:
+            circuit = self._get_circuit(url_path)
+            if circuit.state == HALF_OPEN:
+                circuit.probing = False
+            if not failed:
+                circuit.failures = 0
+                if circuit.state != CLOSED:
+                    circuit.state = CLOSED
+                    circuit.opened.clear()
+                return
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.opened.set()
+
+    def is_open(self, url_path: str) -> bool:
+        """Returns whether the circuit of a request path is open, or half-open with a probe request in flight."""
+        with self._lock:
+            return self._get_circuit(url_path).opened.is_set()
+
+    def wait(self, url_path: str, seconds: float) -> bool:
+        """Waits before retrying a request, returning early if its circuit opens.
+
+        Returns:
+            bool: Whether the circuit is open, in which case the request should not be retried.
+        """
+        with self._lock:
+            opened = self._get_circuit(url_path).opened
+        if opened.is_set():
+            return True
+        return opened.wait(seconds)
+
+    def _get_circuit(self, url_path: str) -> _Circuit:
+        family = get_endpoint_family(url_path)
+        circuit = self._circuits.get(family)
+        if circuit is None:
+            circuit = self._circuits[family] = _Circuit()
+        return circuit
+
+    def __repr__(self):
+        with self._lock:
+            states = {family: circuit.state for family, circuit in self._circuits.items()}
+        return "<{} {}>".format(self.__class__.__name__, states)
@@ -1,10 +1,9 @@
 import os
 import pprint
 import sys
+import threading
 from typing import *
 
-from requests.exceptions import ConnectionError
-
 from cognite.client import utils
 from cognite.client.exceptions import CogniteAPIKeyError
 
@@ -34,6 +33,10 @@ class _DefaultConfig:
         self.max_workers = int(os.getenv("COGNITE_MAX_WORKERS", 10))
         self.headers = {}
         self.timeout = int(os.getenv("COGNITE_TIMEOUT", 30))
+        self.adaptive_concurrency = os.getenv("COGNITE_ADAPTIVE_CONCURRENCY", False)
+        self.json_codec = os.getenv("COGNITE_JSON_CODEC", "json")
+        self.http2 = os.getenv("COGNITE_HTTP2", False)
+        self.disk_cache = os.getenv("COGNITE_DISK_CACHE_DIR")
 
         # Global
         self.disable_gzip = os.getenv("COGNITE_DISABLE_GZIP", False)
@@ -41,7 +44,7 @@ class _DefaultConfig:
         self.status_forcelist = self._get_status_forcelist()
         self.max_retries = int(os.getenv("COGNITE_MAX_RETRIES", 10))
         self.max_retry_backoff = int(os.getenv("COGNITE_MAX_RETRY_BACKOFF", 30))
-        self.max_connection_pool_size = int(os.getenv("COGNITE_MAX_CONNECTION_POOL_SIZE", 50))
+        self.max_connection_pool_size = int(os.getenv("COGNITE_MAX_CONNECTION_POOL_SIZE", 0)) or None
         self.disable_ssl = os.getenv("COGNITE_DISABLE_SSL", False)
 
     @staticmethod
@@ -65,7 +68,27 @@ class ClientConfig(_DefaultConfig):
         token: Union[Callable[[], str], str] = None,
         disable_pypi_version_check: Optional[bool] = None,
         debug: bool = False,
+        adaptive_concurrency: Optional[bool] = None,
+        rate_limits: Dict[str, float] = None,
+        token_background_refresh: bool = False,
+        json_codec: Union[str, "utils._codec.JsonCodec"] = None,
+        compression: Union[str, "utils._compression.CompressionPolicy"] = None,
+        streaming_json_decode: bool = False,
+        http2: Optional[bool] = None,
+        collect_metrics: bool = False,
+        tracing: bool = False,
+        tracer_provider: Any = None,
+        retry_budget: Union[bool, "utils._retry.RetryBudget"] = False,
+        circuit_breaker: Union[bool, "utils._circuit_breaker.CircuitBreaker"] = False,
+        coalesce_requests: Union[bool, "utils._coalescing.RequestCoalescer"] = False,
+        resource_cache: Union[bool, "utils._cache.ResourceCache"] = False,
+        disk_cache: Union[str, "utils._disk_cache.DiskCache"] = None,
+        max_connection_pool_size: int = None,
+        max_retries: int = None,
+        disable_ssl: Optional[bool] = None,
     ):
+        self._project_resolver = None
+        self._project_lock = threading.Lock()
         super().__init__()
 
         self.api_key = api_key or self.api_key
@@ -75,10 +98,18 @@ class ClientConfig(_DefaultConfig):
         self.max_workers = max_workers or self.max_workers
         self.headers = headers or self.headers
         self.timeout = timeout or self.timeout
+        self.max_connection_pool_size = (
+            max_connection_pool_size or self.max_connection_pool_size or max(self.max_workers, 50)
+        )
+        self.max_retries = max_retries if max_retries is not None else self.max_retries
+        self.disable_ssl = disable_ssl if disable_ssl is not None else self.disable_ssl
         self.token = token
         self.disable_pypi_version_check = (
             disable_pypi_version_check if disable_pypi_version_check is not None else self.disable_pypi_version_check
         )
+        self.adaptive_concurrency = (
+            adaptive_concurrency if adaptive_concurrency is not None else self.adaptive_concurrency
+        )
 
         if self.api_key is None and self.token is None:
             raise CogniteAPIKeyError("No API key or token has been specified")
@@ -92,15 +123,158 @@ class ClientConfig(_DefaultConfig):
         if debug:
             utils._logging._configure_logger_for_debug_mode()
 
+        self.token_background_refresh = token_background_refresh
+        self.json_codec = json_codec or self.json_codec
+        if compression is None or isinstance(compression, str):
+            compression = utils._compression.CompressionPolicy(compression or "gzip")
+        self.compression = compression
+        if streaming_json_decode:
+            utils._auxiliary.local_import("ijson")
+        self.streaming_json_decode = streaming_json_decode
+        self.http2 = http2 if http2 is not None else self.http2
+        if self.http2:
+            utils._auxiliary.local_import("httpx", "h2")
+        self.hooks = utils._hooks.RequestHooks()
+        self.metrics = None
+        if collect_metrics:
+            self.metrics = utils._metrics.MetricsCollector()
+            self.metrics.register(self.hooks)
+        self.tracer = None
+        if tracing or tracer_provider is not None:
+            self.tracer = utils._tracing.Tracer(tracer_provider)
+            self.tracer.register(self.hooks)
+        if retry_budget is True:
+            retry_budget = utils._retry.RetryBudget()
+        self.retry_policy = utils._retry.RetryPolicy(
+            max_retries=self.max_retries,
+            max_backoff=self.max_retry_backoff,
+            status_forcelist=self.status_forcelist,
+            budget=retry_budget or None,
+        )
+        if circuit_breaker is True:
+            circuit_breaker = utils._circuit_breaker.CircuitBreaker()
+        self.circuit_breaker = circuit_breaker or None
+        if coalesce_requests is True:
+            coalesce_requests = utils._coalescing.RequestCoalescer()
+        self.coalescer = coalesce_requests or None
+        if resource_cache is True:
+            resource_cache = utils._cache.ResourceCache()
+        self.resource_cache = resource_cache or None
+        disk_cache = disk_cache or self.disk_cache
+        if isinstance(disk_cache, str):
+            disk_cache = utils._disk_cache.DiskCache(disk_cache)
+        self.disk_cache = disk_cache
+        self._token_cache = None
+        self.rate_limits = rate_limits
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._sessions = utils._sessions.SessionPool(self)
+
         if not self.disable_pypi_version_check:
-            try:
-                utils._auxiliary._check_client_has_newest_major_version()
-            except ConnectionError:
-                # PyPI is for some reason not reachable, skip version check
-                pass
+            utils._auxiliary._check_client_has_newest_major_version_in_background()
+
+    @property
+    def project(self) -> Optional[str]:
+        """The project requests are sent to.
+
+        If no project was given, it is inferred from the credentials the first time it is needed, instead of when the
+        client is created.
+        """
+        if self._project is None and self._project_resolver is not None:
+            with self._project_lock:
+                resolver = self._project_resolver
+                if self._project is None and resolver is not None:
+                    # Requests sent while inferring the project, in this thread, see no project
+                    self._project_resolver = None
+                    try:
+                        self._project = resolver()
+                    except Exception:
+                        self._project_resolver = resolver
+                        raise
+        return self._project
+
+    @project.setter
+    def project(self, project: Optional[str]):
+        self._project = project
+
+    @property
+    def executor(self) -> "utils._concurrency.TaskExecutor":
+        """The pool of worker threads shared by every concurrent operation of clients using this configuration.
+
+        It is created on first use with max_workers threads, and replaced if max_workers is changed.
+
+        Returns:
+            TaskExecutor: The executor.
+        """
+        executor = self._executor
+        if executor is None or executor.max_workers != self.max_workers:
+            with self._executor_lock:
+                if self._executor is None or self._executor.max_workers != self.max_workers:
+                    if self._executor is not None:
+                        self._executor.shutdown(wait=False)
+                    self._executor = utils._concurrency.TaskExecutor(self.max_workers)
+                executor = self._executor
+        return executor
+
+    @property
+    def sessions(self) -> "utils._sessions.SessionPool":
+        """The HTTP sessions of clients using this configuration, with connection pools of max_connection_pool_size.
+
+        Returns:
+            SessionPool: The sessions.
+        """
+        return self._sessions
+
+    @property
+    def concurrency_limiter(self) -> Optional["utils._rate_limiting.AdaptiveConcurrencyLimiter"]:
+        """The adaptive limit on requests in flight, shared by all clients in this process using the same project.
+
+        Returns:
+            Optional[AdaptiveConcurrencyLimiter]: The limiter, or None if adaptive_concurrency is disabled.
+        """
+        if not self.adaptive_concurrency:
+            return None
+        return utils._rate_limiting.get_shared_concurrency_limiter(
+            self.base_url, self.project, self.max_connection_pool_size
+        )
+
+    @property
+    def codec(self) -> "utils._codec.JsonCodec":
+        """The codec used to serialize request bodies and parse response bodies, as selected by json_codec."""
+        return utils._codec.get_codec(self.json_codec)
+
+    @property
+    def token_cache(self) -> Optional["utils._auth.TokenCache"]:
+        """Caches the tokens returned by the token factory until shortly before they expire.
+
+        Returns:
+            Optional[TokenCache]: The token cache, or None if token is not a callable.
+        """
+        if not callable(self.token):
+            return None
+        cache = self._token_cache
+        if cache is None or cache.token_factory is not self.token:
+            cache = self._token_cache = utils._auth.TokenCache(
+                self.token, background_refresh=self.token_background_refresh
+            )
+        return cache
+
+    @property
+    def rate_limiter(self) -> Optional["utils._rate_limiting.RateLimiter"]:
+        """The token-bucket limits on request rate per endpoint family, shared by all clients in this process using the
+        same project and rate_limits.
+
+        Returns:
+            Optional[RateLimiter]: The limiter, or None if no rate limits are set.
+        """
+        if not self.rate_limits:
+            return None
+        return utils._rate_limiting.get_shared_rate_limiter(self.base_url, self.project, self.rate_limits)
 
     def __str__(self):
-        return pprint.pformat(self.__dict__, indent=4)
+        attributes = {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+        attributes["project"] = self._project
+        return pprint.pformat(attributes, indent=4)
 
     def _repr_html_(self):
         return self.__str__()
@@ -0,0 +1,202 @@
+import copy
+import hashlib
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional, Tuple
+
+from requests import Response
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+    def run(self, fn: Callable, *args):
+        try:
+            self.result = fn(*args)
+        except Exception as e:
+            self.error = e
+
+    def get(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class _Batch:
+    def __init__(self):
+        self.call = _Call()
+        self.identifiers = []
+        self.keys = set()
+        self.callers = 0
+
+
+def get_byids_identifiers(url_path: str, payload: Any) -> Optional[List[Dict]]:
+    """Returns the identifiers of a byids request which can be merged with other byids requests, or None if it can not.
+
+    Only requests identifying each item by a single id or external id, without duplicates, are merged.
+    """
+    if not url_path.endswith("/byids") or not isinstance(payload, dict) or not isinstance(payload.get("items"), list):
+        return None
+    keys = set()
+    for identifier in payload["items"]:
+        if not isinstance(identifier, dict) or len(identifier) != 1:
+            return None
+        key = _get_identifier_key(identifier)
+        if key is None or key in keys:
+            return None
+        keys.add(key)
+    return payload["items"]
+
+
+def _get_identifier_key(identifier: Dict) -> Optional[Tuple[str, Hashable]]:
+    for field in ("id", "externalId"):
+        if field in identifier and isinstance(identifier[field], (int, str)):
+            return field, identifier[field]
+    return None
+
+
+def get_credentials_key(headers: Mapping[str, str]) -> str:
+    # A hash of the credentials a request is sent with, so that responses are only shared by requests sent with the
+    # same credentials, without keeping the credentials themselves in the keys of the coalescer
+    credentials = "\n".join(headers.get(name) or "" for name in ("api-key", "Authorization"))
+    return hashlib.sha256(credentials.encode()).hexdigest()
+
+
+def copy_response(res: Response) -> Response:
+    """Returns a shallow copy of a response, sharing its raw urllib3 response, which copy.copy leaves out."""
+    res_copy = copy.copy(res)
+    res_copy.raw = res.raw
+    return res_copy
+
+
+def select_items(res: Response, identifiers: List[Dict], dumps: Callable[[Any], bytes]) -> Response:
+    """Returns a copy of the response to a merged byids request, with only the items of the given identifiers, in their
+    order. Identifiers of items not in the response, which was sent with ignoreUnknownIds, are skipped."""
+    # Every caller of the merged request selects its items from the same response, which is parsed once. Concurrent
+    # callers may both parse it, which is harmless.
+    items = getattr(res, "_items_by_identifier", None)
+    if items is None:
+        items = {}
+        for item in res.json()["items"]:
+            for field in ("id", "externalId"):
+                if item.get(field) is not None:
+                    items[(field, item[field])] = item
+        res._items_by_identifier = items
+    selected = [items[key] for key in map(_get_identifier_key, identifiers) if key in items]
+    res_copy = copy_response(res)
+    res_copy._content = dumps({"items": selected})
+    return res_copy
+
+
+class RequestCoalescer:
+    """Shares requests between threads reading the same resources at the same time.
+
+    Concurrent identical requests which only read, e.g. GET requests and POST requests to /byids, /list and /search
+    endpoints, are sent once, and every caller gets the response. Concurrent requests to the same /byids endpoint are
+    merged into one request for the union of their ids and external ids, and every caller gets the items it asked for.
+    A /byids request is sent at once if no other request to its endpoint is in flight. Otherwise, it waits window
+    seconds for others to join it before the merged request is sent. If a merged request fails, e.g.
+    because one of the callers asked for an id which does not exist, every caller sends its own request instead.
+
+    Args:
+        window (float): Seconds a /byids request waits for others to merge with, while another request to its endpoint
+            is in flight.
+        max_batch_size (int): Maximum number of ids and external ids in a merged /byids request.
+    """
+
+    def __init__(self, window: float = 0.005, max_batch_size: int = 1000):
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._calls = {}  # type: Dict[Hashable, _Call]
+        self._batches = {}  # type: Dict[Hashable, _Batch]
+        self._in_flight = Counter()  # type: Counter
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, send: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Calls send, unless a call with the same key is in flight, in which case its result is shared.
+
+        Args:
+            key (Hashable): Identifies the request.
+            send (Callable[[], Any]): Sends the request.
+
+        Returns:
+            Tuple[Any, bool]: What send returned or raised, and whether this thread called it.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if leader:
+            call.run(send)
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.get(), leader
+
+    def do_batched(
+        self,
+        key: Hashable,
+        identifiers: List[Dict],
+        send: Callable[[List[Dict]], Tuple[Response, Any]],
+        split: Callable[[Response, List[Dict]], Optional[Response]],
+    ) -> Optional[Tuple[Response, Any]]:
+        """Merges a /byids request with the concurrent /byids requests with the same key.
+
+        Args:
+            key (Hashable): Identifies the endpoint and the parameters of the request other than its identifiers.
+            identifiers (List[Dict]): The ids and external ids of the request, as returned by get_byids_identifiers.
+            send (Callable[[List[Dict]], Tuple[Response, Any]]): Sends a request for the given identifiers, returning
+                the response and request details.
+            split (Callable[[Response, List[Dict]], Optional[Response]]): Returns the response to a merged request
+                for the items of the given identifiers only, or None if the merged request failed.
+
+        Returns:
+            Optional[Tuple[Response, Any]]: The response for the caller's identifiers, and the request details
+            returned by send if this thread sent it, otherwise None. None if the caller should send its own request.
+        """
+        keys = [_get_identifier_key(identifier) for identifier in identifiers]
+        with self._lock:
+            batch = self._batches.get(key)
+            leader = batch is None or len(batch.keys.union(keys)) > self.max_batch_size
+            if leader:
+                batch = self._batches[key] = _Batch()
+            for identifier_key, identifier in zip(keys, identifiers):
+                if identifier_key not in batch.keys:
+                    batch.keys.add(identifier_key)
+                    batch.identifiers.append(identifier)
+            batch.callers += 1
+        if leader:
+            with self._lock:
+                concurrent = self._in_flight[key] > 0
+            if concurrent:
+                time.sleep(self.window)
+            with self._lock:
+                if self._batches.get(key) is batch:
+                    del self._batches[key]
+                self._in_flight[key] += 1
+            try:
+                batch.call.run(send, batch.identifiers)
+            finally:
+                with self._lock:
+                    self._in_flight[key] -= 1
+                    if not self._in_flight[key]:
+                        del self._in_flight[key]
+            batch.call.done.set()
+        try:
+            res, details = batch.call.get()
+        except Exception:
+            if batch.callers == 1:
+                raise
+            return None
+        if batch.callers == 1:
+            return res, details
+        res = split(res, identifiers)
+        if res is None:
+            return None
+        return res, details if leader else None
@@ -0,0 +1,188 @@
+"""JSON codecs used to serialize request bodies and parse response bodies.
+
+The standard library codec is always available. The orjson and ujson codecs require the respective package. All codecs
+serialize NaN and infinity as NaN, Infinity and -Infinity, like the standard library json module does by default, or
+raise a ValueError for them if created with allow_nan=False.
+"""
+import json
+import math
+from decimal import Decimal
+from typing import Any, Callable, Iterator, Union
+
+from cognite.client import utils
+from cognite.client.exceptions import CogniteImportError
+
+
+def _json_default(x):
+    if type(x).__module__ == "numpy" and hasattr(x, "tolist"):
+        return x.tolist()
+    return utils._auxiliary.json_dump_default(x)
+
+
+def _contains_non_finite(obj: Any) -> bool:
+    # Only called when the serialized object may contain NaN or infinity, so the common case is never walked
+    stack = [obj]
+    while stack:
+        x = stack.pop()
+        if isinstance(x, (float, Decimal)):
+            if not math.isfinite(x):
+                return True
+        elif isinstance(x, dict):
+            stack.extend(x.values())
+        elif isinstance(x, (list, tuple)):
+            stack.extend(x)
+        elif x is not None and not isinstance(x, (str, int)):
+            stack.append(_json_default(x))
+    return False
+
+
+def _dumps_non_finite(obj: Any, allow_nan: bool) -> bytes:
+    # The JSON libraries differ in whether and how they serialize NaN and infinity, so objects containing them are
+    # serialized by the json module
+    if not allow_nan:
+        raise ValueError("Out of range float values are not JSON compliant")
+    return json.dumps(obj, default=_json_default).encode()
+
+
+class JsonCodec:
+    """Serializes objects to JSON bytes and parses JSON.
+
+    Subclasses must handle the types supported by :code:`utils._auxiliary.json_dump_default`, and numpy arrays.
+
+    Args:
+        allow_nan (bool): Serialize NaN and infinity as NaN, Infinity and -Infinity. These are not valid JSON, so pass
+            False to raise a ValueError for them instead.
+    """
+
+    name = None
+
+    def __init__(self, allow_nan: bool = True):
+        self.allow_nan = allow_nan
+
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        raise NotImplementedError
+
+    def iterdumps(self, obj: Any) -> Iterator[bytes]:
+        """Serializes an object to JSON, yielding the result in chunks which concatenate to :code:`dumps(obj)`."""
+        yield self.dumps(obj)
+
+    def __repr__(self):
+        return "<{} {}>".format(self.__class__.__name__, self.name)
+
+
+class StdlibJsonCodec(JsonCodec):
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, default=_json_default, allow_nan=self.allow_nan).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def iterdumps(self, obj: Any) -> Iterator[bytes]:
+        # JSONEncoder.iterencode falls back to the pure Python encoder, so large containers are instead split into
+        # pieces which are each serialized by the C encoder
+        return _iter_json_chunks(obj, self.dumps)
+
+
+_LIST_BATCH_SIZE = 256
+
+
+def _iter_json_chunks(obj: Any, encode: Callable[[Any], bytes]) -> Iterator[bytes]:
+    if isinstance(obj, dict) and obj and all(isinstance(k, str) for k in obj):
+        separator = b"{"
+        for k, v in obj.items():
+            yield separator + encode(k) + b": "
+            yield from _iter_json_chunks(v, encode)
+            separator = b", "
+        yield b"}"
+    elif isinstance(obj, list) and len(obj) > _LIST_BATCH_SIZE:
+        separator = b"["
+        for i in range(0, len(obj), _LIST_BATCH_SIZE):
+            yield separator + encode(obj[i : i + _LIST_BATCH_SIZE])[1:-1]
+            separator = b", "
+        yield b"]"
+    elif isinstance(obj, list) and any(isinstance(item, (dict, list)) for item in obj):
+        separator = b"["
+        for item in obj:
+            yield separator
+            yield from _iter_json_chunks(item, encode)
+            separator = b", "
+        yield b"]"
+    else:
+        yield encode(obj)
+
+
+class OrjsonCodec(JsonCodec):
+    """Uses orjson, which serializes numpy scalars and arrays natively."""
+
+    name = "orjson"
+
+    def __init__(self, allow_nan: bool = True):
+        super().__init__(allow_nan)
+        self._orjson = utils._auxiliary.local_import("orjson")
+        self._options = self._orjson.OPT_SERIALIZE_NUMPY | self._orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        data = self._orjson.dumps(obj, default=utils._auxiliary.json_dump_default, option=self._options)
+        # orjson serializes NaN and infinity as null
+        if b"null" in data and _contains_non_finite(obj):
+            return _dumps_non_finite(obj, self.allow_nan)
+        return data
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    name = "ujson"
+
+    def __init__(self, allow_nan: bool = True):
+        super().__init__(allow_nan)
+        self._ujson = utils._auxiliary.local_import("ujson")
+
+    def dumps(self, obj: Any) -> bytes:
+        # Depending on its version, ujson raises an OverflowError for NaN and infinity, or serializes them
+        try:
+            data = self._ujson.dumps(obj, default=_json_default).encode()
+        except OverflowError:
+            if not _contains_non_finite(obj):
+                raise
+        else:
+            if (b"NaN" not in data and b"Infinity" not in data) or not _contains_non_finite(obj):
+                return data
+        return _dumps_non_finite(obj, self.allow_nan)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._ujson.loads(data)
+
+
+_CODECS = {codec.name: codec for codec in [StdlibJsonCodec, OrjsonCodec, UjsonCodec]}
+_INSTANCES = {}
+
+
+def get_codec(codec: Union[str, JsonCodec]) -> JsonCodec:
+    """Returns the codec with the given name, or the given codec if it is a JsonCodec.
+
+    Args:
+        codec (Union[str, JsonCodec]): 'json', 'orjson', 'ujson', or 'auto' for orjson if it is installed and json
+            otherwise.
+
+    Returns:
+        JsonCodec: The codec.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == "auto":
+        try:
+            return get_codec("orjson")
+        except CogniteImportError:
+            return get_codec("json")
+    if codec not in _CODECS:
+        raise ValueError("Unknown JSON codec '{}', must be one of {}".format(codec, sorted(_CODECS) + ["auto"]))
+    if codec not in _INSTANCES:
+        _INSTANCES[codec] = _CODECS[codec]()
+    return _INSTANCES[codec]
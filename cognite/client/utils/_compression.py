@@ -0,0 +1,125 @@
+import logging
+import zlib
+from typing import Iterable, Optional, Set, Tuple
+
+from cognite.client import utils
+
+log = logging.getLogger("cognite-sdk")
+
+
+def _parse_accept_encoding(header: Optional[str]) -> Set[str]:
+    # The codings listed in an Accept-Encoding header, except those with q=0
+    accepted = set()
+    for coding in (header or "").split(","):
+        name, _, params = coding.partition(";")
+        params = params.replace(" ", "")
+        try:
+            if params.startswith("q=") and float(params[2:]) == 0:
+                continue
+        except ValueError:
+            continue
+        if name.strip():
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+class CompressionPolicy:
+    """Decides whether and how request bodies are compressed.
+
+    When the API rejects a compressed body with status code 415, the policy falls back to the first of gzip and deflate
+    listed in the Accept-Encoding header of the response, or to sending bodies uncompressed if it lists neither, and
+    the request is sent again. The fallback is kept for every later request using the policy.
+
+    Args:
+        algorithm (str): "gzip", "deflate" or "zstd", or None to never compress. zstd requires the zstandard package.
+        min_size (int): Bodies smaller than this number of bytes are sent uncompressed.
+        level (int): Compression level. Defaults to 6 for gzip and deflate, and 3 for zstd. Level 6 compresses JSON
+            almost as well as level 9, in a fraction of the time.
+
+    Examples:
+
+        Only compress bodies of at least 1 kB, and trade some compression for speed::
+
+            >>> from cognite.client import CogniteClient
+            >>> from cognite.client.utils._compression import CompressionPolicy
+            >>> c = CogniteClient(compression=CompressionPolicy(min_size=1024, level=1))
+    """
+
+    ALGORITHMS = ("gzip", "deflate", "zstd")
+
+    def __init__(self, algorithm: Optional[str] = "gzip", min_size: int = 0, level: int = None):
+        if algorithm is not None and algorithm not in self.ALGORITHMS:
+            raise ValueError("Unknown compression algorithm '{}', must be one of {}".format(algorithm, self.ALGORITHMS))
+        if algorithm == "zstd":
+            utils._auxiliary.local_import("zstandard")
+        self.algorithm = algorithm
+        self.min_size = min_size
+        self.level = level if level is not None else (3 if algorithm == "zstd" else 6)
+        # The algorithm in use, which is a fallback once the API has rejected the configured one
+        self._active = algorithm
+
+    def compress(self, chunks: Iterable[bytes]) -> Tuple[bytes, Optional[str]]:
+        """Compresses a body given in chunks, without first concatenating the uncompressed chunks.
+
+        Args:
+            chunks (Iterable[bytes]): The uncompressed body.
+
+        Returns:
+            Tuple[bytes, Optional[str]]: The body to send, and its content encoding, or None if it was not compressed.
+        """
+        chunks = iter(chunks)
+        head = []
+        head_size = 0
+        for chunk in chunks:
+            head.append(chunk)
+            head_size += len(chunk)
+            if head_size >= self.min_size:
+                break
+        algorithm = self._active
+        if algorithm is None or head_size < self.min_size:
+            return b"".join(head + list(chunks)), None
+
+        compressor = self._get_compressor(algorithm)
+        compressed = [compressor.compress(b"".join(head))]
+        for chunk in chunks:
+            compressed.append(compressor.compress(chunk))
+        compressed.append(compressor.flush())
+        return b"".join(compressed), algorithm
+
+    def negotiate(self, rejected: str, accept_encoding: Optional[str]) -> bool:
+        """Falls back to another algorithm after the API rejected a body compressed with the given one.
+
+        Args:
+            rejected (str): The content encoding of the rejected body.
+            accept_encoding (Optional[str]): The Accept-Encoding header of the response rejecting it.
+
+        Returns:
+            bool: Whether the request should be sent again, with a body compressed by compress.
+        """
+        if rejected != self._active:
+            # Another request has already fallen back
+            return True
+        if self._active is None:
+            return False
+        accepted = _parse_accept_encoding(accept_encoding) - {rejected}
+        fallback = next((algorithm for algorithm in ("gzip", "deflate") if algorithm in accepted), None)
+        log.warning(
+            "The API does not accept {} compressed request bodies, {}".format(
+                rejected, "using {} instead".format(fallback) if fallback else "sending them uncompressed"
+            )
+        )
+        self._active = fallback
+        return True
+
+    def _get_compressor(self, algorithm: str):
+        level = self.level if algorithm == self.algorithm else 6
+        if algorithm == "gzip":
+            return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        if algorithm == "deflate":
+            return zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS)
+        return utils._auxiliary.local_import("zstandard").ZstdCompressor(level=level).compressobj()
+
+    def __repr__(self):
+        return "<{} algorithm={} min_size={} level={}>".format(
+            self.__class__.__name__, self.algorithm, self.min_size, self.level
+        )
@@ -1,8 +1,16 @@
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from concurrent.futures.thread import ThreadPoolExecutor
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from cognite.client.exceptions import CogniteAPIError, CogniteDuplicatedError, CogniteNotFoundError
 
+try:
+    from contextvars import copy_context
+except ImportError:  # Python < 3.7
+    copy_context = None
+
 
 class TasksSummary:
     def __init__(
@@ -107,34 +115,269 @@ def collect_exc_info_and_raise(
         ) from dup_exc
 
 
-def execute_tasks_concurrently(func: Callable, tasks: Union[List[Tuple], List[Dict]], max_workers: int) -> TasksSummary:
+_worker_state = threading.local()
+
+
+class _Job:
+    def __init__(self, fn: Callable, args: Tuple, kwargs: Dict):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future = Future()
+        # Runs in a copy of the submitting thread's context, so e.g. the current tracing span carries over
+        self.context = copy_context() if copy_context is not None else None
+        self._claimed = False
+        self._lock = threading.Lock()
+
+    def claim(self) -> bool:
+        with self._lock:
+            if self._claimed:
+                return False
+            self._claimed = True
+        return self.future.set_running_or_notify_cancel()
+
+    def run(self):
+        self.claim_and_run()
+
+    def claim_and_run(self) -> bool:
+        if not self.claim():
+            return False
+        try:
+            if self.context is None:
+                result = self.fn(*self.args, **self.kwargs)
+            else:
+                result = self.context.run(self.fn, *self.args, **self.kwargs)
+        except BaseException as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(result)
+        return True
+
+
+class TaskExecutor:
+    """A long-lived, bounded pool of worker threads shared by all concurrent operations of a client.
+
+    Worker threads are started lazily and reused across calls. Tasks submitted from one of the worker threads (e.g. a
+    paginated list issued from inside a concurrent subtree retrieval) never block waiting for a free worker: the
+    submitting thread runs every task that no other worker has picked up yet itself, so nested submissions can not
+    deadlock and the total number of threads stays bounded by max_workers.
+
+    Args:
+        max_workers (int): The maximum number of worker threads.
+    """
+
+    def __init__(self, max_workers: int):
+        assert max_workers > 0, "Number of workers should be >= 1, was {}".format(max_workers)
+        self.max_workers = max_workers
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Schedule fn(*args, **kwargs) to run on a worker thread.
+
+        Returns:
+            Future: A future representing the result of the call.
+        """
+        return self._submit_job(_Job(fn, args, kwargs)).future
+
+    def run_all(self, fn: Callable, tasks: Union[List[Tuple], List[Dict]]) -> List[Future]:
+        """Run fn once per task and wait for all of them to complete.
+
+        A task is either a tuple of positional arguments or a dict of keyword arguments. A single task, or any tasks
+        submitted from a worker thread, are run in the calling thread unless a worker has already picked them up.
+
+        Returns:
+            List[Future]: Completed futures in the same order as the tasks.
+        """
+        jobs = [_Job(fn, (), task) if isinstance(task, dict) else _Job(fn, task, {}) for task in tasks]
+        if len(jobs) == 1:
+            jobs[0].run()
+            return [jobs[0].future]
+        for job in jobs:
+            self._submit_job(job)
+        if self.in_worker_thread():
+            for job in jobs:
+                job.run()
+        for job in jobs:
+            job.future.exception()
+        return [job.future for job in jobs]
+
+    def iter_completed(
+        self,
+        fn: Callable,
+        tasks: Union[List[Tuple], List[Dict]],
+        max_in_flight: int = None,
+        not_cancelled: List[int] = None,
+    ) -> Iterator[Tuple[int, Future]]:
+        """Run fn once per task and yield (task index, future) pairs in the order the tasks complete.
+
+        At most max_in_flight tasks are scheduled at any time; the rest are scheduled as earlier ones complete. When the
+        generator is closed before it is exhausted, tasks which have not started yet are cancelled and never run.
+
+        Args:
+            fn (Callable): The function to call.
+            tasks (Union[List[Tuple], List[Dict]]): Positional argument tuples or keyword argument dicts, one per call.
+            max_in_flight (int): Maximum number of tasks scheduled at once. Defaults to all of them.
+            not_cancelled (List[int]): If given, the indices of the tasks which had already started, and so could not
+                be cancelled, when the generator was closed are appended to it.
+
+        Yields:
+            Tuple[int, Future]: The index of the task and its completed future.
+        """
+        jobs = [_Job(fn, (), task) if isinstance(task, dict) else _Job(fn, task, {}) for task in tasks]
+        limit = max_in_flight or len(jobs)
+        inline = len(jobs) == 1
+        helping = inline or self.in_worker_thread()
+        not_scheduled = deque(enumerate(jobs))
+        in_flight = {}
+        try:
+            while not_scheduled or in_flight:
+                while not_scheduled and len(in_flight) < limit:
+                    i, job = not_scheduled.popleft()
+                    in_flight[job.future] = (i, job)
+                    if not inline:
+                        self._submit_job(job)
+                if helping:
+                    for i, job in list(in_flight.values()):
+                        if job.claim_and_run():
+                            break
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: in_flight[f][0]):
+                    i, _ = in_flight.pop(future)
+                    yield i, future
+        finally:
+            for future, (i, _) in in_flight.items():
+                if not future.cancel() and not_cancelled is not None:
+                    not_cancelled.append(i)
+            for _, job in not_scheduled:
+                job.future.cancel()
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker threads. A new set of workers is started if the executor is used again."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of submitted tasks waiting for a free worker thread."""
+        pool = self._pool
+        return pool._work_queue.qsize() if pool is not None else 0
+
+    @staticmethod
+    def in_worker_thread() -> bool:
+        return getattr(_worker_state, "is_worker", False)
+
+    def _submit_job(self, job: _Job) -> _Job:
+        self._get_pool().submit(self._run_in_worker, job)
+        return job
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        pool = self._pool
+        if pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(self.max_workers)
+                pool = self._pool
+        return pool
+
+    @staticmethod
+    def _run_in_worker(job: _Job):
+        _worker_state.is_worker = True
+        job.run()
+
+
+def is_retryable_error(exc: Exception) -> bool:
+    return isinstance(exc, CogniteAPIError) and (exc.code == 429 or exc.code >= 500)
+
+
+def stream_tasks_concurrently(
+    func: Callable,
+    tasks: Union[List[Tuple], List[Dict]],
+    executor: TaskExecutor,
+    max_in_flight: int = None,
+    fail_fast: bool = False,
+    not_cancelled: List[int] = None,
+) -> Iterator[Tuple[int, Future]]:
+    """Run func once per task on the executor and yield (task index, future) pairs as the tasks complete.
+
+    Args:
+        func (Callable): The function to call.
+        tasks (Union[List[Tuple], List[Dict]]): Positional argument tuples or keyword argument dicts, one per call.
+        executor (TaskExecutor): The executor to run the tasks on.
+        max_in_flight (int): Maximum number of tasks scheduled at once. Defaults to all of them.
+        fail_fast (bool): Stop after the first task failing with a non-retryable error, cancelling the tasks which
+            have not started yet.
+        not_cancelled (List[int]): If given, the indices of the tasks which were still running when the stream
+            stopped early are appended to it.
+
+    Yields:
+        Tuple[int, Future]: The index of the task and its completed future.
+    """
+    completed = executor.iter_completed(func, tasks, max_in_flight=max_in_flight, not_cancelled=not_cancelled)
+    try:
+        for i, future in completed:
+            yield i, future
+            if fail_fast and future.exception() is not None and not is_retryable_error(future.exception()):
+                return
+    finally:
+        completed.close()
+
+
+def execute_tasks_concurrently(
+    func: Callable,
+    tasks: Union[List[Tuple], List[Dict]],
+    max_workers: int,
+    executor: TaskExecutor = None,
+    max_in_flight: int = None,
+    fail_fast: bool = False,
+) -> TasksSummary:
     assert max_workers > 0, "Number of workers should be >= 1, was {}".format(max_workers)
-    with ThreadPoolExecutor(max_workers) as p:
-        futures = []
-        for task in tasks:
-            if isinstance(task, dict):
-                futures.append(p.submit(func, **task))
-            elif isinstance(task, tuple):
-                futures.append(p.submit(func, *task))
-
-        successful_tasks = []
-        failed_tasks = []
-        unknown_result_tasks = []
-        results = []
-        exceptions = []
-        for i, f in enumerate(futures):
-            try:
-                res = f.result()
-                successful_tasks.append(tasks[i])
-                results.append(res)
-            except Exception as e:
-                exceptions.append(e)
-                if isinstance(e, CogniteAPIError):
-                    if e.code < 500:
-                        failed_tasks.append(tasks[i])
-                    else:
-                        unknown_result_tasks.append(tasks[i])
+    if executor is None:
+        executor = TaskExecutor(max_workers)
+        try:
+            return execute_tasks_concurrently(
+                func, tasks, max_workers, executor=executor, max_in_flight=max_in_flight, fail_fast=fail_fast
+            )
+        finally:
+            executor.shutdown(wait=False)
+
+    not_cancelled = []
+    if fail_fast or max_in_flight:
+        completed = stream_tasks_concurrently(
+            func, tasks, executor, max_in_flight=max_in_flight, fail_fast=fail_fast, not_cancelled=not_cancelled
+        )
+        futures = {i: f for i, f in completed}
+    else:
+        futures = dict(enumerate(executor.run_all(func, tasks)))
+
+    successful_tasks = []
+    failed_tasks = []
+    unknown_result_tasks = []
+    results = []
+    exceptions = []
+    for i, task in enumerate(tasks):
+        if i in not_cancelled:
+            # Still running when the other tasks were cancelled, so it may or may not have been processed
+            unknown_result_tasks.append(task)
+            continue
+        if i not in futures:
+            # Cancelled before it was sent, so nothing was processed
+            failed_tasks.append(task)
+            continue
+        try:
+            res = futures[i].result()
+            successful_tasks.append(task)
+            results.append(res)
+        except Exception as e:
+            exceptions.append(e)
+            if isinstance(e, CogniteAPIError):
+                if e.code < 500:
+                    failed_tasks.append(task)
                 else:
-                    failed_tasks.append(tasks[i])
+                    unknown_result_tasks.append(task)
+            else:
+                failed_tasks.append(task)
 
-        return TasksSummary(successful_tasks, unknown_result_tasks, failed_tasks, results, exceptions)
+    return TasksSummary(successful_tasks, unknown_result_tasks, failed_tasks, results, exceptions)
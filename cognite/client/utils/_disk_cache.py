@@ -0,0 +1,207 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    scope TEXT NOT NULL,
+    resource_path TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    external_id TEXT,
+    last_updated_time INTEGER NOT NULL,
+    item TEXT NOT NULL,
+    PRIMARY KEY (scope, resource_path, id)
+);
+CREATE INDEX IF NOT EXISTS resources_external_id ON resources (scope, resource_path, external_id);
+CREATE TABLE IF NOT EXISTS list_queries (
+    scope TEXT NOT NULL,
+    resource_path TEXT NOT NULL,
+    query TEXT NOT NULL,
+    synced_at INTEGER NOT NULL,
+    listed_at REAL NOT NULL,
+    ids TEXT NOT NULL,
+    PRIMARY KEY (scope, resource_path, query)
+);
+"""
+
+
+ListQuery = NamedTuple("ListQuery", [("synced_at", int), ("ids", List[int])])
+
+
+class DiskCache:
+    """Stores listed resources in an SQLite database, so that listing them again only retrieves what has changed.
+
+    The first time resources are listed with a filter, every resource matching it is listed and stored. When they are
+    listed with the same filter again, only the resources updated since then are listed, by filtering on
+    lastUpdatedTime, and the others are loaded from the database. The database can be shared by concurrent processes.
+
+    Resources deleted by other clients are not noticed by listing updated resources, so every full_refresh_interval
+    seconds all resources matching a filter are listed again. Resources deleted through the client are removed from the
+    database at once.
+
+    Resources which stopped matching a filter are found by also listing every resource of the type updated since the
+    last listing, whether it matches the filter or not. With a filter, refreshing therefore costs as much as the
+    number of resources of that type updated in the whole project, not only of those matching the filter.
+
+    Args:
+        directory (str): Directory to store the database in. Created if it does not exist.
+        resource_paths (Sequence[str]): Resource types to store.
+        overlap (float): Seconds before the last listing to list updated resources from, to allow for clock skew
+            between this machine and the API.
+        full_refresh_interval (float): Seconds after which all resources matching a filter are listed again.
+    """
+
+    FILENAME = "cognite-sdk-cache.sqlite"
+
+    def __init__(
+        self,
+        directory: str,
+        resource_paths: Sequence[str] = ("/assets", "/timeseries"),
+        overlap: float = 300,
+        full_refresh_interval: float = 86400,
+    ):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, self.FILENAME)
+        self.resource_paths = frozenset(resource_paths)
+        self.overlap = overlap
+        self.full_refresh_interval = full_refresh_interval
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections can not be shared between threads, so every thread has its own
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=60)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get_list_query(self, scope: str, resource_path: str, query: str) -> Optional[ListQuery]:
+        """Returns when resources were last listed with a query, and which resources matched it, unless they have not
+        been listed with it for full_refresh_interval seconds.
+
+        Args:
+            scope (str): The base URL and project of the client.
+            resource_path (str): The resource type, e.g. /assets.
+            query (str): The filter and other parameters the resources were listed with, as JSON.
+
+        Returns:
+            Optional[ListQuery]: The lastUpdatedTime to list updated resources from, and the ids of the resources in the
+            order they were listed.
+        """
+        row = (
+            self._connect()
+            .execute(
+                "SELECT synced_at, listed_at, ids FROM list_queries WHERE scope = ? AND resource_path = ? AND query = ?",
+                (scope, resource_path, query),
+            )
+            .fetchone()
+        )
+        if row is None or time.time() - row[1] > self.full_refresh_interval:
+            return None
+        return ListQuery(row[0], json.loads(row[2]))
+
+    def store(
+        self,
+        scope: str,
+        resource_path: str,
+        query: str,
+        started_at: float,
+        items: Iterable[Dict],
+        ids: Iterable[int],
+        full: bool,
+    ):
+        """Stores listed resources, and the ids of the resources matching a query.
+
+        Args:
+            scope (str): The base URL and project of the client.
+            resource_path (str): The resource type, e.g. /assets.
+            query (str): The filter and other parameters the resources were listed with, as JSON.
+            started_at (float): When the listing started, in seconds since epoch.
+            items (Iterable[Dict]): The listed resources, as returned by the API. Resources without an id or a
+                lastUpdatedTime are not stored.
+            ids (Iterable[int]): The ids of all resources matching the query, in the order they were listed.
+            full (bool): Whether all resources matching the query were listed, rather than updated ones only.
+        """
+        rows = [
+            (scope, resource_path, item["id"], item.get("externalId"), item["lastUpdatedTime"], json.dumps(item))
+            for item in items
+            if item.get("id") is not None and item.get("lastUpdatedTime") is not None
+        ]
+        conn = self._connect()
+        with conn:
+            # Resources are only replaced by newer versions, in case a concurrent process stores an older listing
+            if sqlite3.sqlite_version_info >= (3, 24, 0):
+                conn.executemany(
+                    "INSERT INTO resources VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (scope, resource_path, id) DO UPDATE "
+                    "SET external_id = excluded.external_id, last_updated_time = excluded.last_updated_time, "
+                    "item = excluded.item WHERE excluded.last_updated_time >= resources.last_updated_time",
+                    rows,
+                )
+            else:
+                # Upserts were added in SQLite 3.24
+                conn.executemany(
+                    "INSERT OR REPLACE INTO resources SELECT ?, ?, ?, ?, ?, ? WHERE NOT EXISTS ("
+                    "SELECT 1 FROM resources WHERE scope = ? AND resource_path = ? AND id = ? AND last_updated_time > ?)",
+                    [row + (row[0], row[1], row[2], row[4]) for row in rows],
+                )
+            listed_at = started_at
+            if not full:
+                row = conn.execute(
+                    "SELECT listed_at FROM list_queries WHERE scope = ? AND resource_path = ? AND query = ?",
+                    (scope, resource_path, query),
+                ).fetchone()
+                listed_at = row[0] if row is not None else started_at
+            conn.execute(
+                "INSERT OR REPLACE INTO list_queries VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    scope,
+                    resource_path,
+                    query,
+                    int((started_at - self.overlap) * 1000),
+                    listed_at,
+                    json.dumps(list(ids)),
+                ),
+            )
+
+    def load(self, scope: str, resource_path: str, ids: Iterable[int]) -> List[Dict]:
+        """Returns the stored resources with the given ids, in the order of the ids. Ids of deleted resources are
+        skipped."""
+        conn = self._connect()
+        items = {}
+        ids = list(ids)
+        for i in range(0, len(ids), 500):
+            chunk = ids[i : i + 500]
+            rows = conn.execute(
+                "SELECT id, item FROM resources WHERE scope = ? AND resource_path = ? AND id IN ({})".format(
+                    ",".join("?" * len(chunk))
+                ),
+                [scope, resource_path] + chunk,
+            )
+            items.update(rows)
+        return [json.loads(items[item_id]) for item_id in ids if item_id in items]
+
+    def delete(self, scope: str, resource_path: str, identifiers: Iterable[Dict]):
+        """Removes deleted resources, given as identifiers like {"id": 1} or {"externalId": "a"}."""
+        conn = self._connect()
+        with conn:
+            for identifier in identifiers:
+                for field, column in (("id", "id"), ("externalId", "external_id")):
+                    if identifier.get(field) is not None:
+                        conn.execute(
+                            "DELETE FROM resources WHERE scope = ? AND resource_path = ? AND {} = ?".format(column),
+                            (scope, resource_path, identifier[field]),
+                        )
+
+    def clear(self):
+        """Removes all stored resources and queries."""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM resources")
+            conn.execute("DELETE FROM list_queries")
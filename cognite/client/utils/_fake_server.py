@@ -0,0 +1,797 @@
+import gzip
+import itertools
+import json
+import math
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from cognite.client import utils
+
+
+class FakeCDFError(Exception):
+    """An error response of the fake server."""
+
+    def __init__(self, code: int, message: str, **extra):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.extra = extra
+
+    def body(self) -> Dict:
+        return {"error": {"code": self.code, "message": self.message, **self.extra}}
+
+
+def _identifier_key(identifier: Dict) -> Tuple[str, Any]:
+    if "id" in identifier:
+        return "id", identifier["id"]
+    if "externalId" in identifier:
+        return "externalId", identifier["externalId"]
+    raise FakeCDFError(400, "Identifier must have id or externalId: {}".format(identifier))
+
+
+def _matches(item: Dict, filter: Dict) -> bool:
+    for key, expected in filter.items():
+        if expected is None:
+            continue
+        if key == "externalIdPrefix":
+            if not str(item.get("externalId") or "").startswith(expected):
+                return False
+        elif key == "metadata":
+            metadata = item.get("metadata") or {}
+            if any(metadata.get(k) != v for k, v in expected.items()):
+                return False
+        elif key == "assetIds":
+            asset_ids = set(item.get("assetIds") or []) | {item.get("assetId")}
+            if not asset_ids.intersection(expected):
+                return False
+        elif isinstance(expected, dict) and set(expected) <= {"min", "max"}:
+            value = item.get(key)
+            if value is None or value < expected.get("min", value) or value > expected.get("max", value):
+                return False
+        elif isinstance(expected, list) and not isinstance(item.get(key), list):
+            if item.get(key) not in expected:
+                return False
+        elif item.get(key) != expected:
+            return False
+    return True
+
+
+def _page(items: List, limit: Optional[int], cursor: Optional[str], default_limit: int, max_limit: int):
+    start = int(cursor) if cursor else 0
+    limit = min(int(limit or default_limit), max_limit)
+    page = items[start : start + limit]
+    next_cursor = str(start + limit) if start + limit < len(items) else None
+    return page, next_cursor
+
+
+class ResourceStore:
+    """Resources of one type, e.g. assets, indexed by id and external id."""
+
+    def __init__(self, defaults: Dict = None, max_list_limit: int = 1000):
+        self.defaults = defaults or {}
+        self.max_list_limit = max_list_limit
+        self.items = {}
+        self.external_ids = {}
+        self.lock = threading.RLock()
+        self._ids = itertools.count(1)
+
+    def create(self, items: List[Dict], prepare: Callable[[Dict], None] = None) -> List[Dict]:
+        with self.lock:
+            duplicated = [
+                {"externalId": item["externalId"]}
+                for item in items
+                if item.get("externalId") is not None and item["externalId"] in self.external_ids
+            ]
+            if duplicated:
+                raise FakeCDFError(409, "Duplicate external ids", duplicated=duplicated)
+            now = int(time.time() * 1000)
+            created = [
+                {**self.defaults, **item, "id": next(self._ids), "createdTime": now, "lastUpdatedTime": now}
+                for item in items
+            ]
+            # Items are stored before they are prepared, as they may refer to each other, like assets to their parents
+            for item in created:
+                self._store(item)
+            try:
+                for item in created:
+                    if prepare is not None:
+                        prepare(item)
+            except FakeCDFError:
+                for item in created:
+                    del self.items[item["id"]]
+                    self.external_ids.pop(item.get("externalId"), None)
+                raise
+            return created
+
+    def clear(self):
+        """Removes every resource. Ids keep increasing."""
+        with self.lock:
+            self.items.clear()
+            self.external_ids.clear()
+
+    def _store(self, item: Dict):
+        self.items[item["id"]] = item
+        if item.get("externalId") is not None:
+            self.external_ids[item["externalId"]] = item["id"]
+
+    def find(self, identifier: Dict) -> Optional[Dict]:
+        kind, value = _identifier_key(identifier)
+        if kind == "externalId":
+            value = self.external_ids.get(value)
+        return self.items.get(value)
+
+    def retrieve(self, identifiers: List[Dict], ignore_unknown_ids: bool = False) -> List[Dict]:
+        with self.lock:
+            found = [self.find(identifier) for identifier in identifiers]
+            missing = [identifier for identifier, item in zip(identifiers, found) if item is None]
+            if missing and not ignore_unknown_ids:
+                raise FakeCDFError(400, "Ids not found", missing=missing)
+            return [item for item in found if item is not None]
+
+    def list(self, filter: Dict = None, partition: str = None) -> List[Dict]:
+        with self.lock:
+            if filter:
+                items = [item for item in self.items.values() if _matches(item, filter)]
+            else:
+                items = list(self.items.values())
+        if partition:
+            i, n = (int(p) for p in partition.split("/"))
+            items = [item for item in items if item["id"] % n == i - 1]
+        return items
+
+    def update(self, updates: List[Dict]) -> List[Dict]:
+        with self.lock:
+            items = self.retrieve(updates)
+            now = int(time.time() * 1000)
+            for item, update in zip(items, updates):
+                for field, change in update.get("update", {}).items():
+                    if "set" in change:
+                        item[field] = change["set"]
+                    elif change.get("setNull"):
+                        item.pop(field, None)
+                    elif "add" in change or "remove" in change:
+                        if isinstance(item.get(field), dict) or isinstance(change.get("add"), dict):
+                            value = {**(item.get(field) or {}), **change.get("add", {})}
+                            for key in change.get("remove", []):
+                                value.pop(key, None)
+                        else:
+                            value = [v for v in item.get(field) or [] if v not in change.get("remove", [])]
+                            value += [v for v in change.get("add", []) if v not in value]
+                        item[field] = value
+                self._store(item)
+                item["lastUpdatedTime"] = now
+            return items
+
+    def delete(self, identifiers: List[Dict], ignore_unknown_ids: bool = False) -> List[Dict]:
+        with self.lock:
+            items = self.retrieve(identifiers, ignore_unknown_ids)
+            for item in items:
+                del self.items[item["id"]]
+                self.external_ids.pop(item.get("externalId"), None)
+            return items
+
+
+class Route:
+    def __init__(self, method: str, pattern: str, handler: Callable):
+        self.method = method
+        self.pattern = re.compile("^" + pattern + "$")
+        self.handler = handler
+
+
+class FakeCogniteServer:
+    """An in-memory stand-in for the CDF API, served over HTTP from a background thread.
+
+    It implements enough of assets, events, time series, datapoints, raw, sequences and files for the SDK to run its
+    real request, pagination, compression and retry code against it: create, retrieve by ids, list with cursors and
+    partitions, update and delete of resources, datapoints insert, list (raw and aggregates), latest and delete, raw
+    databases, tables and rows, sequence rows, and file upload and download. Filters support equality, externalIdPrefix,
+    metadata, assetIds and min/max ranges.
+
+    Latency, server errors and throttling can be injected to exercise retries and concurrency control. Injected errors
+    are drawn from a random generator seeded with seed, so runs are reproducible.
+
+    Args:
+        project (str): Project name served.
+        latency (Union[float, Callable[[str, str], float]]): Seconds to wait before answering each request, or a
+            function of the method and path returning it.
+        error_rate (float): Fraction of API requests answered with 503.
+        throttle_rate (float): Fraction of API requests answered with 429.
+        retry_after (float): Value of the Retry-After header of throttled responses, in seconds. None sends no header.
+        gzip_responses (bool): Compress responses larger than 1 KiB to clients accepting gzip.
+        seed (int): Seed of the random generator drawing injected errors.
+        host (str): Interface to listen on.
+        port (int): Port to listen on. Defaults to a free port.
+
+    Examples:
+
+        Run the SDK against the server::
+
+            >>> from cognite.client.testing import FakeCogniteServer
+            >>> from cognite.client.data_classes import Asset
+            >>> with FakeCogniteServer(throttle_rate=0.1) as server:
+            ...     c = server.client()
+            ...     c.assets.create([Asset(name="a{}".format(i)) for i in range(5000)])
+            ...     assets = c.assets.list(limit=None)
+    """
+
+    API_KEY = "fake-api-key"
+
+    def __init__(
+        self,
+        project: str = "fake-project",
+        latency: Union[float, Callable[[str, str], float]] = 0,
+        error_rate: float = 0,
+        throttle_rate: float = 0,
+        retry_after: Optional[float] = None,
+        gzip_responses: bool = True,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.project = project
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.gzip_responses = gzip_responses
+        self.request_counts = Counter()
+        self._random = random.Random(seed)
+        self._injected = []
+        self._lock = threading.Lock()
+        self._address = (host, port)
+        self._httpd = None
+        self._thread = None
+        self.reset()
+        self._routes = self._build_routes()
+
+    def reset(self):
+        """Removes all resources, datapoints, rows and files, and clears the request counts."""
+        self.assets = ResourceStore({"metadata": {}})
+        self.events = ResourceStore({"metadata": {}})
+        self.time_series = ResourceStore({"metadata": {}, "isString": False, "isStep": False})
+        self.sequences = ResourceStore({"metadata": {}})
+        self.files = ResourceStore({"metadata": {}, "uploaded": False})
+        self.datapoints = {}
+        self.sequence_rows = {}
+        self.file_contents = {}
+        self.raw = {}
+        self.request_counts.clear()
+
+    @property
+    def base_url(self) -> str:
+        if self._httpd is None:
+            raise RuntimeError("The server is not started")
+        return "http://{}:{}".format(*self._httpd.server_address[:2])
+
+    def start(self) -> "FakeCogniteServer":
+        """Starts serving requests in a background thread."""
+        handler = type("FakeCDFRequestHandler", (_RequestHandler,), {"fake_server": self})
+        self._httpd = ThreadingHTTPServer(self._address, handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-cdf-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops serving requests and closes the listening socket."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = self._thread = None
+
+    def client(self, **kwargs) -> "CogniteClient":
+        """Returns a CogniteClient sending requests to this server. Keyword arguments are passed on to the client."""
+        from cognite.client import CogniteClient
+
+        options = dict(
+            api_key=self.API_KEY,
+            project=self.project,
+            client_name="fake-cdf-server",
+            base_url=self.base_url,
+            disable_pypi_version_check=True,
+        )
+        options.update(kwargs)
+        return CogniteClient(**options)
+
+    def inject_errors(self, status: int, count: int = 1, path_prefix: str = "/"):
+        """Answers the next count API requests to paths starting with path_prefix with the given status.
+
+        Args:
+            status (int): Status code to respond with, e.g. 429 or 500.
+            count (int): Number of requests to fail.
+            path_prefix (str): Path relative to the project, e.g. /timeseries/data.
+        """
+        with self._lock:
+            self._injected.extend([(path_prefix, status)] * count)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _injected_status(self, path: str) -> Optional[int]:
+        with self._lock:
+            for i, (prefix, status) in enumerate(self._injected):
+                if path.startswith(prefix):
+                    del self._injected[i]
+                    return status
+            draw = self._random.random()
+        if draw < self.throttle_rate:
+            return 429
+        if draw < self.throttle_rate + self.error_rate:
+            return 503
+        return None
+
+    def _handle(self, method: str, path: str, query: Dict, body: Any) -> Tuple[int, Any, Dict[str, str]]:
+        latency = self.latency(method, path) if callable(self.latency) else self.latency
+        if latency:
+            time.sleep(latency)
+        with self._lock:
+            self.request_counts[(method, path)] += 1
+        if path == "/login/status":
+            user = {"user": "fake-user", "loggedIn": True, "project": self.project, "projectId": 1, "apiKeyId": 1}
+            return 200, {"data": user}, {}
+
+        prefix = "/api/v1/projects/{}".format(self.project)
+        if path.startswith(prefix):
+            api_path = path[len(prefix) :]
+            status = self._injected_status(api_path)
+            if status is not None:
+                headers = {"Retry-After": str(self.retry_after)} if status == 429 and self.retry_after else {}
+                return status, FakeCDFError(status, "Injected error").body(), headers
+        elif not path.startswith("/files/"):
+            raise FakeCDFError(404, "Unknown path {}".format(path))
+        else:
+            api_path = path
+
+        for route in self._routes:
+            match = route.pattern.match(api_path)
+            if match is not None and route.method == method:
+                args = [unquote(arg) for arg in match.groups()]
+                return 200, route.handler(query, body, *args), {}
+        raise FakeCDFError(404, "No route for {} {}".format(method, api_path))
+
+    def _build_routes(self) -> List[Route]:
+        routes = []
+        resources = [
+            ("/assets", lambda: self.assets, self._prepare_asset),
+            ("/events", lambda: self.events, None),
+            ("/timeseries", lambda: self.time_series, self._prepare_time_series),
+            ("/sequences", lambda: self.sequences, None),
+        ]
+        for path, store, prepare in resources:
+            routes += self._resource_routes(path, store, prepare)
+        routes += [
+            Route("POST", "/timeseries/data", self._insert_datapoints),
+            Route("POST", "/timeseries/data/list", self._list_datapoints),
+            Route("POST", "/timeseries/data/latest", self._latest_datapoints),
+            Route("POST", "/timeseries/data/delete", self._delete_datapoints),
+            Route("POST", "/sequences/data", self._insert_sequence_rows),
+            Route("POST", "/sequences/data/list", self._list_sequence_rows),
+            Route("POST", "/sequences/data/delete", self._delete_sequence_rows),
+            Route("POST", "/files", self._create_file),
+            Route("POST", "/files/list", lambda q, b: self._list_resources(self.files, b)),
+            Route("POST", "/files/byids", lambda q, b: self._retrieve_resources(self.files, b)),
+            Route("POST", "/files/update", lambda q, b: {"items": self.files.update(b["items"])}),
+            Route("POST", "/files/delete", lambda q, b: self._delete_resources(self.files, b)),
+            Route("POST", "/files/downloadlink", self._download_links),
+            Route("PUT", "/files/upload/(\\d+)", self._upload_file),
+            Route("GET", "/files/download/(\\d+)", self._download_file),
+            Route("GET", "/raw/dbs", lambda q, b: self._page_query(q, [{"name": n} for n in self.raw])),
+            Route("POST", "/raw/dbs", self._create_databases),
+            Route("POST", "/raw/dbs/delete", self._delete_databases),
+            Route("GET", "/raw/dbs/([^/]+)/tables", self._list_tables),
+            Route("POST", "/raw/dbs/([^/]+)/tables", self._create_tables),
+            Route("POST", "/raw/dbs/([^/]+)/tables/delete", self._delete_tables),
+            Route("GET", "/raw/dbs/([^/]+)/tables/([^/]+)/rows", self._list_rows),
+            Route("POST", "/raw/dbs/([^/]+)/tables/([^/]+)/rows", self._insert_rows),
+            Route("POST", "/raw/dbs/([^/]+)/tables/([^/]+)/rows/delete", self._delete_rows),
+            Route("GET", "/raw/dbs/([^/]+)/tables/([^/]+)/rows/([^/]+)", self._retrieve_row),
+        ]
+        return routes
+
+    def _resource_routes(self, path: str, store: Callable[[], ResourceStore], prepare: Callable) -> List[Route]:
+        return [
+            Route("POST", path, lambda q, b: {"items": store().create(b["items"], prepare)}),
+            Route("GET", path, lambda q, b: self._list_resources(store(), self._query_as_body(q))),
+            Route("POST", path + "/list", lambda q, b: self._list_resources(store(), b)),
+            Route("POST", path + "/byids", lambda q, b: self._retrieve_resources(store(), b)),
+            Route("GET", path + "/(\\d+)", lambda q, b, id: {**store().retrieve([{"id": int(id)}])[0]}),
+            Route("POST", path + "/update", lambda q, b: {"items": store().update(b["items"])}),
+            Route("POST", path + "/delete", lambda q, b: self._delete_resources(store(), b)),
+        ]
+
+    @staticmethod
+    def _query_as_body(query: Dict) -> Dict:
+        params = {k: v[-1] for k, v in query.items()}
+        body = {k: params.pop(k) for k in ["limit", "cursor", "partition"] if k in params}
+        params.pop("includeMetadata", None)
+        body["filter"] = {k: int(v) if re.fullmatch("-?\\d+", v) else v for k, v in params.items()}
+        return body
+
+    @staticmethod
+    def _list_resources(store: ResourceStore, body: Dict) -> Dict:
+        items = store.list(body.get("filter"), body.get("partition"))
+        page, next_cursor = _page(items, body.get("limit"), body.get("cursor"), 100, store.max_list_limit)
+        return {"items": page, "nextCursor": next_cursor}
+
+    @staticmethod
+    def _retrieve_resources(store: ResourceStore, body: Dict) -> Dict:
+        return {"items": store.retrieve(body["items"], body.get("ignoreUnknownIds", False))}
+
+    @staticmethod
+    def _delete_resources(store: ResourceStore, body: Dict) -> Dict:
+        store.delete(body["items"], body.get("ignoreUnknownIds", False))
+        return {}
+
+    @staticmethod
+    def _page_query(query: Dict, items: List[Dict]) -> Dict:
+        page, next_cursor = _page(
+            items, query.get("limit", [None])[-1], query.get("cursor", [None])[-1], 25, 1000
+        )
+        return {"items": page, "nextCursor": next_cursor}
+
+    def _prepare_asset(self, asset: Dict):
+        if "rootId" in asset:
+            return
+        parent_external_id = asset.pop("parentExternalId", None)
+        if parent_external_id is not None:
+            parent = self.assets.find({"externalId": parent_external_id})
+            if parent is None:
+                raise FakeCDFError(400, "Reference to unknown parent with externalId {}".format(parent_external_id))
+            asset["parentId"] = parent["id"]
+        if asset.get("parentId") is not None:
+            parent = self.assets.items.get(asset["parentId"])
+            if parent is None:
+                raise FakeCDFError(400, "Reference to unknown parent with id {}".format(asset["parentId"]))
+            # The parent may be created in the same request and not be prepared yet
+            self._prepare_asset(parent)
+            asset["rootId"] = parent["rootId"]
+        else:
+            asset["rootId"] = asset["id"]
+
+    def _prepare_time_series(self, time_series: Dict):
+        self.datapoints[time_series["id"]] = []
+
+    # Datapoints
+
+    def _find_time_series(self, identifier: Dict, ignore_unknown_ids: bool = False) -> Optional[Dict]:
+        found = self.time_series.retrieve([identifier], ignore_unknown_ids)
+        return found[0] if found else None
+
+    @staticmethod
+    def _series_header(ts: Dict) -> Dict:
+        header = {"id": ts["id"], "isString": ts["isString"], "isStep": ts["isStep"]}
+        if ts.get("externalId") is not None:
+            header["externalId"] = ts["externalId"]
+        return header
+
+    def _insert_datapoints(self, query: Dict, body: Dict) -> Dict:
+        with self.time_series.lock:
+            for item in body["items"]:
+                ts = self._find_time_series(item)
+                inserted = {}
+                for dp in item["datapoints"]:
+                    if isinstance(dp, dict):
+                        inserted[dp["timestamp"]] = dp["value"]
+                    else:
+                        inserted[dp[0]] = dp[1]
+                current = dict(self.datapoints[ts["id"]])
+                current.update(inserted)
+                self.datapoints[ts["id"]] = sorted(current.items())
+        return {}
+
+    def _list_datapoints(self, query: Dict, body: Dict) -> Dict:
+        items = []
+        for item in body["items"]:
+            spec = {**{k: v for k, v in body.items() if k != "items"}, **item}
+            ts = self._find_time_series(item, spec.get("ignoreUnknownIds", False))
+            if ts is None:
+                continue
+            start = utils._time.timestamp_to_ms(spec.get("start") or 0)
+            end = utils._time.timestamp_to_ms(spec.get("end") or "now")
+            series = self.datapoints[ts["id"]]
+            if spec.get("aggregates"):
+                limit = min(spec.get("limit") or 100, 10000)
+                datapoints = self._aggregate(series, start, end, spec["aggregates"], spec["granularity"], limit)
+            else:
+                limit = min(spec.get("limit") or 100, 100000)
+                datapoints = [{"timestamp": t, "value": v} for t, v in series if start <= t < end][:limit]
+            items.append({**self._series_header(ts), "datapoints": datapoints})
+        return {"items": items}
+
+    @staticmethod
+    def _aggregate(series: List, start: int, end: int, aggregates: List[str], granularity: str, limit: int):
+        granularity_ms = utils._time.granularity_to_ms(granularity)
+        unit_ms = utils._time.granularity_unit_to_ms(granularity)
+        start -= start % unit_ms
+        buckets = {}
+        for t, v in series:
+            if start <= t < end:
+                buckets.setdefault(start + (t - start) // granularity_ms * granularity_ms, []).append((t, v))
+        datapoints = []
+        for bucket_start in sorted(buckets)[:limit]:
+            points = buckets[bucket_start]
+            values = [v for _, v in points]
+            mean = sum(values) / len(values)
+            computed = {
+                "count": len(values),
+                "sum": sum(values),
+                "average": mean,
+                "min": min(values),
+                "max": max(values),
+                "interpolation": values[0],
+                "stepInterpolation": values[0],
+                "totalVariation": sum(abs(b - a) for a, b in zip(values, values[1:])),
+                "discreteVariance": sum((v - mean) ** 2 for v in values) / len(values),
+                "continuousVariance": sum((v - mean) ** 2 for v in values) / len(values),
+            }
+            datapoint = {"timestamp": bucket_start}
+            for aggregate in aggregates:
+                if aggregate not in computed:
+                    raise FakeCDFError(400, "Unknown aggregate {}".format(aggregate))
+                if not (isinstance(computed[aggregate], float) and math.isnan(computed[aggregate])):
+                    datapoint[aggregate] = computed[aggregate]
+            datapoints.append(datapoint)
+        return datapoints
+
+    def _latest_datapoints(self, query: Dict, body: Dict) -> Dict:
+        items = []
+        for item in body["items"]:
+            ts = self._find_time_series(item, body.get("ignoreUnknownIds", False))
+            if ts is None:
+                continue
+            before = utils._time.timestamp_to_ms(item.get("before") or "now")
+            latest = [{"timestamp": t, "value": v} for t, v in self.datapoints[ts["id"]] if t < before][-1:]
+            items.append({**self._series_header(ts), "datapoints": latest})
+        return {"items": items}
+
+    def _delete_datapoints(self, query: Dict, body: Dict) -> Dict:
+        with self.time_series.lock:
+            for item in body["items"]:
+                ts = self._find_time_series(item)
+                begin, end = item["inclusiveBegin"], item.get("exclusiveEnd", float("inf"))
+                self.datapoints[ts["id"]] = [(t, v) for t, v in self.datapoints[ts["id"]] if not begin <= t < end]
+        return {}
+
+    # Sequences
+
+    def _insert_sequence_rows(self, query: Dict, body: Dict) -> Dict:
+        with self.sequences.lock:
+            for item in body["items"]:
+                sequence = self.sequences.retrieve([item])[0]
+                all_columns = [c["externalId"] for c in sequence["columns"]]
+                columns = item.get("columns") or all_columns
+                rows = self.sequence_rows.setdefault(sequence["id"], {})
+                for row in item["rows"]:
+                    values = dict(zip(columns, row["values"]))
+                    rows[row["rowNumber"]] = {**rows.get(row["rowNumber"], {}), **values}
+        return {}
+
+    def _list_sequence_rows(self, query: Dict, body: Dict) -> Dict:
+        sequence = self.sequences.retrieve([body])[0]
+        columns = body.get("columns") or [c["externalId"] for c in sequence["columns"]]
+        start, end = body.get("start") or 0, body.get("end")
+        rows = self.sequence_rows.get(sequence["id"], {})
+        numbers = [n for n in sorted(rows) if n >= start and (end is None or n < end)]
+        page, next_cursor = _page(numbers, body.get("limit"), body.get("cursor"), 100, 10000)
+        column_info = [c for c in sequence["columns"] if c["externalId"] in columns]
+        column_info.sort(key=lambda c: columns.index(c["externalId"]))
+        return {
+            "id": sequence["id"],
+            "externalId": sequence.get("externalId"),
+            "columns": column_info,
+            "rows": [{"rowNumber": n, "values": [rows[n].get(c) for c in columns]} for n in page],
+            "nextCursor": next_cursor,
+        }
+
+    def _delete_sequence_rows(self, query: Dict, body: Dict) -> Dict:
+        with self.sequences.lock:
+            for item in body["items"]:
+                sequence = self.sequences.retrieve([item])[0]
+                rows = self.sequence_rows.get(sequence["id"], {})
+                for n in item["rows"]:
+                    rows.pop(n, None)
+        return {}
+
+    # Files
+
+    def _create_file(self, query: Dict, body: Dict) -> Dict:
+        overwrite = query.get("overwrite", ["false"])[-1].lower() == "true"
+        with self.files.lock:
+            existing = self.files.find(body) if body.get("externalId") is not None else None
+            if existing is not None and overwrite:
+                existing.clear()
+                existing.update({**body, "id": existing["id"], "uploaded": False})
+                existing["lastUpdatedTime"] = int(time.time() * 1000)
+                item = existing
+            else:
+                item = self.files.create([body])[0]
+        return {**item, "uploadUrl": "{}/files/upload/{}".format(self.base_url, item["id"])}
+
+    def _upload_file(self, query: Dict, body: bytes, id: str) -> Dict:
+        with self.files.lock:
+            item = self.files.retrieve([{"id": int(id)}])[0]
+            self.file_contents[item["id"]] = body
+            item["uploaded"] = True
+        return {}
+
+    def _download_links(self, query: Dict, body: Dict) -> Dict:
+        items = self.files.retrieve(body["items"])
+        return {
+            "items": [
+                {"id": item["id"], "downloadUrl": "{}/files/download/{}".format(self.base_url, item["id"])}
+                for item in items
+            ]
+        }
+
+    def _download_file(self, query: Dict, body: Any, id: str) -> bytes:
+        if int(id) not in self.file_contents:
+            raise FakeCDFError(404, "File {} has no content".format(id))
+        return self.file_contents[int(id)]
+
+    # Raw
+
+    def _database(self, name: str) -> Dict:
+        if name not in self.raw:
+            raise FakeCDFError(404, "Database {} not found".format(name))
+        return self.raw[name]
+
+    def _table(self, db_name: str, table_name: str, ensure_parent: bool = False) -> Dict:
+        if ensure_parent:
+            return self.raw.setdefault(db_name, {}).setdefault(table_name, {})
+        tables = self._database(db_name)
+        if table_name not in tables:
+            raise FakeCDFError(404, "Table {} not found".format(table_name))
+        return tables[table_name]
+
+    def _create_databases(self, query: Dict, body: Dict) -> Dict:
+        with self._lock:
+            for item in body["items"]:
+                self.raw.setdefault(item["name"], {})
+        return {"items": body["items"]}
+
+    def _delete_databases(self, query: Dict, body: Dict) -> Dict:
+        with self._lock:
+            for item in body["items"]:
+                if self._database(item["name"]) and not body.get("recursive"):
+                    raise FakeCDFError(400, "Database {} is not empty".format(item["name"]))
+                del self.raw[item["name"]]
+        return {}
+
+    def _list_tables(self, query: Dict, body: Any, db_name: str) -> Dict:
+        return self._page_query(query, [{"name": name} for name in self._database(db_name)])
+
+    def _create_tables(self, query: Dict, body: Dict, db_name: str) -> Dict:
+        ensure_parent = query.get("ensureParent", ["false"])[-1].lower() == "true"
+        with self._lock:
+            for item in body["items"]:
+                self._table(db_name, item["name"], ensure_parent=True) if ensure_parent else self._database(
+                    db_name
+                ).setdefault(item["name"], {})
+        return {"items": body["items"]}
+
+    def _delete_tables(self, query: Dict, body: Dict, db_name: str) -> Dict:
+        with self._lock:
+            for item in body["items"]:
+                self._table(db_name, item["name"])
+                del self.raw[db_name][item["name"]]
+        return {}
+
+    def _list_rows(self, query: Dict, body: Any, db_name: str, table_name: str) -> Dict:
+        rows = list(self._table(db_name, table_name).values())
+        columns = query.get("columns", [None])[-1]
+        if columns is not None:
+            names = [c for c in columns.split(",") if c]
+            rows = [{**row, "columns": {c: row["columns"][c] for c in names if c in row["columns"]}} for row in rows]
+        page, next_cursor = _page(
+            rows, query.get("limit", [None])[-1], query.get("cursor", [None])[-1], 25, 10000
+        )
+        return {"items": page, "nextCursor": next_cursor}
+
+    def _insert_rows(self, query: Dict, body: Dict, db_name: str, table_name: str) -> Dict:
+        ensure_parent = query.get("ensureParent", ["false"])[-1].lower() == "true"
+        now = int(time.time() * 1000)
+        with self._lock:
+            table = self._table(db_name, table_name, ensure_parent)
+            for row in body["items"]:
+                table[row["key"]] = {"key": row["key"], "columns": row["columns"], "lastUpdatedTime": now}
+        return {}
+
+    def _delete_rows(self, query: Dict, body: Dict, db_name: str, table_name: str) -> Dict:
+        with self._lock:
+            table = self._table(db_name, table_name)
+            for row in body["items"]:
+                table.pop(row["key"], None)
+        return {}
+
+    def _retrieve_row(self, query: Dict, body: Any, db_name: str, table_name: str, key: str) -> Dict:
+        table = self._table(db_name, table_name)
+        if key not in table:
+            raise FakeCDFError(404, "Row {} not found".format(key))
+        return table[key]
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    fake_server = None  # type: FakeCogniteServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _read_body(self) -> bytes:
+        if "chunked" in self.headers.get("Transfer-Encoding", ""):
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                chunk = self.rfile.read(size)
+                self.rfile.readline()
+                if size == 0:
+                    break
+                chunks.append(chunk)
+            body = b"".join(chunks)
+        else:
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        encoding = self.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            body = zlib.decompress(body)
+        elif encoding == "zstd":
+            body = utils._auxiliary.local_import("zstandard").ZstdDecompressor().decompressobj().decompress(body)
+        return body
+
+    def _dispatch(self, method: str):
+        url = urlsplit(self.path)
+        headers = {}
+        try:
+            raw_body = self._read_body()
+            is_upload = url.path.startswith("/files/upload/")
+            body = raw_body if is_upload or not raw_body else json.loads(raw_body.decode())
+            status, response, headers = self.fake_server._handle(method, url.path, parse_qs(url.query), body)
+        except FakeCDFError as e:
+            status, response = e.code, e.body()
+        except Exception as e:
+            status, response = 500, FakeCDFError(500, "{}: {}".format(type(e).__name__, e)).body()
+
+        if isinstance(response, bytes):
+            payload, content_type = response, "application/octet-stream"
+        else:
+            payload, content_type = json.dumps(response).encode(), "application/json"
+        if (
+            self.fake_server.gzip_responses
+            and len(payload) > 1024
+            and "gzip" in self.headers.get("Accept-Encoding", "")
+        ):
+            payload = gzip.compress(payload, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("X-Request-Id", str(threading.get_ident()))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
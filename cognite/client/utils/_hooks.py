@@ -0,0 +1,131 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from requests import Response
+
+EVENTS = ("before_request", "after_response", "on_retry", "on_error")
+
+
+class RequestInfo:
+    """Describes a request sent by the SDK. The same object is passed to every hook called for the request.
+
+    Args:
+        method (str): HTTP method.
+        url_path (str): Path relative to the project, e.g. /timeseries/data/list.
+        url (str): Full URL.
+        headers (Dict[str, str]): Headers to send. before_request hooks may modify them.
+        body (Any): The request body, if any.
+
+    The retries and backoff_time attributes hold the number of retries so far and the seconds spent waiting before
+    them. The span attribute holds the tracing span of the request when tracing is enabled.
+    """
+
+    __slots__ = (
+        "method",
+        "url_path",
+        "url",
+        "headers",
+        "bytes_sent",
+        "start",
+        "latency",
+        "retries",
+        "backoff_time",
+        "span",
+    )
+
+    def __init__(self, method: str, url_path: str, url: str, headers: Dict[str, str], body: Any = None):
+        self.method = method
+        self.url_path = url_path.split("?", 1)[0]
+        self.url = url
+        self.headers = headers
+        self.bytes_sent = len(body) if isinstance(body, (bytes, str)) else 0
+        self.start = time.monotonic()
+        self.latency = None  # type: Optional[float]
+        self.retries = 0
+        self.backoff_time = 0.0
+        self.span = None  # type: Any
+
+
+class RequestHooks:
+    """Callbacks called during the lifecycle of every request sent by a client.
+
+    The events are:
+
+    * before_request(info): before the request is sent. info.headers may be modified.
+    * after_response(info, response): when a response is received, whatever its status code. info.latency holds the
+      time since the request was first sent, in seconds, including retries.
+    * on_retry(info, status, error): when an attempt failed and is about to be retried, before waiting to retry it.
+      status is the status code of the failed attempt, or None if it failed with error.
+    * on_error(info, error): when the request fails, either without a response or with an error status code.
+
+    Hooks run on the thread sending the request and should return quickly. Exceptions raised by hooks propagate to the
+    caller. When no hooks are registered, requests are sent without creating a RequestInfo.
+
+    Examples:
+
+        Log slow requests::
+
+            >>> from cognite.client import CogniteClient
+            >>> c = CogniteClient()
+            >>> def log_slow(info, response):
+            ...     if info.latency > 5:
+            ...         print("{} {} took {:.1f}s".format(info.method, info.url_path, info.latency))
+            >>> c.hooks.register("after_response", log_slow)
+    """
+
+    def __init__(self):
+        self._hooks = {event: () for event in EVENTS}  # type: Dict[str, Tuple[Callable, ...]]
+        self._active = False
+        self._lock = threading.Lock()
+
+    def register(self, event: str, hook: Callable):
+        """Register a hook for an event.
+
+        Args:
+            event (str): One of before_request, after_response, on_retry and on_error.
+            hook (Callable): The function to call.
+        """
+        self._check_event(event)
+        with self._lock:
+            self._hooks[event] += (hook,)
+            self._active = True
+
+    def unregister(self, event: str, hook: Callable):
+        """Unregister a hook registered for an event.
+
+        Args:
+            event (str): The event the hook was registered for.
+            hook (Callable): The hook to remove.
+        """
+        self._check_event(event)
+        with self._lock:
+            hooks = list(self._hooks[event])
+            hooks.remove(hook)
+            self._hooks[event] = tuple(hooks)
+            self._active = any(self._hooks.values())
+
+    def __bool__(self):
+        return self._active
+
+    def before_request(self, info: RequestInfo):
+        for hook in self._hooks["before_request"]:
+            hook(info)
+
+    def after_response(self, info: RequestInfo, res: Response):
+        info.latency = time.monotonic() - info.start
+        for hook in self._hooks["after_response"]:
+            hook(info, res)
+
+    def on_retry(self, info: RequestInfo, status: Optional[int], error: Optional[Exception]):
+        for hook in self._hooks["on_retry"]:
+            hook(info, status, error)
+
+    def on_error(self, info: RequestInfo, error: Exception):
+        for hook in self._hooks["on_error"]:
+            hook(info, error)
+
+    @staticmethod
+    def _check_event(event: str):
+        if event not in EVENTS:
+            raise ValueError("Unknown event '{}', must be one of {}".format(event, EVENTS))
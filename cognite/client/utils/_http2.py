@@ -0,0 +1,248 @@
+"""HTTP/2 transport for requests sessions.
+
+Requests are sent with an httpx client, which multiplexes concurrent requests over a few HTTP/2 connections instead of
+opening one connection per request in flight. Requires httpx and h2, which the http2 extra installs
+(pip install cognite-sdk[http2]).
+
+The synchronous httpx client does not support sending HTTP/2 requests from several threads at once, so each adapter
+runs an asynchronous httpx client on its own event loop thread. The calling threads wait for their request there.
+
+An httpx client verifies certificates and selects its proxy when it is created, while requests passes them with each
+request. The adapter therefore keeps one client for each combination of verify, cert and proxy it is sent.
+"""
+import asyncio
+import io
+import os
+import ssl
+import threading
+from typing import Any, AsyncIterator, Awaitable, Dict, Optional, Tuple, Union
+
+import requests
+from requests import PreparedRequest, Response
+from requests import exceptions as requests_exceptions
+from requests.adapters import BaseAdapter
+from requests.packages.urllib3 import HTTPResponse, Retry
+from requests.packages.urllib3 import exceptions as urllib3_exceptions
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, select_proxy
+
+from cognite.client import utils
+
+
+class HTTP2Adapter(BaseAdapter):
+    """A requests transport adapter sending requests over HTTP/2 with httpx.
+
+    Retries follow the same urllib3 Retry configuration as the default HTTPAdapter, so sessions behave the same with
+    either adapter. Requests are sent from a daemon thread running an event loop, so any number of threads can use the
+    adapter concurrently.
+
+    Args:
+        max_retries (Retry): How to retry failed connections and retryable status codes.
+        max_connections (int): The maximum number of connections per host. Each connection carries many concurrent
+            requests.
+        verify (bool): Whether to verify the server's TLS certificate by default. Requests sent with another verify,
+            a client certificate or a proxy get an httpx client of their own.
+    """
+
+    def __init__(self, max_retries: Retry = None, max_connections: int = 10, verify: bool = True):
+        super().__init__()
+        httpx = utils._auxiliary.local_import("httpx")
+        utils._auxiliary.local_import("h2")
+        self._httpx = httpx
+        self.max_retries = max_retries if max_retries is not None else Retry(0, read=False)
+        self.max_connections = max_connections
+        self.verify = verify
+        self._client = self._create_client(verify, None, None)
+        self._clients = {}  # type: Dict[Tuple[Any, Any, Optional[str]], Any]
+        self._clients_lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="cognite-sdk-http2", daemon=True).start()
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, tuple] = None,
+        verify: bool = True,
+        cert=None,
+        proxies=None,
+    ) -> Response:
+        client = self._get_client(verify, cert, select_proxy(request.url, proxies))
+        retries = self.max_retries
+        while True:
+            try:
+                res = self._run(self._send(client, self._build_httpx_request(client, request, timeout), stream))
+            except self._httpx.TransportError as e:
+                try:
+                    retries = retries.increment(request.method, request.url, error=to_urllib3_error(e))
+                except urllib3_exceptions.MaxRetryError:
+                    raise to_requests_error(e, request) from e
+                retries.sleep()
+                continue
+
+            if retries.is_retry(request.method, res.status_code, "Retry-After" in res.headers):
+                status_response = HTTPResponse(status=res.status_code, headers=dict(res.headers), preload_content=False)
+                try:
+                    retries = retries.increment(request.method, request.url, response=status_response)
+                except urllib3_exceptions.MaxRetryError:
+                    if retries.raise_on_status:
+                        self._run(res.aclose())
+                        raise requests_exceptions.RetryError(
+                            "Max retries exceeded with url: {}".format(request.url), request=request
+                        )
+                    return self.build_response(request, res, retries)
+                self._run(res.aclose())
+                retries.sleep(status_response)
+                continue
+            return self.build_response(request, res, retries)
+
+    def build_response(self, request: PreparedRequest, res, retries: Retry) -> Response:
+        # The body is exposed through an urllib3 response so that stream=True, iter_content and res.raw.retries work
+        # as with HTTPAdapter. httpx has already decoded the content, so the raw response is given no headers.
+        raw = HTTPResponse(
+            body=io.BytesIO(res.content) if res.is_closed else _ResponseBodyReader(self, res),
+            status=res.status_code,
+            reason=res.reason_phrase,
+            retries=retries,
+            preload_content=False,
+            decode_content=False,
+        )
+        response = Response()
+        response.status_code = res.status_code
+        response.headers = CaseInsensitiveDict(res.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = raw
+        response.reason = res.reason_phrase
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        with self._clients_lock:
+            clients = [self._client] + list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            self._run(client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def _get_client(self, verify: Union[bool, str], cert: Union[None, str, tuple], proxy: Optional[str]):
+        if verify == self.verify and cert is None and proxy is None:
+            return self._client
+        key = (verify, cert, proxy)
+        with self._clients_lock:
+            if key not in self._clients:
+                self._clients[key] = self._create_client(verify, cert, proxy)
+            return self._clients[key]
+
+    def _create_client(self, verify: Union[bool, str], cert: Union[None, str, tuple], proxy: Optional[str]):
+        return self._httpx.AsyncClient(
+            http2=True,
+            verify=create_ssl_context(verify, cert),
+            proxy=proxy,
+            limits=self._httpx.Limits(
+                max_connections=self.max_connections, max_keepalive_connections=self.max_connections
+            ),
+        )
+
+    async def _send(self, client, request, stream: bool):
+        # Unless the caller streams the body, it is read on the event loop, saving a thread hop per chunk
+        res = await client.send(request, stream=True)
+        if not stream:
+            try:
+                await res.aread()
+            finally:
+                await res.aclose()
+        return res
+
+    def _run(self, coro: Awaitable) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _build_httpx_request(self, client, request: PreparedRequest, timeout: Union[None, float, tuple]):
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            timeout = self._httpx.Timeout(read_timeout, connect=connect_timeout)
+        else:
+            timeout = self._httpx.Timeout(timeout)
+        return client.build_request(
+            request.method, request.url, headers=list(request.headers.items()), content=request.body, timeout=timeout
+        )
+
+
+def to_urllib3_error(error: Exception) -> Exception:
+    # Retry.increment counts connect and read errors separately, based on the urllib3 exception type
+    httpx = utils._auxiliary.local_import("httpx")
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return urllib3_exceptions.ConnectTimeoutError(str(error))
+    if isinstance(error, httpx.TimeoutException):
+        return urllib3_exceptions.ReadTimeoutError(None, None, str(error))
+    return urllib3_exceptions.ProtocolError(str(error))
+
+
+def to_requests_error(error: Exception, request: PreparedRequest) -> Exception:
+    httpx = utils._auxiliary.local_import("httpx")
+    if isinstance(error, httpx.ConnectTimeout):
+        return requests_exceptions.ConnectTimeout(error, request=request)
+    if isinstance(error, httpx.TimeoutException):
+        return requests_exceptions.ReadTimeout(error, request=request)
+    if isinstance(error, httpx.ConnectError):
+        # Wrapped like HTTPAdapter does, so that errors before the request was sent can be told apart
+        reason = to_urllib3_error(error)
+        return requests_exceptions.ConnectionError(
+            urllib3_exceptions.MaxRetryError(None, request.url, reason), request=request
+        )
+    return requests_exceptions.ConnectionError(error, request=request)
+
+
+def create_ssl_context(verify: Union[bool, str], cert: Union[None, str, tuple]) -> Union[bool, ssl.SSLContext]:
+    # verify and cert take the same values as in requests: a CA bundle file or directory, and a client certificate
+    # file or a (certificate, key) tuple
+    if cert is None and isinstance(verify, bool):
+        return verify
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    elif verify is True:
+        context = ssl.create_default_context(cafile=requests.certs.where())
+    elif os.path.isdir(verify):
+        context = ssl.create_default_context(capath=verify)
+    else:
+        context = ssl.create_default_context(cafile=verify)
+    if isinstance(cert, tuple):
+        context.load_cert_chain(*cert)
+    elif cert is not None:
+        context.load_cert_chain(cert)
+    return context
+
+
+class _ResponseBodyReader:
+    # File-like object over the body of a streamed httpx response, closing the response once the body is read
+    def __init__(self, adapter: HTTP2Adapter, res):
+        self._adapter = adapter
+        self._res = res
+        self._chunks = res.aiter_bytes()  # type: Optional[AsyncIterator[bytes]]
+        self._buffer = bytearray()
+
+    def read(self, amt: int = None) -> bytes:
+        while self._chunks is not None and (amt is None or len(self._buffer) < amt):
+            try:
+                chunk = self._adapter._run(self._chunks.__anext__())
+            except StopAsyncIteration:
+                self.close()
+                break
+            self._buffer += chunk
+        if amt is None:
+            amt = len(self._buffer)
+        data = bytes(self._buffer[:amt])
+        del self._buffer[:amt]
+        return data
+
+    def close(self):
+        if self._chunks is not None:
+            self._chunks = None
+            self._adapter._run(self._res.aclose())
+
+    @property
+    def closed(self) -> bool:
+        return self._chunks is None and not self._buffer
@@ -0,0 +1,239 @@
+import bisect
+import copy
+import json
+import re
+import threading
+from typing import Dict, Optional, Sequence
+
+from requests import Response
+
+from cognite.client.utils._hooks import RequestHooks, RequestInfo
+
+# Upper bounds, in seconds, of the latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_ID_SEGMENT = re.compile(r"(?<=/)(\d+|[^/]*%[0-9A-Fa-f]{2}[^/]*)(?=/|$)")
+_RAW_NAMES = re.compile(r"^/raw/dbs/[^/]+(/tables/[^/]+)?")
+
+
+def get_endpoint(url_path: str) -> str:
+    """Returns the endpoint a request path belongs to, replacing ids and names in the path with placeholders.
+
+    Args:
+        url_path (str): Path relative to the project, e.g. /assets/123.
+
+    Returns:
+        str: The endpoint, e.g. /assets/{id}.
+    """
+    endpoint = _RAW_NAMES.sub(lambda m: "/raw/dbs/{db}" + ("/tables/{table}" if m.group(1) else ""), url_path)
+    return _ID_SEGMENT.sub("{id}", endpoint)
+
+
+class LatencyHistogram:
+    """Counts observed latencies in buckets with fixed upper bounds.
+
+    Args:
+        buckets (Sequence[float]): Increasing upper bounds of the buckets, in seconds. A last bucket without an upper
+            bound is added.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, latency: float):
+        self.counts[bisect.bisect_left(self.buckets, latency)] += 1
+        self.count += 1
+        self.sum += latency
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimates a quantile by interpolating linearly within the bucket it falls in.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            Optional[float]: The estimated latency in seconds, or None if nothing has been observed. Quantiles falling
+            in the last bucket are reported as the largest upper bound.
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+
+class EndpointMetrics:
+    """Request metrics for one endpoint."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.throttled = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retry_backoff = 0.0
+        self.status_codes = {}  # type: Dict[int, int]
+        self.latency = LatencyHistogram(buckets)
+
+    def dump(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "retry_backoff": self.retry_backoff,
+            "status_codes": dict(self.status_codes),
+            "latency_mean": self.latency.sum / self.latency.count if self.latency.count else None,
+            "latency_p50": self.latency.quantile(0.5),
+            "latency_p90": self.latency.quantile(0.9),
+            "latency_p99": self.latency.quantile(0.99),
+        }
+
+
+class MetricsCollector:
+    """Collects request metrics per endpoint from the request hooks of a client.
+
+    For every endpoint, it counts requests, responses per status code, failed requests, retried attempts, throttled
+    attempts (status code 429), bytes sent and received, and seconds spent waiting between retried attempts, and keeps
+    a histogram of request latencies. Bytes received are taken from the Content-Length header when present, so they
+    are the compressed sizes. It also counts the requests in flight, and the datapoints retrieved and inserted.
+
+    Args:
+        buckets (Sequence[float]): Upper bounds of the latency histogram buckets, in seconds.
+
+    Examples:
+
+        Collect metrics and print the latency of datapoint requests::
+
+            >>> from cognite.client import CogniteClient
+            >>> c = CogniteClient(collect_metrics=True)
+            >>> dps = c.datapoints.retrieve(id=1, start="2w-ago", end="now")
+            >>> print(c.metrics.dump()["/timeseries/data/list"]["latency_p90"])
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._endpoints = {}  # type: Dict[str, EndpointMetrics]
+        self._endpoint_cache = {}  # type: Dict[str, str]
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.datapoints_retrieved = 0
+        self.datapoints_inserted = 0
+
+    def register(self, hooks: RequestHooks):
+        """Registers the collector's hooks, to collect metrics from all requests using them."""
+        hooks.register("before_request", self.before_request)
+        hooks.register("after_response", self.after_response)
+        hooks.register("on_retry", self.on_retry)
+        hooks.register("on_error", self.on_error)
+
+    def unregister(self, hooks: RequestHooks):
+        """Unregisters the collector's hooks."""
+        hooks.unregister("before_request", self.before_request)
+        hooks.unregister("after_response", self.after_response)
+        hooks.unregister("on_retry", self.on_retry)
+        hooks.unregister("on_error", self.on_error)
+
+    def before_request(self, info: RequestInfo):
+        with self._lock:
+            self.in_flight += 1
+
+    def after_response(self, info: RequestInfo, res: Response):
+        content_length = res.headers.get("Content-Length")
+        if content_length is not None:
+            bytes_received = int(content_length)
+        else:
+            # Reading the body of a streamed response here would break streaming
+            bytes_received = len(res.content) if res._content_consumed else 0
+        with self._lock:
+            self.in_flight -= 1
+            metrics = self._get_metrics(info.url_path)
+            metrics.requests += 1
+            metrics.bytes_sent += info.bytes_sent
+            metrics.bytes_received += bytes_received
+            metrics.retry_backoff += info.backoff_time
+            metrics.status_codes[res.status_code] = metrics.status_codes.get(res.status_code, 0) + 1
+            if res.status_code == 429:
+                metrics.throttled += 1
+            metrics.latency.observe(info.latency)
+
+    def on_retry(self, info: RequestInfo, status: Optional[int], error: Optional[Exception]):
+        with self._lock:
+            metrics = self._get_metrics(info.url_path)
+            metrics.retries += 1
+            metrics.bytes_sent += info.bytes_sent
+            if status == 429:
+                metrics.throttled += 1
+
+    def on_error(self, info: RequestInfo, error: Exception):
+        with self._lock:
+            metrics = self._get_metrics(info.url_path)
+            metrics.errors += 1
+            if info.latency is None:
+                # Failed without a response, so after_response was not called
+                self.in_flight -= 1
+                metrics.requests += 1
+                metrics.bytes_sent += info.bytes_sent
+                metrics.retry_backoff += info.backoff_time
+
+    def count_datapoints(self, retrieved: int = 0, inserted: int = 0):
+        """Adds to the number of datapoints retrieved and inserted.
+
+        Args:
+            retrieved (int): Number of datapoints, or aggregate values, received.
+            inserted (int): Number of datapoints sent.
+        """
+        with self._lock:
+            self.datapoints_retrieved += retrieved
+            self.datapoints_inserted += inserted
+
+    def dump(self) -> Dict[str, Dict]:
+        """Returns the metrics of every endpoint, with the latency summarized as its mean, median, p90 and p99.
+
+        Returns:
+            Dict[str, Dict]: The metrics per endpoint.
+        """
+        with self._lock:
+            return {endpoint: metrics.dump() for endpoint, metrics in sorted(self._endpoints.items())}
+
+    def snapshot(self) -> Dict[str, EndpointMetrics]:
+        """Returns a copy of the metrics of every endpoint, including the complete latency histograms.
+
+        Returns:
+            Dict[str, EndpointMetrics]: The metrics per endpoint.
+        """
+        with self._lock:
+            return copy.deepcopy(self._endpoints)
+
+    def reset(self):
+        """Discards all metrics collected so far. The number of requests in flight is kept."""
+        with self._lock:
+            self._endpoints = {}
+            self.datapoints_retrieved = self.datapoints_inserted = 0
+
+    def _get_metrics(self, url_path: str) -> EndpointMetrics:
+        endpoint = self._endpoint_cache.get(url_path)
+        if endpoint is None:
+            endpoint = get_endpoint(url_path)
+            if len(self._endpoint_cache) < 10000:
+                self._endpoint_cache[url_path] = endpoint
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = EndpointMetrics(self.buckets)
+        return metrics
+
+    def __str__(self):
+        return json.dumps(self.dump(), indent=4)
@@ -0,0 +1,415 @@
+import functools
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from cognite.client import utils
+from cognite.client.exceptions import CogniteImportError
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # Python < 3.7
+    ContextVar = None
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# The profile of the current context, the call being profiled and the stages entered, as (profiler, call, stages).
+# The executor of a client runs tasks in a copy of the submitting thread's context, so work done on worker threads is
+# attributed to the call which started it.
+_CURRENT = ContextVar("cognite_sdk_memory_profile", default=None) if ContextVar is not None else None
+
+STAGES = ("http", "decode", "_load", "_extend", "to_pandas")
+
+_MIB = 1024 * 1024
+
+# tracemalloc and inspect are imported when first needed, as importing them takes longer than importing the data
+# classes decorated with profiled_stage
+
+
+def peak_rss() -> Optional[int]:
+    """Returns the peak resident set size of the process so far, in bytes, or None where it is unavailable."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class StageProfile:
+    """Time and memory spent in one stage of the calls to a method, e.g. in decoding responses.
+
+    Attributes:
+        count (int): Number of times the stage was entered.
+        seconds (float): Total time spent in the stage. Stages run concurrently on worker threads add up.
+        peak (int): Largest increase of traced memory from the start of the stage to its peak, in bytes.
+        retained (int): Total memory allocated by the stage and still allocated when it ended, in bytes.
+        bytes (int): Size of the HTTP response bodies received, for the http stage.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.peak = 0
+        self.retained = 0
+        self.bytes = 0
+
+    def dump(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "seconds": self.seconds,
+            "peak": self.peak,
+            "retained": self.retained,
+            "bytes": self.bytes,
+        }
+
+
+class CallProfile:
+    """Time and memory spent in one call to a public method of an API, and in each of its stages.
+
+    Attributes:
+        name (str): The method called, e.g. DatapointsAPI.retrieve.
+        seconds (float): Duration of the call.
+        peak (int): Increase of traced memory from the start of the call to its peak, in bytes.
+        retained (int): Memory allocated by the call and still allocated when it returned, in bytes. This includes the
+            result.
+        peak_rss (Optional[int]): Peak resident set size of the process when the call returned, in bytes.
+        stages (Dict[str, StageProfile]): Profiles of the stages of the call, by name.
+        snapshot (Optional[tracemalloc.Snapshot]): Snapshot of the traced memory when the call returned, if snapshots
+            were requested.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.peak = 0
+        self.retained = 0
+        self.peak_rss = None
+        self.stages = {}  # type: Dict[str, StageProfile]
+        self.snapshot = None
+
+    def dump(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "seconds": self.seconds,
+            "peak": self.peak,
+            "retained": self.retained,
+            "peak_rss": self.peak_rss,
+            "stages": {name: stage.dump() for name, stage in self.stages.items()},
+        }
+
+
+class MemoryProfile:
+    """Time and memory spent in the calls made to a client while profiling, per call and per stage of each call.
+
+    The stages are:
+
+    * http: sending requests and receiving their responses, including retries.
+    * decode: parsing JSON response bodies. With streaming_json_decode, this includes receiving the bodies of
+      datapoints responses, which are decoded while they are received.
+    * _load: creating data class objects from the parsed responses.
+    * _extend: appending datapoints retrieved in several requests to one another.
+    * to_pandas: converting data class objects to pandas DataFrames.
+
+    Memory is measured with tracemalloc, which traces allocations of the whole process, so allocations made by other
+    threads at the same time are counted as well, and stages running concurrently on worker threads count each
+    other's allocations. The peaks of stages and calls require Python 3.9 or later; on older versions they are the
+    memory retained.
+
+    Attributes:
+        calls (List[CallProfile]): The profiles of the calls, in the order they returned.
+        peak_rss (Optional[int]): Peak resident set size of the process when profiling stopped, in bytes.
+    """
+
+    def __init__(self):
+        self.calls = []  # type: List[CallProfile]
+        self.peak_rss = None
+
+    def dump(self) -> List[Dict[str, Any]]:
+        """Returns the profile of every call as a dictionary.
+
+        Returns:
+            List[Dict[str, Any]]: The profiles.
+        """
+        return [call.dump() for call in self.calls]
+
+    def to_pandas(self) -> "pandas.DataFrame":
+        """Returns a DataFrame with a row for every call, and for every stage of every call.
+
+        Returns:
+            pandas.DataFrame: The profiles, with a column for the call, the stage (empty for the call itself), and
+            the count, time, peak, retained and received bytes.
+        """
+        pd = utils._auxiliary.local_import("pandas")
+        return pd.DataFrame(self._rows(), columns=["call", "stage", "count", "seconds", "peak", "retained", "bytes"])
+
+    def report(self) -> str:
+        """Returns the profiles as a table, with memory in MiB.
+
+        Returns:
+            str: The table.
+        """
+        header = "{:<36} {:<10} {:>6} {:>10} {:>11} {:>15} {:>12}".format(
+            "call", "stage", "count", "time (s)", "peak (MiB)", "retained (MiB)", "body (MiB)"
+        )
+        lines = [header, "-" * len(header)]
+        for call, stage, count, seconds, peak, retained, size in self._rows():
+            lines.append(
+                "{:<36} {:<10} {:>6} {:>10.3f} {:>11.1f} {:>15.1f} {:>12}".format(
+                    call if not stage else "",
+                    stage,
+                    count,
+                    seconds,
+                    peak / _MIB,
+                    retained / _MIB,
+                    "{:.1f}".format(size / _MIB) if stage == "http" else "",
+                )
+            )
+        if self.peak_rss is not None:
+            lines.append("Peak RSS of the process: {:.1f} MiB".format(self.peak_rss / _MIB))
+        return "\n".join(lines)
+
+    def _rows(self) -> List[tuple]:
+        rows = []
+        for call in self.calls:
+            rows.append((call.name, "", 1, call.seconds, call.peak, call.retained, 0))
+            for name in sorted(call.stages, key=lambda s: STAGES.index(s) if s in STAGES else len(STAGES)):
+                stage = call.stages[name]
+                rows.append((call.name, name, stage.count, stage.seconds, stage.peak, stage.retained, stage.bytes))
+        return rows
+
+    def __str__(self):
+        return self.report()
+
+    def __repr__(self):
+        return self.report()
+
+
+class _Measurement:
+    def __init__(self, base: int):
+        self.base = base
+        self.peak = base
+
+
+class MemoryProfiler:
+    """Measures the calls to the APIs of one client, and the stages of those calls, into a MemoryProfile.
+
+    Use :code:`CogniteClient.profile` rather than this class directly.
+
+    Args:
+        config (ClientConfig): The configuration of the client whose calls are profiled.
+        snapshots (bool): Take a tracemalloc snapshot when every call returns.
+    """
+
+    def __init__(self, config: "utils._client_config.ClientConfig", snapshots: bool = False):
+        self.config = config
+        self.snapshots = snapshots
+        self.profile = MemoryProfile()
+        self._active = set()
+        self._lock = threading.Lock()
+        self._started_tracing = False
+        import tracemalloc
+
+        self._tracemalloc = tracemalloc
+
+    def start(self):
+        if not self._tracemalloc.is_tracing():
+            self._tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self):
+        self.profile.peak_rss = peak_rss()
+        if self._started_tracing:
+            self._tracemalloc.stop()
+            self._started_tracing = False
+
+    def _enter(self) -> _Measurement:
+        with self._lock:
+            self._fold_peak()
+            measurement = _Measurement(self._tracemalloc.get_traced_memory()[0])
+            self._active.add(measurement)
+        return measurement
+
+    def _exit(self, measurement: _Measurement):
+        with self._lock:
+            self._fold_peak()
+            self._active.discard(measurement)
+        current = self._tracemalloc.get_traced_memory()[0]
+        return max(measurement.peak, current) - measurement.base, current - measurement.base
+
+    def _fold_peak(self):
+        # tracemalloc has a single peak, so before it is reset, it is recorded in every measurement in progress
+        current, peak = self._tracemalloc.get_traced_memory()
+        if hasattr(self._tracemalloc, "reset_peak"):
+            self._tracemalloc.reset_peak()
+        else:
+            peak = current
+        for measurement in self._active:
+            measurement.peak = max(measurement.peak, peak)
+
+    def record_call(self, call: CallProfile):
+        with self._lock:
+            self.profile.calls.append(call)
+
+    def record_stage(self, call: CallProfile, name: str, seconds: float, peak: int, retained: int, size: int):
+        with self._lock:
+            stage = call.stages.get(name)
+            if stage is None:
+                stage = call.stages[name] = StageProfile()
+            stage.count += 1
+            stage.seconds += seconds
+            stage.peak = max(stage.peak, peak)
+            stage.retained += retained
+            stage.bytes += size
+
+
+@contextmanager
+def profile(config: "utils._client_config.ClientConfig", snapshots: bool = False):
+    """Profiles the calls to the APIs of a client made in the current context. See :code:`CogniteClient.profile`."""
+    if _CURRENT is None:
+        raise CogniteImportError("contextvars")
+    profiler = MemoryProfiler(config, snapshots)
+    profiler.start()
+    token = _CURRENT.set((profiler, None, ()))
+    try:
+        yield profiler.profile
+    finally:
+        _CURRENT.reset(token)
+        profiler.stop()
+
+
+class _NoStage:
+    def add_bytes(self, size: int):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NO_STAGE = _NoStage()
+
+
+class _Stage:
+    def __init__(self, profiler: MemoryProfiler, call: CallProfile, stages: tuple, name: str):
+        self._profiler = profiler
+        self._call = call
+        self._stages = stages
+        self._name = name
+        self._size = 0
+
+    def add_bytes(self, size: int):
+        self._size += size
+
+    def __enter__(self):
+        self._token = _CURRENT.set((self._profiler, self._call, self._stages + (self._name,)))
+        self._measurement = self._profiler._enter()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        seconds = time.perf_counter() - self._start
+        peak, retained = self._profiler._exit(self._measurement)
+        _CURRENT.reset(self._token)
+        self._profiler.record_stage(self._call, self._name, seconds, peak, retained, self._size)
+        return False
+
+
+def is_profiling() -> bool:
+    """Returns whether calls made in the current context are being profiled."""
+    return _CURRENT is not None and _CURRENT.get() is not None
+
+
+def stage(name: str):
+    """Measures a stage of the call being profiled in the current context, if any.
+
+    Stages entered again while already in progress, e.g. _load of each item while loading a list, are measured once.
+
+    Args:
+        name (str): Name of the stage, e.g. decode.
+
+    Returns:
+        A context manager returning an object to report the size of response bodies to with add_bytes().
+    """
+    current = _CURRENT.get() if _CURRENT is not None else None
+    if current is None:
+        return _NO_STAGE
+    profiler, call, stages = current
+    if call is None or name in stages:
+        return _NO_STAGE
+    return _Stage(profiler, call, stages, name)
+
+
+def _run_call(profiler: MemoryProfiler, name: str, func, *args, **kwargs):
+    call = CallProfile(name)
+    token = _CURRENT.set((profiler, call, ()))
+    measurement = profiler._enter()
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        call.seconds = time.perf_counter() - start
+        call.peak, call.retained = profiler._exit(measurement)
+        _CURRENT.reset(token)
+        call.peak_rss = peak_rss()
+        if profiler.snapshots:
+            call.snapshot = profiler._tracemalloc.take_snapshot()
+        profiler.record_call(call)
+
+
+def profiled_stage(name: str):
+    """Decorates a function to measure its calls as a stage of the call being profiled, if any.
+
+    Calls to the function made directly while profiling, like converting a result to pandas, are profiled as calls
+    of their own.
+    """
+
+    def decorator(func):
+        call_name = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            current = _CURRENT.get() if _CURRENT is not None else None
+            if current is not None and current[1] is None:
+                return _run_call(current[0], call_name, wrapper, *args, **kwargs)
+            with stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _profiled_method(func, name: str):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        current = _CURRENT.get() if _CURRENT is not None else None
+        # Calls made by other calls, e.g. retrieve_dataframe calling retrieve, are part of the outermost call
+        if current is None or current[1] is not None:
+            return func(self, *args, **kwargs)
+        if current[0].config is not self._config:
+            # Calls to other clients are not profiled, and neither is the work they do
+            token = _CURRENT.set(None)
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                _CURRENT.reset(token)
+        return _run_call(current[0], name, func, self, *args, **kwargs)
+
+    return wrapper
+
+
+def profile_api_methods(cls):
+    """Wraps every public method defined by an API class, to profile calls to it while the client is profiled."""
+    import inspect
+
+    for attr, value in list(cls.__dict__.items()):
+        if not attr.startswith("_") and inspect.isfunction(value) and not inspect.isgeneratorfunction(value):
+            setattr(cls, attr, _profiled_method(value, "{}.{}".format(cls.__name__, attr)))
+    return cls
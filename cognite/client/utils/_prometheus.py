@@ -0,0 +1,160 @@
+from typing import Dict, Iterator, List, Tuple
+
+from requests import Session
+
+from cognite.client import utils
+
+
+def get_connection_pool_usage(sessions: List[Session]) -> Dict[str, Tuple[int, int]]:
+    """Returns the number of connections in use and the size of the connection pool of every host.
+
+    Args:
+        sessions (List[Session]): The sessions whose HTTPAdapter connection pools to inspect. Adapters without urllib3
+            connection pools, like the HTTP/2 adapter, are skipped.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: Connections in use and pool size, summed over the sessions, per scheme://host:port.
+    """
+    usage = {}
+    for session in sessions:
+        for adapter in set(session.adapters.values()):
+            pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+            if pools is None:
+                continue
+            with pools.lock:
+                conn_pools = list(pools._container.items())
+            for key, conn_pool in conn_pools:
+                host = "{}://{}:{}".format(key.key_scheme, key.key_host, key.key_port)
+                in_use, size = usage.get(host, (0, 0))
+                # Idle connections, and slots for connections not yet opened, are kept in the pool's queue
+                usage[host] = (in_use + conn_pool.pool.maxsize - conn_pool.pool.qsize(), size + conn_pool.pool.maxsize)
+    return usage
+
+
+class PrometheusCollector:
+    """Exposes the request metrics and statistics of a client to Prometheus.
+
+    The metrics are the requests by endpoint and status code, failed, retried and throttled requests, bytes sent and
+    received, seconds waited between retried attempts and request latency histograms per endpoint, as collected by
+    the client's MetricsCollector. It also exposes the number of requests in flight, the datapoints retrieved and
+    inserted, the connections in use and the size of the HTTP/1.1 connection pools, and the number of tasks waiting
+    for a worker thread. Requires prometheus_client.
+
+    Args:
+        client (CogniteClient): A client created with collect_metrics=True.
+        namespace (str): Prefix of the metric names.
+
+    Examples:
+
+        Serve the metrics of a client on port 8000::
+
+            >>> from cognite.client import CogniteClient
+            >>> from cognite.client.utils._prometheus import PrometheusCollector
+            >>> c = CogniteClient(collect_metrics=True)
+            >>> PrometheusCollector(c).start_http_server(8000)
+
+        Register the metrics in an existing registry::
+
+            >>> from cognite.client import CogniteClient
+            >>> from cognite.client.utils._prometheus import PrometheusCollector
+            >>> from prometheus_client import REGISTRY
+            >>> c = CogniteClient(collect_metrics=True)
+            >>> PrometheusCollector(c).register(REGISTRY)
+    """
+
+    def __init__(self, client, namespace: str = "cognite_sdk"):
+        self._prometheus = utils._auxiliary.local_import("prometheus_client")
+        self._core = utils._auxiliary.local_import("prometheus_client.core")
+        if client.metrics is None:
+            raise ValueError("The client must be created with collect_metrics=True to expose its metrics")
+        self._client = client
+        self._namespace = namespace
+
+    def register(self, registry=None):
+        """Registers the collector in a registry, so that its metrics are exposed with the other metrics in it.
+
+        Args:
+            registry (CollectorRegistry): The registry. Defaults to the global registry of prometheus_client.
+        """
+        (registry or self._prometheus.REGISTRY).register(self)
+
+    def start_http_server(self, port: int, addr: str = "0.0.0.0"):
+        """Serves the metrics of the client, and no other metrics, on a port in a background thread.
+
+        Args:
+            port (int): The port to listen on.
+            addr (str): The address to listen on.
+
+        Returns:
+            What prometheus_client.start_http_server returns, which is the server and its thread in recent versions.
+        """
+        registry = self._prometheus.CollectorRegistry(auto_describe=True)
+        self.register(registry)
+        return self._prometheus.start_http_server(port, addr=addr, registry=registry)
+
+    def collect(self) -> Iterator:
+        core = self._core
+        metrics = self._client.metrics
+        name = (self._namespace + "_{}").format
+        endpoints = sorted(metrics.snapshot().items())
+
+        requests = core.CounterMetricFamily(
+            name("requests"), "Requests by endpoint and status code.", labels=["endpoint", "status"]
+        )
+        for endpoint, m in endpoints:
+            for status, count in sorted(m.status_codes.items()):
+                requests.add_metric([endpoint, str(status)], count)
+        yield requests
+
+        for attribute, metric, documentation in [
+            ("errors", "request_errors", "Requests which failed, with or without a response."),
+            ("retries", "request_retries", "Attempts which were retried."),
+            ("throttled", "requests_throttled", "Attempts answered with status code 429."),
+            ("bytes_sent", "request_sent_bytes", "Bytes sent in request bodies, including retried attempts."),
+            ("bytes_received", "response_received_bytes", "Bytes received in response bodies."),
+            ("retry_backoff", "retry_backoff_seconds", "Seconds spent waiting between retried attempts."),
+        ]:
+            family = core.CounterMetricFamily(name(metric), documentation, labels=["endpoint"])
+            for endpoint, m in endpoints:
+                family.add_metric([endpoint], getattr(m, attribute))
+            yield family
+
+        latency = core.HistogramMetricFamily(
+            name("request_duration_seconds"), "Request latency, including retries.", labels=["endpoint"]
+        )
+        for endpoint, m in endpoints:
+            cumulative, buckets = 0, []
+            for upper_bound, count in zip(m.latency.buckets + ("+Inf",), m.latency.counts):
+                cumulative += count
+                buckets.append((str(upper_bound), cumulative))
+            latency.add_metric([endpoint], buckets, m.latency.sum)
+        yield latency
+
+        yield core.GaugeMetricFamily(
+            name("requests_in_flight"), "Requests sent and not yet answered.", metrics.in_flight
+        )
+        yield core.CounterMetricFamily(
+            name("datapoints_retrieved"), "Datapoints and aggregate values retrieved.", metrics.datapoints_retrieved
+        )
+        yield core.CounterMetricFamily(name("datapoints_inserted"), "Datapoints inserted.", metrics.datapoints_inserted)
+
+        executor = self._client.config.executor
+        yield core.GaugeMetricFamily(
+            name("executor_queue_depth"), "Tasks waiting for a free worker thread.", executor.queue_depth
+        )
+        yield core.GaugeMetricFamily(
+            name("executor_workers"), "Maximum number of worker threads.", executor.max_workers
+        )
+
+        in_use = core.GaugeMetricFamily(
+            name("connection_pool_in_use"), "HTTP/1.1 connections in use, per host.", labels=["host"]
+        )
+        size = core.GaugeMetricFamily(
+            name("connection_pool_size"), "Maximum number of kept HTTP/1.1 connections, per host.", labels=["host"]
+        )
+        sessions = [session for kind, session in self._client.config.sessions.created().items() if kind != "http2"]
+        for host, (host_in_use, host_size) in sorted(get_connection_pool_usage(sessions).items()):
+            in_use.add_metric([host], host_in_use)
+            size.add_metric([host], host_size)
+        yield in_use
+        yield size
@@ -0,0 +1,271 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+THROTTLING_STATUS_CODES = (429, 503)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the number of requests in flight, adapting the limit with additive increase/multiplicative decrease.
+
+    The limit is multiplied by decrease_factor when a request is throttled (429 or 503) or when the recent latency
+    rises above latency_tolerance times the long-term latency, at most once per round-trip time. Every request
+    completing without either signal grows the limit by 1 / limit, i.e. by one per round-trip at full utilisation,
+    up to max_limit.
+
+    Args:
+        max_limit (int): Upper bound, and initial value, of the limit.
+        min_limit (int): Lower bound of the limit.
+        decrease_factor (float): Factor to multiply the limit with on overload.
+        latency_tolerance (float): How many times slower than the long-term latency requests may get before the
+            limit is decreased. Set to None to react to throttling only.
+    """
+
+    _SHORT_TERM_WEIGHT = 0.2
+    _LONG_TERM_WEIGHT = 0.02
+
+    def __init__(
+        self, max_limit: int, min_limit: int = 1, decrease_factor: float = 0.5, latency_tolerance: float = 2.0
+    ):
+        assert 1 <= min_limit <= max_limit, "Expected 1 <= min_limit <= max_limit, got {} and {}".format(
+            min_limit, max_limit
+        )
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+
+        self._limit = float(max_limit)
+        self._in_flight = 0
+        self._short_term_latency = None
+        self._long_term_latency = None
+        self._last_decrease = 0.0
+        self._throttled_count = 0
+        self._decrease_count = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """The current maximum number of requests in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently in flight."""
+        return self._in_flight
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, latency: float = None, throttled: bool = False):
+        """Register that a request has completed.
+
+        Args:
+            latency (float): Duration of the request in seconds. None if the request failed without a response.
+            throttled (bool): Whether the API responded with, or the request was retried because of, a 429 or 503.
+        """
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                self._throttled_count += 1
+                self._decrease(time.monotonic())
+            elif latency is not None:
+                self._update_latency(latency)
+                if self._latency_has_risen():
+                    self._decrease(time.monotonic())
+                elif self._limit < self.max_limit:
+                    self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, float]:
+        """Returns a snapshot of the limiter state.
+
+        Returns:
+            Dict[str, float]: The current limit, the number of requests in flight, the number of throttled requests
+            and of limit decreases seen so far, and the short- and long-term request latency in seconds.
+        """
+        with self._cond:
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "throttled": self._throttled_count,
+                "decreases": self._decrease_count,
+                "short_term_latency": self._short_term_latency,
+                "long_term_latency": self._long_term_latency,
+            }
+
+    def _update_latency(self, latency: float):
+        if self._short_term_latency is None:
+            self._short_term_latency = self._long_term_latency = latency
+            return
+        self._short_term_latency += self._SHORT_TERM_WEIGHT * (latency - self._short_term_latency)
+        self._long_term_latency += self._LONG_TERM_WEIGHT * (latency - self._long_term_latency)
+
+    def _latency_has_risen(self) -> bool:
+        if self.latency_tolerance is None or self._long_term_latency is None:
+            return False
+        return self._short_term_latency > self.latency_tolerance * self._long_term_latency
+
+    def _decrease(self, now: float):
+        # Only back off once per round-trip, as all requests in flight see the same overload
+        if now - self._last_decrease < (self._short_term_latency or 0):
+            return
+        self._last_decrease = now
+        self._decrease_count += 1
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+
+    def __repr__(self):
+        return "<{} limit={} in_flight={}>".format(self.__class__.__name__, self.limit, self.in_flight)
+
+
+_SHARED_CONCURRENCY_LIMITERS = {}  # type: Dict[Tuple[str, str], AdaptiveConcurrencyLimiter]
+_SHARED_CONCURRENCY_LIMITERS_LOCK = threading.Lock()
+
+
+def get_shared_concurrency_limiter(base_url: str, project: str, max_limit: int) -> AdaptiveConcurrencyLimiter:
+    """Returns the limiter shared by every client in this process sending requests to the given project."""
+    key = (base_url, project)
+    with _SHARED_CONCURRENCY_LIMITERS_LOCK:
+        if key not in _SHARED_CONCURRENCY_LIMITERS:
+            _SHARED_CONCURRENCY_LIMITERS[key] = AdaptiveConcurrencyLimiter(max_limit)
+        return _SHARED_CONCURRENCY_LIMITERS[key]
+
+
+class TokenBucket:
+    """A token bucket refilled at a constant rate.
+
+    Args:
+        rate (float): Tokens added per second.
+        capacity (float): Maximum number of tokens, i.e. the largest burst allowed. Defaults to rate, but at least 1.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        assert rate > 0, "rate must be positive, was {}".format(rate)
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Take tokens from the bucket if they are available, without waiting.
+
+        Returns:
+            bool: Whether the tokens were taken.
+        """
+        return self._take_or_get_wait_time(tokens) == 0
+
+    def acquire(self, tokens: float = 1, blocking: bool = True, timeout: float = None) -> bool:
+        """Take tokens from the bucket, waiting for them to become available if blocking is True.
+
+        Args:
+            tokens (float): The number of tokens to take.
+            blocking (bool): Wait for tokens to become available.
+            timeout (float): Maximum number of seconds to wait. Waits indefinitely if None.
+
+        Returns:
+            bool: Whether the tokens were taken.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait_time = self._take_or_get_wait_time(tokens)
+            if wait_time == 0:
+                return True
+            if not blocking or (deadline is not None and time.monotonic() + wait_time > deadline):
+                return False
+            time.sleep(wait_time)
+
+    async def acquire_async(self, tokens: float = 1):
+        """Take tokens from the bucket, waiting for them to become available without blocking the event loop."""
+        while True:
+            wait_time = self._take_or_get_wait_time(tokens)
+            if wait_time == 0:
+                return
+            await asyncio.sleep(wait_time)
+
+    def _take_or_get_wait_time(self, tokens: float) -> float:
+        assert tokens <= self.capacity, "Can not acquire {} tokens from a bucket of size {}".format(
+            tokens, self.capacity
+        )
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0
+            return (tokens - self._tokens) / self.rate
+
+
+class RateLimiter:
+    """Limits the request rate of a client per endpoint family.
+
+    Each key in limits is either an endpoint family, i.e. a path prefix relative to the project such as
+    :code:`/timeseries/data`, :code:`/raw` or :code:`/assets`, or :code:`*` for all requests not matching any family.
+    A request is counted against the family with the longest matching prefix.
+
+    Args:
+        limits (Dict[str, float]): Maximum number of requests per second, per endpoint family.
+    """
+
+    DEFAULT = "*"
+
+    def __init__(self, limits: Dict[str, float]):
+        self.limits = dict(limits)
+        self._buckets = {family: TokenBucket(rate) for family, rate in limits.items()}
+        self._families = sorted((f for f in limits if f != self.DEFAULT), key=len, reverse=True)
+        self._family_cache = {}
+
+    def get_bucket(self, url_path: str) -> Optional[TokenBucket]:
+        """Returns the token bucket requests to the given path are counted against, if any."""
+        return self._buckets.get(self.get_family(url_path))
+
+    def get_family(self, url_path: str) -> str:
+        family = self._family_cache.get(url_path)
+        if family is None:
+            family = self.DEFAULT
+            for f in self._families:
+                if url_path == f or url_path.startswith(f.rstrip("/") + "/"):
+                    family = f
+                    break
+            if len(self._family_cache) < 10000:
+                self._family_cache[url_path] = family
+        return family
+
+    def try_acquire(self, url_path: str) -> bool:
+        """Take a token for a request to the given path if one is available, without waiting."""
+        bucket = self.get_bucket(url_path)
+        return bucket is None or bucket.try_acquire()
+
+    def acquire(self, url_path: str, blocking: bool = True, timeout: float = None) -> bool:
+        """Take a token for a request to the given path. See :code:`TokenBucket.acquire`."""
+        bucket = self.get_bucket(url_path)
+        return bucket is None or bucket.acquire(blocking=blocking, timeout=timeout)
+
+    async def acquire_async(self, url_path: str):
+        """Take a token for a request to the given path without blocking the event loop."""
+        bucket = self.get_bucket(url_path)
+        if bucket is not None:
+            await bucket.acquire_async()
+
+    def __repr__(self):
+        return "<{} {}>".format(self.__class__.__name__, self.limits)
+
+
+_SHARED_RATE_LIMITERS = {}  # type: Dict[Tuple[str, str, Tuple[Tuple[str, float], ...]], RateLimiter]
+_SHARED_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def get_shared_rate_limiter(base_url: str, project: str, limits: Dict[str, float]) -> RateLimiter:
+    """Returns the limiter shared by every client in this process sending requests to the given project with the same
+    rate limits."""
+    key = (base_url, project, tuple(sorted(limits.items())))
+    with _SHARED_RATE_LIMITERS_LOCK:
+        if key not in _SHARED_RATE_LIMITERS:
+            _SHARED_RATE_LIMITERS[key] = RateLimiter(limits)
+        return _SHARED_RATE_LIMITERS[key]
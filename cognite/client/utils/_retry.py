@@ -0,0 +1,168 @@
+import email.utils
+import random
+import threading
+import time
+from typing import Optional, Sequence
+
+import requests
+from requests import Response
+from requests.packages.urllib3 import exceptions as urllib3_exceptions
+
+
+class RetryBudget:
+    """Limits the retries of a client to a fraction of the requests it sends.
+
+    When an API is overloaded, retrying every failed request multiplies the load on it. The budget allows ratio retries
+    per request sent, plus min_retries_per_second so that clients sending few requests can still retry. Unused
+    retries accumulate up to max_balance. When the budget is spent, failed requests are not retried, and the response
+    or error of the last attempt is returned to the caller.
+
+    Args:
+        ratio (float): Retries allowed per request sent.
+        min_retries_per_second (float): Retries allowed per second, however few requests are sent.
+        max_balance (float): Maximum number of unused retries kept.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries_per_second: float = 10, max_balance: float = 100):
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_balance = max_balance
+        self.denied = 0
+        self._balance = float(min(min_retries_per_second, max_balance))
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def balance(self) -> float:
+        """The number of retries currently allowed."""
+        with self._lock:
+            self._refill()
+            return self._balance
+
+    def deposit(self):
+        """Adds the retries allowed by one request sent."""
+        with self._lock:
+            self._balance = min(self._balance + self.ratio, self.max_balance)
+
+    def withdraw(self) -> bool:
+        """Spends one retry, if the budget allows it.
+
+        Returns:
+            bool: Whether the retry is allowed.
+        """
+        with self._lock:
+            self._refill()
+            if self._balance < 1:
+                self.denied += 1
+                return False
+            self._balance -= 1
+            return True
+
+    def _refill(self):
+        now = time.monotonic()
+        self._balance = min(self._balance + (now - self._last_refill) * self.min_retries_per_second, self.max_balance)
+        self._last_refill = now
+
+
+def is_connect_error(error: Exception) -> bool:
+    """Returns whether a request failed before it was sent, so that it is safe to retry it whatever it does."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError) or not error.args:
+        return False
+    # The adapters wrap the urllib3 error in a MaxRetryError, as they are not allowed to retry
+    reason = getattr(error.args[0], "reason", error.args[0])
+    return isinstance(reason, urllib3_exceptions.ConnectTimeoutError)
+
+
+def parse_retry_after(res: Response) -> Optional[float]:
+    """Returns the seconds to wait given by the Retry-After header of a response, or None if it has none."""
+    value = res.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RetryPolicy:
+    """Decides which failed attempts of a request to retry, and how long to wait before retrying.
+
+    Requests failing to connect, and requests answered with status code 429, are always retried. Requests which are
+    safe to repeat are also retried on other connection errors, timeouts and the status codes in status_forcelist.
+
+    Waits use decorrelated jitter: each wait is drawn at random between base_backoff and three times the previous wait,
+    and capped at max_backoff, so that clients throttled at the same time do not retry in lockstep. When a response has
+    a Retry-After header, the client waits as long as it says instead, also capped at max_backoff.
+
+    Args:
+        max_retries (int): Maximum number of retries of a request.
+        max_backoff (float): Maximum number of seconds to wait before a retry.
+        base_backoff (float): Minimum number of seconds to wait before a retry.
+        status_forcelist (Sequence[int]): Status codes to retry requests which are safe to repeat on.
+        budget (Optional[RetryBudget]): Limits retries to a fraction of the requests sent.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 10,
+        max_backoff: float = 30,
+        base_backoff: float = 0.5,
+        status_forcelist: Sequence[int] = (429, 502, 503, 504),
+        budget: Optional[RetryBudget] = None,
+    ):
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+        self.base_backoff = base_backoff
+        self.status_forcelist = frozenset(status_forcelist)
+        self.budget = budget
+
+    def on_request(self):
+        """Called once for every request sent, before its first attempt."""
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def should_retry(
+        self, retries: int, is_retryable: bool, status: Optional[int] = None, error: Optional[Exception] = None
+    ) -> bool:
+        """Returns whether to retry a failed attempt.
+
+        Args:
+            retries (int): Number of times the request has been retried already.
+            is_retryable (bool): Whether the request is safe to repeat.
+            status (Optional[int]): Status code of the response to the attempt, if any.
+            error (Optional[Exception]): The error the attempt failed with, if it got no response.
+
+        Returns:
+            bool: Whether to retry.
+        """
+        if retries >= self.max_retries:
+            return False
+        if error is not None:
+            retry = is_connect_error(error) or (
+                is_retryable and isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+            )
+        else:
+            retry = status == 429 or (is_retryable and status in self.status_forcelist)
+        return retry and (self.budget is None or self.budget.withdraw())
+
+    def get_backoff(self, previous: float, res: Optional[Response] = None) -> float:
+        """Returns the seconds to wait before the next attempt.
+
+        Args:
+            previous (float): Seconds waited before the previous attempt, or 0 before the first retry.
+            res (Optional[Response]): The response to the failed attempt, if any.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        retry_after = parse_retry_after(res) if res is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        return min(random.uniform(self.base_backoff, max(previous, self.base_backoff) * 3), self.max_backoff)
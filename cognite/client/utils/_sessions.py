@@ -0,0 +1,189 @@
+import logging
+import os
+import threading
+import weakref
+from http import cookiejar
+from typing import Dict
+
+from requests import Request, Session
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3 import Retry
+
+from cognite.client import utils
+
+log = logging.getLogger("cognite-sdk")
+
+
+class BlockAll(cookiejar.CookiePolicy):
+    return_ok = set_ok = domain_return_ok = path_return_ok = lambda self, *args, **kwargs: False
+    netscape = True
+    rfc2965 = hide_cookie2 = False
+
+
+class RetryWithMaxBackoff(Retry):
+    def __init__(self, max_backoff: float = getattr(Retry, "DEFAULT_BACKOFF_MAX", 120), **kwargs):
+        super().__init__(**kwargs)
+        self.max_backoff = max_backoff
+
+    def new(self, **kw):
+        retry = super().new(**kw)
+        retry.max_backoff = self.max_backoff
+        return retry
+
+    def get_backoff_time(self):
+        return min(self.max_backoff, super().get_backoff_time())
+
+
+def init_requests_session(
+    config: "utils._client_config.ClientConfig", retry: Retry = None, http2: bool = False
+) -> Session:
+    session = Session()
+    session.cookies.set_policy(BlockAll())
+
+    if http2:
+        adapter = utils._http2.HTTP2Adapter(
+            max_retries=retry, max_connections=config.max_connection_pool_size, verify=not config.disable_ssl
+        )
+    else:
+        adapter = HTTPAdapter(max_retries=retry or 0, pool_maxsize=config.max_connection_pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    if config.disable_ssl:
+        import urllib3
+
+        urllib3.disable_warnings()
+        session.verify = False
+
+    return session
+
+
+def init_external_requests_session(config: "utils._client_config.ClientConfig") -> Session:
+    # Used for URLs outside the API, like file upload and download links, which are sent without the retry engine of
+    # APIClient, so throttled requests and failed connections are retried by urllib3
+    retry = RetryWithMaxBackoff(
+        max_backoff=config.max_retry_backoff,
+        total=config.max_retries,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=[429],
+        method_whitelist=False,
+        raise_on_status=False,
+    )
+    return init_requests_session(config, retry)
+
+
+_SESSION_FACTORIES = {
+    "external": init_external_requests_session,
+    # API requests are retried by APIClient, so the adapters of this session never retry
+    "api": init_requests_session,
+    # The HTTP/2 session is only created once a client enables http2, as it requires httpx
+    "http2": lambda config: init_requests_session(config, http2=True),
+}
+
+# Every pool in this process, so that their sessions can be dropped in a child process after os.fork()
+_POOLS = weakref.WeakSet()
+
+
+class SessionPool:
+    """The HTTP sessions of one client configuration, created on first use.
+
+    Connection pools are sized by max_connection_pool_size, and SSL verification and retries of the session used for
+    URLs outside the API follow the configuration, so clients with different settings never share connections.
+
+    After os.fork(), the child process starts with no sessions, so it never reads from or writes to sockets it shares
+    with its parent.
+
+    Args:
+        config (ClientConfig): The configuration to create sessions from.
+    """
+
+    def __init__(self, config: "utils._client_config.ClientConfig"):
+        self._config = config
+        self._sessions = {}
+        self._lock = threading.Lock()
+        _POOLS.add(self)
+
+    def get(self, kind: str) -> Session:
+        """Returns the session of the given kind, creating it on first use.
+
+        Args:
+            kind (str): "api" for API requests, "http2" for API requests over HTTP/2, or "external" for URLs outside
+                the API, like file upload and download links.
+
+        Returns:
+            Session: The session.
+        """
+        session = self._sessions.get(kind)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(kind)
+                if session is None:
+                    session = self._sessions[kind] = _SESSION_FACTORIES[kind](self._config)
+        return session
+
+    def created(self) -> Dict[str, Session]:
+        """Returns the sessions created so far, by kind."""
+        return dict(self._sessions)
+
+    def warm_up(self, connections: int = None) -> int:
+        """Opens keep-alive connections to the API, resolving its host and completing TLS handshakes in advance.
+
+        The connections are opened concurrently on the executor of the configuration and kept in the connection pool
+        of the session used for API requests. Connections over HTTP/2 and through proxies are not opened in advance.
+
+        Args:
+            connections (int): Number of connections to open. Defaults to max_workers. At most
+                max_connection_pool_size connections are kept.
+
+        Returns:
+            int: The number of connections opened.
+        """
+        if self._config.http2:
+            return 0
+        url = self._config.base_url
+        pool = self._get_connection_pool(url)
+        n = min(connections or self._config.max_workers, self._config.max_connection_pool_size)
+        conns = [pool._get_conn() for _ in range(n)]
+        futures = self._config.executor.run_all(lambda conn: conn.connect(), [(conn,) for conn in conns])
+        opened = 0
+        for conn, future in zip(conns, futures):
+            if future.exception() is None:
+                opened += 1
+            else:
+                log.debug("Failed to open connection to {}: {}".format(url, future.exception()))
+                conn.close()
+            pool._put_conn(conn)
+        return opened
+
+    def _get_connection_pool(self, url: str):
+        # The urllib3 pool the session used for API requests sends requests to url through
+        session = self.get("api")
+        adapter = session.get_adapter(url)
+        if hasattr(adapter, "get_connection_with_tls_context"):
+            return adapter.get_connection_with_tls_context(Request("GET", url).prepare(), session.verify, cert=None)
+        pool = adapter.get_connection(url)
+        adapter.cert_verify(pool, url, session.verify, None)
+        return pool
+
+    def close(self):
+        """Closes the connections of every session. New sessions are created if the pool is used again."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
+
+    def _reset_after_fork(self):
+        # The sockets are shared with the parent process, so they must be forgotten rather than closed
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+
+def _reset_pools_after_fork():
+    for pool in list(_POOLS):
+        pool._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
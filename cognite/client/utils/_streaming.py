@@ -0,0 +1,102 @@
+"""Incremental decoding of JSON response bodies.
+
+Response bodies are decoded with ijson as they are downloaded, so large pages are never held in memory both as bytes
+and as one nested Python object. Requires ijson >= 3.0.
+"""
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from requests import Response
+
+from cognite.client import utils
+
+_CHUNK_SIZE = 65536
+_SCALAR_EVENTS = {"null", "boolean", "integer", "double", "number", "string"}
+
+
+def _iter_chunks(res: Response) -> Iterator[bytes]:
+    try:
+        yield from res.iter_content(_CHUNK_SIZE)
+    finally:
+        res.close()
+
+
+class ListResponseReader:
+    """Iterates over the items of a list response as they are decoded.
+
+    Once all items have been iterated over, next_cursor holds the cursor of the next page, if any.
+
+    Args:
+        res (Response): A response to a request sent with stream=True.
+    """
+
+    def __init__(self, res: Response):
+        self.res = res
+        self.next_cursor = None  # type: Optional[str]
+
+    def __iter__(self) -> Iterator[Any]:
+        ijson = utils._auxiliary.local_import("ijson")
+        items, cursors = ijson.sendable_list(), ijson.sendable_list()
+        # Two parsers run over the same bytes, as the cursor may come before or after the items
+        parsers = [ijson.items_coro(items, "items.item", use_float=True), ijson.items_coro(cursors, "nextCursor")]
+        for chunk in _iter_chunks(self.res):
+            for parser in parsers:
+                parser.send(chunk)
+            yield from items
+            del items[:]
+        for parser in parsers:
+            parser.close()
+        yield from items
+        self.next_cursor = cursors[0] if cursors else None
+
+
+@utils._profiling.profiled_stage("decode")
+def load_datapoints_columns(res: Response, expected_fields: List[str]) -> List[Tuple[Dict[str, Any], Dict[str, List]]]:
+    """Decodes a response from /timeseries/data/list straight into one list per datapoint field.
+
+    Args:
+        res (Response): A response to a request sent with stream=True.
+        expected_fields (List[str]): The datapoint fields to collect, besides timestamp.
+
+    Returns:
+        List[Tuple[Dict[str, Any], Dict[str, List]]]: For each item, its metadata (id, externalId, isString, ...) and
+        the datapoint fields. Values missing from a datapoint are None.
+    """
+    ijson = utils._auxiliary.local_import("ijson")
+    fields = expected_fields + ["timestamp"]
+    item_prefix = "items.item"
+    dp_prefix = item_prefix + ".datapoints.item"
+    meta_prefix_len = len(item_prefix) + 1
+
+    items = []
+    meta, columns, columns_by_prefix, n_datapoints = None, None, {}, 0
+    for prefix, event, value in ijson.parse(_ResponseReader(res), use_float=True):
+        column = columns_by_prefix.get(prefix)
+        if column is not None:
+            column.append(value)
+        elif prefix == dp_prefix:
+            if event == "end_map":
+                n_datapoints += 1
+                for column in columns.values():
+                    if len(column) < n_datapoints:
+                        column.append(None)
+        elif prefix == item_prefix:
+            if event == "start_map":
+                meta, columns, n_datapoints = {}, {field: [] for field in fields}, 0
+                columns_by_prefix = {dp_prefix + "." + field: column for field, column in columns.items()}
+            elif event == "end_map":
+                items.append((meta, columns))
+        elif event in _SCALAR_EVENTS and prefix.startswith(item_prefix) and not prefix.startswith(dp_prefix):
+            meta[prefix[meta_prefix_len:]] = value
+    return items
+
+
+class _ResponseReader:
+    # File-like object over the decoded content of a streamed response
+    def __init__(self, res: Response):
+        self._chunks = _iter_chunks(res)
+
+    def read(self, size: int = -1) -> bytes:
+        # ijson calls read(0) to find out whether the file returns bytes or str
+        if size == 0:
+            return b""
+        return next(self._chunks, b"")
@@ -0,0 +1,151 @@
+import functools
+import inspect
+from collections import UserList
+from typing import Any, Dict, Optional
+
+from requests import Response
+
+from cognite.client import utils
+from cognite.client.utils._hooks import RequestHooks, RequestInfo
+
+INSTRUMENTATION_NAME = "cognite-sdk"
+
+
+class _NoSpan:
+    """Stands in for a span when tracing is disabled, so traced code needs no checks of its own."""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class Tracer:
+    """Creates OpenTelemetry spans for the calls and requests of a client.
+
+    Every call to a public method of an API (e.g. :code:`client.datapoints.retrieve`) is traced by a span, with a child
+    span for each HTTP request it sends, and for each chunk or window of work it splits into. Spans started on the
+    worker threads of the client are children of the span of the call that started the work.
+
+    Requires the opentelemetry-api package. Spans are only recorded and exported if a tracer provider has been
+    configured, e.g. with the opentelemetry-sdk package.
+
+    Args:
+        tracer_provider (Any): The OpenTelemetry TracerProvider to create spans with. Defaults to the global one.
+    """
+
+    def __init__(self, tracer_provider: Any = None):
+        trace = utils._auxiliary.local_import("opentelemetry.trace")
+        self._status_code = trace.StatusCode
+        self._tracer = trace.get_tracer(
+            INSTRUMENTATION_NAME, utils._auxiliary.get_current_sdk_version(), tracer_provider
+        )
+
+    def span(self, name: str, attributes: Dict[str, Any] = None):
+        """Starts a span as the current span, ending it when the returned context manager exits.
+
+        Args:
+            name (str): Name of the span.
+            attributes (Dict[str, Any]): Attributes to set on the span.
+
+        Returns:
+            A context manager returning the span.
+        """
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+    def register(self, hooks: RequestHooks):
+        """Registers hooks tracing every request sent using them."""
+        hooks.register("before_request", self.before_request)
+        hooks.register("after_response", self.after_response)
+        hooks.register("on_retry", self.on_retry)
+        hooks.register("on_error", self.on_error)
+
+    def unregister(self, hooks: RequestHooks):
+        """Unregisters the hooks tracing requests."""
+        hooks.unregister("before_request", self.before_request)
+        hooks.unregister("after_response", self.after_response)
+        hooks.unregister("on_retry", self.on_retry)
+        hooks.unregister("on_error", self.on_error)
+
+    def before_request(self, info: RequestInfo):
+        info.span = self._tracer.start_span(
+            "HTTP {}".format(info.method),
+            attributes={
+                "http.method": info.method,
+                "http.url": info.url,
+                "http.route": utils._metrics.get_endpoint(info.url_path),
+                "cognite.bytes_sent": info.bytes_sent,
+            },
+        )
+
+    def after_response(self, info: RequestInfo, res: Response):
+        span = info.span
+        span.set_attribute("http.status_code", res.status_code)
+        span.set_attribute("cognite.retries", info.retries)
+        content_length = res.headers.get("Content-Length")
+        if content_length is not None:
+            span.set_attribute("cognite.bytes_received", int(content_length))
+        request_id = res.headers.get("X-Request-Id")
+        if request_id is not None:
+            span.set_attribute("cognite.request_id", request_id)
+        if res.status_code >= 400:
+            span.set_status(self._status_code.ERROR)
+        span.end()
+
+    def on_retry(self, info: RequestInfo, status: Optional[int], error: Optional[Exception]):
+        attributes = {"http.status_code": status} if status is not None else {"exception.type": type(error).__name__}
+        info.span.add_event("retry", attributes)
+
+    def on_error(self, info: RequestInfo, error: Exception):
+        if info.latency is not None:
+            # Failed with an error status code, so the span was ended by after_response
+            return
+        info.span.record_exception(error)
+        info.span.set_status(self._status_code.ERROR, str(error))
+        info.span.end()
+
+
+def span(tracer: Optional[Tracer], name: str, attributes: Dict[str, Any] = None):
+    """Starts a span with the tracer of a client, or a span doing nothing if tracing is disabled.
+
+    Args:
+        tracer (Optional[Tracer]): The tracer of the client, or None.
+        name (str): Name of the span.
+        attributes (Dict[str, Any]): Attributes to set on the span.
+
+    Returns:
+        A context manager returning the span.
+    """
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.span(name, attributes)
+
+
+def _traced_method(func, name: str):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        tracer = self._config.tracer
+        if tracer is None:
+            return func(self, *args, **kwargs)
+        with tracer.span(name) as span:
+            res = func(self, *args, **kwargs)
+            if isinstance(res, (list, UserList)):
+                span.set_attribute("cognite.items", len(res))
+            return res
+
+    return wrapper
+
+
+def trace_api_methods(cls):
+    """Wraps every public method defined by an API class, to trace calls to it when tracing is enabled."""
+    for attr, value in list(cls.__dict__.items()):
+        if not attr.startswith("_") and inspect.isfunction(value) and not inspect.isgeneratorfunction(value):
+            setattr(cls, attr, _traced_method(value, "{}.{}".format(cls.__name__, attr)))
+    return cls
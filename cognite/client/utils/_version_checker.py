@@ -1,9 +1,15 @@
 import argparse
+import json
 import os
 import re
+import time
+from typing import Optional
 
 import requests
 
+# Seconds a version check stored on disk is reused before PyPI is asked again
+CACHE_TTL = 24 * 60 * 60
+
 
 def check_if_version_exists(package_name: str, version: str):
     versions = get_all_versions(package_name=package_name)
@@ -19,6 +25,55 @@ def get_newest_version_in_major_release(package_name: str, version: str):
     return _format_version(major, minor, micro, pr_cycle, pr_version)
 
 
+def get_cache_path() -> str:
+    cache_dir = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_dir, "cognite-sdk", "pypi-version-check.json")
+
+
+def get_cached_newest_version_in_major_release(
+    package_name: str, version: str, cache_path: str = None, ttl: float = CACHE_TTL
+) -> str:
+    """Returns the newest version in the major release of version, asking PyPI at most once every ttl seconds.
+
+    The answer is stored in a file shared by every process on the machine. Failing to read or write it only means
+    PyPI is asked again.
+    """
+    cache_path = cache_path or get_cache_path()
+    newest_version = _read_cached_version(cache_path, package_name, version, ttl)
+    if newest_version is None:
+        newest_version = get_newest_version_in_major_release(package_name, version)
+        _write_cached_version(cache_path, package_name, version, newest_version)
+    return newest_version
+
+
+def _read_cached_version(cache_path: str, package_name: str, version: str, ttl: float) -> Optional[str]:
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(cached, dict)
+        or cached.get("package") != package_name
+        or cached.get("version") != version
+        or not time.time() - ttl < cached.get("checked_at", 0) <= time.time()
+    ):
+        return None
+    return cached.get("newest_version")
+
+
+def _write_cached_version(cache_path: str, package_name: str, version: str, newest_version: str):
+    cached = {"package": package_name, "version": version, "newest_version": newest_version, "checked_at": time.time()}
+    tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(cached, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
 def get_all_versions(package_name: str):
     disable_ssl = os.getenv("COGNITE_DISABLE_SSL", False)
     verify_ssl = not disable_ssl
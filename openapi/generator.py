@@ -11,6 +11,7 @@ from openapi.utils import TYPE_MAPPING
 TO_EXCLUDE = ["project", "cursor"]
 GEN_CLASS_PATTERN = "# GenClass: ([\S ]+)\s+class (\S+)\(.+\):(?:(?!# GenStop)[\s\S])+# GenStop"
 GEN_UPDATE_CLASS_PATTERN = "# GenUpdateClass: (\S+)\s+class (\S+)\(.+\):(?:(?!# GenStop)[\s\S])+# GenStop"
+GEN_CLASS_PATTERN_FOR_CLASS = "# GenClass: [\S ]+\s+class {}\(.+\):(?:(?!# GenStop)[\s\S])+# GenStop"
 GEN_PROPERTY_CLASS_PATTERN = "# GenPropertyClass: (\S+)\s+class (\S+)\(.+\):(?:(?!# GenStop)[\s\S])+# GenStop"
 
 GenClassSegment = namedtuple("GenClassSegment", ["schema_names", "class_name"])
@@ -54,10 +55,11 @@ class ClassGenerator:
             else:
                 schemas.append(self._spec.components.schemas.get(schema_name))
         docstring = self.generate_docstring(schemas, indentation=4, is_property=is_property)
+        slots = "" if is_property else self.generate_slots(schemas, class_segment.class_name, indentation=4)
         constructor_args = self.generate_constructor(schemas, indentation=4, is_property=is_property)
         property_definitions = self.generate_properties(schemas, indentation=4) if is_property else ""
         loader = self.generate_loader(schemas, class_segment.class_name, indentation=4)
-        generated_segment = docstring + "\n" + constructor_args + "\n" + property_definitions + loader
+        generated_segment = docstring + "\n" + slots + constructor_args + "\n" + property_definitions + loader
         return class_segment.class_name, generated_segment
 
     def generate_docstring(self, schemas, indentation, is_property=False):
@@ -78,6 +80,29 @@ class ClassGenerator:
         docstring += " " * indentation + '"""'
         return docstring
 
+    def generate_slots(self, schemas, class_name, indentation):
+        slots = []
+        ignore = [p for p in TO_EXCLUDE]
+        for schema in schemas:
+            for prop_name in self._get_schema_properties(schema):
+                prop_name = utils.to_snake_case(prop_name)
+                if prop_name not in ignore:
+                    slots.append(prop_name)
+                    ignore.append(prop_name)
+        slots.extend(self._get_private_slots(class_name))
+        slots = ", ".join('"{}"'.format(slot) for slot in slots) + ("," if len(slots) == 1 else "")
+        return "\n" + " " * indentation + "__slots__ = ({})\n".format(slots)
+
+    def _get_private_slots(self, class_name):
+        # Private attributes are set by hand-written code after the generated segment, so keep them when regenerating
+        segment = re.search(GEN_CLASS_PATTERN_FOR_CLASS.format(re.escape(class_name)), self._input)
+        if segment is None:
+            return []
+        slots = re.search(r"__slots__ = \(([^)]*)\)", segment.group(0))
+        if slots is None:
+            return []
+        return [slot for slot in re.findall(r'"(\w+)"', slots.group(1)) if slot.startswith("_")]
+
     def generate_constructor(self, schemas, indentation, is_property=False):
         constructor_params = [" " * indentation + "def __init__(self"]
         ignore = [p for p in TO_EXCLUDE]
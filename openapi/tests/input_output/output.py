@@ -84,6 +84,23 @@ class Asset(CogniteResource):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "external_id",
+        "name",
+        "parent_id",
+        "parent_external_id",
+        "description",
+        "data_set_id",
+        "metadata",
+        "source",
+        "labels",
+        "id",
+        "created_time",
+        "last_updated_time",
+        "root_id",
+        "aggregates",
+    )
+
     def __init__(
         self,
         external_id: str = None,
@@ -220,6 +237,22 @@ class AssetFilter(CogniteFilter):
         cognite_client (CogniteClient): The client to associate with this object.
     """
 
+    __slots__ = (
+        "name",
+        "parent_ids",
+        "parent_external_ids",
+        "root_ids",
+        "asset_subtree_ids",
+        "data_set_ids",
+        "metadata",
+        "source",
+        "created_time",
+        "last_updated_time",
+        "root",
+        "external_id_prefix",
+        "labels",
+    )
+
     def __init__(
         self,
         name: str = None,
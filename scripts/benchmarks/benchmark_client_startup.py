@@ -0,0 +1,51 @@
+"""Measures the time to import the SDK and to create a CogniteClient, each in a fresh interpreter.
+
+The PyPI version check is left enabled, and no project is given to the client unless --project is passed, so any
+network I/O done while creating the client is included in the measurement.
+
+Usage:
+    python scripts/benchmarks/benchmark_client_startup.py [--repeat N] [--project PROJECT]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+MEASURE = """
+import json, time
+start = time.perf_counter()
+from cognite.client import CogniteClient
+imported = time.perf_counter()
+CogniteClient(api_key="key", client_name="bench", project={project!r})
+created = time.perf_counter()
+print(json.dumps({{"import": imported - start, "construct": created - imported}}))
+"""
+
+
+def run_once(project: str = None) -> dict:
+    env = dict(os.environ)
+    env.pop("COGNITE_PROJECT", None)
+    env.pop("COGNITE_DISABLE_PYPI_VERSION_CHECK", None)
+    command = [sys.executable, "-W", "ignore", "-c", MEASURE.format(project=project)]
+    out = subprocess.run(command, env=env, check=True, stdout=subprocess.PIPE).stdout
+    return json.loads(out.decode().strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--project")
+    args = parser.parse_args()
+
+    runs = [run_once(args.project) for _ in range(args.repeat)]
+    for phase in ["import", "construct"]:
+        timings = [run[phase] * 1000 for run in runs]
+        print(
+            "{:<12} median {:>9.2f} ms   min {:>9.2f} ms".format(phase, statistics.median(timings), min(timings))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Compares fetching datapoints over HTTP/1.1 and HTTP/2 against a local stand-in for the datapoints API.
+
+The stand-in server runs in its own process and speaks both protocols over TLS, negotiated with ALPN. It counts the
+connections each client opens. Every request is answered after a fixed delay, standing in for the time the API spends on it. Requires httpx[http2]
+and the openssl command line tool, used to create a self-signed certificate.
+
+Usage:
+    python scripts/benchmarks/benchmark_http2.py [--series N] [--points N] [--max-workers N] [--latency SECONDS]
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import multiprocessing
+import os
+import ssl
+import subprocess
+import tempfile
+import time
+
+import h2.config
+import h2.connection
+import h2.events
+
+from cognite.client import CogniteClient
+
+
+class StandInServer:
+    """Answers POST /timeseries/data/list with evenly spaced datapoints, over HTTP/1.1 or HTTP/2.
+
+    Args:
+        points (int): Number of datapoints in each time series.
+        latency (float): Seconds to wait before answering each request.
+    """
+
+    def __init__(self, points: int, latency: float):
+        self.points = points
+        self.latency = latency
+        # Shared with the server process
+        self._connections = multiprocessing.Value("i", 0)
+        self._requests = multiprocessing.Value("i", 0)
+        self._port = multiprocessing.Value("i", 0)
+        self._started = multiprocessing.Event()
+
+    @property
+    def connections(self) -> int:
+        return self._connections.value
+
+    @property
+    def requests(self) -> int:
+        return self._requests.value
+
+    @property
+    def port(self) -> int:
+        return self._port.value
+
+    def start(self, certfile: str, keyfile: str):
+        multiprocessing.Process(target=self._run, args=(certfile, keyfile), daemon=True).start()
+        self._started.wait()
+
+    def reset_counts(self):
+        self._connections.value = self._requests.value = 0
+
+    def _run(self, certfile: str, keyfile: str):
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(certfile, keyfile)
+        context.set_alpn_protocols(["h2", "http/1.1"])
+        loop = asyncio.new_event_loop()
+        server = loop.run_until_complete(asyncio.start_server(self._handle, "127.0.0.1", 0, ssl=context))
+        self._port.value = server.sockets[0].getsockname()[1]
+        self._started.set()
+        loop.run_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        protocol = writer.get_extra_info("ssl_object").selected_alpn_protocol()
+        self._connections.value += 1
+        try:
+            if protocol == "h2":
+                await self._serve_http2(reader, writer)
+            else:
+                await self._serve_http1(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, headers: dict, body: bytes) -> bytes:
+        self._requests.value += 1
+        await asyncio.sleep(self.latency)
+        if headers.get("content-encoding") == "gzip":
+            body = gzip.decompress(body)
+        query = json.loads(body)
+        item = dict(query["items"][0], isString=False, isStep=False, unit=None)
+        if query.get("aggregates"):
+            # No aggregates, so the SDK fetches each series in one window
+            item["datapoints"] = []
+        else:
+            first = -(-query["start"] // 1000) * 1000
+            timestamps = range(first, min(query["end"], self.points * 1000), 1000)[: query["limit"]]
+            item["datapoints"] = [{"timestamp": t, "value": t / 1000} for t in timestamps]
+        return json.dumps({"items": [item]}).encode()
+
+    async def _serve_http1(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            headers = {}
+            for line in head.decode("latin-1").split("\r\n")[1:]:
+                if line:
+                    name, value = line.split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+            response = await self._respond(headers, body)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\ncontent-length: %d\r\n\r\n" % len(response)
+            )
+            writer.write(response)
+            await writer.drain()
+
+    async def _serve_http2(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        window_updated = asyncio.Event()
+        requests = {}
+
+        async def send_response(stream_id, headers, body):
+            data = await self._respond(headers, body)
+            conn.send_headers(stream_id, [(":status", "200"), ("content-type", "application/json")])
+            while data:
+                while conn.local_flow_control_window(stream_id) < 1:
+                    window_updated.clear()
+                    writer.write(conn.data_to_send())
+                    await window_updated.wait()
+                size = min(conn.local_flow_control_window(stream_id), conn.max_outbound_frame_size, len(data))
+                conn.send_data(stream_id, data[:size])
+                data = data[size:]
+            conn.end_stream(stream_id)
+            writer.write(conn.data_to_send())
+            await writer.drain()
+
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                return
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    headers = {k.decode(): v.decode() for k, v in event.headers}
+                    requests[event.stream_id] = (headers, bytearray())
+                elif isinstance(event, h2.events.DataReceived):
+                    requests[event.stream_id][1].extend(event.data)
+                    conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    headers, body = requests.pop(event.stream_id)
+                    asyncio.ensure_future(send_response(event.stream_id, headers, bytes(body)))
+                elif isinstance(event, h2.events.WindowUpdated):
+                    window_updated.set()
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
+
+
+def make_certificate(directory: str):
+    """Creates a self-signed certificate for localhost, and makes requests and httpx trust it."""
+    certfile, keyfile = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=localhost"]
+        + ["-addext", "subjectAltName=DNS:localhost", "-keyout", keyfile, "-out", certfile],
+        check=True,
+        stderr=subprocess.DEVNULL,
+    )
+    os.environ["REQUESTS_CA_BUNDLE"] = os.environ["SSL_CERT_FILE"] = certfile
+    return certfile, keyfile
+
+
+def bench(server: StandInServer, http2: bool, args):
+    client = CogniteClient(
+        api_key="key",
+        project="bench",
+        client_name="benchmark_http2",
+        base_url="https://localhost:{}".format(server.port),
+        max_workers=args.max_workers,
+        disable_pypi_version_check=True,
+        http2=http2,
+    )
+    server.reset_counts()
+    start = time.perf_counter()
+    dps = client.datapoints.retrieve(id=list(range(args.series)), start=0, end=args.points * 1000)
+    elapsed = time.perf_counter() - start
+    n_datapoints = sum(len(d) for d in dps)
+    assert args.series * args.points == n_datapoints
+    print(
+        "{:<8} {:>12} {:>10} {:>10.2f} {:>12.0f} {:>14.0f}".format(
+            "HTTP/2" if http2 else "HTTP/1.1",
+            server.connections,
+            server.requests,
+            elapsed,
+            server.requests / elapsed,
+            n_datapoints / elapsed,
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--series", type=int, default=500)
+    parser.add_argument("--points", type=int, default=2000)
+    parser.add_argument("--max-workers", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        server = StandInServer(args.points, args.latency)
+        server.start(*make_certificate(directory))
+        print(
+            "{:<8} {:>12} {:>10} {:>10} {:>12} {:>14}".format(
+                "", "connections", "requests", "seconds", "requests/s", "datapoints/s"
+            )
+        )
+        for http2 in [False, True]:
+            bench(server, http2, args)
+
+
+if __name__ == "__main__":
+    main()
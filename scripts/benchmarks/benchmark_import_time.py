@@ -0,0 +1,63 @@
+"""Measures how long importing the SDK takes with `python -X importtime`, and fails if it exceeds a budget.
+
+Every statement is run in a fresh interpreter. The time reported is the cumulative import time of the modules the
+statement imports, excluding those imported during interpreter startup, so it does not depend on the site packages
+installed. Budgets are in milliseconds and meant for comparing commits on the same machine.
+
+Usage:
+    python scripts/benchmarks/benchmark_import_time.py [--repeat N] [--budget-factor F]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+# Statement to time, and its budget in milliseconds
+BUDGETS = {
+    "import cognite.client": 5,
+    "from cognite.client import CogniteClient": 250,
+    "from cognite.client.data_classes import Asset": 25,
+}
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def top_level_imports(statement: str) -> dict:
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], env=env, check=True, stderr=subprocess.PIPE
+    ).stderr
+    imports = {}
+    for line in stderr.decode().splitlines():
+        match = _LINE.match(line)
+        if match and len(match.group(3)) == 1:
+            imports[match.group(4)] = int(match.group(2))
+    return imports
+
+
+def import_time_ms(statement: str) -> float:
+    startup = top_level_imports("pass")
+    imports = top_level_imports(statement)
+    return sum(us for name, us in imports.items() if name not in startup) / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--budget-factor", type=float, default=1.0, help="Multiply every budget by this factor.")
+    args = parser.parse_args()
+
+    exceeded = False
+    for statement, budget in BUDGETS.items():
+        median = statistics.median(import_time_ms(statement) for _ in range(args.repeat))
+        budget *= args.budget_factor
+        status = "ok" if median <= budget else "OVER BUDGET"
+        exceeded |= median > budget
+        print("{:<50} {:>8.1f} ms (budget {:>6.1f} ms) {}".format(statement, median, budget, status))
+    sys.exit(1 if exceeded else 0)
+
+
+if __name__ == "__main__":
+    main()
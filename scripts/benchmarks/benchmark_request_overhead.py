@@ -0,0 +1,68 @@
+"""Measures the client-side overhead of a request, i.e. everything APIClient._do_request does except network I/O.
+
+Usage:
+    python scripts/benchmarks/benchmark_request_overhead.py [--number N]
+
+The script runs against whichever tree cognite.client is imported from, so the figures before a change are measured by
+running this copy of it against a checkout of the commit before the change:
+
+    git worktree add /tmp/before <commit>~1
+    PYTHONPATH=/tmp/before python scripts/benchmarks/benchmark_request_overhead.py
+    python scripts/benchmarks/benchmark_request_overhead.py
+"""
+import argparse
+import base64
+import json
+import time
+import timeit
+from unittest import mock
+
+from cognite.client import CogniteClient
+
+
+def make_jwt(lifetime: int = 3600) -> str:
+    def encode(obj):
+        return base64.urlsafe_b64encode(json.dumps(obj).encode()).decode().rstrip("=")
+
+    return "{}.{}.signature".format(encode({"alg": "none"}), encode({"exp": int(time.time()) + lifetime}))
+
+
+def fake_response():
+    res = mock.MagicMock()
+    res.status_code = 200
+    res.json.return_value = {"items": []}
+    return res
+
+
+def get_api_session(api):
+    # Older trees have no _api_session, and send requests which may be retried, like GET, with _request_session_with_retry
+    session = getattr(api, "_api_session", None)
+    return session if session is not None else api._request_session_with_retry
+
+
+def bench(name: str, stmt, number: int):
+    best = min(timeit.repeat(stmt, number=number, repeat=5))
+    print("{:<40} {:>8.2f} us/call".format(name, best / number * 1e6))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    token = make_jwt()
+    clients = {
+        "api key": CogniteClient(api_key="key", project="p", client_name="bench", disable_pypi_version_check=True),
+        "token factory": CogniteClient(
+            token=lambda: token, project="p", client_name="bench", disable_pypi_version_check=True
+        ),
+    }
+    for auth, client in clients.items():
+        api = client.assets
+        bench("configure headers ({})".format(auth), lambda: api._configure_headers(api._config.headers), args.number)
+        with mock.patch.object(get_api_session(api), "request", return_value=fake_response()):
+            bench("do request ({})".format(auth), lambda: api._do_request("GET", "/assets"), args.number)
+
+
+if __name__ == "__main__":
+    main()
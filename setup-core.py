@@ -18,6 +18,15 @@ setup(
     author="Erlend Vollset",
     author_email="erlend.vollset@cognite.com",
     install_requires=["requests>=2.21.0,<3.0.0"],
+    extras_require={
+        "orjson": ["orjson"],
+        "ujson": ["ujson"],
+        "ijson": ["ijson>=3.0"],
+        "http2": ["httpx[http2]>=0.26"],
+        "async": ["httpx>=0.26"],
+        "tracing": ["opentelemetry-api", "opentelemetry-sdk"],
+        "prometheus": ["prometheus_client"],
+    },
     python_requires=">=3.5",
     packages=["cognite." + p for p in find_packages(where="cognite")],
     include_package_data=True,
@@ -29,7 +29,6 @@ from tests.utils import BASE_URL
 @pytest.fixture
 def rsps_with_login_mock():
     with responses.RequestsMock() as rsps:
-        rsps.add(rsps.GET, "https://pypi.python.org/simple/cognite-sdk/#history", status=200, body="")
         rsps.add(
             rsps.GET,
             BASE_URL + "/login/status",
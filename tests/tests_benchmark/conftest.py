@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+from cognite.client.testing import FakeCogniteServer
+
+pytest.importorskip("pytest_benchmark")
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Multiplies the number of series, datapoints, rows and resources of every benchmark, e.g. 0.01 for a quick run.
+# Results are only comparable between runs with the same scale.
+SCALE = float(os.getenv("COGNITE_BENCHMARK_SCALE", 1))
+
+
+def scaled(n: int) -> int:
+    return max(1, int(n * SCALE))
+
+
+def pytest_collection_modifyitems(config, items):
+    # The suite takes minutes and gigabytes of memory, so it only runs when its directory is passed to pytest
+    requested = any(os.path.abspath(arg.split("::")[0]).startswith(BENCHMARK_DIR) for arg in config.args)
+    if requested:
+        return
+    skip = pytest.mark.skip(reason="benchmarks only run when tests/tests_benchmark is passed to pytest")
+    for item in items:
+        if str(item.fspath).startswith(BENCHMARK_DIR):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def server():
+    with FakeCogniteServer(seed=0) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def client(server):
+    return server.client(max_workers=10)
+
+
+def create_time_series(server, prefix: str, n_series: int, n_datapoints: int, interval_ms: int = 1000):
+    """Creates time series directly in the server, each with n_datapoints points starting at epoch."""
+    points = [(i * interval_ms, float(i % 1000)) for i in range(n_datapoints)]
+    created = server.time_series.create([{"externalId": "{}-{}".format(prefix, i)} for i in range(n_series)])
+    for ts in created:
+        server.datapoints[ts["id"]] = list(points)
+    return [ts["externalId"] for ts in created]
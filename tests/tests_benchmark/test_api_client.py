@@ -0,0 +1,22 @@
+import pytest
+
+from tests.tests_benchmark.conftest import scaled
+
+
+@pytest.fixture(scope="module")
+def n_events(server):
+    n_events = scaled(100000)
+    server.events.create([{"externalId": "event-{}".format(i), "type": "benchmark"} for i in range(n_events)])
+    return n_events
+
+
+def test_list_partitioned(benchmark, client, n_events):
+    benchmark.group = "list"
+    res = benchmark.pedantic(client.events.list, kwargs=dict(partitions=10, limit=None), rounds=3)
+    assert n_events == len(res)
+
+
+def test_list_generator(benchmark, client, n_events):
+    benchmark.group = "list"
+    res = benchmark.pedantic(client.events.list, kwargs=dict(limit=None), rounds=3)
+    assert n_events == len(res)
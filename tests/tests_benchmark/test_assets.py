@@ -0,0 +1,19 @@
+from cognite.client.data_classes import Asset
+from tests.tests_benchmark.conftest import scaled
+
+
+def make_hierarchy(n_assets: int, fanout: int = 10):
+    # A tree where asset i is the child of asset (i - 1) // fanout, so it is a few levels deep and wide
+    assets = [Asset(external_id="asset-0", name="asset-0")]
+    for i in range(1, n_assets):
+        parent = assets[(i - 1) // fanout]
+        external_id = "asset-{}".format(i)
+        assets.append(Asset(external_id=external_id, name=external_id, parent_external_id=parent.external_id))
+    return assets
+
+
+def test_create_hierarchy(benchmark, client, server):
+    benchmark.group = "assets.create_hierarchy"
+    assets = make_hierarchy(scaled(100000))
+    res = benchmark.pedantic(client.assets.create_hierarchy, args=(assets,), setup=server.assets.clear, rounds=3)
+    assert len(assets) == len(res)
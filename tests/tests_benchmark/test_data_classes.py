@@ -0,0 +1,58 @@
+import pytest
+
+from cognite.client.data_classes import AssetList, EventList
+from tests.tests_benchmark.conftest import scaled
+
+N_OBJECTS = 1000000
+
+
+@pytest.fixture(scope="module")
+def events():
+    return [
+        {
+            "id": i,
+            "externalId": "event-{}".format(i),
+            "type": "benchmark",
+            "startTime": i * 1000,
+            "endTime": i * 1000 + 500,
+            "assetIds": [i % 1000],
+            "metadata": {"index": str(i)},
+            "createdTime": 0,
+            "lastUpdatedTime": 0,
+        }
+        for i in range(scaled(N_OBJECTS))
+    ]
+
+
+@pytest.fixture(scope="module")
+def assets():
+    return [
+        {"id": i, "externalId": "asset-{}".format(i), "name": "asset-{}".format(i), "parentId": i // 10, "rootId": 0}
+        for i in range(scaled(N_OBJECTS))
+    ]
+
+
+def test_load_events(benchmark, events):
+    benchmark.group = "_load"
+    res = benchmark.pedantic(EventList._load, args=(events,), rounds=3)
+    assert len(events) == len(res)
+
+
+def test_load_assets(benchmark, assets):
+    benchmark.group = "_load"
+    res = benchmark.pedantic(AssetList._load, args=(assets,), rounds=3)
+    assert len(assets) == len(res)
+
+
+def test_dump_events(benchmark, events):
+    benchmark.group = "dump"
+    event_list = EventList._load(events)
+    res = benchmark.pedantic(event_list.dump, kwargs=dict(camel_case=True), rounds=3)
+    assert len(events) == len(res)
+
+
+def test_dump_assets(benchmark, assets):
+    benchmark.group = "dump"
+    asset_list = AssetList._load(assets)
+    res = benchmark.pedantic(asset_list.dump, kwargs=dict(camel_case=True), rounds=3)
+    assert len(assets) == len(res)
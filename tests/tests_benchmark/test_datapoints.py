@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.tests_benchmark.conftest import create_time_series, scaled
+
+TOTAL_DATAPOINTS = 100000
+SERIES_COUNTS = [1, 100, 10000]
+
+
+@pytest.fixture(scope="module", params=SERIES_COUNTS, ids=lambda n: "{}-series".format(n))
+def external_ids(request, server):
+    n_series = scaled(request.param)
+    return create_time_series(server, "dps-{}".format(n_series), n_series, scaled(TOTAL_DATAPOINTS) // n_series or 1)
+
+
+def test_retrieve_raw(benchmark, client, external_ids):
+    benchmark.group = "datapoints.retrieve raw"
+    res = benchmark.pedantic(
+        client.datapoints.retrieve, kwargs=dict(external_id=external_ids, start=0, end="now"), rounds=3
+    )
+    assert len(external_ids) == len(res)
+
+
+def test_retrieve_aggregates(benchmark, client, external_ids):
+    benchmark.group = "datapoints.retrieve aggregates"
+    res = benchmark.pedantic(
+        client.datapoints.retrieve,
+        kwargs=dict(external_id=external_ids, start=0, end="now", aggregates=["average", "max"], granularity="1m"),
+        rounds=3,
+    )
+    assert len(external_ids) == len(res)
+
+
+@pytest.fixture(scope="module")
+def dataframe_external_ids(server):
+    return create_time_series(server, "dataframe", scaled(100), scaled(TOTAL_DATAPOINTS) // scaled(100) or 1)
+
+
+def test_retrieve_dataframe(benchmark, client, dataframe_external_ids):
+    benchmark.group = "datapoints.retrieve_dataframe"
+    df = benchmark.pedantic(
+        client.datapoints.retrieve_dataframe,
+        kwargs=dict(external_id=dataframe_external_ids, start=0, end="now", aggregates=["average"], granularity="1s"),
+        rounds=3,
+    )
+    assert len(dataframe_external_ids) == df.shape[1]
+
+
+def test_insert_multiple(benchmark, client, server):
+    benchmark.group = "datapoints.insert"
+    n_series = scaled(100)
+    external_ids = create_time_series(server, "insert-multiple", n_series, 0)
+    points = [(i * 1000, float(i)) for i in range(scaled(TOTAL_DATAPOINTS) // n_series or 1)]
+    items = [{"externalId": xid, "datapoints": points} for xid in external_ids]
+    benchmark.pedantic(client.datapoints.insert_multiple, args=(items,), rounds=3)
+
+
+def test_insert_dataframe(benchmark, client, server):
+    benchmark.group = "datapoints.insert"
+    n_series = scaled(100)
+    external_ids = create_time_series(server, "insert-dataframe", n_series, 0)
+    n_rows = scaled(TOTAL_DATAPOINTS) // n_series or 1
+    index = pd.to_datetime(np.arange(n_rows) * 1000, unit="ms")
+    df = pd.DataFrame(np.random.RandomState(0).normal(size=(n_rows, n_series)), index=index, columns=external_ids)
+    benchmark.pedantic(client.datapoints.insert_dataframe, args=(df,), kwargs=dict(external_id_headers=True), rounds=3)
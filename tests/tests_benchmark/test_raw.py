@@ -0,0 +1,24 @@
+import pytest
+
+from tests.tests_benchmark.conftest import scaled
+
+N_ROWS = 100000
+
+
+@pytest.fixture(scope="module")
+def rows():
+    return {"row-{}".format(i): {"index": i, "name": "row-{}".format(i), "value": i / 3} for i in range(scaled(N_ROWS))}
+
+
+def test_insert_rows(benchmark, client, rows):
+    benchmark.group = "raw.rows"
+    benchmark.pedantic(
+        client.raw.rows.insert, args=("benchmark", "insert", rows), kwargs=dict(ensure_parent=True), rounds=3
+    )
+
+
+def test_list_rows(benchmark, client, rows):
+    benchmark.group = "raw.rows"
+    client.raw.rows.insert("benchmark", "list", rows, ensure_parent=True)
+    res = benchmark.pedantic(client.raw.rows.list, args=("benchmark", "list"), kwargs=dict(limit=None), rounds=3)
+    assert len(rows) == len(res)
@@ -0,0 +1,18 @@
+from tests.tests_benchmark.conftest import scaled
+
+N_ROWS = 100000
+N_COLUMNS = 10
+
+
+def test_retrieve_rows(benchmark, client, server):
+    benchmark.group = "sequences.data"
+    columns = [{"externalId": "column-{}".format(i), "valueType": "DOUBLE"} for i in range(N_COLUMNS)]
+    sequence = server.sequences.create([{"externalId": "benchmark", "columns": columns}])[0]
+    server.sequence_rows[sequence["id"]] = {
+        n: {c["externalId"]: n + i / 10 for i, c in enumerate(columns)} for n in range(scaled(N_ROWS))
+    }
+
+    res = benchmark.pedantic(
+        client.sequences.data.retrieve, kwargs=dict(external_id="benchmark", start=0, end=None), rounds=3
+    )
+    assert scaled(N_ROWS) == len(res)
@@ -3,6 +3,7 @@ import queue
 import re
 import time
 from collections import OrderedDict
+from unittest import mock
 
 import pytest
 
@@ -271,7 +272,7 @@ class TestAssets:
             assert asset.id == i + 1
 
     def test_get_subtree_w_error(self, mock_get_subtree_w_request_failure):
-        with pytest.raises(CogniteAPIError):
+        with mock.patch("time.sleep"), pytest.raises(CogniteAPIError):
             COGNITE_CLIENT.assets.retrieve_subtree(id=1)
 
     def test_assets_update_object(self):
@@ -421,6 +421,58 @@ class TestGetDatapoints:
         assert 100000 == jsgz_load(mock_get_datapoints.calls[2].request.body)["limit"]
 
 
+@pytest.fixture
+def streaming_json_decode():
+    pytest.importorskip("ijson")
+    DPS_CLIENT._config.streaming_json_decode = True
+    yield
+    DPS_CLIENT._config.streaming_json_decode = False
+
+
+@pytest.mark.usefixtures("streaming_json_decode")
+class TestGetDatapointsStreamingDecode:
+    # Streamed response bodies can not be read again, so results are not compared to the mocked responses
+
+    def test_retrieve_datapoints_by_id(self, mock_get_datapoints):
+        dps_res = DPS_CLIENT.retrieve(id=123, start=1000000, end=1100000)
+        assert isinstance(dps_res, Datapoints)
+        assert 123 == dps_res.id
+        assert "123" == dps_res.external_id
+        assert list(range(1000000, 1100000, 1000)) == dps_res.timestamp
+        assert 100 == len(dps_res.value)
+        assert all(isinstance(v, float) for v in dps_res.value)
+
+    def test_retrieve_datapoints_aggregates_paging(self, mock_get_datapoints):
+        with set_request_limit(DPS_CLIENT, 20):
+            dps_res = DPS_CLIENT.retrieve(
+                id=123, start=0, end=100000, aggregates=["average", "stepInterpolation"], granularity="1s"
+            )
+        assert list(range(0, 100000, 1000)) == dps_res.timestamp
+        assert 100 == len(dps_res.average) == len(dps_res.step_interpolation)
+
+    def test_retrieve_datapoints_some_aggregates_omitted(self, mock_get_datapoints_one_ts_has_missing_aggregates):
+        dps_res_list = DPS_CLIENT.retrieve(
+            id={"id": 1, "aggregates": ["average"]},
+            external_id={"externalId": "def", "aggregates": ["interpolation"]},
+            start=0,
+            end=1,
+            granularity="1s",
+        )
+        assert [0, 1, 2, 3, 4] == dps_res_list.get(id=1).average
+        assert [None, 1, None, 3, None] == dps_res_list.get(external_id="def").interpolation
+
+    def test_retrieve_datapoints_empty_extrafields_set(self, mock_get_datapoints_empty):
+        res = DPS_CLIENT.retrieve(id=1, start=0, end=10000)
+        assert 0 == len(res)
+        assert "kPa" == res.unit
+        assert res.is_step is False
+        assert res.is_string is False
+
+    def test_retrieve_datapoints_last_beyond_end(self, mock_get_datapoints_include_outside):
+        dpt = DPS_CLIENT.retrieve(id=1, include_outside_points=True, start=1000000000, end=1000000000 + 100000)
+        assert 100001 == len(dpt)
+
+
 class TestQueryDatapoints:
     def test_query_single(self, mock_get_datapoints):
         dps_res = DPS_CLIENT.query(query=DatapointsQuery(id=1, start=0, end=10000))
@@ -1,13 +1,17 @@
 import os
 from collections import namedtuple
+from unittest import mock
 
+import numpy as np
 import pytest
 
-from cognite.client import CogniteClient
-from cognite.client._api_client import APIClient
+from cognite.client import CogniteClient, utils
+from cognite.client._api_client import APIClient, RequestBlockedError, block_requests
 from cognite.client.data_classes._base import *
 from cognite.client.exceptions import CogniteAPIError, CogniteNotFoundError
 from cognite.client.utils._client_config import ClientConfig
+from cognite.client.utils._compression import CompressionPolicy
+from cognite.client.utils._sessions import RetryWithMaxBackoff
 from tests.utils import jsgz_load, set_request_limit
 
 BASE_URL = "http://localtest.com/api/1.0/projects/test-project"
@@ -112,6 +116,12 @@ class TestBasicRequests:
         assert e.value.code == 400
         assert e.value.message == "Client error"
 
+    def test_blocked_requests_are_not_sent(self, rsps):
+        with block_requests():
+            with pytest.raises(RequestBlockedError, match="GET /someurl"):
+                API_CLIENT_WITH_API_KEY._get(URL_PATH)
+        assert 0 == len(rsps.calls)
+
     @pytest.mark.usefixtures("disable_gzip")
     def test_request_gzip_disabled(self, rsps):
         def check_gzip_disabled(request):
@@ -161,6 +171,113 @@ class TestBasicRequests:
         assert "api-key" not in headers
         assert "Bearer {}".format(API_CLIENT_WITH_TOKEN._config.token) == headers["Authorization"]
 
+    @pytest.mark.parametrize("json_codec", ["json", "orjson", "ujson"])
+    def test_json_codec(self, rsps, json_codec):
+        if json_codec != "json":
+            pytest.importorskip(json_codec)
+        client = APIClient(
+            ClientConfig(project="test-project", api_key="abc", base_url=BASE_URL, json_codec=json_codec),
+            cognite_client=COGNITE_CLIENT,
+        )
+        rsps.add(rsps.POST, BASE_URL + URL_PATH, status=200, json=RESPONSE)
+        res = client._post(URL_PATH, {"values": np.array([1.5, 2.5]), "id": np.int64(1)})
+        assert {"values": [1.5, 2.5], "id": 1} == jsgz_load(rsps.calls[-1].request.body)
+        assert RESPONSE == res.json()
+
+    def test_small_bodies_not_compressed(self, rsps):
+        client = APIClient(
+            ClientConfig(
+                project="test-project", api_key="abc", base_url=BASE_URL, compression=CompressionPolicy(min_size=100)
+            ),
+            cognite_client=COGNITE_CLIENT,
+        )
+        rsps.add(rsps.POST, BASE_URL + URL_PATH, status=200, json=RESPONSE)
+        client._post(URL_PATH, {"any": "ok"})
+        client._post(URL_PATH, {"items": [{"id": i} for i in range(100)]})
+        assert "Content-Encoding" not in rsps.calls[-2].request.headers
+        assert b'{"any": "ok"}' == rsps.calls[-2].request.body
+        assert "gzip" == rsps.calls[-1].request.headers["Content-Encoding"]
+        assert 100 == len(jsgz_load(rsps.calls[-1].request.body)["items"])
+
+    def test_response_json_not_shared(self, rsps):
+        rsps.add(rsps.GET, BASE_URL + URL_PATH, status=200, json=RESPONSE)
+        res = API_CLIENT_WITH_API_KEY._get(URL_PATH)
+        res.json()["any"] = "changed"
+        assert RESPONSE == res.json()
+
+    def test_static_headers_rebuilt_when_config_changes(self):
+        client = APIClient(
+            ClientConfig(project="test-project", api_key="abc", base_url=BASE_URL), cognite_client=COGNITE_CLIENT
+        )
+        static_headers = client._get_static_headers()
+        assert static_headers is client._get_static_headers()
+        client._config.api_key = "def"
+        assert "def" == client._configure_headers({})["api-key"]
+        client._config.token = "ghi"
+        headers = client._configure_headers({"x": "y"})
+        assert "Bearer ghi" == headers["Authorization"]
+        assert "api-key" not in headers
+        assert "x" not in client._get_static_headers()
+
+    def test_invalid_token_raises(self):
+        client = APIClient(
+            ClientConfig(project="test-project", api_key="abc", base_url=BASE_URL), cognite_client=COGNITE_CLIENT
+        )
+        client._config.token = 1
+        with pytest.raises(TypeError, match="'token' must be"):
+            client._configure_headers({})
+
+    def test_token_cache_invalidated_on_401(self, rsps):
+        tokens = iter(["a", "b"])
+        client = APIClient(
+            ClientConfig(project="test-project", base_url=BASE_URL, token=lambda: next(tokens)),
+            cognite_client=COGNITE_CLIENT,
+        )
+        client._config.token_cache.invalidate = mock.MagicMock()
+        rsps.add(rsps.GET, BASE_URL + URL_PATH, status=401, json={"error": {"message": "Unauthorized", "code": 401}})
+        with pytest.raises(CogniteAPIError):
+            client._get(URL_PATH)
+        client._config.token_cache.invalidate.assert_called_once_with()
+
+    def test_adaptive_concurrency_backs_off_on_429(self, rsps):
+        client = APIClient(
+            ClientConfig(project="adaptive-project", api_key="abc", base_url=BASE_URL, adaptive_concurrency=True),
+            cognite_client=COGNITE_CLIENT,
+        )
+        limiter = client._config.concurrency_limiter
+        rsps.add(rsps.POST, BASE_URL + URL_PATH, status=200, json=RESPONSE)
+        rsps.add(rsps.POST, BASE_URL + URL_PATH, status=429, json={"error": {"message": "Too many", "code": 429}})
+        client._post(URL_PATH, {"any": "ok"})
+        assert limiter.limit == limiter.max_limit
+        with mock.patch("time.sleep"), pytest.raises(CogniteAPIError):
+            client._post(URL_PATH, {"any": "ok"})
+        assert limiter.limit < limiter.max_limit
+        assert 0 == limiter.in_flight
+
+    def test_rate_limits_per_endpoint_family(self, rsps):
+        client = APIClient(
+            ClientConfig(project="abc", api_key="abc", base_url=BASE_URL, rate_limits={URL_PATH: 1}),
+            cognite_client=COGNITE_CLIENT,
+        )
+        bucket = client._config.rate_limiter.get_bucket(URL_PATH)
+        rsps.add(rsps.POST, BASE_URL + URL_PATH, status=200, json=RESPONSE)
+        client._post(URL_PATH, {"any": "ok"})
+        assert not bucket.try_acquire()
+        assert client._config.rate_limiter.get_bucket("/other") is None
+
+    def test_rate_limits_count_every_attempt(self, rsps):
+        client = APIClient(
+            ClientConfig(project="abc", api_key="abc", base_url=BASE_URL, rate_limits={URL_PATH: 100}),
+            cognite_client=COGNITE_CLIENT,
+        )
+        rsps.add(rsps.GET, BASE_URL + URL_PATH, status=503, json={"error": {"message": "Unavailable", "code": 503}})
+        rsps.add(rsps.GET, BASE_URL + URL_PATH, status=200, json=RESPONSE)
+        with mock.patch("time.sleep"), mock.patch.object(
+            client._config.rate_limiter, "acquire", wraps=client._config.rate_limiter.acquire
+        ) as acquire:
+            client._get(URL_PATH)
+        assert [mock.call(URL_PATH), mock.call(URL_PATH)] == acquire.call_args_list
+
 
 class SomeUpdate(CogniteUpdate):
     @property
@@ -322,20 +439,30 @@ class TestStandardRetrieveMultiple:
             rsps.POST,
             BASE_URL + URL_PATH + "/byids",
             status=400,
-            json={"error": {"message": "Not Found", "missing": [{"id": 1}]}},
+            json={"error": {"message": "Not Found", "missing": [{"id": 1}, {"id": 2}]}},
         )
+        with pytest.raises(CogniteNotFoundError) as e:
+            API_CLIENT_WITH_API_KEY._retrieve_multiple(
+                cls=SomeResourceList, resource_path=URL_PATH, wrap_ids=True, ids=[1, 2]
+            )
+        assert [{"id": 1}, {"id": 2}] == e.value.not_found
+
+    def test_not_found_cancels_remaining_chunks(self, rsps):
+        rsps.assert_all_requests_are_fired = False
         rsps.add(
             rsps.POST,
             BASE_URL + URL_PATH + "/byids",
             status=400,
-            json={"error": {"message": "Not Found", "missing": [{"id": 2}]}},
+            json={"error": {"message": "Not Found", "missing": [{"id": 1}]}},
         )
+        rsps.add(rsps.POST, BASE_URL + URL_PATH + "/byids", status=200, json={"items": [{"x": 1, "id": 2}]})
         with set_request_limit(API_CLIENT_WITH_API_KEY, 1):
             with pytest.raises(CogniteNotFoundError) as e:
                 API_CLIENT_WITH_API_KEY._retrieve_multiple(
-                    cls=SomeResourceList, resource_path=URL_PATH, wrap_ids=True, ids=[1, 2]
+                    cls=SomeResourceList, resource_path=URL_PATH, wrap_ids=True, ids=[1, 2, 3]
                 )
-        assert [{"id": 1}, {"id": 2}] == e.value.not_found
+        assert [{"id": 1}] == e.value.not_found
+        assert 1 == len(rsps.calls)
 
     def test_cognite_client_is_set(self, mock_by_ids):
         assert (
@@ -504,6 +631,26 @@ class TestStandardList:
                 raise AssertionError("resource chunk length was not 1000 or 500")
         assert 11500 == total_resources
 
+    @pytest.fixture
+    def streaming_json_decode(self):
+        pytest.importorskip("ijson")
+        API_CLIENT_WITH_API_KEY._config.streaming_json_decode = True
+        yield
+        API_CLIENT_WITH_API_KEY._config.streaming_json_decode = False
+
+    @pytest.mark.usefixtures("streaming_json_decode", "mock_get_for_autopaging_2589")
+    @pytest.mark.parametrize(
+        "chunk_size, limit, expected_chunks", [(2500, None, [2500, 89]), (1000, 2563, [1000] * 2 + [563])]
+    )
+    def test_standard_list_generator_streaming_json_decode(self, chunk_size, limit, expected_chunks):
+        chunks = list(
+            API_CLIENT_WITH_API_KEY._list_generator(
+                cls=SomeResourceList, resource_path=URL_PATH, method="GET", chunk_size=chunk_size, limit=limit
+            )
+        )
+        assert expected_chunks == [len(chunk) for chunk in chunks]
+        assert all(isinstance(resource, SomeResource) for chunk in chunks for resource in chunk)
+
     @pytest.mark.usefixtures("mock_get_for_autopaging_2589")
     def test_standard_list_generator_with_chunk_size_chunk_edge_case(self):
         total_resources = 0
@@ -1011,8 +1158,44 @@ class TestHelpers:
 
 
 class TestConnectionPooling:
-    def test_connection_pool_is_shared_between_clients(self):
+    def test_clients_own_their_connection_pools(self):
         c1 = CogniteClient()
         c2 = CogniteClient()
-        assert c1._api_client._request_session == c2._api_client._request_session
-        assert c1._api_client._request_session_with_retry == c2._api_client._request_session_with_retry
+        assert c1._api_client._request_session is not c2._api_client._request_session
+        assert c1._api_client._api_session is not c2._api_client._api_session
+        assert c1.assets._api_session is c1._api_client._api_session
+
+    def test_pool_size_and_ssl_follow_client_config(self):
+        c = CogniteClient(max_workers=80, disable_ssl=True)
+        assert 80 == c.config.max_connection_pool_size
+        adapter = c._api_client._api_session.get_adapter(BASE_URL)
+        assert 80 == adapter._pool_maxsize
+        assert c._api_client._api_session.verify is False
+        assert 20 == CogniteClient(max_connection_pool_size=20).config.max_connection_pool_size
+
+    def test_external_session_retries_follow_client_config(self):
+        c = CogniteClient(max_retries=3)
+        assert 3 == c._api_client._request_session.get_adapter(BASE_URL).max_retries.total
+        assert 3 == c.config.retry_policy.max_retries
+
+    def test_sessions_reset_after_fork(self):
+        c = CogniteClient()
+        session = c._api_client._api_session
+        utils._sessions._reset_pools_after_fork()
+        assert c._api_client._api_session is not session
+
+    def test_warm_up_opens_connections(self):
+        c = CogniteClient(base_url="http://localtest.com", max_workers=3)
+        with mock.patch("urllib3.connection.HTTPConnection.connect") as connect:
+            assert 3 == c.warm_up()
+        assert 3 == connect.call_count
+        pool = c.config.sessions._get_connection_pool("http://localtest.com")
+        assert 3 == len([conn for conn in pool.pool.queue if conn is not None])
+
+
+class TestRetryWithMaxBackoff:
+    def test_max_backoff_is_carried_over_to_new_attempts(self):
+        retry = RetryWithMaxBackoff(max_backoff=0.5, total=10, backoff_factor=10)
+        for _ in range(3):
+            retry = retry.increment(method="GET", url="/assets", error=ConnectionError())
+        assert 0.5 == retry.get_backoff_time()
@@ -0,0 +1,171 @@
+import asyncio
+import re
+import threading
+from unittest import mock
+
+import pytest
+import requests
+
+from cognite.client import AsyncCogniteClient
+from cognite.client.data_classes import Asset, AssetList, LoginStatus, Row
+from cognite.client.exceptions import CogniteAPIError
+from tests.utils import jsgz_load
+
+httpx = pytest.importorskip("httpx")
+
+
+def send_with_requests(request):
+    # Sends the requests of the async client with requests, so that the rsps fixture mocks them
+    res = requests.request(request.method, str(request.url), headers=dict(request.headers), data=request.content)
+    return httpx.Response(res.status_code, headers={"Content-Type": "application/json"}, content=res.content)
+
+
+def create_client(**kwargs):
+    client = AsyncCogniteClient(max_workers=2, **kwargs)
+    client._http_client._transport = httpx.MockTransport(send_with_requests)
+    return client
+
+
+CLIENT = create_client()
+BASE_URL = CLIENT.assets._api._get_base_url_with_base_path()
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestAsyncCogniteClient:
+    def test_apis_mirror_sync_client(self):
+        for name in ["assets", "datapoints", "events", "files", "raw", "sequences", "time_series", "three_d"]:
+            assert hasattr(CLIENT, name)
+        assert asyncio.iscoroutinefunction(CLIENT.assets.retrieve)
+        assert asyncio.iscoroutinefunction(CLIENT.raw.rows.list)
+        assert asyncio.iscoroutinefunction(CLIENT.three_d.models.list)
+
+    def test_retrieve_returns_same_data_classes(self, rsps):
+        rsps.add(rsps.POST, BASE_URL + "/assets/byids", status=200, json={"items": [{"id": 1, "name": "a"}]})
+        res = run(CLIENT.assets.retrieve(id=1))
+        assert isinstance(res, Asset)
+        assert res.id == 1
+        assert res._cognite_client is CLIENT.sync_client
+
+    def test_nested_api(self, rsps):
+        rsps.add(rsps.GET, BASE_URL + "/raw/dbs/db1/tables/t1/rows", status=200, json={"items": [{"key": "k"}]})
+        res = run(CLIENT.raw.rows.list("db1", "t1", limit=1))
+        assert isinstance(res[0], Row)
+
+    def test_requests_are_sent_from_the_event_loop(self, rsps):
+        thread_ids = set()
+
+        def callback(request):
+            thread_ids.add(threading.get_ident())
+            return 200, {}, '{"items": [{"id": 1}]}'
+
+        rsps.add_callback(rsps.POST, re.compile(BASE_URL + "/assets/list"), callback=callback)
+
+        async def many():
+            return await asyncio.gather(*[CLIENT.assets.list(limit=1) for _ in range(50)])
+
+        res = run(many())
+        assert 50 == len(res)
+        assert all(isinstance(r, AssetList) for r in res)
+        assert {threading.get_ident()} == thread_ids
+
+    def test_requests_in_flight_are_not_bounded_by_max_workers(self):
+        in_flight = []
+
+        async def handler(request):
+            in_flight.append(request)
+            while len(in_flight) < 20:
+                await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"items": [{"id": 1}]})
+
+        client = AsyncCogniteClient(max_workers=2)
+        client._http_client._transport = httpx.MockTransport(handler)
+
+        async def many():
+            calls = asyncio.gather(*[client.assets.retrieve(id=i) for i in range(20)])
+            return await asyncio.wait_for(calls, timeout=5)
+
+        assert 20 == len(run(many()))
+
+    def test_methods_returning_nothing(self, rsps):
+        rsps.add(rsps.POST, BASE_URL + "/assets/delete", status=200, json={})
+        assert run(CLIENT.assets.delete(id=[1, 2])) is None
+        assert [{"id": 1}, {"id": 2}] == jsgz_load(rsps.calls[0].request.body)["items"]
+
+    def test_methods_using_the_response_run_on_executor(self, rsps):
+        thread_ids = set()
+
+        def callback(request):
+            thread_ids.add(threading.get_ident())
+            return 200, {}, '{"data": {"user": "u", "loggedIn": true, "project": "p", "projectId": 1}}'
+
+        rsps.add_callback(rsps.GET, CLIENT.config.base_url + "/login/status", callback=callback)
+        res = run(CLIENT.login.status())
+        assert isinstance(res, LoginStatus)
+        assert threading.get_ident() not in thread_ids
+
+    def test_blocking_client_features_run_on_executor(self, rsps):
+        thread_ids = set()
+
+        def callback(request):
+            thread_ids.add(threading.get_ident())
+            return 200, {}, '{"items": [{"id": 1}]}'
+
+        rsps.add_callback(rsps.POST, BASE_URL + "/assets/byids", callback=callback)
+        client = create_client(resource_cache=True)
+        assert 1 == run(client.assets.retrieve(id=1)).id
+        assert threading.get_ident() not in thread_ids
+
+    def test_invalid_arguments_raise(self):
+        with pytest.raises(AssertionError, match="Exactly one of id and external id"):
+            run(CLIENT.assets.retrieve())
+
+    def test_errors_propagate(self, rsps):
+        rsps.add(rsps.POST, BASE_URL + "/assets/byids", status=400, json={"error": {"message": "bad", "code": 400}})
+        with pytest.raises(CogniteAPIError, match="bad"):
+            run(CLIENT.assets.retrieve(id=1))
+
+    def test_retries(self, rsps):
+        url = CLIENT.config.base_url + "/login/status"
+        rsps.add(rsps.GET, url, status=429, headers={"Retry-After": "0"}, json={})
+        rsps.add(rsps.GET, url, status=200, json={"any": "ok"})
+        res = run(CLIENT.get("/login/status"))
+        assert {"any": "ok"} == res.json()
+        assert 2 == len(rsps.calls)
+
+    def test_rate_limits_count_every_attempt(self, rsps):
+        url = CLIENT.config.base_url + "/login/status"
+        rsps.add(rsps.GET, url, status=429, headers={"Retry-After": "0"}, json={})
+        rsps.add(rsps.GET, url, status=200, json={"any": "ok"})
+        client = create_client(rate_limits={"*": 100})
+        limiter = client.config.rate_limiter
+        with mock.patch.object(limiter, "acquire_async", wraps=limiter.acquire_async) as acquire_async:
+            run(client.get("/login/status"))
+        assert [mock.call("/login/status"), mock.call("/login/status")] == acquire_async.call_args_list
+
+    def test_arbitrary_requests(self, rsps):
+        rsps.add(rsps.GET, CLIENT.config.base_url + "/login/status", status=200, json={"any": "ok"})
+        res = run(CLIENT.get("/login/status"))
+        assert {"any": "ok"} == res.json()
+
+    def test_private_attributes_not_exposed(self):
+        with pytest.raises(AttributeError):
+            CLIENT.assets._post
+
+    def test_close_leaves_sync_client_open(self, rsps):
+        rsps.add(rsps.POST, BASE_URL + "/assets/byids", status=200, json={"items": [{"id": 1}]})
+
+        async def use():
+            async with create_client() as c:
+                await c.assets.retrieve(id=1)
+                return c
+
+        c = run(use())
+        assert c._http_client._client is None
+        assert 1 == c.sync_client.assets.retrieve(id=1).id
@@ -1,9 +1,23 @@
+import copy
+import pickle
 from decimal import Decimal
 from unittest import mock
 
 import pytest
 
 from cognite.client import CogniteClient
+from cognite.client.data_classes import (
+    Asset,
+    Datapoint,
+    Event,
+    EventFilter,
+    FileMetadata,
+    Label,
+    Row,
+    Table,
+    TimeSeries,
+    TimeSeriesFilter,
+)
 from cognite.client.data_classes._base import *
 from cognite.client.exceptions import CogniteMissingClientError
 
@@ -20,6 +34,16 @@ class MyResource(CogniteResource):
         return self._cognite_client
 
 
+class MySlottedResource(CogniteResource):
+    __slots__ = ("var_a", "var_b", "_private")
+
+    def __init__(self, var_a=None, var_b=None, cognite_client=None):
+        self.var_a = var_a
+        self.var_b = var_b
+        self._private = 1
+        self._cognite_client = cognite_client
+
+
 class MyUpdate(CogniteUpdate):
     @property
     def string(self):
@@ -173,6 +197,62 @@ class TestCogniteResource:
             mr.use()
 
 
+class TestSlottedCogniteResource:
+    def test_no_dict(self):
+        assert not hasattr(MySlottedResource(1), "__dict__")
+
+    def test_dump(self):
+        assert {"var_a": 1} == MySlottedResource(1).dump()
+        assert {"varA": 1, "varB": 2} == MySlottedResource(1, 2).dump(camel_case=True)
+
+    def test_dump_without_attributes(self):
+        assert {} == CogniteResource().dump()
+        assert {} == CogniteResource().dump(camel_case=True)
+        assert {} == CogniteResponse().dump()
+        assert {} == CogniteResponse().dump(camel_case=True)
+
+    def test_load(self):
+        assert {"var_a": 1, "var_b": 2} == MySlottedResource._load({"varA": 1, "varB": 2, "varC": 3}).dump()
+        assert {"var_a": 1} == MySlottedResource._load({"varA": 1, "dump": 2, "private": 3}).dump()
+
+    def test_eq(self):
+        assert MySlottedResource(1, "s") == MySlottedResource(1, "s", cognite_client=mock.MagicMock())
+        assert MySlottedResource(1, "s") != MySlottedResource(1)
+
+    def test_str(self):
+        assert json.dumps({"var_a": 1, "var_b": {"var_a": 2}}, indent=4) == str(
+            MySlottedResource(1, MySlottedResource(2))
+        )
+
+    def test_subclass_without_slots(self):
+        class Subclass(MySlottedResource):
+            def __init__(self, var_a=None, var_c=None, cognite_client=None):
+                super().__init__(var_a, cognite_client=cognite_client)
+                self.var_c = var_c
+
+        assert {"var_a": 1, "var_c": 3} == Subclass(1, 3).dump()
+        assert {"var_a": 1, "var_c": 3} == Subclass._load({"varA": 1, "varC": 3}).dump()
+
+    def test_copy_and_pickle(self):
+        c = CogniteClient()
+        res = MySlottedResource(1, [2], cognite_client=c)
+        assert res == copy.copy(res)
+        assert copy.copy(res)._cognite_client is c
+        assert res == pickle.loads(pickle.dumps(MySlottedResource(1, [2])))
+
+    def test_client(self):
+        c = CogniteClient()
+        with pytest.raises(CogniteMissingClientError):
+            MySlottedResource(1)._cognite_client
+        assert MySlottedResource(1, cognite_client=c)._cognite_client is c
+
+    @pytest.mark.parametrize(
+        "cls", [Asset, Datapoint, Event, EventFilter, FileMetadata, Label, Row, Table, TimeSeries, TimeSeriesFilter]
+    )
+    def test_data_classes_are_slotted(self, cls):
+        assert not hasattr(cls(), "__dict__")
+
+
 class TestCogniteResourceList:
     def test_dump(self):
         assert [{"var_a": 1, "var_b": 2}, {"var_a": 2, "var_b": 3}] == MyResourceList(
@@ -10,7 +10,7 @@ from unittest.mock import patch
 
 import pytest
 
-from cognite.client import CogniteClient, utils
+from cognite.client import CogniteClient, _cognite_client, utils
 from cognite.client._api.assets import AssetList
 from cognite.client._api.files import FileMetadataList
 from cognite.client._api.time_series import TimeSeriesList
@@ -66,6 +66,13 @@ def environment_client_config():
         del os.environ["COGNITE_PROJECT"]
 
 
+@pytest.fixture(autouse=True)
+def clear_inferred_projects():
+    _cognite_client._INFERRED_PROJECTS.clear()
+    yield
+    _cognite_client._INFERRED_PROJECTS.clear()
+
+
 class TestCogniteClient:
     def test_project_is_correct(self, rsps_with_login_mock):
         with unset_env_var("COGNITE_PROJECT"):
@@ -93,7 +100,6 @@ class TestCogniteClient:
         assert c.config.project == "test"
 
     def test_invalid_api_key(self, rsps):
-        rsps.add(rsps.GET, _PYPI_ADDRESS, status=200, body="")
         rsps.add(
             rsps.GET,
             BASE_URL + "/login/status",
@@ -101,8 +107,40 @@ class TestCogniteClient:
             json={"data": {"project": "", "loggedIn": False, "user": "", "projectId": -1}},
         )
         with unset_env_var("COGNITE_PROJECT"):
-            with pytest.raises(CogniteAPIKeyError):
-                CogniteClient()
+            c = CogniteClient()
+        with pytest.raises(CogniteAPIKeyError):
+            c.config.project
+
+    def test_no_requests_sent_on_creation(self, rsps):
+        with unset_env_var("COGNITE_PROJECT"):
+            CogniteClient()
+        assert len(rsps.calls) == 0
+
+    def test_inferred_project_is_cached(self, rsps_with_login_mock):
+        with unset_env_var("COGNITE_PROJECT"):
+            assert CogniteClient().config.project == "test"
+            assert CogniteClient().config.project == "test"
+        assert len(rsps_with_login_mock.calls) == 1
+
+    def test_apis_created_on_first_access(self):
+        c = CogniteClient()
+        assert "assets" not in vars(c)
+        assets = c.assets
+        assert vars(c)["assets"] is assets is c.assets
+        assert c.datapoints.synthetic is c.datapoints.synthetic
+
+    def test_apis_do_not_depend_on_set_name(self):
+        # Python 3.5 does not call __set_name__, as setattr on a class does not either
+        class Client:
+            pass
+
+        Client.assets = _cognite_client._api("assets", "AssetsAPI")
+        Client.events = _cognite_client._api("events", "EventsAPI")
+        c = Client()
+        c._config = CogniteClient().config
+        c._API_VERSION = CogniteClient._API_VERSION
+        assert type(c.assets).__name__ == "AssetsAPI"
+        assert type(c.events).__name__ == "EventsAPI"
 
     def test_no_client_name(self):
         with unset_env_var("COGNITE_CLIENT_NAME"):
@@ -173,52 +211,59 @@ class TestCogniteClient:
         with ThreadPool() as pool:
             pool.map(self.create_client_and_check_config, list(range(16)))
 
-    def test_client_debug_mode(self, rsps_with_login_mock):
-        with unset_env_var("COGNITE_PROJECT"):
-            CogniteClient(debug=True)
+    def test_client_debug_mode(self):
+        CogniteClient(debug=True)
         log = logging.getLogger("cognite-sdk")
         assert isinstance(log.handlers[0].formatter, DebugLogFormatter)
         log.handlers = []
         log.propagate = False
 
-    def test_version_check_disabled_env(self, rsps_with_login_mock):
-        rsps_with_login_mock.assert_all_requests_are_fired = False
-        with unset_env_var("COGNITE_PROJECT"):
-            with set_env_var("COGNITE_DISABLE_PYPI_VERSION_CHECK", "1"):
-                CogniteClient()
-        assert len(rsps_with_login_mock.calls) == 1
-        assert rsps_with_login_mock.calls[0].request.url.startswith("https://greenfield.cognitedata.com")
+    @patch("cognite.client.utils._auxiliary._check_client_has_newest_major_version_in_background")
+    def test_version_check_disabled_env(self, mock_check):
+        with set_env_var("COGNITE_DISABLE_PYPI_VERSION_CHECK", "1"):
+            CogniteClient()
+        mock_check.assert_not_called()
 
-    def test_version_check_disabled_arg(self, rsps_with_login_mock):
-        rsps_with_login_mock.assert_all_requests_are_fired = False
-        with unset_env_var("COGNITE_PROJECT"):
-            with unset_env_var("COGNITE_DISABLE_PYPI_VERSION_CHECK"):
-                CogniteClient(disable_pypi_version_check=True)
-        assert len(rsps_with_login_mock.calls) == 1
-        assert rsps_with_login_mock.calls[0].request.url.startswith("https://greenfield.cognitedata.com")
+    @patch("cognite.client.utils._auxiliary._check_client_has_newest_major_version_in_background")
+    def test_version_check_disabled_arg(self, mock_check):
+        with unset_env_var("COGNITE_DISABLE_PYPI_VERSION_CHECK"):
+            CogniteClient(disable_pypi_version_check=True)
+        mock_check.assert_not_called()
 
-    def test_version_check_enabled(self, rsps_with_login_mock):
-        with unset_env_var("COGNITE_PROJECT"):
+    @patch("cognite.client.utils._auxiliary._check_client_has_newest_major_version_in_background")
+    def test_version_check_enabled(self, mock_check):
+        with unset_env_var("COGNITE_DISABLE_PYPI_VERSION_CHECK"):
             CogniteClient()
-        assert len(rsps_with_login_mock.calls) == 2
+        mock_check.assert_called_once_with()
 
     @patch("cognite.client.utils._version_checker.re.findall")
     @patch("cognite.client.utils._version_checker.requests")
     def test_verify_ssl_enabled_by_default(self, mock_requests, mock_findall):
-
         c = CogniteClient()
+        utils._version_checker.get_all_versions("cognite-sdk")
 
         mock_requests.get.assert_called_with(_PYPI_ADDRESS, verify=True)
         assert c._api_client._request_session.verify is True
-        assert c._api_client._request_session_with_retry.verify is True
+        assert c._api_client._api_session.verify is True
 
     @patch("cognite.client.utils._version_checker.re.findall")
     @patch("cognite.client.utils._version_checker.requests")
     def test_verify_ssl_disabled(self, mock_requests, mock_findall):
         with set_env_var("COGNITE_DISABLE_SSL", "1"):
-            CogniteClient()
+            utils._version_checker.get_all_versions("cognite-sdk")
             mock_requests.get.assert_called_with(_PYPI_ADDRESS, verify=False)
 
+    @patch("cognite.client.utils._version_checker.get_newest_version_in_major_release", return_value="1.0.1")
+    def test_newest_version_cached_on_disk(self, mock_get_newest, tmpdir):
+        cache_path = str(tmpdir.join("cache", "version.json"))
+        check = utils._version_checker.get_cached_newest_version_in_major_release
+        assert "1.0.1" == check("cognite-sdk", "1.0.0", cache_path=cache_path)
+        assert "1.0.1" == check("cognite-sdk", "1.0.0", cache_path=cache_path)
+        assert mock_get_newest.call_count == 1
+        check("cognite-sdk", "1.0.1", cache_path=cache_path)
+        check("cognite-sdk", "1.0.1", cache_path=cache_path, ttl=0)
+        assert mock_get_newest.call_count == 3
+
 
 class TestInstantiateWithClient:
     @pytest.mark.parametrize("cls", [Asset, Event, FileMetadata, TimeSeries])
@@ -5,6 +5,7 @@ import pytest
 
 from cognite.client.data_classes import Asset, AssetList, Event, EventList, FileMetadata, FileMetadataList
 from cognite.client.experimental import CogniteClient
+from cognite.client.utils._concurrency import TaskExecutor
 
 c = CogniteClient()
 
@@ -104,7 +105,7 @@ class TestAssetList:
         mock_cognite_client = mock.MagicMock()
         mock_method = getattr(mock_cognite_client, method)
         mock_method.list.side_effect = [resources_a1, resources_a2, resources_a3]
-        mock_method._config = mock.Mock(max_workers=3)
+        mock_method._config = mock.Mock(max_workers=3, executor=TaskExecutor(3))
 
         assets = AssetList([Asset(id=1), Asset(id=2), Asset(id=3)], cognite_client=mock_cognite_client)
         assets._retrieve_chunk_size = 1
@@ -0,0 +1,58 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import cognite.client
+from cognite.client import data_classes, utils
+
+
+def imported_modules(statement: str):
+    code = "import json, sys\n{}\nprint(json.dumps(sorted(sys.modules)))".format(statement)
+    out = subprocess.run([sys.executable, "-c", code], check=True, stdout=subprocess.PIPE).stdout
+    return set(json.loads(out.decode().splitlines()[-1]))
+
+
+class TestLazyImports:
+    def test_import_package_imports_nothing_else(self):
+        modules = imported_modules("import cognite.client")
+        assert "requests" not in modules
+        assert not [m for m in modules if m.startswith("cognite.client.") and m != "cognite.client.utils"]
+
+    def test_import_client_imports_no_apis_or_data_classes(self):
+        modules = imported_modules("from cognite.client import CogniteClient")
+        assert not [m for m in modules if m.startswith("cognite.client._api.")]
+        data_class_modules = [m for m in modules if m.startswith("cognite.client.data_classes.")]
+        assert ["cognite.client.data_classes._base"] == data_class_modules
+
+    def test_import_client_imports_no_optional_features(self):
+        modules = imported_modules("from cognite.client import CogniteClient")
+        for name in ["_cache", "_circuit_breaker", "_coalescing", "_compression", "_disk_cache", "_hooks", "_retry"]:
+            assert "cognite.client.utils." + name not in modules
+        assert "sqlite3" not in modules
+
+    def test_api_module_imported_on_first_access(self):
+        modules = imported_modules(
+            "from cognite.client import CogniteClient\n"
+            "CogniteClient(api_key='key', project='p', client_name='c', disable_pypi_version_check=True).events"
+        )
+        assert "cognite.client._api.events" in modules
+        assert "cognite.client._api.assets" not in modules
+
+    def test_eager_imports_before_python_3_7(self):
+        modules = imported_modules("sys.version_info = (3, 6, 15)\nfrom cognite.client.data_classes import Asset")
+        assert {
+            "cognite.client._cognite_client",
+            "cognite.client._async_cognite_client",
+            "cognite.client.data_classes.events",
+            "cognite.client.utils._coalescing",
+        } <= modules
+
+    @pytest.mark.parametrize("module", [cognite.client, data_classes, utils])
+    def test_lazy_attributes_resolve(self, module):
+        for name in dir(module):
+            if not name.startswith("__"):
+                assert getattr(module, name) is not None
+        with pytest.raises(AttributeError):
+            module.does_not_exist
@@ -0,0 +1,106 @@
+import base64
+import json
+import threading
+import time
+
+from cognite.client.utils._auth import TokenCache, get_jwt_expiry
+
+
+def make_jwt(expires_at):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": expires_at}).encode()).decode().rstrip("=")
+    return "header.{}.signature".format(payload)
+
+
+class CountingFactory:
+    def __init__(self, *tokens):
+        self.tokens = list(tokens)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.tokens[min(self.calls, len(self.tokens)) - 1]
+
+
+class TestGetJwtExpiry:
+    def test_reads_exp_claim(self):
+        assert 1234567890 == get_jwt_expiry(make_jwt(1234567890))
+
+    def test_opaque_token(self):
+        assert get_jwt_expiry("abc") is None
+        assert get_jwt_expiry("a.b.c") is None
+        assert get_jwt_expiry(None) is None
+
+
+class TestTokenCache:
+    def test_caches_until_refresh_margin(self):
+        factory = CountingFactory(make_jwt(time.time() + 3600))
+        cache = TokenCache(factory)
+        assert cache.get() == cache.get() == factory.tokens[0]
+        assert 1 == factory.calls
+
+    def test_refreshes_expiring_token(self):
+        factory = CountingFactory(make_jwt(time.time() + 10), make_jwt(time.time() + 3600))
+        cache = TokenCache(factory, refresh_margin=30)
+        assert factory.tokens[0] == cache.get()
+        assert factory.tokens[1] == cache.get()
+        assert factory.tokens[1] == cache.get()
+        assert 2 == factory.calls
+
+    def test_does_not_cache_opaque_tokens(self):
+        factory = CountingFactory("abc")
+        cache = TokenCache(factory)
+        cache.get()
+        cache.get()
+        assert 2 == factory.calls
+
+    def test_invalidate(self):
+        factory = CountingFactory(make_jwt(time.time() + 3600))
+        cache = TokenCache(factory)
+        cache.get()
+        cache.invalidate()
+        cache.get()
+        assert 2 == factory.calls
+
+    def test_get_while_invalidated(self):
+        cache = TokenCache(CountingFactory(make_jwt(time.time() + 3600)))
+        errors = []
+        done = threading.Event()
+
+        def get():
+            while not done.is_set():
+                try:
+                    assert cache.get() is not None
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=get) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for _ in range(10000):
+            cache.invalidate()
+        done.set()
+        for thread in threads:
+            thread.join()
+        assert [] == errors
+
+    def test_background_refresh_returns_current_token(self):
+        refreshed = threading.Event()
+        old, new = make_jwt(time.time() + 10), make_jwt(time.time() + 3600)
+        tokens = iter([old, new])
+
+        def factory():
+            try:
+                return next(tokens)
+            finally:
+                refreshed.set()
+
+        cache = TokenCache(factory, refresh_margin=30, background_refresh=True)
+        assert old == cache.get()
+        refreshed.clear()
+        assert old == cache.get()
+        assert refreshed.wait(1)
+        for _ in range(100):
+            if cache.get() == new:
+                break
+            time.sleep(0.01)
+        assert new == cache.get()
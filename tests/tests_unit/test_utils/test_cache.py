@@ -0,0 +1,137 @@
+import json
+import time
+
+import pytest
+
+from cognite.client import CogniteClient
+from cognite.client.data_classes import FileMetadata
+from cognite.client.utils._cache import ResourceCache
+from tests.utils import jsgz_load
+
+BASE_URL = "http://localtest.com/api/v1/projects/test-project"
+
+
+class TestResourceCache:
+    def test_get_by_id_or_external_id(self):
+        cache = ResourceCache()
+        cache.put("/assets", [{"id": 1, "externalId": "a", "name": "one"}, {"id": 2}])
+        found = cache.get("/assets", [{"externalId": "a"}, {"id": 3}, {"id": 2}])
+        assert {0: {"id": 1, "externalId": "a", "name": "one"}, 2: {"id": 2}} == found
+        assert {} == cache.get("/events", [{"id": 1}])
+        assert {"size": 2, "hits": 2, "misses": 2, "evictions": 0} == cache.stats()
+
+    def test_returns_copies(self):
+        cache = ResourceCache()
+        cache.put("/assets", [{"id": 1, "metadata": {"a": "b"}}])
+        cache.get("/assets", [{"id": 1}])[0]["metadata"]["a"] = "c"
+        assert "b" == cache.get("/assets", [{"id": 1}])[0]["metadata"]["a"]
+
+    def test_expires(self):
+        cache = ResourceCache(ttl=0.01)
+        cache.put("/assets", [{"id": 1}])
+        time.sleep(0.02)
+        assert {} == cache.get("/assets", [{"id": 1}])
+        assert 0 == cache.stats()["size"]
+
+    def test_evicts_least_recently_used(self):
+        cache = ResourceCache(max_size=2)
+        cache.put("/assets", [{"id": 1, "externalId": "a"}, {"id": 2}])
+        cache.get("/assets", [{"id": 1}])
+        cache.put("/assets", [{"id": 3}])
+        assert [0, 2] == sorted(cache.get("/assets", [{"externalId": "a"}, {"id": 2}, {"id": 3}]))
+        assert {"size": 2, "evictions": 1} == {k: v for k, v in cache.stats().items() if k in ("size", "evictions")}
+
+    def test_invalidate(self):
+        cache = ResourceCache()
+        cache.put("/assets", [{"id": 1, "externalId": "a"}, {"id": 2}])
+        cache.put("/events", [{"id": 1}])
+        cache.invalidate("/assets", [{"externalId": "a"}])
+        assert [1] == list(cache.get("/assets", [{"id": 1}, {"id": 2}]))
+        cache.clear("/assets")
+        assert {} == cache.get("/assets", [{"id": 2}])
+        assert 1 == cache.stats()["size"]
+
+
+class TestCachedRetrieve:
+    @pytest.fixture
+    def client(self):
+        return CogniteClient(
+            api_key="abc",
+            project="test-project",
+            client_name="test",
+            base_url="http://localtest.com",
+            resource_cache=True,
+            disable_pypi_version_check=True,
+        )
+
+    @pytest.fixture
+    def mock_byids(self, rsps):
+        def callback(request):
+            items = jsgz_load(request.body)["items"]
+            return 200, {}, json.dumps({"items": [dict(item, name="ts", id=item.get("id", 10)) for item in items]})
+
+        rsps.add_callback(rsps.POST, BASE_URL + "/timeseries/byids", callback=callback)
+        return rsps
+
+    def test_only_misses_are_retrieved(self, client, mock_byids):
+        client.time_series.retrieve_multiple(ids=[1, 2])
+        res = client.time_series.retrieve_multiple(ids=[2, 3, 1])
+        assert [2, 3, 1] == [ts.id for ts in res]
+        assert [{"id": 3}] == jsgz_load(mock_byids.calls[1].request.body)["items"]
+        assert 3 == client.time_series.retrieve(id=3).id
+        assert 2 == len(mock_byids.calls)
+        assert {"size": 3, "hits": 3, "misses": 3, "evictions": 0} == client.config.resource_cache.stats()
+
+    def test_cached_by_external_id(self, client, mock_byids):
+        client.time_series.retrieve(external_id="a")
+        assert 10 == client.time_series.retrieve(id=10).id
+        assert 1 == len(mock_byids.calls)
+
+    def test_invalidated_by_update_and_delete(self, client, mock_byids):
+        mock_byids.add(mock_byids.POST, BASE_URL + "/timeseries/update", status=200, json={"items": [{"id": 1}]})
+        mock_byids.add(mock_byids.POST, BASE_URL + "/timeseries/delete", status=200, json={})
+        client.time_series.retrieve_multiple(ids=[1, 2])
+        client.time_series.update(client.time_series._LIST_CLASS._UPDATE(id=1).name.set("new"))
+        client.time_series.delete(id=2)
+        client.time_series.retrieve_multiple(ids=[1, 2])
+        assert [{"id": 1}, {"id": 2}] == jsgz_load(mock_byids.calls[-1].request.body)["items"]
+
+    def test_invalidated_after_update(self, client, mock_byids):
+        def update(request):
+            # The resource is retrieved, and cached, while it is being updated
+            client.time_series.retrieve(id=1)
+            return 200, {}, json.dumps({"items": [{"id": 1}]})
+
+        mock_byids.add_callback(mock_byids.POST, BASE_URL + "/timeseries/update", callback=update)
+        client.time_series.update(client.time_series._LIST_CLASS._UPDATE(id=1).name.set("new"))
+        client.time_series.retrieve(id=1)
+        assert 2 == len([call for call in mock_byids.calls if call.request.url.endswith("/byids")])
+
+    def test_files_invalidated_by_overwrite_and_upload(self, client, rsps):
+        def byids(request):
+            items = jsgz_load(request.body)["items"]
+            return 200, {}, json.dumps({"items": [dict(item, name="f", id=1, externalId="a") for item in items]})
+
+        rsps.add_callback(rsps.POST, BASE_URL + "/files/byids", callback=byids)
+        created = {"id": 1, "externalId": "a", "name": "f", "uploadUrl": "http://upload.com/1"}
+        rsps.add(rsps.POST, BASE_URL + "/files", status=200, json=created)
+        rsps.add(rsps.PUT, "http://upload.com/1", status=200)
+
+        client.files.retrieve(id=1)
+        client.files.create(FileMetadata(external_id="a", name="f"), overwrite=True)
+        client.files.retrieve(id=1)
+        client.files.upload_bytes(b"content", external_id="a", name="f", overwrite=True)
+        client.files.retrieve(external_id="a")
+        assert 3 == len([call for call in rsps.calls if call.request.url.endswith("/byids")])
+
+    def test_not_cached_when_disabled(self, mock_byids):
+        client = CogniteClient(
+            api_key="abc",
+            project="test-project",
+            client_name="test",
+            base_url="http://localtest.com",
+            disable_pypi_version_check=True,
+        )
+        client.time_series.retrieve(id=1)
+        client.time_series.retrieve(id=1)
+        assert 2 == len(mock_byids.calls)
@@ -0,0 +1,125 @@
+import pickle
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from cognite.client._api_client import APIClient
+from cognite.client.exceptions import CogniteAPIError, CogniteCircuitOpenError
+from cognite.client.utils._circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, get_endpoint_family
+from cognite.client.utils._client_config import ClientConfig
+from cognite.client.utils._concurrency import execute_tasks_concurrently
+
+BASE_URL = "http://localtest.com/api/v1/projects/test-project"
+
+
+@pytest.mark.parametrize(
+    "url_path, family",
+    [
+        ("/assets/byids", "/assets"),
+        ("/assets", "/assets"),
+        ("/timeseries/data/list", "/timeseries/data"),
+        ("/timeseries/byids", "/timeseries"),
+        ("/raw/dbs/db/tables/t/rows", "/raw"),
+    ],
+)
+def test_get_endpoint_family(url_path, family):
+    assert family == get_endpoint_family(url_path)
+
+
+def fail(breaker, url_path, times):
+    for _ in range(times):
+        breaker.before_attempt(url_path)
+        breaker.record(url_path, failed=True)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3)
+        fail(breaker, "/assets/byids", 2)
+        breaker.record("/assets/list", failed=False)
+        fail(breaker, "/assets/byids", 2)
+        assert CLOSED == breaker.get_state("/assets")
+        fail(breaker, "/assets/byids", 1)
+        assert OPEN == breaker.get_state("/assets")
+        assert breaker.is_open("/assets/list")
+        assert CLOSED == breaker.get_state("/events")
+
+    def test_fails_fast_while_open(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        fail(breaker, "/timeseries/data", 1)
+        with pytest.raises(CogniteCircuitOpenError) as e:
+            breaker.before_attempt("/timeseries/data/list")
+        assert "/timeseries/data" == e.value.endpoint
+        assert 29 < e.value.retry_after <= 30
+        assert (str(e.value),) == e.value.args
+        breaker.before_attempt("/timeseries/byids")
+
+    def test_open_error_message(self):
+        error = CogniteCircuitOpenError("/timeseries/data", 12.345)
+        assert "Requests to /timeseries/data are failing, not sending more for 12.3 seconds" == str(error)
+        assert (str(error),) == error.args
+        unpickled = pickle.loads(pickle.dumps(error))
+        assert ("/timeseries/data", 12.345) == (unpickled.endpoint, unpickled.retry_after)
+
+    def test_single_probe_when_half_open(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        fail(breaker, "/assets", 1)
+        breaker.before_attempt("/assets")
+        assert HALF_OPEN == breaker.get_state("/assets")
+        with pytest.raises(CogniteCircuitOpenError):
+            breaker.before_attempt("/assets")
+        breaker.record("/assets", failed=False)
+        assert CLOSED == breaker.get_state("/assets")
+        assert not breaker.is_open("/assets")
+
+    def test_failed_probe_opens_circuit_again(self):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+        fail(breaker, "/assets", 2)
+        time.sleep(0.05)
+        fail(breaker, "/assets", 1)
+        assert OPEN == breaker.get_state("/assets")
+        with pytest.raises(CogniteCircuitOpenError):
+            breaker.before_attempt("/assets")
+
+    def test_wait_returns_when_circuit_opens(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        threading.Timer(0.05, breaker.record, args=("/assets", True)).start()
+        start = time.monotonic()
+        assert breaker.wait("/assets", 10)
+        assert time.monotonic() - start < 5
+        assert not breaker.wait("/events", 0)
+
+
+class TestCircuitBreakerInRequests:
+    @pytest.fixture
+    def api_client(self):
+        config = ClientConfig(
+            project="test-project",
+            api_key="abc",
+            base_url="http://localtest.com",
+            client_name="test",
+            circuit_breaker=CircuitBreaker(failure_threshold=2),
+        )
+        return APIClient(config, api_version="v1")
+
+    def test_stops_retrying_and_fails_fast(self, api_client, rsps):
+        rsps.add(rsps.POST, BASE_URL + "/assets/byids", status=503, json={"error": {"code": 503, "message": "down"}})
+        with mock.patch("time.sleep"):
+            with pytest.raises(CogniteAPIError) as e:
+                api_client._post("/assets/byids", json={})
+            assert 503 == e.value.code
+            assert 2 == len(rsps.calls)
+            with pytest.raises(CogniteCircuitOpenError):
+                api_client._post("/assets/byids", json={})
+        assert 2 == len(rsps.calls)
+
+    def test_queued_tasks_are_released(self, api_client, rsps):
+        rsps.add(rsps.POST, BASE_URL + "/assets/byids", status=503, json={"error": {"code": 503, "message": "down"}})
+        tasks = [("/assets/byids", {"items": [i]}) for i in range(20)]
+        with mock.patch("time.sleep"):
+            summary = execute_tasks_concurrently(api_client._post, tasks, max_workers=2, fail_fast=True)
+        assert len(rsps.calls) < 5
+        assert any(isinstance(e, CogniteCircuitOpenError) for e in summary.exceptions)
+        assert 20 == len(summary.failed_tasks) + len(summary.unknown_tasks)
@@ -0,0 +1,262 @@
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from requests import Response
+
+from cognite.client import CogniteClient
+from cognite.client.exceptions import CogniteNotFoundError
+from cognite.client.utils._coalescing import (
+    RequestCoalescer,
+    get_byids_identifiers,
+    get_credentials_key,
+    select_items,
+)
+from tests.utils import jsgz_load
+
+BASE_URL = "http://localtest.com/api/v1/projects/test-project"
+
+
+def run_concurrently(fn, args_list):
+    with ThreadPoolExecutor(len(args_list)) as executor:
+        return list(executor.map(lambda args: fn(*args), args_list))
+
+
+class TestRequestCoalescer:
+    def test_concurrent_calls_share_result(self):
+        calls = []
+        started = threading.Event()
+
+        def send():
+            calls.append(1)
+            started.set()
+            time.sleep(0.1)
+            return "result"
+
+        coalescer = RequestCoalescer()
+        leader = threading.Thread(target=coalescer.do, args=("key", send))
+        leader.start()
+        started.wait()
+        assert ("result", False) == coalescer.do("key", send)
+        leader.join()
+        assert 1 == len(calls)
+        assert ("result", True) == coalescer.do("key", send)
+
+    def test_error_is_shared(self):
+        def send():
+            time.sleep(0.05)
+            raise ValueError("failed")
+
+        coalescer = RequestCoalescer()
+        with pytest.raises(ValueError):
+            run_concurrently(coalescer.do, [("key", send)] * 3)
+
+    def test_batched_calls_are_merged(self):
+        sent = []
+        in_flight = threading.Event()
+        release = threading.Event()
+
+        def send(identifiers):
+            sent.append(identifiers)
+            if identifiers == [{"id": 0}]:
+                in_flight.set()
+                release.wait()
+            return "merged", "details"
+
+        coalescer = RequestCoalescer(window=0.1)
+        first = threading.Thread(target=coalescer.do_batched, args=("key", [{"id": 0}], send, lambda res, ids: ids))
+        first.start()
+        in_flight.wait()
+        results = run_concurrently(
+            coalescer.do_batched,
+            [
+                ("key", [{"id": 1}, {"id": 2}], send, lambda res, ids: ids),
+                ("key", [{"id": 2}, {"externalId": "a"}], send, lambda res, ids: ids),
+            ],
+        )
+        release.set()
+        first.join()
+        assert [[{"id": 0}], [{"id": 1}, {"id": 2}, {"externalId": "a"}]] == sent
+        assert [[{"id": 1}, {"id": 2}], [{"id": 2}, {"externalId": "a"}]] == [identifiers for identifiers, _ in results]
+        assert ["details", None] == sorted([details for _, details in results], key=lambda d: d is None)
+
+    def test_no_window_without_requests_in_flight(self):
+        coalescer = RequestCoalescer(window=10)
+        t0 = time.time()
+        assert ("merged", None) == coalescer.do_batched("key", [{"id": 1}], lambda ids: ("merged", None), None)
+        assert time.time() - t0 < 1
+
+    def test_batch_size_is_limited(self):
+        sent = []
+
+        def send(identifiers):
+            sent.append(identifiers)
+            return "merged", None
+
+        coalescer = RequestCoalescer(window=0.1, max_batch_size=2)
+        run_concurrently(
+            coalescer.do_batched,
+            [("key", [{"id": 1}, {"id": 2}], send, lambda res, ids: ids), ("key", [{"id": 3}], send, lambda r, i: i)],
+        )
+        assert 2 == len(sent)
+
+
+@pytest.mark.parametrize(
+    "url_path, payload, expected",
+    [
+        ("/assets/byids", {"items": [{"id": 1}, {"externalId": "a"}]}, [{"id": 1}, {"externalId": "a"}]),
+        ("/assets/byids", {"items": [{"id": 1}, {"id": 1}]}, None),
+        ("/assets/byids", {"items": [{"id": 1, "externalId": "a"}]}, None),
+        ("/assets/list", {"items": [{"id": 1}]}, None),
+        ("/assets/byids", None, None),
+    ],
+)
+def test_get_byids_identifiers(url_path, payload, expected):
+    assert expected == get_byids_identifiers(url_path, payload)
+
+
+def test_select_items():
+    res = Response()
+    res.status_code = 200
+    res.raw = object()
+    res._content = json.dumps({"items": [{"id": 1, "externalId": "a"}, {"id": 2}]}).encode()
+    selected = select_items(res, [{"id": 2}, {"externalId": "a"}, {"id": 3}], lambda obj: json.dumps(obj).encode())
+    assert {"items": [{"id": 2}, {"id": 1, "externalId": "a"}]} == selected.json()
+    assert 2 == len(res.json()["items"])
+    assert res.raw is selected.raw
+
+
+def test_get_credentials_key():
+    key = get_credentials_key({"api-key": "abc"})
+    assert key == get_credentials_key({"api-key": "abc", "x-cdp-app": "other"})
+    assert "abc" not in key
+    assert key != get_credentials_key({"api-key": "def"})
+    assert key != get_credentials_key({"Authorization": "abc"})
+
+
+@pytest.fixture
+def debug_logging():
+    logger = logging.getLogger("cognite-sdk")
+    level, handlers, propagate = logger.level, logger.handlers, logger.propagate
+    yield
+    logger.setLevel(level)
+    logger.handlers = handlers
+    logger.propagate = propagate
+
+
+class TestCoalescedRequests:
+    @pytest.fixture(params=[False, True], ids=["", "debug"])
+    def client(self, request):
+        if request.param:
+            request.getfixturevalue("debug_logging")
+        return CogniteClient(
+            api_key="abc",
+            project="test-project",
+            client_name="test",
+            base_url="http://localtest.com",
+            coalesce_requests=RequestCoalescer(window=0.1),
+            disable_pypi_version_check=True,
+            debug=request.param,
+        )
+
+    def test_identical_reads_are_sent_once(self, client, rsps):
+        def callback(request):
+            time.sleep(0.1)
+            return 200, {}, json.dumps({"id": 1, "name": "a"})
+
+        rsps.add_callback(rsps.GET, BASE_URL + "/assets/1", callback=callback)
+        assets = run_concurrently(client.assets._get, [("/assets/1",)] * 5)
+        assert 1 == len(rsps.calls)
+        assert all({"id": 1, "name": "a"} == res.json() for res in assets)
+        assets[0].json()["name"] = "b"
+        assert "a" == assets[1].json()["name"]
+
+    def test_byids_requests_are_merged(self, client, rsps):
+        def callback(request):
+            items = jsgz_load(request.body)["items"]
+            return 200, {}, json.dumps({"items": [{"id": item["id"], "name": str(item["id"])} for item in items]})
+
+        rsps.add_callback(rsps.POST, BASE_URL + "/assets/byids", callback=_in_flight_until_released(callback))
+        results = _run_while_in_flight(client, client.assets.retrieve_multiple, [([1, 2],), ([2, 3],), ([4],)])
+        assert [[0], [1, 2, 3, 4]] == sorted(
+            [item["id"] for item in jsgz_load(call.request.body)["items"]] for call in rsps.calls
+        )
+        assert [[1, 2], [2, 3], [4]] == [[asset.id for asset in assets] for assets in results]
+
+    def test_failed_merged_request_is_split(self, client, rsps):
+        def callback(request):
+            items = jsgz_load(request.body)["items"]
+            if any(item["id"] == 3 for item in items):
+                return 400, {}, json.dumps({"error": {"code": 400, "message": "missing", "missing": [{"id": 3}]}})
+            return 200, {}, json.dumps({"items": items})
+
+        rsps.add_callback(rsps.POST, BASE_URL + "/assets/byids", callback=_in_flight_until_released(callback))
+        results = _run_while_in_flight(client, lambda ids: _retrieve_or_error(client, ids), [([1, 2],), ([3],)])
+        assert [1, 2] == [asset.id for asset in results[0]]
+        assert isinstance(results[1], CogniteNotFoundError)
+        assert 4 == len(rsps.calls)
+
+    def test_reads_with_other_credentials_are_not_shared(self, client, rsps):
+        def callback(request):
+            time.sleep(0.1)
+            return 200, {}, json.dumps({"apiKey": request.headers["api-key"]})
+
+        other_client = CogniteClient(
+            api_key="def",
+            project="test-project",
+            client_name="test",
+            base_url="http://localtest.com",
+            coalesce_requests=client.config.coalescer,
+            disable_pypi_version_check=True,
+        )
+        rsps.add_callback(rsps.GET, BASE_URL + "/assets/1", callback=callback)
+        responses = run_concurrently(lambda c: c.assets._get("/assets/1"), [(client,), (other_client,)] * 2)
+        assert 2 == len(rsps.calls)
+        assert ["abc", "def", "abc", "def"] == [res.json()["apiKey"] for res in responses]
+
+    def test_writes_are_not_coalesced(self, client, rsps):
+        def callback(request):
+            time.sleep(0.05)
+            return 200, {}, json.dumps({})
+
+        rsps.add_callback(rsps.POST, BASE_URL + "/timeseries/data", callback=callback)
+        run_concurrently(client.datapoints._post, [("/timeseries/data", {"items": []})] * 3)
+        assert 3 == len(rsps.calls)
+
+
+def _retrieve_or_error(client, ids):
+    try:
+        return client.assets.retrieve_multiple(ids)
+    except CogniteNotFoundError as e:
+        return e
+
+
+_IN_FLIGHT = threading.Event()
+_RELEASE = threading.Event()
+
+
+def _in_flight_until_released(callback):
+    # Keeps the request for id 0 in flight until released, so that the byids requests sent meanwhile are merged
+    def wrapped(request):
+        if jsgz_load(request.body)["items"] == [{"id": 0}]:
+            _IN_FLIGHT.set()
+            _RELEASE.wait()
+        return callback(request)
+
+    return wrapped
+
+
+def _run_while_in_flight(client, fn, args_list):
+    _IN_FLIGHT.clear()
+    _RELEASE.clear()
+    first = threading.Thread(target=client.assets.retrieve_multiple, args=([0],))
+    first.start()
+    _IN_FLIGHT.wait()
+    try:
+        return run_concurrently(fn, args_list)
+    finally:
+        _RELEASE.set()
+        first.join()
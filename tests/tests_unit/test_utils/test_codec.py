@@ -0,0 +1,117 @@
+import json
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from cognite.client.utils._client_config import ClientConfig
+from cognite.client.utils._codec import JsonCodec, OrjsonCodec, StdlibJsonCodec, get_codec
+
+CODECS = ["json", "orjson", "ujson"]
+
+
+def get_installed_codec(name):
+    if name != "json":
+        pytest.importorskip(name)
+    return get_codec(name)
+
+
+@pytest.mark.parametrize("name", CODECS)
+class TestCodecs:
+    def test_roundtrip(self, name):
+        codec = get_installed_codec(name)
+        obj = {"items": [{"id": 1, "name": "ø", "value": 1.5, "metadata": {"a": None}, "flag": True}]}
+        data = codec.dumps(obj)
+        assert isinstance(data, bytes)
+        assert obj == codec.loads(data)
+        assert obj == codec.loads(data.decode())
+
+    def test_numpy_and_decimal(self, name):
+        codec = get_installed_codec(name)
+        obj = {
+            "int": np.int64(1),
+            "float": np.float64(1.5),
+            "array": np.array([1.0, 2.0]),
+            "int_array": np.arange(3),
+            "decimal": Decimal("0.5"),
+        }
+        assert {"int": 1, "float": 1.5, "array": [1.0, 2.0], "int_array": [0, 1, 2], "decimal": 0.5} == codec.loads(
+            codec.dumps(obj)
+        )
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            {"items": [{"id": 1, "datapoints": [[i, i / 2] for i in range(1000)]}]},
+            {"items": [{"id": i} for i in range(300)], "ignoreUnknownIds": True},
+            {"a": [], "b": {}, "c": [[1, {"d": None}]], 1: "non-string key"},
+            [],
+            "string",
+        ],
+    )
+    def test_iterdumps_matches_dumps(self, name, obj):
+        codec = get_installed_codec(name)
+        assert codec.dumps(obj) == b"".join(codec.iterdumps(obj))
+
+    def test_unserializable_raises(self, name):
+        with pytest.raises(TypeError):
+            get_installed_codec(name).dumps({"a": {1, 2}})
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            {"a": None, "b": float("nan")},
+            {"a": [None, np.array([1.0, np.inf])]},
+            {"a": None, "b": np.float32("-inf")},
+            {"a": None, "b": Decimal("NaN")},
+            {"NaN": "Infinity", "b": [-float("inf")]},
+        ],
+    )
+    def test_nan_and_infinity_serialized_like_json_module(self, name, obj):
+        assert StdlibJsonCodec().dumps(obj) == get_installed_codec(name).dumps(obj)
+        assert b"NaN" in StdlibJsonCodec().dumps({"a": float("nan")})
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            {"a": None, "b": float("nan")},
+            {"a": [None, np.array([1.0, np.inf])]},
+            {"a": None, "b": np.float32("-inf")},
+            {"a": None, "b": Decimal("NaN")},
+            {"NaN": "Infinity", "b": [-float("inf")]},
+        ],
+    )
+    def test_nan_and_infinity_raise_unless_allowed(self, name, obj):
+        codec = type(get_installed_codec(name))(allow_nan=False)
+        with pytest.raises(ValueError, match="Out of range float values are not JSON compliant"):
+            codec.dumps(obj)
+
+    def test_null_and_strings_like_nan(self, name):
+        obj = {"a": None, "NaN": "Infinity", "b": [1.5, None]}
+        assert obj == json.loads(get_installed_codec(name).dumps(obj))
+        assert obj == json.loads(type(get_installed_codec(name))(allow_nan=False).dumps(obj))
+
+
+class TestGetCodec:
+    def test_codecs_are_reused(self):
+        assert get_codec("json") is get_codec("json")
+
+    def test_auto_prefers_orjson(self):
+        pytest.importorskip("orjson")
+        assert isinstance(get_codec("auto"), OrjsonCodec)
+
+    def test_instance_is_returned_as_is(self):
+        codec = StdlibJsonCodec()
+        assert codec is get_codec(codec)
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError, match="Unknown JSON codec 'yaml'"):
+            get_codec("yaml")
+
+    def test_config(self):
+        assert "json" == ClientConfig().codec.name
+        assert isinstance(ClientConfig().codec, JsonCodec)
+
+    def test_config_orjson(self):
+        pytest.importorskip("orjson")
+        assert "orjson" == ClientConfig(json_codec="orjson").codec.name
@@ -0,0 +1,100 @@
+import gzip
+import json
+import zlib
+
+import pytest
+
+from cognite.client import CogniteClient
+from cognite.client.utils._client_config import ClientConfig
+from cognite.client.utils._compression import CompressionPolicy
+
+BODY = [b'{"items": [', b'{"id": 1}, ' * 100, b'{"id": 2}', b"]}"]
+
+
+def decompress(data, encoding):
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "deflate":
+        return zlib.decompress(data)
+    import zstandard
+
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+class TestCompressionPolicy:
+    @pytest.mark.parametrize("algorithm", ["gzip", "deflate", "zstd"])
+    def test_compress_chunks(self, algorithm):
+        if algorithm == "zstd":
+            pytest.importorskip("zstandard")
+        data, encoding = CompressionPolicy(algorithm).compress(BODY)
+        assert algorithm == encoding
+        assert b"".join(BODY) == decompress(data, encoding)
+        assert len(data) < len(b"".join(BODY))
+
+    def test_below_min_size_is_not_compressed(self):
+        assert (b"{}", None) == CompressionPolicy(min_size=100).compress([b"{", b"}"])
+
+    def test_at_min_size_is_compressed(self):
+        data, encoding = CompressionPolicy(min_size=10).compress(BODY)
+        assert "gzip" == encoding
+        assert b"".join(BODY) == gzip.decompress(data)
+
+    def test_disabled(self):
+        assert (b"".join(BODY), None) == CompressionPolicy(None).compress(BODY)
+
+    def test_level(self):
+        assert 6 == CompressionPolicy().level
+        assert 1 == CompressionPolicy(level=1).level
+
+    def test_zstd_level(self):
+        pytest.importorskip("zstandard")
+        assert 3 == CompressionPolicy("zstd").level
+
+    @pytest.mark.parametrize(
+        "algorithm, accept_encoding, expected",
+        [
+            ("deflate", "gzip", "gzip"),
+            ("gzip", "deflate, gzip;q=0", "deflate"),
+            ("gzip", "br, identity", None),
+            ("gzip", None, None),
+        ],
+    )
+    def test_negotiate(self, algorithm, accept_encoding, expected):
+        policy = CompressionPolicy(algorithm)
+        assert policy.negotiate(algorithm, accept_encoding)
+        data, encoding = policy.compress(BODY)
+        assert expected == encoding
+        assert b"".join(BODY) == (decompress(data, encoding) if encoding else data)
+        # Requests which were sent before the fallback are sent again, without falling back further
+        assert policy.negotiate(algorithm, None)
+        assert expected == policy.compress(BODY)[1]
+
+    def test_negotiate_uncompressed(self):
+        assert not CompressionPolicy(None).negotiate(None, "gzip")
+
+    def test_rejected_request_is_sent_again(self, rsps):
+        url = "http://localtest.com/api/v1/projects/test-project/assets"
+        error = {"error": {"code": 415, "message": "Unsupported Content-Encoding"}}
+        rsps.add(rsps.POST, url, status=415, json=error, headers={"Accept-Encoding": "gzip"})
+        rsps.add(rsps.POST, url, status=200, json={"items": []})
+        client = CogniteClient(
+            api_key="abc",
+            project="test-project",
+            client_name="test",
+            base_url="http://localtest.com",
+            compression="deflate",
+            disable_pypi_version_check=True,
+        )
+        client.assets._post("/assets", json={"items": [{"name": "a"}]})
+        assert ["deflate", "gzip"] == [call.request.headers["Content-Encoding"] for call in rsps.calls]
+        assert {"items": [{"name": "a"}]} == json.loads(gzip.decompress(rsps.calls[1].request.body))
+
+    def test_unknown_algorithm(self):
+        with pytest.raises(ValueError, match="Unknown compression algorithm 'br'"):
+            CompressionPolicy("br")
+
+    def test_config(self):
+        assert "gzip" == ClientConfig().compression.algorithm
+        assert "deflate" == ClientConfig(compression="deflate").compression.algorithm
+        policy = CompressionPolicy(min_size=1024)
+        assert policy is ClientConfig(compression=policy).compression
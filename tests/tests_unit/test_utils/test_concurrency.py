@@ -0,0 +1,205 @@
+import threading
+import time
+
+import pytest
+
+from cognite.client.exceptions import CogniteAPIError
+from cognite.client.utils._client_config import ClientConfig
+from cognite.client.utils._concurrency import TaskExecutor, execute_tasks_concurrently, stream_tasks_concurrently
+
+
+class TestTaskExecutor:
+    def test_results_in_task_order(self):
+        executor = TaskExecutor(4)
+        futures = executor.run_all(lambda x, y=0: x + y, [(1,), {"x": 2, "y": 3}, (4, 5)])
+        assert [1, 5, 9] == [f.result() for f in futures]
+
+    def test_workers_are_reused(self):
+        executor = TaskExecutor(2)
+        executor.run_all(lambda: None, [(), (), ()])
+        pool = executor._pool
+        executor.run_all(lambda: None, [(), (), ()])
+        assert pool is executor._pool
+        assert len(pool._threads) <= 2
+
+    def test_single_task_runs_in_calling_thread(self):
+        executor = TaskExecutor(2)
+        futures = executor.run_all(threading.get_ident, [()])
+        assert threading.get_ident() == futures[0].result()
+        assert executor._pool is None
+
+    def test_nested_submissions_do_not_deadlock(self):
+        executor = TaskExecutor(2)
+        thread_ids = set()
+
+        def leaf(i):
+            thread_ids.add(threading.get_ident())
+            time.sleep(0.001)
+            return i
+
+        def inner(i):
+            return sum(f.result() for f in executor.run_all(leaf, [(j,) for j in range(5)])) + i
+
+        def outer():
+            return sum(f.result() for f in executor.run_all(inner, [(i,) for i in range(5)]))
+
+        futures = executor.run_all(outer, [(), (), ()])
+        assert [60, 60, 60] == [f.result() for f in futures]
+        assert len(thread_ids) <= 2
+
+    def test_exceptions_are_captured(self):
+        def fn(i):
+            if i == 1:
+                raise ValueError("bad")
+            return i
+
+        futures = TaskExecutor(2).run_all(fn, [(0,), (1,), (2,)])
+        assert 0 == futures[0].result()
+        with pytest.raises(ValueError):
+            futures[1].result()
+
+    def test_shutdown_and_reuse(self):
+        executor = TaskExecutor(2)
+        executor.run_all(lambda: None, [(), ()])
+        executor.shutdown()
+        assert executor._pool is None
+        assert [1, 1] == [f.result() for f in executor.run_all(lambda: 1, [(), ()])]
+
+
+class TestExecuteTasksConcurrently:
+    def test_summary_with_shared_executor(self):
+        def fn(i):
+            if i == 1:
+                raise CogniteAPIError("bad", code=400)
+            if i == 2:
+                raise CogniteAPIError("down", code=503)
+            return i
+
+        summary = execute_tasks_concurrently(fn, [(0,), (1,), (2,)], max_workers=2, executor=TaskExecutor(2))
+        assert [(0,)] == summary.successful_tasks
+        assert [(1,)] == summary.failed_tasks
+        assert [(2,)] == summary.unknown_tasks
+        assert [0] == summary.results
+
+    def test_without_executor(self):
+        summary = execute_tasks_concurrently(lambda i: i, [(0,), (1,)], max_workers=2)
+        assert [0, 1] == summary.results
+
+
+class TestStreamTasksConcurrently:
+    def test_yields_in_completion_order(self):
+        def fn(delay):
+            time.sleep(delay)
+            return delay
+
+        completed = stream_tasks_concurrently(fn, [(0.2,), (0.0,)], TaskExecutor(2))
+        assert [(1, 0.0), (0, 0.2)] == [(i, f.result()) for i, f in completed]
+
+    def test_max_in_flight_bounds_scheduled_tasks(self):
+        lock = threading.Lock()
+        state = {"running": 0, "max": 0}
+
+        def fn():
+            with lock:
+                state["running"] += 1
+                state["max"] = max(state["max"], state["running"])
+            time.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+
+        assert 10 == len(list(stream_tasks_concurrently(fn, [()] * 10, TaskExecutor(5), max_in_flight=2)))
+        assert state["max"] <= 2
+
+    def test_fail_fast_cancels_pending_tasks(self):
+        calls = []
+
+        def fn(i):
+            calls.append(i)
+            if i == 0:
+                raise CogniteAPIError("bad", code=400)
+            return i
+
+        completed = list(
+            stream_tasks_concurrently(fn, [(i,) for i in range(10)], TaskExecutor(1), max_in_flight=1, fail_fast=True)
+        )
+        assert 1 == len(completed)
+        assert [0] == calls
+
+    def test_fail_fast_continues_on_retryable_error(self):
+        def fn(i):
+            if i == 0:
+                raise CogniteAPIError("busy", code=503)
+            return i
+
+        completed = list(
+            stream_tasks_concurrently(fn, [(i,) for i in range(3)], TaskExecutor(1), max_in_flight=1, fail_fast=True)
+        )
+        assert 3 == len(completed)
+
+    def test_closing_generator_cancels_remaining(self):
+        calls = []
+        completed = stream_tasks_concurrently(calls.append, [(i,) for i in range(10)], TaskExecutor(1), max_in_flight=1)
+        next(completed)
+        completed.close()
+        assert [0] == calls
+
+    def test_nested_streams_in_worker_threads(self):
+        executor = TaskExecutor(1)
+
+        def inner():
+            return sum(
+                f.result() for _, f in stream_tasks_concurrently(lambda i: i, [(i,) for i in range(4)], executor)
+            )
+
+        assert [6, 6] == [f.result() for _, f in stream_tasks_concurrently(inner, [(), ()], executor)]
+
+    def test_summary_reports_cancelled_tasks_as_failed(self):
+        def fn(i):
+            if i == 1:
+                raise CogniteAPIError("bad", code=400)
+            return i
+
+        summary = execute_tasks_concurrently(
+            fn, [(0,), (1,), (2,)], max_workers=1, executor=TaskExecutor(1), max_in_flight=1, fail_fast=True
+        )
+        assert [(0,)] == summary.successful_tasks
+        assert [(1,), (2,)] == summary.failed_tasks
+        assert [0] == summary.results
+        assert 1 == len(summary.exceptions)
+
+    def test_summary_reports_running_tasks_as_unknown(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def fn(i):
+            if i == 0:
+                started.wait()
+                raise CogniteAPIError("bad", code=400)
+            started.set()
+            release.wait()
+            return i
+
+        try:
+            summary = execute_tasks_concurrently(
+                fn, [(0,), (1,), (2,)], max_workers=2, executor=TaskExecutor(2), max_in_flight=2, fail_fast=True
+            )
+        finally:
+            release.set()
+        assert [] == summary.successful_tasks
+        assert [(1,)] == summary.unknown_tasks
+        assert [(0,), (2,)] == summary.failed_tasks
+        assert 1 == len(summary.exceptions)
+
+
+class TestClientConfigExecutor:
+    def test_executor_is_persistent(self):
+        config = ClientConfig(max_workers=3)
+        assert config.executor is config.executor
+        assert 3 == config.executor.max_workers
+
+    def test_executor_follows_max_workers(self):
+        config = ClientConfig(max_workers=3)
+        executor = config.executor
+        config.max_workers = 1
+        assert executor is not config.executor
+        assert 1 == config.executor.max_workers
@@ -0,0 +1,153 @@
+import json
+import multiprocessing
+import sqlite3
+import time
+
+import pytest
+
+from cognite.client import CogniteClient
+from cognite.client.utils._disk_cache import DiskCache
+from tests.utils import jsgz_load
+
+BASE_URL = "http://localtest.com/api/v1/projects/test-project"
+SCOPE = "http://localtest.com/test-project"
+
+
+def _store_items(directory, start):
+    cache = DiskCache(directory)
+    for i in range(start, start + 50):
+        cache.store(SCOPE, "/assets", "{}", time.time(), [{"id": i, "lastUpdatedTime": 1}], [i], full=True)
+
+
+class TestDiskCache:
+    def test_store_and_load(self, tmp_path):
+        cache = DiskCache(str(tmp_path))
+        assert cache.get_list_query(SCOPE, "/assets", "{}") is None
+        items = [{"id": 2, "externalId": "b", "lastUpdatedTime": 1}, {"id": 1, "lastUpdatedTime": 1}]
+        cache.store(SCOPE, "/assets", "{}", 1000, items, [1, 2], full=True)
+        cache.full_refresh_interval = float("inf")
+        assert (1000 - cache.overlap) * 1000 == cache.get_list_query(SCOPE, "/assets", "{}").synced_at
+        assert [1, 2] == cache.get_list_query(SCOPE, "/assets", "{}").ids
+        assert [2, 1] == [item["id"] for item in DiskCache(str(tmp_path)).load(SCOPE, "/assets", [2, 1, 3])]
+        assert [] == cache.load("other", "/assets", [1])
+
+    def test_items_without_id_or_last_updated_time_not_stored(self, tmp_path):
+        cache = DiskCache(str(tmp_path))
+        items = [{"id": 1}, {"externalId": "a", "lastUpdatedTime": 1}, {"id": 2, "lastUpdatedTime": 1}]
+        cache.store(SCOPE, "/assets", "{}", time.time(), items, [1, 2], full=True)
+        assert [2] == [item["id"] for item in cache.load(SCOPE, "/assets", [1, 2])]
+
+    @pytest.mark.parametrize("sqlite_version", [sqlite3.sqlite_version_info, (3, 23, 0)])
+    def test_older_versions_do_not_replace_newer(self, tmp_path, monkeypatch, sqlite_version):
+        monkeypatch.setattr(sqlite3, "sqlite_version_info", sqlite_version)
+        cache = DiskCache(str(tmp_path))
+        cache.store(SCOPE, "/assets", "{}", time.time(), [{"id": 1, "name": "new", "lastUpdatedTime": 2}], [1], True)
+        cache.store(SCOPE, "/assets", "{}", time.time(), [{"id": 1, "name": "old", "lastUpdatedTime": 1}], [1], True)
+        assert "new" == cache.load(SCOPE, "/assets", [1])[0]["name"]
+        cache.store(SCOPE, "/assets", "{}", time.time(), [{"id": 1, "name": "newer", "lastUpdatedTime": 3}], [1], True)
+        assert "newer" == cache.load(SCOPE, "/assets", [1])[0]["name"]
+
+    def test_full_refresh_interval(self, tmp_path):
+        cache = DiskCache(str(tmp_path), full_refresh_interval=0.01)
+        cache.store(SCOPE, "/assets", "{}", time.time(), [], [], full=True)
+        time.sleep(0.02)
+        assert cache.get_list_query(SCOPE, "/assets", "{}") is None
+
+    def test_delete(self, tmp_path):
+        cache = DiskCache(str(tmp_path))
+        items = [{"id": 1, "externalId": "a", "lastUpdatedTime": 1}, {"id": 2, "lastUpdatedTime": 1}]
+        cache.store(SCOPE, "/assets", "{}", time.time(), items, [1, 2], full=True)
+        cache.delete(SCOPE, "/assets", [{"externalId": "a"}])
+        assert [2] == [item["id"] for item in cache.load(SCOPE, "/assets", [1, 2])]
+        cache.clear()
+        assert cache.get_list_query(SCOPE, "/assets", "{}") is None
+
+    def test_shared_by_processes(self, tmp_path):
+        processes = [
+            multiprocessing.Process(target=_store_items, args=(str(tmp_path), start)) for start in range(0, 200, 50)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        assert [0] * 4 == [process.exitcode for process in processes]
+        assert 200 == len(DiskCache(str(tmp_path)).load(SCOPE, "/assets", range(200)))
+
+
+class TestCachedList:
+    @pytest.fixture
+    def client(self, tmp_path):
+        return CogniteClient(
+            api_key="abc",
+            project="test-project",
+            client_name="test",
+            base_url="http://localtest.com",
+            disk_cache=str(tmp_path),
+            disable_pypi_version_check=True,
+        )
+
+    @pytest.fixture
+    def mock_list(self, rsps):
+        time_series = {1: {"id": 1, "name": "a", "lastUpdatedTime": 1}, 2: {"id": 2, "name": "b", "lastUpdatedTime": 1}}
+
+        def callback(request):
+            filter = jsgz_load(request.body).get("filter", {})
+            items = [
+                ts
+                for ts in time_series.values()
+                if ts.get("lastUpdatedTime", 0) >= filter.get("lastUpdatedTime", {}).get("min", 0)
+                and ts["name"] == filter.get("name", ts["name"])
+            ]
+            return 200, {}, json.dumps({"items": items})
+
+        rsps.add_callback(rsps.POST, BASE_URL + "/timeseries/list", callback=callback)
+        rsps.time_series = time_series
+        return rsps
+
+    def test_only_updated_resources_are_listed(self, client, mock_list):
+        assert ["a", "b"] == [ts.name for ts in client.time_series.list(limit=None)]
+        mock_list.time_series[2] = {"id": 2, "name": "c", "lastUpdatedTime": int(time.time() * 1000)}
+        mock_list.time_series[3] = {"id": 3, "name": "d", "lastUpdatedTime": int(time.time() * 1000)}
+        assert ["a", "c", "d"] == [ts.name for ts in client.time_series.list(limit=None)]
+        assert 2 == len(mock_list.calls)
+        assert "lastUpdatedTime" in jsgz_load(mock_list.calls[1].request.body)["filter"]
+
+    def test_resources_stop_and_start_matching_filter(self, client, mock_list):
+        assert [1] == [ts.id for ts in client.time_series.list(name="a", limit=None)]
+        mock_list.time_series[1] = {"id": 1, "name": "b", "lastUpdatedTime": int(time.time() * 1000)}
+        assert [] == client.time_series.list(name="a", limit=None).data
+        assert [1, 2] == [ts.id for ts in client.time_series.list(name="b", limit=None)]
+
+    def test_order_of_first_listing_is_kept(self, client, mock_list):
+        mock_list.time_series.clear()
+        mock_list.time_series.update({i: {"id": i, "name": "a", "lastUpdatedTime": 1} for i in [3, 1, 2]})
+        assert [3, 1, 2] == [ts.id for ts in client.time_series.list(limit=None)]
+        mock_list.time_series[0] = {"id": 0, "name": "a", "lastUpdatedTime": int(time.time() * 1000)}
+        mock_list.time_series[1] = {"id": 1, "name": "b", "lastUpdatedTime": int(time.time() * 1000)}
+        assert [3, 1, 2, 0] == [ts.id for ts in client.time_series.list(limit=None)]
+        assert [3, 2, 0] == [ts.id for ts in client.time_series.list(name="a", limit=None)]
+
+    def test_only_matching_updated_resources_are_stored(self, client, mock_list):
+        client.time_series.list(limit=None)
+        client.time_series.list(name="a", limit=None)
+        mock_list.time_series[2] = {"id": 2, "name": "c", "lastUpdatedTime": int(time.time() * 1000)}
+        client.time_series.list(name="a", limit=None)
+        assert "b" == client.config.disk_cache.load(SCOPE, "/timeseries", [2])[0]["name"]
+
+    def test_resources_without_last_updated_time_are_not_cached(self, client, mock_list):
+        mock_list.time_series[1] = {"id": 1, "name": "a"}
+        assert [1, 2] == [ts.id for ts in client.time_series.list(limit=None)]
+        assert client.config.disk_cache.get_list_query(SCOPE, "/timeseries", "{}") is None
+
+    def test_deleted_resources_are_removed(self, client, mock_list):
+        mock_list.add(mock_list.POST, BASE_URL + "/timeseries/delete", status=200, json={})
+        client.time_series.list(limit=None)
+        client.time_series.delete(id=1)
+        del mock_list.time_series[1]
+        assert [2] == [ts.id for ts in client.time_series.list(limit=None)]
+
+    def test_limited_lists_are_not_cached(self, client, mock_list):
+        client.time_series.list(limit=10)
+        client.time_series.list(limit=10)
+        assert 2 == len(mock_list.calls)
+        assert client.config.disk_cache.get_list_query(SCOPE, "/timeseries", "{}") is None
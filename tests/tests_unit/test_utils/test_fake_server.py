@@ -0,0 +1,129 @@
+import pytest
+
+from cognite.client.data_classes import Asset, Event, Sequence, TimeSeries
+from cognite.client.exceptions import CogniteAPIError, CogniteDuplicatedError, CogniteNotFoundError
+from cognite.client.testing import FakeCogniteServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeCogniteServer() as server:
+        yield server
+
+
+def fast_retrying_client(server, **kwargs):
+    client = server.client(**kwargs)
+    client.config.retry_policy.base_backoff = client.config.retry_policy.max_backoff = 0.01
+    return client
+
+
+@pytest.fixture
+def client(server):
+    server.reset()
+    yield fast_retrying_client(server)
+
+
+class TestResources:
+    def test_create_list_and_retrieve(self, client):
+        client.events.create([Event(external_id="e{}".format(i), type="a" if i % 2 else "b") for i in range(2500)])
+
+        assert 2500 == len(client.events.list(limit=None))
+        assert 2500 == len(client.events.list(limit=None, partitions=3))
+        assert 1250 == len(client.events.list(limit=None, type="a"))
+        assert "e7" == client.events.retrieve(external_id="e7").external_id
+        assert client.events.retrieve(external_id="missing") is None
+        with pytest.raises(CogniteNotFoundError):
+            client.events.retrieve_multiple(external_ids=["e1", "missing"])
+
+    def test_create_duplicate(self, client):
+        client.time_series.create(TimeSeries(external_id="ts"))
+        with pytest.raises(CogniteDuplicatedError) as e:
+            client.time_series.create(TimeSeries(external_id="ts"))
+        assert [{"externalId": "ts"}] == e.value.duplicated
+
+    def test_create_hierarchy(self, client):
+        assets = [Asset(external_id="root", name="root")]
+        assets += [Asset(external_id="c{}".format(i), parent_external_id="root", name="c") for i in range(1500)]
+        client.assets.create_hierarchy(assets)
+
+        root = client.assets.retrieve(external_id="root")
+        child = client.assets.retrieve(external_id="c1000")
+        assert root.id == child.parent_id == child.root_id
+
+    def test_update_and_delete(self, client):
+        asset = client.assets.create(Asset(external_id="a", name="old", metadata={"k": "v"}))
+        client.assets.update(Asset(id=asset.id, name="new"))
+        assert "new" == client.assets.retrieve(asset.id).name
+
+        client.assets.delete(external_id="a")
+        assert client.assets.retrieve(asset.id) is None
+
+
+class TestDatapoints:
+    def test_insert_and_retrieve(self, client):
+        client.time_series.create(TimeSeries(external_id="ts"))
+        client.datapoints.insert([(i * 1000, float(i)) for i in range(150000)], external_id="ts")
+
+        dps = client.datapoints.retrieve(external_id="ts", start=0, end="now")
+        assert 150000 == len(dps)
+        assert [0.0, 1.0] == dps.value[:2]
+
+        aggregates = client.datapoints.retrieve(
+            external_id="ts", start=0, end="now", aggregates=["average", "count"], granularity="1h"
+        )
+        assert [3600, 3600] == aggregates.count[:2]
+        assert 1799.5 == aggregates.average[0]
+
+        assert 149999.0 == client.datapoints.retrieve_latest(external_id="ts").value[0]
+
+    def test_delete_range(self, client):
+        client.time_series.create(TimeSeries(external_id="ts"))
+        client.datapoints.insert([(i * 1000, float(i)) for i in range(10)], external_id="ts")
+        client.datapoints.delete_range(start=0, end=5000, external_id="ts")
+        assert 5 == len(client.datapoints.retrieve(external_id="ts", start=0, end="now"))
+
+
+class TestRawSequencesAndFiles:
+    def test_raw_rows(self, client):
+        client.raw.rows.insert("db", "table", {"k{}".format(i): {"i": i} for i in range(3000)}, ensure_parent=True)
+
+        assert ["db"] == [db.name for db in client.raw.databases.list()]
+        assert 3000 == len(client.raw.rows.list("db", "table", limit=None))
+        assert {"i": 3} == client.raw.rows.retrieve("db", "table", "k3").columns
+
+    def test_sequence_rows(self, client):
+        client.sequences.create(Sequence(external_id="s", columns=[{"externalId": "a", "valueType": "DOUBLE"}]))
+        client.sequences.data.insert({i: [float(i)] for i in range(25000)}, column_external_ids=["a"], external_id="s")
+
+        data = client.sequences.data.retrieve(external_id="s", start=0, end=None)
+        assert 25000 == len(data)
+        assert [2.0] == data[2]
+
+    def test_upload_and_download(self, client):
+        client.files.upload_bytes(b"content", name="f", external_id="f")
+        assert b"content" == client.files.download_bytes(external_id="f")
+        assert client.files.retrieve(external_id="f").uploaded
+
+
+class TestFaultInjection:
+    def test_injected_errors_are_retried(self, server, client):
+        server.inject_errors(503, count=2, path_prefix="/events")
+        server.inject_errors(429, count=1, path_prefix="/events")
+
+        assert [] == client.events.list()
+        assert 4 == server.request_counts[("POST", "/api/v1/projects/{}/events/list".format(server.project))]
+
+    def test_error_rate_is_reproducible(self):
+        counts = []
+        for _ in range(2):
+            with FakeCogniteServer(error_rate=0.3, throttle_rate=0.3, seed=1) as server:
+                client = fast_retrying_client(server, max_retries=50, retry_budget=False)
+                for _ in range(5):
+                    client.events.list()
+                counts.append(sum(server.request_counts.values()))
+        assert counts[0] == counts[1] > 5
+
+    def test_unknown_route(self, client):
+        with pytest.raises(CogniteAPIError) as e:
+            client.get("/unknown")
+        assert 404 == e.value.code
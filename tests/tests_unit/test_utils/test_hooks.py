@@ -0,0 +1,84 @@
+from unittest import mock
+
+import pytest
+import requests
+
+from cognite.client._api_client import APIClient
+from cognite.client.exceptions import CogniteAPIError
+from cognite.client.utils._client_config import ClientConfig
+from cognite.client.utils._hooks import RequestHooks
+
+BASE_URL = "http://localtest.com/api/1.0/projects/test-project"
+
+
+@pytest.fixture
+def api_client():
+    config = ClientConfig(project="test-project", api_key="abc", base_url=BASE_URL, client_name="test")
+    return APIClient(config)
+
+
+@pytest.fixture
+def events(api_client):
+    events = []
+    hooks = api_client._config.hooks
+    hooks.register("before_request", lambda info: events.append(("before_request", info)))
+    hooks.register("after_response", lambda info, res: events.append(("after_response", res.status_code)))
+    hooks.register("on_retry", lambda info, status, error: events.append(("on_retry", status)))
+    hooks.register("on_error", lambda info, error: events.append(("on_error", type(error))))
+    return events
+
+
+class TestRequestHooks:
+    def test_no_hooks_is_falsy(self):
+        hooks = RequestHooks()
+        assert not hooks
+        hook = lambda info: None
+        hooks.register("before_request", hook)
+        assert hooks
+        hooks.unregister("before_request", hook)
+        assert not hooks
+
+    def test_unknown_event(self):
+        with pytest.raises(ValueError, match="Unknown event 'after_request'"):
+            RequestHooks().register("after_request", lambda info: None)
+
+    def test_successful_request(self, api_client, events, rsps):
+        rsps.add(rsps.POST, BASE_URL + "/assets/list", status=200, json={"items": []})
+        api_client._post("/assets/list", json={"limit": 1})
+
+        assert ["before_request", "after_response"] == [event for event, _ in events]
+        info = events[0][1]
+        assert "POST" == info.method
+        assert "/assets/list" == info.url_path
+        assert BASE_URL + "/assets/list" == info.url
+        assert info.bytes_sent > 0
+        assert info.latency >= 0
+        assert 200 == events[1][1]
+
+    def test_before_request_modifies_headers(self, api_client, rsps):
+        api_client._config.hooks.register("before_request", lambda info: info.headers.update({"x-trace": "abc"}))
+        rsps.add(rsps.GET, BASE_URL + "/assets", status=200, json={"items": []})
+        api_client._get("/assets")
+        assert "abc" == rsps.calls[0].request.headers["x-trace"]
+
+    def test_error_status(self, api_client, events, rsps):
+        rsps.add(rsps.GET, BASE_URL + "/assets/1", status=400, json={"error": {"code": 400, "message": "bad"}})
+        with pytest.raises(CogniteAPIError):
+            api_client._get("/assets/1")
+        assert [("after_response", 400), ("on_error", CogniteAPIError)] == events[1:]
+
+    def test_connection_error(self, api_client, events, rsps):
+        rsps.add(rsps.POST, BASE_URL + "/assets", body=requests.exceptions.ConnectionError("reset"))
+        with pytest.raises(requests.exceptions.ConnectionError):
+            api_client._post("/assets", json={})
+        assert [("on_error", requests.exceptions.ConnectionError)] == events[1:]
+        assert events[0][1].latency is None
+
+    def test_retries_reported_before_retrying(self, api_client, events, rsps):
+        rsps.add(rsps.GET, BASE_URL + "/assets", status=429, json={})
+        rsps.add(rsps.GET, BASE_URL + "/assets", status=503, json={})
+        rsps.add(rsps.GET, BASE_URL + "/assets", status=200, json={"items": []})
+        with mock.patch("time.sleep"):
+            api_client._get("/assets")
+        assert [("on_retry", 429), ("on_retry", 503), ("after_response", 200)] == events[1:]
+        assert 2 == events[0][1].retries
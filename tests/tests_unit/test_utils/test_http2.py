@@ -0,0 +1,136 @@
+import gzip
+import json
+import ssl
+from unittest import mock
+
+import pytest
+import requests
+from requests.packages.urllib3 import Retry
+
+from cognite.client import CogniteClient
+from cognite.client.utils._client_config import ClientConfig
+from cognite.client.utils._http2 import HTTP2Adapter, create_ssl_context
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+URL = "https://example.com/api/v1/projects/p/assets"
+
+
+def make_session(handler, retries=None):
+    adapter = HTTP2Adapter(max_retries=retries)
+    adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    session = requests.Session()
+    session.trust_env = False
+    session.mount("https://", adapter)
+    return session
+
+
+class TestHTTP2Adapter:
+    def test_request_and_response(self):
+        requests_received = []
+
+        def handler(request):
+            requests_received.append(request)
+            return httpx.Response(200, json={"items": [{"id": 1}]}, headers={"x-request-id": "abc"})
+
+        res = make_session(handler).post(URL, data=b'{"limit": 1}', headers={"api-key": "key"})
+        assert 200 == res.status_code
+        assert {"items": [{"id": 1}]} == res.json()
+        assert "abc" == res.headers["X-Request-Id"]
+        assert URL == res.url
+
+        request = requests_received[0]
+        assert "POST" == request.method
+        assert b'{"limit": 1}' == request.content
+        assert "key" == request.headers["api-key"]
+
+    def test_stream_decoded_body(self):
+        body = json.dumps({"items": list(range(100000))}).encode()
+
+        def handler(request):
+            return httpx.Response(200, content=gzip.compress(body), headers={"Content-Encoding": "gzip"})
+
+        res = make_session(handler).get(URL, stream=True)
+        assert body == b"".join(res.iter_content(1024))
+
+    def test_retry_status_codes(self):
+        statuses = iter([503, 429, 200])
+
+        def handler(request):
+            return httpx.Response(next(statuses), json={})
+
+        retries = Retry(total=5, backoff_factor=0, status_forcelist=[429, 503], method_whitelist=False)
+        res = make_session(handler, retries).post(URL, data=b"{}")
+        assert 200 == res.status_code
+        assert [503, 429] == [r.status for r in res.raw.retries.history]
+
+    def test_return_last_response_when_retries_exhausted(self):
+        def handler(request):
+            return httpx.Response(503, json={"error": {"code": 503, "message": "unavailable"}})
+
+        retries = Retry(total=2, backoff_factor=0, status_forcelist=[503], raise_on_status=False)
+        res = make_session(handler, retries).get(URL)
+        assert 503 == res.status_code
+        assert "unavailable" == res.json()["error"]["message"]
+
+    def test_connection_error(self):
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            raise httpx.ConnectError("connection refused")
+
+        retries = Retry(total=2, backoff_factor=0)
+        with pytest.raises(requests.exceptions.ConnectionError):
+            make_session(handler, retries).get(URL)
+        assert 3 == len(attempts)
+
+    def test_read_timeout(self):
+        def handler(request):
+            raise httpx.ReadTimeout("timed out")
+
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            make_session(handler, Retry(total=2, read=0, backoff_factor=0)).get(URL)
+
+    def test_verify_cert_and_proxy_of_request(self):
+        session = make_session(lambda request: httpx.Response(500))
+        adapter = session.get_adapter(URL)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})))
+        with mock.patch.object(adapter, "_create_client", return_value=client) as create_client:
+            proxies = {"https": "http://proxy:3128"}
+            assert 200 == session.get(URL, verify=False, cert=("c.pem", "k.pem"), proxies=proxies).status_code
+            assert 200 == session.get(URL, verify=False, cert=("c.pem", "k.pem"), proxies=proxies).status_code
+            assert 500 == session.get(URL).status_code
+        create_client.assert_called_once_with(False, ("c.pem", "k.pem"), "http://proxy:3128")
+
+    def test_ssl_context(self):
+        assert create_ssl_context(True, None) is True
+        assert create_ssl_context(False, None) is False
+        context = create_ssl_context(requests.certs.where(), None)
+        assert ssl.CERT_REQUIRED == context.verify_mode
+        with pytest.raises(FileNotFoundError):
+            create_ssl_context(False, "missing.pem")
+
+
+class TestHTTP2Option:
+    def test_config(self, monkeypatch):
+        assert ClientConfig(api_key="key", client_name="c", http2=True).http2
+        assert not ClientConfig(api_key="key", client_name="c").http2
+        monkeypatch.setenv("COGNITE_HTTP2", "1")
+        assert ClientConfig(api_key="key", client_name="c").http2
+
+    def test_api_client_selects_http2_session(self):
+        client = CogniteClient(api_key="key", project="p", client_name="c", http2=True, disable_pypi_version_check=True)
+        api = client.assets
+        session = mock.MagicMock()
+        session.request.return_value.status_code = 200
+        with mock.patch.object(client.config.sessions, "get", return_value=session):
+            api._do_request("GET", "/assets")
+        assert session.request.called
+
+    def test_http2_session_uses_http2_adapter(self):
+        config = ClientConfig(api_key="key", client_name="c", http2=True)
+        session = config.sessions.get("http2")
+        assert isinstance(session.get_adapter(URL), HTTP2Adapter)
+        assert session is config.sessions.get("http2")
@@ -0,0 +1,146 @@
+from unittest import mock
+
+import pytest
+import requests
+
+from cognite.client import CogniteClient
+from cognite.client.exceptions import CogniteAPIError
+from cognite.client.utils._hooks import RequestInfo
+from cognite.client.utils._metrics import LatencyHistogram, MetricsCollector, get_endpoint
+
+BASE_URL = "http://localtest.com/api/v1/projects/test-project"
+
+
+@pytest.mark.parametrize(
+    "url_path, endpoint",
+    [
+        ("/assets/123", "/assets/{id}"),
+        ("/assets/byids", "/assets/byids"),
+        ("/timeseries/data/list", "/timeseries/data/list"),
+        ("/3d/models/1/revisions/2/nodes", "/3d/models/{id}/revisions/{id}/nodes"),
+        ("/raw/dbs/my%20db/tables/table1/rows", "/raw/dbs/{db}/tables/{table}/rows"),
+        ("/raw/dbs/db1/tables", "/raw/dbs/{db}/tables"),
+        ("/raw/dbs/db1/tables/t1/rows/row%2F1", "/raw/dbs/{db}/tables/{table}/rows/{id}"),
+    ],
+)
+def test_get_endpoint(url_path, endpoint):
+    assert endpoint == get_endpoint(url_path)
+
+
+class TestLatencyHistogram:
+    def test_observe(self):
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        for latency in [0.05, 0.1, 0.5, 5]:
+            histogram.observe(latency)
+        assert [2, 1, 1] == histogram.counts
+        assert 4 == histogram.count
+        assert 5.65 == pytest.approx(histogram.sum)
+
+    def test_quantile(self):
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        assert histogram.quantile(0.5) is None
+        for latency in [0.05] * 50 + [0.5] * 50:
+            histogram.observe(latency)
+        assert 0.1 == pytest.approx(histogram.quantile(0.5))
+        assert 0.82 == pytest.approx(histogram.quantile(0.9))
+        histogram.observe(100)
+        assert 1.0 == histogram.quantile(1)
+
+
+def response(status_code, content_length=None):
+    res = mock.MagicMock(status_code=status_code)
+    res.headers = {} if content_length is None else {"Content-Length": str(content_length)}
+    return res
+
+
+def request_info(url_path, body=b"", latency=0.2):
+    info = RequestInfo("POST", url_path, BASE_URL + url_path, {}, body)
+    info.latency = latency
+    return info
+
+
+class TestMetricsCollector:
+    def test_collect(self):
+        collector = MetricsCollector()
+        collector.after_response(request_info("/assets/1", b"abc"), response(200, 100))
+        collector.after_response(request_info("/assets/2", latency=0.02), response(200, 50))
+        info = request_info("/assets/byids", b"{}")
+        collector.on_retry(info, 429, None)
+        info.backoff_time = 0.5
+        collector.after_response(info, response(400, 10))
+        collector.on_error(info, CogniteAPIError("bad", 400))
+
+        metrics = collector.dump()
+        assert ["/assets/byids", "/assets/{id}"] == list(metrics)
+        assert {
+            "requests": 2,
+            "errors": 0,
+            "retries": 0,
+            "throttled": 0,
+            "bytes_sent": 3,
+            "bytes_received": 150,
+            "retry_backoff": 0.0,
+            "status_codes": {200: 2},
+        } == {k: v for k, v in metrics["/assets/{id}"].items() if not k.startswith("latency")}
+        assert 0.11 == pytest.approx(metrics["/assets/{id}"]["latency_mean"])
+        assert {
+            "requests": 1,
+            "errors": 1,
+            "retries": 1,
+            "throttled": 1,
+            "bytes_sent": 4,
+            "bytes_received": 10,
+            "retry_backoff": 0.5,
+            "status_codes": {400: 1},
+        } == {k: v for k, v in metrics["/assets/byids"].items() if not k.startswith("latency")}
+
+    def test_error_without_response(self):
+        collector = MetricsCollector()
+        info = RequestInfo("GET", "/assets", BASE_URL + "/assets", {})
+        collector.on_error(info, requests.exceptions.ConnectionError())
+        assert 1 == collector.dump()["/assets"]["requests"] == collector.dump()["/assets"]["errors"]
+        assert collector.dump()["/assets"]["latency_p50"] is None
+
+    def test_in_flight(self):
+        collector = MetricsCollector()
+        first, second = request_info("/assets/1"), RequestInfo("GET", "/assets/2", BASE_URL + "/assets/2", {})
+        collector.before_request(first)
+        collector.before_request(second)
+        assert 2 == collector.in_flight
+        collector.after_response(first, response(200))
+        collector.on_error(second, requests.exceptions.ConnectionError())
+        assert 0 == collector.in_flight
+
+    def test_reset(self):
+        collector = MetricsCollector()
+        collector.after_response(request_info("/assets/1"), response(200))
+        collector.count_datapoints(retrieved=10, inserted=5)
+        collector.reset()
+        assert {} == collector.dump()
+        assert 0 == collector.datapoints_retrieved == collector.datapoints_inserted
+
+
+class TestClientMetrics:
+    def test_disabled_by_default(self):
+        client = CogniteClient(
+            api_key="abc", project="test-project", client_name="test", disable_pypi_version_check=True
+        )
+        assert client.metrics is None
+        assert not client.hooks
+
+    def test_collect_metrics(self, rsps):
+        client = CogniteClient(
+            api_key="abc",
+            project="test-project",
+            client_name="test",
+            base_url="http://localtest.com",
+            collect_metrics=True,
+            disable_pypi_version_check=True,
+        )
+        rsps.add(rsps.POST, BASE_URL + "/assets/list", status=200, json={"items": []})
+        client.assets.list(limit=10)
+        metrics = client.metrics.dump()["/assets/list"]
+        assert 1 == metrics["requests"]
+        assert {200: 1} == metrics["status_codes"]
+        assert metrics["bytes_sent"] > 0
+        assert metrics["latency_p50"] is not None
@@ -0,0 +1,119 @@
+import tracemalloc
+
+import pytest
+
+from cognite.client.data_classes import TimeSeries
+from cognite.client.testing import FakeCogniteServer
+from cognite.client.utils import _profiling
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeCogniteServer() as server:
+        client = server.client()
+        client.time_series.create([TimeSeries(external_id="ts{}".format(i)) for i in range(2)])
+        for i in range(2):
+            client.datapoints.insert([(t * 1000, float(t)) for t in range(2000)], external_id="ts{}".format(i))
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    return server.client()
+
+
+def stage_names(call):
+    return list(call.stages)
+
+
+class TestProfile:
+    def test_calls_and_stages(self, client):
+        with client.profile() as p:
+            dps = client.datapoints.retrieve(external_id=["ts0", "ts1"], start=0, end="now")
+            client.time_series.list()
+
+        assert ["DatapointsAPI.retrieve", "TimeSeriesAPI.list"] == [call.name for call in p.calls]
+        retrieve, ts_list = p.calls
+        assert {"http", "decode", "_load", "_extend"} <= set(retrieve.stages)
+        assert ["http", "decode", "_load"] == stage_names(ts_list)
+        assert 2 <= retrieve.stages["http"].count
+        assert 0 < retrieve.stages["http"].bytes
+        assert 0 < retrieve.peak
+        assert 0 < retrieve.seconds
+        assert 2 == len(dps)
+
+    def test_nested_calls_belong_to_outermost_call(self, client):
+        with client.profile() as p:
+            client.datapoints.retrieve_dataframe(
+                external_id="ts0", start=0, end="now", aggregates=["average"], granularity="1m"
+            )
+
+        assert ["DatapointsAPI.retrieve_dataframe"] == [call.name for call in p.calls]
+        assert "to_pandas" in p.calls[0].stages
+
+    def test_direct_calls_to_data_classes(self, client):
+        dps = client.datapoints.retrieve(external_id="ts0", start=0, end="now")
+        with client.profile() as p:
+            dps.to_pandas()
+
+        assert ["Datapoints.to_pandas"] == [call.name for call in p.calls]
+        assert ["to_pandas"] == stage_names(p.calls[0])
+
+    def test_other_clients_and_calls_outside_context_not_profiled(self, server, client):
+        other = server.client()
+        with client.profile() as p:
+            other.time_series.list()
+        client.time_series.list()
+
+        assert [] == p.calls
+
+    def test_report(self, client):
+        with client.profile() as p:
+            client.time_series.list()
+
+        report = str(p)
+        assert "TimeSeriesAPI.list" in report
+        assert "decode" in report
+        df = p.to_pandas()
+        assert ["call", "stage", "count", "seconds", "peak", "retained", "bytes"] == list(df.columns)
+        assert ["", "http", "decode", "_load"] == list(df.stage)
+
+    def test_snapshots(self, client):
+        with client.profile(snapshots=True) as p:
+            client.time_series.list()
+        assert isinstance(p.calls[0].snapshot, tracemalloc.Snapshot)
+
+    def test_tracing_stopped_only_if_started_by_profile(self, client):
+        with client.profile():
+            assert tracemalloc.is_tracing()
+        assert not tracemalloc.is_tracing()
+
+        tracemalloc.start()
+        try:
+            with client.profile():
+                pass
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+
+class TestStage:
+    def test_no_stage_outside_profile(self):
+        assert _profiling._NO_STAGE is _profiling.stage("decode")
+
+    def test_peak_of_nested_measurements(self, client):
+        profiler = _profiling.MemoryProfiler(client._config)
+        profiler.start()
+        try:
+            outer = profiler._enter()
+            inner = profiler._enter()
+            data = bytearray(10 * 1024 * 1024)
+            del data
+            inner_peak, _ = profiler._exit(inner)
+            outer_peak, outer_retained = profiler._exit(outer)
+        finally:
+            profiler.stop()
+
+        assert 10 * 1024 * 1024 <= inner_peak
+        assert 10 * 1024 * 1024 <= outer_peak
+        assert outer_retained < 1024 * 1024
@@ -0,0 +1,90 @@
+import json
+import urllib.request
+
+import pytest
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from cognite.client import CogniteClient
+from cognite.client.exceptions import CogniteAPIError
+from cognite.client.utils._prometheus import PrometheusCollector, get_connection_pool_usage
+from tests.utils import jsgz_load
+
+prometheus_client = pytest.importorskip("prometheus_client")
+
+BASE_URL = "http://localtest.com/api/v1/projects/test-project"
+
+
+def make_client(collect_metrics=True):
+    return CogniteClient(
+        api_key="abc",
+        project="test-project",
+        client_name="test",
+        base_url="http://localtest.com",
+        collect_metrics=collect_metrics,
+        disable_pypi_version_check=True,
+    )
+
+
+@pytest.fixture
+def registry():
+    return prometheus_client.CollectorRegistry()
+
+
+class TestPrometheusCollector:
+    def test_requires_metrics(self):
+        with pytest.raises(ValueError, match="collect_metrics=True"):
+            PrometheusCollector(make_client(collect_metrics=False))
+
+    def test_collect(self, registry, rsps):
+        client = make_client()
+        PrometheusCollector(client).register(registry)
+
+        def request_callback(request):
+            item = dict(jsgz_load(request.body)["items"][0], isString=False)
+            item["datapoints"] = [{"timestamp": t, "value": 1.0} for t in range(3)]
+            return 200, {}, json.dumps({"items": [item]})
+
+        rsps.add_callback(rsps.POST, BASE_URL + "/timeseries/data/list", callback=request_callback)
+        rsps.add(rsps.POST, BASE_URL + "/timeseries/data", status=200, json={})
+        rsps.add(rsps.GET, BASE_URL + "/assets/1", status=500, json={"error": {"code": 500, "message": "err"}})
+        client.datapoints.retrieve(id=1, start=0, end=10)
+        client.datapoints.insert([(1, 1.0), (2, 2.0)], id=1)
+        with pytest.raises(CogniteAPIError):
+            client.assets._get("/assets/1")
+
+        sample = registry.get_sample_value
+        labels = {"endpoint": "/timeseries/data/list", "status": "200"}
+        assert 1 == sample("cognite_sdk_requests_total", labels)
+        assert 1 == sample("cognite_sdk_requests_total", {"endpoint": "/assets/{id}", "status": "500"})
+        assert 1 == sample("cognite_sdk_request_errors_total", {"endpoint": "/assets/{id}"})
+        assert sample("cognite_sdk_request_sent_bytes_total", {"endpoint": "/timeseries/data"}) > 0
+        assert 0 == sample("cognite_sdk_retry_backoff_seconds_total", {"endpoint": "/timeseries/data"})
+        assert 1 == sample("cognite_sdk_request_duration_seconds_count", {"endpoint": "/timeseries/data/list"})
+        assert 1 == sample("cognite_sdk_request_duration_seconds_bucket", {"endpoint": "/assets/{id}", "le": "+Inf"})
+        assert 0 == sample("cognite_sdk_requests_in_flight")
+        assert 3 == sample("cognite_sdk_datapoints_retrieved_total")
+        assert 2 == sample("cognite_sdk_datapoints_inserted_total")
+        assert 0 == sample("cognite_sdk_executor_queue_depth")
+        assert client.config.max_workers == sample("cognite_sdk_executor_workers")
+        assert b"cognite_sdk_connection_pool_size" in prometheus_client.generate_latest(registry)
+
+    def test_start_http_server(self):
+        client = make_client()
+        server, _ = PrometheusCollector(client).start_http_server(0, addr="127.0.0.1")
+        try:
+            with urllib.request.urlopen("http://127.0.0.1:{}/metrics".format(server.server_port)) as res:
+                assert b"cognite_sdk_requests_in_flight 0.0" in res.read()
+        finally:
+            server.shutdown()
+
+
+def test_get_connection_pool_usage():
+    session = Session()
+    adapter = HTTPAdapter(pool_maxsize=5)
+    session.mount("http://", adapter)
+    assert {} == get_connection_pool_usage([session])
+    pool = adapter.poolmanager.connection_from_url("http://localtest.com")
+    assert {"http://localtest.com:80": (0, 5)} == get_connection_pool_usage([session])
+    pool._get_conn()
+    assert {"http://localtest.com:80": (1, 5)} == get_connection_pool_usage([session])
@@ -0,0 +1,189 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cognite.client.utils._client_config import ClientConfig
+from cognite.client.utils._rate_limiting import (
+    AdaptiveConcurrencyLimiter,
+    RateLimiter,
+    TokenBucket,
+    get_shared_concurrency_limiter,
+    get_shared_rate_limiter,
+)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_starts_at_max_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=10)
+        assert 10 == limiter.limit
+        assert 0 == limiter.in_flight
+
+    def test_throttling_decreases_limit_multiplicatively(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=16)
+        limiter.acquire()
+        limiter.release(latency=None, throttled=True)
+        assert 8 == limiter.limit
+        assert 1 == limiter.stats()["throttled"]
+
+    def test_decreases_at_most_once_per_round_trip(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=16)
+        limiter.acquire()
+        limiter.release(latency=10)
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release(throttled=True)
+        assert 8 == limiter.limit
+        assert 3 == limiter.stats()["throttled"]
+
+    def test_never_below_min_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=4, min_limit=2)
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(throttled=True)
+        assert 2 == limiter.limit
+
+    def test_increases_additively_up_to_max(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=4, latency_tolerance=None)
+        limiter.acquire()
+        limiter.release(throttled=True)
+        assert 2 == limiter.limit
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release(latency=0.01)
+        assert 3 == limiter.limit
+        for _ in range(100):
+            limiter.acquire()
+            limiter.release(latency=0.01)
+        assert 4 == limiter.limit
+
+    def test_rising_latency_decreases_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=10, latency_tolerance=2.0)
+        for _ in range(50):
+            limiter.acquire()
+            limiter.release(latency=0.001)
+        assert 10 == limiter.limit
+        for _ in range(10):
+            limiter.acquire()
+            limiter.release(latency=1)
+        assert limiter.limit < 10
+        assert limiter.stats()["decreases"] >= 1
+
+    def test_acquire_blocks_at_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def acquire():
+            limiter.acquire()
+            acquired.set()
+
+        t = threading.Thread(target=acquire)
+        t.start()
+        time.sleep(0.05)
+        assert not acquired.is_set()
+        limiter.release(latency=0.01)
+        t.join(1)
+        assert acquired.is_set()
+
+    def test_invalid_limits(self):
+        with pytest.raises(AssertionError):
+            AdaptiveConcurrencyLimiter(max_limit=1, min_limit=2)
+
+
+class TestSharedConcurrencyLimiter:
+    def test_shared_per_project(self):
+        a = get_shared_concurrency_limiter("https://a", "p1", 10)
+        assert a is get_shared_concurrency_limiter("https://a", "p1", 10)
+        assert a is not get_shared_concurrency_limiter("https://a", "p2", 10)
+
+    def test_config_exposes_limiter_when_enabled(self):
+        assert ClientConfig().concurrency_limiter is None
+        c1 = ClientConfig(project="shared", adaptive_concurrency=True)
+        c2 = ClientConfig(project="shared", adaptive_concurrency=True)
+        assert c1.concurrency_limiter is c2.concurrency_limiter
+
+
+class TestTokenBucket:
+    def test_allows_burst_up_to_capacity(self):
+        bucket = TokenBucket(rate=1, capacity=3)
+        assert [True, True, True, False] == [bucket.try_acquire() for _ in range(4)]
+
+    def test_refills_at_rate(self):
+        bucket = TokenBucket(rate=100, capacity=1)
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+        time.sleep(0.02)
+        assert bucket.try_acquire()
+
+    def test_blocking_acquire_waits_for_token(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+        bucket.acquire()
+        t0 = time.monotonic()
+        assert bucket.acquire()
+        assert time.monotonic() - t0 >= 0.04
+
+    def test_acquire_with_timeout(self):
+        bucket = TokenBucket(rate=1, capacity=1)
+        bucket.acquire()
+        assert not bucket.acquire(timeout=0.01)
+        assert not bucket.acquire(blocking=False)
+
+    def test_acquire_async(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+
+        async def acquire_twice():
+            await asyncio.gather(bucket.acquire_async(), bucket.acquire_async())
+
+        loop = asyncio.new_event_loop()
+        try:
+            t0 = time.monotonic()
+            loop.run_until_complete(acquire_twice())
+            assert time.monotonic() - t0 >= 0.04
+        finally:
+            loop.close()
+
+
+class TestRateLimiter:
+    def test_longest_prefix_wins(self):
+        limiter = RateLimiter({"/timeseries": 1, "/timeseries/data": 2, "*": 3})
+        assert "/timeseries/data" == limiter.get_family("/timeseries/data/list")
+        assert "/timeseries" == limiter.get_family("/timeseries/byids")
+        assert "*" == limiter.get_family("/timeseriesfoo")
+        assert "*" == limiter.get_family("/raw/dbs")
+
+    def test_unlimited_without_default(self):
+        limiter = RateLimiter({"/raw": 1})
+        assert limiter.get_bucket("/assets") is None
+        assert all(limiter.try_acquire("/assets") for _ in range(10))
+        assert limiter.try_acquire("/raw/dbs")
+        assert not limiter.try_acquire("/raw/dbs/db/tables")
+
+    def test_config_rebuilds_limiter_when_limits_change(self):
+        config = ClientConfig()
+        assert config.rate_limiter is None
+        config.rate_limits = {"/raw": 1}
+        limiter = config.rate_limiter
+        assert limiter is config.rate_limiter
+        config.rate_limits = {"/raw": 2}
+        assert limiter is not config.rate_limiter
+
+    def test_shared_per_project_and_limits(self):
+        a = get_shared_rate_limiter("https://a", "p1", {"/raw": 1, "*": 2})
+        assert a is get_shared_rate_limiter("https://a", "p1", {"*": 2, "/raw": 1})
+        assert a is not get_shared_rate_limiter("https://a", "p2", {"/raw": 1, "*": 2})
+        assert a is not get_shared_rate_limiter("https://b", "p1", {"/raw": 1, "*": 2})
+        assert a is not get_shared_rate_limiter("https://a", "p1", {"/raw": 1})
+
+    def test_config_limiter_shared_by_clients(self):
+        c1 = ClientConfig(project="shared-rate", rate_limits={"/raw": 1})
+        c2 = ClientConfig(project="shared-rate", rate_limits={"/raw": 1})
+        assert c1.rate_limiter is c2.rate_limiter
+
+    def test_concurrent_first_use_builds_one_limiter(self):
+        config = ClientConfig(project="concurrent-rate", rate_limits={"/raw": 1})
+        with ThreadPoolExecutor(8) as executor:
+            limiters = list(executor.map(lambda _: config.rate_limiter, range(100)))
+        assert all(limiter is limiters[0] for limiter in limiters)
@@ -0,0 +1,171 @@
+import email.utils
+import time
+from unittest import mock
+
+import pytest
+import requests
+from requests.packages.urllib3.exceptions import MaxRetryError, NewConnectionError, ReadTimeoutError
+
+from cognite.client._api_client import APIClient
+from cognite.client.exceptions import CogniteAPIError
+from cognite.client.utils._client_config import ClientConfig
+from cognite.client.utils._retry import RetryBudget, RetryPolicy, is_connect_error, parse_retry_after
+
+BASE_URL = "http://localtest.com/api/v1/projects/test-project"
+
+
+def response(headers=None):
+    res = requests.Response()
+    res.headers.update(headers or {})
+    return res
+
+
+def connect_error():
+    return requests.exceptions.ConnectionError(MaxRetryError(None, "/", NewConnectionError(None, "refused")))
+
+
+class TestRetryBudget:
+    def test_withdraw_until_spent(self):
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0, max_balance=10)
+        assert not budget.withdraw()
+        for _ in range(4):
+            budget.deposit()
+        assert budget.withdraw()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        assert 2 == budget.denied
+
+    def test_deposits_capped_at_max_balance(self):
+        budget = RetryBudget(ratio=1, min_retries_per_second=0, max_balance=3)
+        for _ in range(10):
+            budget.deposit()
+        assert 3 == budget.balance
+
+    def test_refilled_over_time(self):
+        budget = RetryBudget(min_retries_per_second=100, max_balance=1)
+        assert budget.withdraw()
+        time.sleep(0.02)
+        assert budget.withdraw()
+
+    def test_opt_in(self):
+        assert ClientConfig().retry_policy.budget is None
+        assert isinstance(ClientConfig(retry_budget=True).retry_policy.budget, RetryBudget)
+
+
+class TestRetryPolicy:
+    @pytest.mark.parametrize(
+        "is_retryable, status, error, expected",
+        [
+            (False, 429, None, True),
+            (False, 503, None, False),
+            (True, 503, None, True),
+            (True, 500, None, False),
+            (True, 400, None, False),
+            (False, None, connect_error(), True),
+            (False, None, requests.exceptions.ConnectTimeout(), True),
+            (False, None, requests.exceptions.ReadTimeout(), False),
+            (True, None, requests.exceptions.ReadTimeout(), True),
+            (False, None, requests.exceptions.ConnectionError("reset"), False),
+            (True, None, requests.exceptions.ConnectionError("reset"), True),
+        ],
+    )
+    def test_should_retry(self, is_retryable, status, error, expected):
+        assert expected == RetryPolicy().should_retry(0, is_retryable, status, error)
+
+    def test_max_retries(self):
+        policy = RetryPolicy(max_retries=2)
+        assert policy.should_retry(1, True, 429)
+        assert not policy.should_retry(2, True, 429)
+
+    def test_budget_limits_retries(self):
+        policy = RetryPolicy(budget=RetryBudget(ratio=1, min_retries_per_second=0))
+        assert not policy.should_retry(0, True, 429)
+        policy.on_request()
+        assert policy.should_retry(0, True, 429)
+        assert not policy.should_retry(1, True, 429)
+
+    def test_backoff_jitter(self):
+        policy = RetryPolicy(base_backoff=0.5, max_backoff=4)
+        backoffs = [policy.get_backoff(0) for _ in range(100)]
+        assert all(0.5 <= backoff <= 1.5 for backoff in backoffs)
+        assert len(set(backoffs)) > 1
+        assert all(0.5 <= policy.get_backoff(1) <= 3 for _ in range(100))
+        assert all(0.5 <= policy.get_backoff(10) <= 4 for _ in range(100))
+
+    def test_backoff_from_retry_after(self):
+        policy = RetryPolicy(max_backoff=30)
+        assert 2 == policy.get_backoff(0, response({"Retry-After": "2"}))
+        assert 30 == policy.get_backoff(0, response({"Retry-After": "120"}))
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert 1.5 == parse_retry_after(response({"Retry-After": "1.5"}))
+
+    def test_http_date(self):
+        retry_at = email.utils.formatdate(time.time() + 10, usegmt=True)
+        assert 8 < parse_retry_after(response({"Retry-After": retry_at})) <= 10
+
+    def test_date_in_the_past(self):
+        assert 0 == parse_retry_after(response({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}))
+
+    def test_missing_or_invalid(self):
+        assert parse_retry_after(response()) is None
+        assert parse_retry_after(response({"Retry-After": "soon"})) is None
+
+
+def test_is_connect_error():
+    assert is_connect_error(connect_error())
+    assert not is_connect_error(
+        requests.exceptions.ConnectionError(MaxRetryError(None, "/", ReadTimeoutError(None, "/", "")))
+    )
+    assert not is_connect_error(ValueError())
+
+
+class TestRetryEngine:
+    @pytest.fixture
+    def api_client(self):
+        config = ClientConfig(
+            project="test-project", api_key="abc", base_url="http://localtest.com", client_name="test"
+        )
+        return APIClient(config, api_version="v1")
+
+    def test_retries_until_success(self, api_client, rsps):
+        for status in [503, 429]:
+            rsps.add(rsps.POST, BASE_URL + "/assets/list", status=status, json={})
+        rsps.add(rsps.POST, BASE_URL + "/assets/list", status=200, json={"items": []})
+        with mock.patch("time.sleep") as sleep:
+            res = api_client._post("/assets/list", json={})
+        assert 200 == res.status_code
+        assert 3 == len(rsps.calls)
+        assert 2 == sleep.call_count
+
+    def test_does_not_retry_unsafe_requests(self, api_client, rsps):
+        rsps.add(rsps.POST, BASE_URL + "/assets", status=503, json={"error": {"code": 503, "message": "busy"}})
+        with pytest.raises(CogniteAPIError):
+            api_client._post("/assets", json={})
+        assert 1 == len(rsps.calls)
+
+    def test_waits_retry_after(self, api_client, rsps):
+        rsps.add(rsps.GET, BASE_URL + "/assets", status=429, json={}, headers={"Retry-After": "3"})
+        rsps.add(rsps.GET, BASE_URL + "/assets", status=200, json={"items": []})
+        with mock.patch("time.sleep") as sleep:
+            api_client._get("/assets")
+        sleep.assert_called_once_with(3)
+
+    def test_spent_budget_returns_last_response(self, api_client, rsps):
+        api_client._config.retry_policy.budget = RetryBudget(ratio=1, min_retries_per_second=0)
+        rsps.add(rsps.GET, BASE_URL + "/assets", status=429, json={"error": {"code": 429, "message": "throttled"}})
+        with mock.patch("time.sleep"):
+            with pytest.raises(CogniteAPIError) as e:
+                api_client._get("/assets")
+        assert 429 == e.value.code
+        # The request itself adds one retry to the budget
+        assert 2 == len(rsps.calls)
+        assert 1 == api_client._config.retry_policy.budget.denied
+
+    def test_retries_connect_errors(self, api_client, rsps):
+        rsps.add(rsps.POST, BASE_URL + "/assets", body=connect_error())
+        rsps.add(rsps.POST, BASE_URL + "/assets", status=200, json={"items": []})
+        with mock.patch("time.sleep"):
+            assert 200 == api_client._post("/assets", json={}).status_code
@@ -0,0 +1,65 @@
+import gzip
+import json
+
+import pytest
+import requests
+
+from cognite.client.utils._streaming import ListResponseReader, load_datapoints_columns
+
+pytest.importorskip("ijson")
+
+URL = "https://example.com/list"
+
+
+def get_streamed(rsps, body, **kwargs):
+    rsps.add(rsps.GET, URL, status=200, body=body, **kwargs)
+    return requests.get(URL, stream=True)
+
+
+class TestListResponseReader:
+    def test_items_and_cursor(self, rsps):
+        body = json.dumps({"items": [{"id": i, "name": "ø", "value": 1.5} for i in range(5000)], "nextCursor": "abc"})
+        page = ListResponseReader(get_streamed(rsps, body))
+        assert [{"id": i, "name": "ø", "value": 1.5} for i in range(5000)] == list(page)
+        assert "abc" == page.next_cursor
+
+    def test_cursor_before_items(self, rsps):
+        page = ListResponseReader(get_streamed(rsps, '{"nextCursor": null, "items": [{"a": [1, {"b": 2}]}]}'))
+        assert [{"a": [1, {"b": 2}]}] == list(page)
+        assert page.next_cursor is None
+
+    def test_gzip_encoded(self, rsps):
+        body = gzip.compress(json.dumps({"items": [1, 2, 3], "nextCursor": "c"}).encode())
+        page = ListResponseReader(get_streamed(rsps, body, headers={"Content-Encoding": "gzip"}))
+        assert [1, 2, 3] == list(page)
+        assert "c" == page.next_cursor
+
+
+class TestLoadDatapointsColumns:
+    def test_columns(self, rsps):
+        body = {
+            "items": [
+                {
+                    "id": 1,
+                    "datapoints": [
+                        {"timestamp": 0, "average": 1.5, "max": 2},
+                        {"timestamp": 1000, "max": 3},
+                        {"timestamp": 2000, "average": 0.5, "unexpected": 1},
+                    ],
+                    "externalId": "a",
+                    "isString": False,
+                    "isStep": True,
+                    "unit": None,
+                }
+            ]
+        }
+        items = load_datapoints_columns(get_streamed(rsps, json.dumps(body)), ["average", "max"])
+        assert [
+            (
+                {"id": 1, "externalId": "a", "isString": False, "isStep": True, "unit": None},
+                {"average": [1.5, None, 0.5], "max": [2, 3, None], "timestamp": [0, 1000, 2000]},
+            )
+        ] == items
+
+    def test_no_items(self, rsps):
+        assert [] == load_datapoints_columns(get_streamed(rsps, '{"items": []}'), ["value"])
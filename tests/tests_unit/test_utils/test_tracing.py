@@ -0,0 +1,128 @@
+import json
+from unittest import mock
+
+import pytest
+import requests
+
+from cognite.client import CogniteClient
+from cognite.client.exceptions import CogniteAPIError
+from cognite.client.utils._tracing import _NO_SPAN, span
+from tests.utils import jsgz_load
+
+trace = pytest.importorskip("opentelemetry.trace")
+trace_sdk = pytest.importorskip("opentelemetry.sdk.trace")
+export = pytest.importorskip("opentelemetry.sdk.trace.export")
+in_memory_span_exporter = pytest.importorskip("opentelemetry.sdk.trace.export.in_memory_span_exporter")
+
+BASE_URL = "http://localtest.com/api/v1/projects/test-project"
+
+
+@pytest.fixture
+def exporter():
+    return in_memory_span_exporter.InMemorySpanExporter()
+
+
+@pytest.fixture
+def client(exporter):
+    tracer_provider = trace_sdk.TracerProvider()
+    tracer_provider.add_span_processor(export.SimpleSpanProcessor(exporter))
+    return CogniteClient(
+        api_key="abc",
+        project="test-project",
+        client_name="test",
+        base_url="http://localtest.com",
+        max_workers=4,
+        disable_pypi_version_check=True,
+        tracer_provider=tracer_provider,
+    )
+
+
+def spans_by_name(exporter):
+    spans = {}
+    for s in exporter.get_finished_spans():
+        spans.setdefault(s.name, []).append(s)
+    return spans
+
+
+def parent_of(span, exporter):
+    return next(s for s in exporter.get_finished_spans() if s.context.span_id == span.parent.span_id)
+
+
+class TestTracing:
+    def test_disabled_by_default(self):
+        client = CogniteClient(
+            api_key="abc", project="test-project", client_name="test", disable_pypi_version_check=True
+        )
+        assert client.config.tracer is None
+        assert span(client.config.tracer, "name") is _NO_SPAN
+        assert not client.config.hooks
+
+    def test_api_call_and_request_spans(self, client, exporter, rsps):
+        rsps.add(
+            rsps.POST,
+            BASE_URL + "/assets/list",
+            status=200,
+            json={"items": [{"id": 1}, {"id": 2}]},
+            headers={"X-Request-Id": "abc"},
+        )
+        client.assets.list(limit=10)
+
+        spans = spans_by_name(exporter)
+        assert ["HTTP POST", "AssetsAPI.list"] == [s.name for s in exporter.get_finished_spans()]
+        call, request = spans["AssetsAPI.list"][0], spans["HTTP POST"][0]
+        assert call.parent is None
+        assert call.context.span_id == request.parent.span_id
+        assert 2 == call.attributes["cognite.items"]
+        assert "/assets/list" == request.attributes["http.route"]
+        assert 200 == request.attributes["http.status_code"]
+        assert 0 == request.attributes["cognite.retries"]
+        assert "abc" == request.attributes["cognite.request_id"]
+        assert request.attributes["cognite.bytes_sent"] > 0
+
+    def test_failed_request(self, client, exporter, rsps):
+        rsps.add(rsps.POST, BASE_URL + "/assets/byids", body=requests.exceptions.ConnectionError("refused"))
+        with mock.patch("time.sleep"), pytest.raises(requests.exceptions.ConnectionError):
+            client.assets.retrieve(id=1)
+
+        spans = spans_by_name(exporter)
+        request, call = spans["HTTP POST"][0], spans["AssetsAPI.retrieve"][0]
+        assert trace.StatusCode.ERROR == request.status.status_code == call.status.status_code
+        assert ["retry"] * client.config.max_retries + ["exception"] == [event.name for event in request.events]
+
+    def test_error_status(self, client, exporter, rsps):
+        rsps.add(rsps.POST, BASE_URL + "/assets/byids", status=400, json={"error": {"code": 400, "message": "bad"}})
+        with pytest.raises(CogniteAPIError):
+            client.assets.retrieve(id=1)
+        request = spans_by_name(exporter)["HTTP POST"][0]
+        assert 400 == request.attributes["http.status_code"]
+        assert trace.StatusCode.ERROR == request.status.status_code
+
+    def test_datapoints_spans_across_threads(self, client, exporter, rsps):
+        def request_callback(request):
+            payload = jsgz_load(request.body)
+            item = dict(payload["items"][0], isString=False, isStep=False)
+            if payload["aggregates"]:
+                item["datapoints"] = []
+            else:
+                first = -(-payload["start"] // 1000) * 1000
+                timestamps = range(first, payload["end"], 1000)[: payload["limit"]]
+                item["datapoints"] = [{"timestamp": t, "value": 1.0} for t in timestamps]
+            return 200, {}, json.dumps({"items": [item]})
+
+        rsps.add_callback(rsps.POST, BASE_URL + "/timeseries/data/list", callback=request_callback)
+        client.datapoints._DPS_LIMIT = 10
+        client.datapoints.retrieve(id=[1, 2, 3], start=0, end=25000)
+
+        spans = spans_by_name(exporter)
+        call = spans["DatapointsAPI.retrieve"][0]
+        assert 3 == call.attributes["cognite.items"]
+        assert 3 == len(spans["datapoints.first_page"]) == len(spans["datapoints.count"])
+        for first_page in spans["datapoints.first_page"]:
+            assert call.context.span_id == first_page.parent.span_id
+            assert 10 == first_page.attributes["cognite.items"]
+        windows = [s for s in spans["datapoints.window"] if parent_of(s, exporter).name == "DatapointsAPI.retrieve"]
+        assert [15, 15, 15] == [w.attributes["cognite.items"] for w in windows]
+        assert [2, 2, 2] == [w.attributes["cognite.pages"] for w in windows]
+        for request in spans["HTTP POST"]:
+            assert parent_of(request, exporter).name in ["datapoints.first_page", "datapoints.window"]
+        assert {call.context.trace_id} == {s.context.trace_id for s in exporter.get_finished_spans()}